@@ -1,7 +1,11 @@
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+from foton_system.core.ops.audit_store import AuditStore
+from foton_system.core.ops.audit_writer import AuditWriter, compact
 from foton_system.modules.shared.infrastructure.bootstrap.bootstrap_service import BootstrapService
 
 class AuditLogger:
@@ -12,6 +16,13 @@ class AuditLogger:
             cls._instance = super(AuditLogger, cls).__new__(cls)
             cls._instance._initialize()
         return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """Flushes pending events and drops the singleton (tests, shutdown)."""
+        if cls._instance is not None:
+            cls._instance.close()
+        cls._instance = None
     
     def _initialize(self):
         # Determine log path based on environment
@@ -27,40 +38,77 @@ class AuditLogger:
         except Exception as e:
             # Fallback to local execution directory if bootstrap fails (rare)
             self.log_file = Path("audit_events.jsonl")
+        # Rotation (gzip + index of closed segments) and reverse-reading queries
+        self.store = AuditStore(self.log_file)
+        # Writes happen on a background thread; FOTON_AUDIT_SYNC=1 (tests) writes inline
+        self.synchronous = os.environ.get("FOTON_AUDIT_SYNC") == "1"
+        self.writer = AuditWriter(self._write_batch)
 
-    def log_event(self, op_name: str, actor: str, client_id: str, payload: dict, result: dict, status: str):
+    def log_event(self, op_name: str, actor: str, client_id: str, payload: dict, result: dict, status: str,
+                  duration_ms: Optional[float] = None, spans: Optional[list] = None):
         """
         Logs a structured event to the audit trail.
+        Large strings/bytes in payload and result are stored truncated with their sha256.
+        `duration_ms` / `spans` (tracing summary) are added when given.
         """
         event = {
             "timestamp": datetime.now().isoformat(),
             "op": op_name,
             "actor": actor,
             "client_id": client_id,
-            "payload": payload,  # Input params
-            "result": result,    # Output metrics
+            "payload": compact(payload),  # Input params
+            "result": compact(result),    # Output metrics
             "status": status
         }
-        
+        if duration_ms is not None:
+            event["duration_ms"] = duration_ms
+        if spans:
+            event["spans"] = compact(spans)
+
+        if not self.synchronous:
+            self.writer.submit(event)
+            return
         try:
-            # Append to JSONL file
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            self._write_batch([event])
         except Exception as e:
             # If we can't maintain the audit trail, we should at least print to stderr
             print(f"[AUDIT FAIL] Could not write to {self.log_file}: {e}")
 
+    def _write_batch(self, events):
+        """Appends events to the active segment in one write (rotating it first if due)."""
+        try:
+            if self.store.should_rotate():
+                self.store.rotate()
+        except Exception as e:
+            # A failed rotation must not cost the events: keep appending to the active file
+            print(f"[AUDIT WARN] Could not rotate {self.log_file}: {e}")
+
+        lines = "".join(json.dumps(e, ensure_ascii=False, default=str) + "\n" for e in events)
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Waits until every event logged so far is on disk."""
+        return self.writer.flush(timeout)
+
+    def close(self):
+        """Flushes and stops the background writer."""
+        self.writer.close()
+
     def get_recent_events(self, limit=10):
-        """Reads the last N events for analysis."""
-        events = []
-        if not self.log_file.exists():
-            return events
-            
+        """Reads the last N events for analysis (newest first, reading from the end of the trail)."""
+        return self.query_events(limit=limit)
+
+    def query_events(self, limit: int = 10, op: Optional[str] = None, client_id: Optional[str] = None,
+                     since: Optional[str] = None, until: Optional[str] = None, status: Optional[str] = None):
+        """
+        Last N events matching the filters, newest first.
+        since/until are ISO dates (YYYY-MM-DD, inclusive). Archived segments that
+        cannot match (per the segment index) are not opened.
+        """
+        self.flush()
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                for line in reversed(lines[-limit:]):
-                    events.append(json.loads(line))
+            return self.store.query(limit=limit, op=op, client_id=client_id,
+                                    since=since, until=until, status=status)
         except Exception:
-            pass
-        return events
+            return []
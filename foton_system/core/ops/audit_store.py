@@ -0,0 +1,247 @@
+"""
+Segmented storage and queries for the POP audit trail.
+
+Layout (user config dir):
+
+    audit_events.jsonl                  active segment (appended by AuditLogger)
+    audit_segments/
+        audit_events.20250305T101530000000-000.jsonl.gz   closed segments (gzip)
+        index.json                                        per-segment summary
+
+The active segment is rotated when it passes ``rotate_bytes`` (or, with
+``rotate_daily``, on the first write of a new day). Closed segments are
+gzipped and summarized in ``index.json`` — first/last timestamp, event
+count, and the ops, clients and days they contain — so a filtered query
+only decompresses segments that can hold a match.
+
+Queries return newest first: the active segment is read backwards in
+blocks from the end of the file, so the latest events cost the same no
+matter how large the trail has grown.
+"""
+
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+SEGMENT_DIR = "audit_segments"
+INDEX_FILE = "index.json"
+ROTATE_BYTES = 5 * 1024 * 1024
+BLOCK_SIZE = 64 * 1024
+
+
+def read_lines_reversed(path: Path, block_size: int = BLOCK_SIZE) -> Iterator[str]:
+    """Yields the non-empty lines of `path` from last to first, reading fixed-size blocks from the end."""
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        pending = b''
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + pending).split(b'\n')
+            pending = lines.pop(0)  # may continue in the previous block
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.decode('utf-8', errors='replace')
+        if pending.strip():
+            yield pending.decode('utf-8', errors='replace')
+
+
+def _parse(line: str) -> Optional[Dict[str, Any]]:
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None  # torn write / hand edit
+    return event if isinstance(event, dict) else None
+
+
+def matches(event: Dict[str, Any], op: Optional[str] = None, client_id: Optional[str] = None,
+            since: Optional[str] = None, until: Optional[str] = None, status: Optional[str] = None) -> bool:
+    """Filter on op, client and status (exact) and on ISO dates (since/until inclusive, by day)."""
+    if op and event.get('op') != op:
+        return False
+    if client_id and event.get('client_id') != client_id:
+        return False
+    if status and str(event.get('status', '')).upper() != status.upper():
+        return False
+    day = str(event.get('timestamp', ''))[:10]
+    if since and day < since:
+        return False
+    if until and day > until:
+        return False
+    return True
+
+
+def summarize(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Index entry for a closed segment."""
+    stamps = [str(e.get('timestamp', '')) for e in events if e.get('timestamp')]
+    return {
+        "count": len(events),
+        "first": min(stamps) if stamps else "",
+        "last": max(stamps) if stamps else "",
+        "ops": sorted({str(e.get('op')) for e in events if e.get('op')}),
+        "clients": sorted({str(e.get('client_id')) for e in events if e.get('client_id')}),
+        "days": sorted({s[:10] for s in stamps}),
+    }
+
+
+def _may_contain(entry: Dict[str, Any], op=None, client_id=None, since=None, until=None) -> bool:
+    if op and op not in entry.get("ops", []):
+        return False
+    if client_id and client_id not in entry.get("clients", []):
+        return False
+    days = entry.get("days") or []
+    if since and days and days[-1] < since:
+        return False
+    if until and days and days[0] > until:
+        return False
+    return True
+
+
+class AuditStore:
+    """Rotation, segment index and reverse queries over an audit JSONL file."""
+
+    def __init__(self, active_file: Path, rotate_bytes: int = ROTATE_BYTES, rotate_daily: bool = False):
+        self.active_file = Path(active_file)
+        self.segment_dir = self.active_file.parent / SEGMENT_DIR
+        self.index_file = self.segment_dir / INDEX_FILE
+        self.rotate_bytes = rotate_bytes
+        self.rotate_daily = rotate_daily
+
+    # --- Rotation ---
+
+    def should_rotate(self) -> bool:
+        try:
+            st = self.active_file.stat()
+        except OSError:
+            return False
+        if st.st_size == 0:
+            return False
+        if st.st_size >= self.rotate_bytes:
+            return True
+        return self.rotate_daily and datetime.fromtimestamp(st.st_mtime).date() != datetime.now().date()
+
+    def rotate(self) -> Optional[Path]:
+        """Closes the active segment: gzip into audit_segments/ and index it. Returns the new segment."""
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.segment_dir / f"rotating-{os.getpid()}-{time.time_ns()}.jsonl"
+        try:
+            # Atomic: concurrent writers simply start a new active file
+            os.replace(self.active_file, staging)
+        except FileNotFoundError:
+            return None  # another process rotated first
+
+        with open(staging, 'rb') as f:
+            raw = f.read()
+        events = [e for e in (_parse(line) for line in raw.decode('utf-8', errors='replace').splitlines()
+                              if line.strip()) if e]
+        entry = summarize(events)
+
+        index = self.load_index()
+        segment = self._segment_name(entry["first"])
+        with gzip.open(segment, 'wb') as gz:
+            gz.write(raw)
+        staging.unlink()
+
+        index[segment.name] = entry
+        self._save_index(index)
+        return segment
+
+    def _segment_name(self, first_ts: str) -> Path:
+        """audit_events.<first event, to the microsecond>-<seq>.jsonl.gz — names sort in rotation order."""
+        try:
+            first = datetime.fromisoformat(first_ts)
+        except ValueError:
+            first = datetime.now()
+        stamp = first.strftime('%Y%m%dT%H%M%S%f')
+        n = 0
+        while (self.segment_dir / f"audit_events.{stamp}-{n:03d}.jsonl.gz").exists():
+            n += 1
+        return self.segment_dir / f"audit_events.{stamp}-{n:03d}.jsonl.gz"
+
+    # --- Index ---
+
+    def segments(self) -> List[Path]:
+        """Closed segments, oldest first."""
+        if not self.segment_dir.exists():
+            return []
+        return sorted(self.segment_dir.glob("audit_events.*.jsonl.gz"))
+
+    def load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Index reconciled with the segments on disk (missing entries are rebuilt, stale ones dropped)."""
+        try:
+            index = json.loads(self.index_file.read_text(encoding='utf-8'))
+            if not isinstance(index, dict):
+                index = {}
+        except (OSError, json.JSONDecodeError):
+            index = {}
+
+        names = {p.name: p for p in self.segments()}
+        dirty = set(index) - set(names)
+        for stale in dirty:
+            del index[stale]
+        for name, path in names.items():
+            if name not in index:
+                index[name] = summarize(list(self._read_segment(path)))
+                dirty.add(name)
+        if dirty:
+            self._save_index(index)
+        return index
+
+    def _save_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_file.with_name(f"{INDEX_FILE}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, ensure_ascii=False, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, self.index_file)
+
+    # --- Queries ---
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[Dict[str, Any]]:
+        with gzip.open(path, 'rt', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                event = _parse(line) if line.strip() else None
+                if event:
+                    yield event
+
+    def iter_events(self, op: Optional[str] = None, client_id: Optional[str] = None,
+                    since: Optional[str] = None, until: Optional[str] = None,
+                    status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Matching events, newest first: active segment backwards, then closed segments the index allows."""
+        if self.active_file.exists():
+            for line in read_lines_reversed(self.active_file):
+                event = _parse(line)
+                if event and matches(event, op, client_id, since, until, status):
+                    yield event
+
+        index = self.load_index()
+        for path in reversed(self.segments()):
+            entry = index.get(path.name)
+            if entry and not _may_contain(entry, op, client_id, since, until):
+                continue
+            events = [e for e in self._read_segment(path) if matches(e, op, client_id, since, until, status)]
+            yield from reversed(events)
+
+    def query(self, limit: int = 10, **filters) -> List[Dict[str, Any]]:
+        events = []
+        for event in self.iter_events(**filters):
+            events.append(event)
+            if len(events) >= limit:
+                break
+        return events
+
+    def stats(self) -> Dict[str, Any]:
+        index = self.load_index()
+        try:
+            active = self.active_file.stat().st_size
+        except OSError:
+            active = 0
+        return {
+            "active_bytes": active,
+            "segments": len(index),
+            "archived_events": sum(e.get("count", 0) for e in index.values()),
+        }
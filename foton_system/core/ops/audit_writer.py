@@ -0,0 +1,193 @@
+"""
+Background writer for the POP audit trail.
+
+``BaseOp.execute`` used to open, append and close ``audit_events.jsonl`` in
+its ``finally`` block — on the request path of every MCP tool. AuditWriter
+moves that I/O to a daemon thread:
+
+- events go into a bounded queue; when it is full the caller writes its own
+  batch (backpressure, never drops events)
+- the thread writes batches with one open/append per batch, flushing every
+  ``flush_interval`` seconds or as soon as ``flush_size`` events are pending
+- ``flush()`` blocks until everything queued so far is on disk; ``close()``
+  flushes and stops the thread. close() runs at interpreter exit and on
+  SIGTERM / SIGBREAK (the previous handler is still called)
+
+Payloads are compacted before they are queued (see ``compact``): long
+strings and bytes become a short prefix + length + sha256, so a 50k-char
+``conteudo`` costs a few hundred bytes in the trail and can still be
+matched against the original.
+"""
+
+import atexit
+import functools
+import hashlib
+import queue
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+MAX_FIELD_CHARS = 2000
+PREVIEW_CHARS = 200
+FLUSH_INTERVAL = 0.5
+FLUSH_SIZE = 100
+QUEUE_SIZE = 10000
+
+
+def compact(value: Any, max_chars: int = MAX_FIELD_CHARS) -> Any:
+    """
+    Copy of `value` that is safe and small to log: strings longer than
+    `max_chars` and any bytes become {"_truncated", "_length", "_sha256"};
+    containers are walked recursively.
+    """
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return {
+            "_truncated": value[:PREVIEW_CHARS],
+            "_length": len(value),
+            "_sha256": hashlib.sha256(value.encode('utf-8', errors='replace')).hexdigest(),
+        }
+    if isinstance(value, (bytes, bytearray)):
+        return {"_bytes": len(value), "_sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, dict):
+        return {str(k): compact(v, max_chars) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [compact(v, max_chars) for v in value]
+    return value
+
+
+class _Flush:
+    """Queue marker: set once every event queued before it has been written."""
+
+    def __init__(self, stop: bool = False):
+        self.done = threading.Event()
+        self.stop = stop
+
+
+class AuditWriter:
+    """Batches events on a daemon thread and hands them to `write_batch`."""
+
+    def __init__(self, write_batch: Callable[[List[Dict[str, Any]]], None],
+                 flush_interval: float = FLUSH_INTERVAL, flush_size: int = FLUSH_SIZE,
+                 queue_size: int = QUEUE_SIZE):
+        self._write_batch = write_batch
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._hooks_installed = False
+        self._stats = {"queued": 0, "written": 0, "batches": 0, "overflow": 0}
+
+    # --- Producer side ---
+
+    def submit(self, event: Dict[str, Any]) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+            self._stats["queued"] += 1
+        except queue.Full:
+            # Backpressure: write on the caller's thread instead of dropping
+            self._stats["overflow"] += 1
+            self._write([event])
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Blocks until every event submitted so far is written. Returns False on timeout."""
+        if not self.running:
+            return True
+        marker = _Flush()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flushes and stops the thread (idempotent). Later submits restart it."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None or not thread.is_alive():
+            return
+        marker = _Flush(stop=True)
+        self._queue.put(marker)
+        marker.done.wait(timeout)
+        thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats, pending=self._queue.qsize())
+
+    def _ensure_started(self) -> None:
+        if self.running:
+            return
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(target=self._run, name="foton-audit-writer", daemon=True)
+            self._thread.start()
+            if not self._hooks_installed:
+                self._hooks_installed = True
+                atexit.register(self.close)
+                _install_signal_handlers(self.close)
+
+    # --- Consumer side ---
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            self._write_batch(batch)
+            self._stats["written"] += len(batch)
+            self._stats["batches"] += 1
+        except Exception as e:
+            print(f"[AUDIT FAIL] Could not write {len(batch)} event(s): {e}")
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, _Flush):
+                if batch:
+                    self._write(batch)
+                    batch, deadline = [], None
+                item.done.set()
+                if item.stop:
+                    return
+                continue
+
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if batch and (item is None or len(batch) >= self.flush_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch, deadline = [], None
+
+
+def _install_signal_handlers(callback: Callable[[], None]) -> None:
+    """Runs `callback` on SIGTERM/SIGBREAK, then the previous handler. Main thread only."""
+    if threading.current_thread() is not threading.main_thread():
+        return
+    for name in ("SIGTERM", "SIGBREAK"):
+        signum = getattr(signal, name, None)
+        if signum is None:
+            continue
+        try:
+            previous = signal.getsignal(signum)
+            signal.signal(signum, functools.partial(_on_signal, callback, previous))
+        except (ValueError, OSError):
+            pass
+
+
+def _on_signal(callback, previous, signum, frame):
+    callback()
+    if callable(previous):
+        previous(signum, frame)
+    elif previous == signal.SIG_DFL:
+        raise SystemExit(128 + signum)
@@ -1,18 +1,31 @@
 from abc import ABC, abstractmethod
+import time
 import traceback
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from foton_system.core.ops.audit_logger import AuditLogger
+from foton_system.modules.shared.domain.exceptions import OperationCancelledError
+from foton_system.modules.shared.infrastructure.services import tracing
 
 class BaseOp(ABC):
     """
     Abstract Base Class for all FOTON Standard Operating Procedures (POPs).
     Enforces validation, execution structure, and auditing.
     """
+
+    # Max parallel items when run through OpBatch (None = no limit)
+    max_batch_workers: Optional[int] = None
+    # Safe to run again from the start after an interruption (job queue recovery)
+    retryable: bool = False
     
     def __init__(self, actor: str = "System"):
         self.actor = actor
         self.audit_logger = AuditLogger()
         self.op_name = self.__class__.__name__
+        # Set by the job runner: progress sink (done, total, message) and cancellation flag
+        self.progress_callback: Optional[Callable[[int, Optional[int], str], None]] = None
+        self.cancel_event = None
+        # Service instances built through get_service(); OpBatch shares one dict across items
+        self.shared: Dict[str, Any] = {}
 
     @abstractmethod
     def validate(self, **kwargs) -> Dict[str, Any]:
@@ -30,6 +43,27 @@ class BaseOp(ABC):
         """
         pass
 
+    def get_service(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Service instance cached in `self.shared` (built on first use)."""
+        service = self.shared.get(key)
+        if service is None:
+            service = self.shared.setdefault(key, factory())
+        return service
+
+    def audit_record(self, payload: Dict[str, Any], result: Dict[str, Any]):
+        """(payload, result) written to the audit event. Override to summarize large ones."""
+        return payload, result
+
+    def report_progress(self, done: int, total: Optional[int] = None, message: str = "") -> None:
+        """
+        Progress checkpoint for long operations. Forwards to the job runner
+        (if any) and raises OperationCancelledError once the job is cancelled.
+        """
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise OperationCancelledError(self.op_name)
+        if self.progress_callback is not None:
+            self.progress_callback(done, total, message)
+
     def execute(self, client_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
         The main entry point. Orchestrates Validation -> Execution -> Auditing.
@@ -37,13 +71,19 @@ class BaseOp(ABC):
         status = "SUCCESS"
         result = {}
         validated_data = {}
+        started = time.perf_counter()
+        # Root span (no-op unless tracing is enabled); services add child spans
+        op_span = tracing.span(self.op_name, actor=self.actor)
         
         try:
-            # 1. Validation
-            validated_data = self.validate(**kwargs)
-            
-            # 2. Execution
-            result = self.execute_logic(validated_data)
+            with op_span:
+                # 1. Validation
+                with tracing.span("validate"):
+                    validated_data = self.validate(**kwargs)
+
+                # 2. Execution
+                with tracing.span("execute"):
+                    result = self.execute_logic(validated_data)
             
             return result
 
@@ -55,11 +95,14 @@ class BaseOp(ABC):
         finally:
             # 3. Auditing (Always runs, even on failure)
             # Filter passwords or sensitive data from payload if needed in future
+            audit_payload, audit_result = self.audit_record(kwargs, result)  # Raw inputs by default
             self.audit_logger.log_event(
                 op_name=self.op_name,
                 actor=self.actor,
                 client_id=client_id or validated_data.get("client_name", "UNKNOWN"),
-                payload=kwargs, # Log raw inputs
-                result=result,
-                status=status
+                payload=audit_payload,
+                result=audit_result,
+                status=status,
+                duration_ms=round((time.perf_counter() - started) * 1000, 3),
+                spans=op_span.summary(),
             )
@@ -0,0 +1,448 @@
+"""
+Persistent background job queue for long-running operations.
+
+Jobs are BaseOp executions (op name from ``JOB_OPS`` + JSON kwargs) stored
+in ``jobs.sqlite`` in the app data dir, so they survive a server restart:
+
+    QUEUED -> RUNNING -> SUCCESS | ERROR | CANCELLED
+
+- Worker threads claim the oldest QUEUED job in an IMMEDIATE transaction, so
+  several processes (MCP server, a ``job_queue.py work`` process) can share
+  the queue without running a job twice.
+- Ops report progress through ``BaseOp.report_progress``; the row keeps
+  done/total/message (written at most every ``PROGRESS_INTERVAL`` seconds).
+- Cancelling a QUEUED job is immediate; a RUNNING job gets
+  ``cancel_requested`` and stops at its next progress checkpoint.
+- Owners heartbeat their RUNNING jobs. Jobs whose owner stopped
+  heartbeating (crash, killed server) are re-queued, up to ``MAX_ATTEMPTS``,
+  when their op is ``retryable``; the others may have half-written their
+  output and are failed as interrupted instead. On a clean exit the owner
+  re-queues the jobs its threads let go of right away. A job whose thread outlives the stop timeout stays RUNNING (it may
+  still finish) and is left to ``recover()`` once its heartbeat goes stale.
+"""
+
+import atexit
+import functools
+import importlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from foton_system.modules.shared.domain.exceptions import OperationCancelledError
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.shared.infrastructure.services.path_manager import PathManager
+
+logger = setup_logger()
+
+DB_FILENAME = "jobs.sqlite"
+DEFAULT_WORKERS = 2
+POLL_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 5.0
+STALE_AFTER = 60.0
+PROGRESS_INTERVAL = 0.5
+MAX_ATTEMPTS = 3
+
+QUEUED, RUNNING, SUCCESS, ERROR, CANCELLED = "QUEUED", "RUNNING", "SUCCESS", "ERROR", "CANCELLED"
+FINISHED = (SUCCESS, ERROR, CANCELLED)
+INTERRUPTED = "Interrompida (operação não idempotente; verifique o resultado e reenvie)"
+
+# Ops that can run as jobs: name -> (module, class)
+JOB_OPS = {
+    "indexar_conhecimento": ("foton_system.core.ops.op_index_knowledge", "OpIndexKnowledge"),
+    "gerar_documento": ("foton_system.core.ops.op_doc_gen", "OpGenerateDocument"),
+    "gerar_documentos_lote": ("foton_system.core.ops.op_doc_batch", "OpBatchGenerateDocuments"),
+    "registrar_financeiro_lote": ("foton_system.core.ops.op_finance_batch", "OpFinanceBatchEntry"),
+    "analise_financeira": ("foton_system.core.ops.op_finance_analytics", "OpFinanceAnalytics"),
+    "manutencao": ("foton_system.core.ops.op_maintenance", "OpMaintenance"),
+    "lote_operacoes": ("foton_system.core.ops.op_batch", "OpBatch"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    op TEXT NOT NULL,
+    kwargs TEXT NOT NULL,
+    client_id TEXT,
+    actor TEXT,
+    status TEXT NOT NULL,
+    done INTEGER,
+    total INTEGER,
+    message TEXT,
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    heartbeat REAL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+"""
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+class JobQueue:
+    """SQLite-backed job queue with in-process worker threads (see module docstring)."""
+
+    _instance: Optional["JobQueue"] = None
+
+    def __init__(self, db_path: Optional[Path] = None, workers: int = DEFAULT_WORKERS,
+                 registry: Optional[Dict[str, tuple]] = None):
+        self.db_path = Path(db_path) if db_path else PathManager.get_app_data_dir() / DB_FILENAME
+        self.workers = workers
+        self.registry = dict(registry or JOB_OPS)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._active: Dict[str, threading.Thread] = {}
+        self._last_progress: Dict[str, float] = {}
+        self._atexit = False
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def instance(cls) -> "JobQueue":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        if cls._instance is not None:
+            cls._instance.stop()
+        cls._instance = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # --- Client API --------------------------------------------------------
+
+    def submit(self, op: str, kwargs: Optional[Dict[str, Any]] = None, client_id: Optional[str] = None,
+               actor: str = "System", start: bool = True) -> str:
+        """Queues `op` (a JOB_OPS name) with `kwargs`. Returns the job id."""
+        if op not in self.registry:
+            raise ValueError(f"Operation must be one of: {', '.join(sorted(self.registry))}.")
+        try:
+            payload = json.dumps(kwargs or {}, ensure_ascii=False)
+        except TypeError as e:
+            raise ValueError(f"Parameters must be JSON serializable: {e}")
+
+        job_id = uuid.uuid4().hex[:12]
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, op, kwargs, client_id, actor, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, op, payload, client_id, actor, QUEUED, _now()),
+            )
+        if start:
+            self.start()
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent jobs first."""
+        query, params = "SELECT * FROM jobs", []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status.upper())
+        query += " ORDER BY rowid DESC LIMIT ?"
+        params.append(int(limit))
+        with closing(self._connect()) as conn:
+            return [self._to_dict(r) for r in conn.execute(query, params)]
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """Cancels a job. Returns its status afterwards (None if unknown)."""
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status = ?",
+                         (CANCELLED, _now(), job_id, QUEUED))
+            conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?", (job_id, RUNNING))
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        event = self._cancel_events.get(job_id)
+        if event is not None:
+            event.set()
+        return row['status'] if row else None
+
+    def stats(self) -> Dict[str, int]:
+        with closing(self._connect()) as conn:
+            counts = {r['status']: r['n'] for r in
+                      conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")}
+        counts['workers'] = sum(t.is_alive() for t in self._threads if t.name.startswith("foton-job-worker"))
+        return counts
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for key in ("kwargs", "result"):
+            if job.get(key):
+                try:
+                    job[key] = json.loads(job[key])
+                except json.JSONDecodeError:
+                    pass
+        job['cancel_requested'] = bool(job['cancel_requested'])
+        return job
+
+    # --- Workers -----------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self) -> None:
+        """Starts the worker and heartbeat threads (idempotent); resumes jobs left by a dead owner."""
+        with self._lock:
+            if self.running or self.workers <= 0:
+                return
+            self._stop.clear()
+            self.recover()
+            self._threads = [
+                threading.Thread(target=self._worker_loop, name=f"foton-job-worker-{n}", daemon=True)
+                for n in range(self.workers)
+            ]
+            self._threads.append(threading.Thread(target=self._heartbeat_loop, name="foton-job-heartbeat",
+                                                  daemon=True))
+            for thread in self._threads:
+                thread.start()
+            if not self._atexit:
+                self._atexit = True
+                atexit.register(self.stop)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stops the threads. Jobs they let go of are handed back to the queue."""
+        self._stop.set()
+        self._wakeup.set()
+        for event in list(self._cancel_events.values()):
+            event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._release_owned()
+
+    def run_pending(self, max_jobs: Optional[int] = None) -> int:
+        """Runs queued jobs on the calling thread (CLI, tests). Returns how many ran."""
+        ran = 0
+        while max_jobs is None or ran < max_jobs:
+            job = self._claim()
+            if job is None:
+                break
+            self._run(job)
+            ran += 1
+        return ran
+
+    def recover(self) -> int:
+        """Re-queues RUNNING jobs of retryable ops whose owner stopped heartbeating;
+        fails the others, and any job past MAX_ATTEMPTS."""
+        cutoff = time.time() - STALE_AFTER
+        with closing(self._connect()) as conn:
+            stale = [r['op'] for r in conn.execute("SELECT DISTINCT op FROM jobs WHERE status = ? AND heartbeat < ?",
+                                                   (RUNNING, cutoff))]
+            if not stale:
+                return 0
+            retry = [op for op in stale if self._retryable(op)]
+            marks = ", ".join("?" * len(retry))
+            failed = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ?, owner = NULL "
+                "WHERE status = ? AND heartbeat < ? AND attempts >= ?",
+                (ERROR, "Interrompido (tentativas esgotadas)", _now(), RUNNING, cutoff, MAX_ATTEMPTS),
+            ).rowcount
+            failed += conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ?, owner = NULL "
+                f"WHERE status = ? AND heartbeat < ? AND op NOT IN ({marks})",
+                (ERROR, INTERRUPTED, _now(), RUNNING, cutoff, *retry),
+            ).rowcount
+            requeued = conn.execute(
+                f"UPDATE jobs SET status = ?, owner = NULL WHERE status = ? AND heartbeat < ? AND op IN ({marks})",
+                (QUEUED, RUNNING, cutoff, *retry),
+            ).rowcount
+        if requeued or failed:
+            logger.warning(f"Fila de tarefas: {requeued} tarefa(s) retomada(s), {failed} com falha")
+        return requeued
+
+    def _release_owned(self) -> None:
+        """Re-queues this owner's RUNNING jobs, except those a live thread is still executing."""
+        busy = [job_id for job_id, thread in list(self._active.items()) if thread.is_alive()]
+        if busy:
+            logger.warning(f"Fila de tarefas: {len(busy)} tarefa(s) ainda em execução após o stop; "
+                           f"ficam RUNNING até concluírem ou o heartbeat expirar")
+        marks = ", ".join("?" * len(busy))
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE jobs SET status = ?, owner = NULL, attempts = MAX(attempts - 1, 0) "
+                         f"WHERE status = ? AND owner = ? AND id NOT IN ({marks})",
+                         (QUEUED, RUNNING, self.owner, *busy))
+
+    def _op_class(self, op: str):
+        module, cls_name = self.registry[op]
+        return getattr(importlib.import_module(module), cls_name)
+
+    def _retryable(self, op: str) -> bool:
+        try:
+            return bool(self._op_class(op).retryable)
+        except (KeyError, ImportError, AttributeError):
+            return False
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT * FROM jobs WHERE status = ? ORDER BY rowid LIMIT 1",
+                                   (QUEUED,)).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, owner = ?, heartbeat = ?, started_at = ?, "
+                        "attempts = attempts + 1 WHERE id = ?",
+                        (RUNNING, self.owner, time.time(), _now(), row['id']),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return row
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                job = self._claim()
+            except sqlite3.Error as e:
+                logger.error(f"Fila de tarefas: erro ao buscar tarefa: {e}")
+                job = None
+            if job is None:
+                self._wakeup.wait(POLL_INTERVAL)
+                self._wakeup.clear()
+                continue
+            self._run(job)
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                with closing(self._connect()) as conn:
+                    conn.execute("UPDATE jobs SET heartbeat = ? WHERE status = ? AND owner = ?",
+                                 (time.time(), RUNNING, self.owner))
+                    # Cancellations requested from another process
+                    for row in conn.execute("SELECT id FROM jobs WHERE owner = ? AND status = ? "
+                                            "AND cancel_requested = 1", (self.owner, RUNNING)):
+                        event = self._cancel_events.get(row['id'])
+                        if event is not None:
+                            event.set()
+                self.recover()
+            except sqlite3.Error as e:
+                logger.error(f"Fila de tarefas: erro no heartbeat: {e}")
+
+    def _run(self, job: sqlite3.Row) -> None:
+        job_id = job['id']
+        if job['cancel_requested']:
+            self._finish(job_id, CANCELLED)
+            return
+        event = self._cancel_events[job_id] = threading.Event()
+        self._active[job_id] = threading.current_thread()
+        try:
+            op = self._op_class(job['op'])(actor=job['actor'] or "System")
+            op.cancel_event = event
+            op.progress_callback = functools.partial(self._progress, job_id)
+            result = op.execute(client_id=job['client_id'], **json.loads(job['kwargs']))
+            self._finish(job_id, SUCCESS, result=json.dumps(result, ensure_ascii=False, default=str))
+        except OperationCancelledError:
+            if self._stop.is_set() and not self._cancel_requested(job_id):
+                if not op.retryable:
+                    self._finish(job_id, ERROR, error=INTERRUPTED)
+                return  # shutting down: stop() hands the job back to the queue
+            self._finish(job_id, CANCELLED)
+        except Exception as e:
+            logger.error(f"Tarefa {job_id} ({job['op']}) falhou: {e}")
+            self._finish(job_id, ERROR, error=str(e))
+        finally:
+            self._cancel_events.pop(job_id, None)
+            self._active.pop(job_id, None)
+            self._last_progress.pop(job_id, None)
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row['cancel_requested'])
+
+    def _progress(self, job_id: str, done: int, total: Optional[int] = None, message: str = "") -> None:
+        now = time.monotonic()
+        if total is None or done < total:
+            if now - self._last_progress.get(job_id, 0.0) < PROGRESS_INTERVAL:
+                return
+        self._last_progress[job_id] = now
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE jobs SET done = ?, total = ?, message = ?, heartbeat = ? WHERE id = ?",
+                         (done, total, message, time.time(), job_id))
+
+    def _finish(self, job_id: str, status: str, result: Optional[str] = None, error: Optional[str] = None):
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, owner = NULL WHERE id = ?",
+                (status, result, error, _now(), job_id),
+            )
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Background Job Queue.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    submit_p = sub.add_parser("submit", help="Queue an operation")
+    submit_p.add_argument("op", choices=sorted(JOB_OPS))
+    submit_p.add_argument("--params", default="{}", help="JSON object with the op parameters")
+    submit_p.add_argument("--client", help="Client id for the audit trail")
+    sub.add_parser("list", help="Recent jobs")
+    status_p = sub.add_parser("status", help="Show one job")
+    status_p.add_argument("job_id")
+    cancel_p = sub.add_parser("cancel", help="Cancel a job")
+    cancel_p.add_argument("job_id")
+    work_p = sub.add_parser("work", help="Run worker threads until interrupted")
+    work_p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+
+    args = parser.parse_args()
+
+    try:
+        queue = JobQueue(workers=getattr(args, "workers", DEFAULT_WORKERS))
+        if args.command == "submit":
+            job_id = queue.submit(args.op, json.loads(args.params), client_id=args.client,
+                                  actor="CLI_User", start=False)
+            print(f"SUCCESS: job {job_id} queued")
+        elif args.command == "list":
+            for job in queue.list():
+                print(f"  {job['id']} {job['op']:28s} {job['status']:9s} {job['created_at']}")
+        elif args.command == "status":
+            job = queue.get(args.job_id)
+            if job is None:
+                raise ValueError(f"Job not found: {args.job_id}")
+            print(json.dumps(job, ensure_ascii=False, indent=2, default=str))
+        elif args.command == "cancel":
+            print(f"SUCCESS: {args.job_id} -> {queue.cancel(args.job_id)}")
+        else:
+            queue.start()
+            print(f"Working ({queue.workers} worker(s)) on {queue.db_path}. Ctrl+C to stop.")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                queue.stop()
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
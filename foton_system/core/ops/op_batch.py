@@ -0,0 +1,240 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+import functools
+import importlib
+import json
+import os
+import time
+import traceback
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.modules.shared.domain.exceptions import OperationCancelledError
+from foton_system.modules.shared.infrastructure.services import tracing
+from foton_system.modules.shared.infrastructure.services.process_pool import pool_context
+
+MAX_ITEMS = 1000
+MAX_WORKERS = 8
+
+# Ops that can be batched by name (CLI, job queue): name -> (module, class)
+BATCH_OPS = {
+    "OpCreateClient": ("foton_system.core.ops.op_create_client", "OpCreateClient"),
+    "OpFinanceEntry": ("foton_system.core.ops.op_finance_entry", "OpFinanceEntry"),
+    "OpGenerateDocument": ("foton_system.core.ops.op_doc_gen", "OpGenerateDocument"),
+}
+
+# --- Item execution (also runs inside pool processes) ---------------------------
+
+_worker_op: Optional[BaseOp] = None
+
+
+def _init_worker(op_cls, actor: str):
+    """Pool initializer: one op instance (and its shared services) per process."""
+    global _worker_op
+    _worker_op = op_cls(actor=actor)
+
+
+def _run_item(op: BaseOp, data: Dict[str, Any], parent=None) -> Tuple[str, Dict[str, Any], float, Optional[list]]:
+    """Runs execute_logic for one validated item -> (status, result, duration_ms, spans)."""
+    started = time.perf_counter()
+    with tracing.span(op.op_name, parent=parent) as item_span:
+        try:
+            result, status = op.execute_logic(data), "SUCCESS"
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            result, status = {"error": str(e), "traceback": traceback.format_exc()}, "ERROR"
+    return status, result, round((time.perf_counter() - started) * 1000, 3), item_span.summary()
+
+
+def _worker_run(data: Dict[str, Any]):
+    return _run_item(_worker_op, data)
+
+
+class OpBatch(BaseOp):
+    """
+    Runs one Op over many inputs (client import, bank statement, mailing).
+    All items are validated up front (nothing runs if any is invalid); then
+    execute_logic runs on a bounded thread pool sharing one set of service
+    instances (or a process pool, one op per process). Item failures are
+    collected, not raised. Each item gets its own audit event, plus one
+    aggregated OpBatch event.
+    """
+
+    def __init__(self, op_cls=None, actor: str = "System", workers: Optional[int] = None,
+                 processes: bool = False):
+        super().__init__(actor=actor)
+        self.op_cls = op_cls
+        self.workers = workers
+        self.processes = processes
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        """
+        Requires:
+        - items (list or JSON str): one kwargs dict per item, as for the op's execute()
+        - op (str), unless an op class was given: one of BATCH_OPS
+        Optional:
+        - workers (int), processes (bool): override the constructor values
+        """
+        op_cls = self.op_cls or self._resolve_op(kwargs.get("op"))
+
+        items = kwargs.get("items") or []
+        if isinstance(items, str):
+            try:
+                items = json.loads(items)
+            except (json.JSONDecodeError, TypeError):
+                raise ValueError("items must be a JSON list.")
+        if not isinstance(items, list) or not items:
+            raise ValueError("Provide at least one item.")
+        if len(items) > MAX_ITEMS:
+            raise ValueError(f"At most {MAX_ITEMS} items per batch.")
+
+        probe = op_cls(actor=self.actor)
+        validated, errors = [], []
+        for i, raw in enumerate(items, 1):
+            try:
+                if not isinstance(raw, dict):
+                    raise ValueError("item must be an object")
+                validated.append((raw, probe.validate(**dict(raw))))
+            except ValueError as e:
+                errors.append(f"#{i}: {e}")
+        if errors:
+            raise ValueError("Invalid items — " + "; ".join(errors))
+
+        processes = bool(kwargs.get("processes", self.processes))
+        workers = kwargs.get("workers", self.workers)
+        if workers is None:
+            workers = min(os.cpu_count() or 1, MAX_WORKERS) if processes else MAX_WORKERS
+        try:
+            workers = int(workers)
+        except (TypeError, ValueError):
+            raise ValueError("workers must be an integer.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        workers = min(workers, len(validated), op_cls.max_batch_workers or workers)
+
+        return {"op_cls": op_cls, "items": validated, "workers": workers, "processes": processes}
+
+    @staticmethod
+    def _resolve_op(name):
+        if name not in BATCH_OPS:
+            raise ValueError(f"op must be one of: {', '.join(sorted(BATCH_OPS))}.")
+        module, cls_name = BATCH_OPS[name]
+        return getattr(importlib.import_module(module), cls_name)
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        op_cls = validated_data["op_cls"]
+        items = validated_data["items"]
+        workers = validated_data["workers"]
+        total = len(items)
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * total
+
+        # Thread / inline mode: one op instance for every item, services built once
+        item_op = op_cls(actor=self.actor)
+        item_op.shared = self.shared
+        item_op.cancel_event = self.cancel_event
+        parent = tracing.current_span()
+
+        def record(done: int, i: int, status: str, result: Dict[str, Any], duration_ms, spans):
+            raw, data = items[i]
+            self.audit_logger.log_event(
+                op_name=item_op.op_name,
+                actor=self.actor,
+                client_id=data.get("client_name", "UNKNOWN"),
+                payload=raw,
+                result=result,
+                status=status,
+                duration_ms=duration_ms,
+                spans=spans,
+            )
+            outcome = {"index": i, "status": status}
+            if status == "SUCCESS":
+                outcome["result"] = result
+            else:
+                outcome["error"] = result.get("error")
+            outcomes[i] = outcome
+            self.report_progress(done, total, "itens")
+
+        if workers <= 1:
+            mode = "inline"
+            for done, (i, (_, data)) in enumerate(enumerate(items), 1):
+                record(done, i, *_run_item(item_op, data, parent))
+        else:
+            mode = "process" if validated_data["processes"] else "thread"
+            if mode == "process":
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(op_cls, self.actor),
+                                           mp_context=pool_context())
+                run = _worker_run
+            else:
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="foton-opbatch")
+                run = functools.partial(_run_item, item_op, parent=parent)
+            with pool:
+                futures = {pool.submit(run, data): i for i, (_, data) in enumerate(items)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    try:
+                        try:
+                            outcome = future.result()
+                        except OperationCancelledError:
+                            raise
+                        except Exception as e:  # worker crashed (BrokenProcessPool, pickling, ...)
+                            outcome = ("ERROR", {"error": f"Falha no worker: {e}"}, None, None)
+                        record(done, i, *outcome)
+                    except BaseException:
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        raise
+
+        succeeded = sum(1 for o in outcomes if o["status"] == "SUCCESS")
+        failed = total - succeeded
+        status = "COMPLETED" if not failed else ("FAILED" if not succeeded else "PARTIAL")
+        return {
+            "status": status,
+            "op": item_op.op_name,
+            "total": total,
+            "succeeded": succeeded,
+            "failed": failed,
+            "workers": workers,
+            "mode": mode,
+            "items": outcomes,
+            "message": f"{item_op.op_name}: {succeeded}/{total} itens concluídos ({failed} com erro)"
+        }
+
+    def audit_record(self, payload: Dict[str, Any], result: Dict[str, Any]):
+        """Aggregated event: item count and failures only (each item has its own event)."""
+        items = payload.get("items")
+        summary_payload = dict(payload, items=len(items) if isinstance(items, list) else items)
+        if self.op_cls is not None:
+            summary_payload.setdefault("op", self.op_cls.__name__)
+        if "items" in result:
+            outcomes = result["items"]
+            result = {k: v for k, v in result.items() if k != "items"}
+            result["errors"] = {o["index"]: o["error"] for o in outcomes if o["status"] != "SUCCESS"}
+        return summary_payload, result
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Run an Op over many inputs (POP).")
+    parser.add_argument("--op", required=True, choices=sorted(BATCH_OPS), help="Op to run")
+    parser.add_argument("--items", required=True,
+                        help='JSON list of op kwargs, e.g. \'[{"name": "Maria Silva"}]\' or @file.json')
+    parser.add_argument("--workers", type=int, help="Max parallel items")
+    parser.add_argument("--processes", action="store_true", help="Use a process pool instead of threads")
+
+    args = parser.parse_args()
+
+    try:
+        raw_items = args.items
+        if raw_items.startswith("@"):
+            with open(raw_items[1:], "r", encoding="utf-8") as f:
+                raw_items = f.read()
+        op = OpBatch(actor="CLI_User", workers=args.workers, processes=args.processes)
+        result = op.execute(client_id="BATCH", op=args.op, items=raw_items)
+        print(f"SUCCESS: {result['message']}")
+        for item in result["items"]:
+            if item["status"] != "SUCCESS":
+                print(f"  #{item['index'] + 1}: {item['error']}")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
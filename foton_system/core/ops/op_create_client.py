@@ -10,6 +10,9 @@ class OpCreateClient(BaseOp):
     Standard Operation to create a new client.
     Enforces folder structure and registers in the master database.
     """
+
+    # Each creation rewrites the Excel database: batch items must run one at a time
+    max_batch_workers = 1
     
     def validate(self, **kwargs) -> Dict[str, Any]:
         """
@@ -30,8 +33,7 @@ class OpCreateClient(BaseOp):
         Executes the client creation logic.
         """
         # 1. Setup Service (Ideally dependency injection, but for POP we keep it contained)
-        repo = ExcelClientRepository()
-        service = ClientService(repo)
+        service = self.get_service("clients", lambda: ClientService(ExcelClientRepository()))
         
         name = validated_data["name"]
         alias = validated_data.get("alias")
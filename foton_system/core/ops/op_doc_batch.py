@@ -0,0 +1,128 @@
+from typing import Dict, Any
+from datetime import datetime
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.core.ops.op_doc_gen import resolve_template_path
+from foton_system.modules.documents.application.use_cases.batch_generation import (
+    resolve_batch_targets, run_batch,
+)
+from foton_system.modules.shared.infrastructure.config.config import Config
+from foton_system.modules.shared.infrastructure.services.path_manager import PathManager
+import json
+
+
+class OpBatchGenerateDocuments(BaseOp):
+    """
+    Standard Operation to generate one template for many clients/services.
+    Targets are rendered in parallel worker processes sharing the compiled
+    template; the per-item manifest is saved in the app data dir.
+    """
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        """
+        Requires:
+        - template_name (str)
+        - clients (list or comma-separated str) and/or filter (str)
+        Optional:
+        - service (str), extra_data (dict), workers (int), dry_run (bool)
+        """
+        if not kwargs.get("template_name"):
+            raise ValueError("Template Name is required.")
+
+        clients = kwargs.get("clients") or []
+        if isinstance(clients, str):
+            clients = [c.strip() for c in clients.split(",") if c.strip()]
+        kwargs["clients"] = list(clients)
+        kwargs["filter"] = (kwargs.get("filter") or "").strip()
+        if not kwargs["clients"] and not kwargs["filter"]:
+            raise ValueError("Provide 'clients' and/or 'filter'.")
+
+        kwargs["extra_data"] = kwargs.get("extra_data") or {}
+        if isinstance(kwargs["extra_data"], str):
+            try:
+                kwargs["extra_data"] = json.loads(kwargs["extra_data"])
+            except (json.JSONDecodeError, TypeError):
+                raise ValueError("extra_data must be a JSON object.")
+
+        workers = kwargs.get("workers")
+        kwargs["workers"] = int(workers) if workers else None
+        kwargs["dry_run"] = bool(kwargs.get("dry_run", False))
+        return kwargs
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        config = Config()
+        template_path = resolve_template_path(validated_data["template_name"], config.templates_path)
+
+        targets = resolve_batch_targets(
+            config,
+            names=validated_data["clients"],
+            filtro=validated_data["filter"],
+            service=validated_data.get("service") or "",
+        )
+        if not targets:
+            raise ValueError("No clients matched the batch selection.")
+
+        manifest = run_batch(
+            template_path,
+            targets,
+            extra_data=validated_data["extra_data"],
+            workers=validated_data["workers"],
+            dry_run=validated_data["dry_run"],
+            config=config,
+            on_progress=lambda done, total: self.report_progress(done, total, "documentos"),
+        )
+
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        manifest_path = manifest.save(
+            PathManager.get_app_data_dir() / "lotes" / f"lote_{stamp}_{template_path.stem}.json"
+        )
+
+        return {
+            "status": "PLANNED" if validated_data["dry_run"] else "GENERATED",
+            "template": template_path.name,
+            "summary": manifest.summary(),
+            "elapsed": round(manifest.elapsed, 3),
+            "workers": manifest.workers,
+            "manifest_path": str(manifest_path),
+            "items": manifest.to_dict()["items"],
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+    import multiprocessing
+    import sys
+
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(description="Batch Document Generation (POP).")
+    parser.add_argument("--template", required=True, help="Template Filename")
+    parser.add_argument("--clients", default="", help="Comma-separated client names (or cliente/servico)")
+    parser.add_argument("--filter", default="", help="Glob or substring over client folder names")
+    parser.add_argument("--service", default="", help="Service subfolder to target in every client")
+    parser.add_argument("--data", help="JSON string of extra data (applied to every item)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count, max 8)")
+    parser.add_argument("--dry-run", action="store_true", help="Only resolve targets and write the manifest")
+
+    args = parser.parse_args()
+
+    try:
+        op = OpBatchGenerateDocuments(actor="CLI_User")
+        result = op.execute(
+            client_id="BATCH",
+            template_name=args.template,
+            clients=args.clients,
+            filter=args.filter,
+            service=args.service,
+            extra_data=args.data,
+            workers=args.workers,
+            dry_run=args.dry_run,
+        )
+        summary = result["summary"]
+        for item in result["items"]:
+            detail = item["output_path"] if item["status"] != "ERROR" else item["error"]
+            print(f"  [{item['status']}] {item['target']}: {detail}")
+        print(f"SUCCESS: {summary['gerados']} generated, {summary['erros']} errors "
+              f"in {result['elapsed']}s. Manifest: {result['manifest_path']}")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
@@ -5,9 +5,29 @@ from foton_system.modules.documents.application.use_cases.document_service impor
 from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
 from foton_system.modules.documents.infrastructure.adapters.python_pptx_adapter import PythonPPTXAdapter
 from foton_system.modules.shared.infrastructure.config.config import Config
+from foton_system.modules.clients.application.use_cases.client_query import resolve_client_path
 from foton_system.modules.shared.infrastructure.bootstrap.bootstrap_service import BootstrapService
+from foton_system.modules.shared.infrastructure.services import tracing
 import json
 
+def resolve_template_path(template_name: str, template_dir: Path) -> Path:
+    """Template file in `template_dir`, trying .docx/.pptx when no extension is given."""
+    template_path = template_dir / template_name
+
+    if not template_path.exists():
+         # Try appending extension if missing
+         if not template_name.endswith(('.docx', '.pptx')):
+             # Check both
+             if (template_dir / f"{template_name}.docx").exists():
+                 template_path = template_dir / f"{template_name}.docx"
+             elif (template_dir / f"{template_name}.pptx").exists():
+                 template_path = template_dir / f"{template_name}.pptx"
+
+    if not template_path.exists():
+         raise FileNotFoundError(f"Template '{template_name}' not found in {template_dir}")
+    return template_path
+
+
 class OpGenerateDocument(BaseOp):
     """
     Standard Operation to generate a document from a template.
@@ -38,69 +58,38 @@ class OpGenerateDocument(BaseOp):
         return kwargs
 
     def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
-        # 1. Setup Services
-        docx_adapter = PythonDocxAdapter()
-        pptx_adapter = PythonPPTXAdapter()
-        service = DocumentService(docx_adapter, pptx_adapter)
+        # 1. Setup Services (shared across items when run through OpBatch)
+        service = self.get_service(
+            "documents", lambda: DocumentService(PythonDocxAdapter(), PythonPPTXAdapter())
+        )
         
-        # 2. Resolve Client Path
-        # Logic duplicated from MCP/Install service - ideally moved to a helper
+        # 2. Resolve Client Path (shared ranked index)
         client_name = validated_data["client_name"]
-        base = Config().base_pasta_clientes
-        # Simple resolution for now
-        client_path = base / client_name
-        
-        # If folder doesn't exist, try finding it by partial match or just accept it might fail in service
-        if not client_path.exists():
-             # Basic search strategy
-             for p in base.iterdir():
-                 if p.is_dir() and client_name.lower() in p.name.lower():
-                     client_path = p
-                     break
-        
-        if not client_path.exists():
-            raise FileNotFoundError(f"Client folder for '{client_name}' not found.")
+        config = Config()
+        ignored = set(config.ignored_folders + ['.obsidian'])
+        with tracing.span("resolve_client"):
+            try:
+                client_path = resolve_client_path(client_name, config.base_pasta_clientes, ignored)
+            except ValueError as e:
+                raise FileNotFoundError(f"Client folder for '{client_name}' not found: {e}")
 
         # 3. Resolve Template
-        template_name = validated_data["template_name"]
-        template_dir = Config().templates_path
-        template_path = template_dir / template_name
-        
-        if not template_path.exists():
-             # Try appending extension if missing
-             if not template_name.endswith(('.docx', '.pptx')):
-                 # Check both
-                 if (template_dir / f"{template_name}.docx").exists():
-                     template_path = template_dir / f"{template_name}.docx"
-                 elif (template_dir / f"{template_name}.pptx").exists():
-                     template_path = template_dir / f"{template_name}.pptx"
-                     
-        if not template_path.exists():
-             raise FileNotFoundError(f"Template '{template_name}' not found in {template_dir}")
+        with tracing.span("resolve_template"):
+            template_path = resolve_template_path(validated_data["template_name"], Config().templates_path)
 
-        # 4. Prepare Data
-        # We need to temporarily write JSON for the legacy service to read
-        # TODO: Refactor Service to accept Dict directly to avoid IO
-        temp_data_file = client_path / "temp_pop_data.json"
-        with open(temp_data_file, 'w', encoding='utf-8') as f:
-            json.dump(validated_data["extra_data"], f)
-
-        # 5. Generate
+        # 4. Generate (data in memory; INFO context from the client folder)
         output_name = f"GERADO_{template_path.name}"
         output_path = client_path / output_name
         
         doc_type = "pptx" if template_path.suffix == ".pptx" else "docx"
         
-        try:
-            service.generate_document(
-                template_path=str(template_path),
-                data_path=str(temp_data_file),
-                output_path=str(output_path),
-                doc_type=doc_type
-            )
-        finally:
-            if temp_data_file.exists():
-                temp_data_file.unlink()
+        service.generate_document(
+            template_path=str(template_path),
+            output_path=str(output_path),
+            doc_type=doc_type,
+            data=validated_data["extra_data"] if isinstance(validated_data["extra_data"], dict) else {},
+            context_dir=client_path,
+        )
 
         return {
             "status": "GENERATED",
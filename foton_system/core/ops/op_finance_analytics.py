@@ -0,0 +1,126 @@
+from typing import Dict, Any
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.modules.finance.domain.services import ledger_analytics
+from foton_system.modules.finance.infrastructure.repositories.firm_ledger_store import (
+    FirmLedgerStore, firm_ledger_paths, parse_ledger_date,
+)
+from foton_system.modules.shared.infrastructure.config.config import Config
+
+ANALYSES = ("fluxo", "saldo", "aging", "anual")
+METRIC_ALIASES = {"receita": "income", "despesa": "expense", "saldo": "net"}
+
+
+def _records(frame):
+    """DataFrame -> list of JSON-friendly dicts (a named index becomes the first column)."""
+    if frame.index.name is not None:
+        frame = frame.reset_index()
+    for column in frame.columns:
+        if str(frame[column].dtype).startswith(('period', 'category')):
+            frame[column] = frame[column].astype(str)
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+class OpFinanceAnalytics(BaseOp):
+    """
+    Standard Operation for firm-wide financial analytics.
+    Entries come from the consolidated firm ledger (synced first) and are
+    analysed with vectorized pandas operations.
+    """
+
+    # Read-only (the ledger sync is incremental): an interrupted run can start over
+    retryable = True
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        """
+        Requires:
+        - analysis (str): 'fluxo', 'saldo', 'aging' or 'anual'
+        Optional:
+        - period (str): 'mensal', 'trimestral' or 'anual' (default mensal)
+        - start / end (str), client (str), window (int), as_of (str)
+        - metric (str): 'receita', 'despesa' or 'saldo' (anual)
+        """
+        analysis = (kwargs.get("analysis") or "fluxo").lower()
+        if analysis not in ANALYSES:
+            raise ValueError(f"Analysis must be one of: {', '.join(ANALYSES)}.")
+        kwargs["analysis"] = analysis
+        kwargs["freq"] = ledger_analytics.period_alias(kwargs.get("period") or "mensal")
+
+        for key in ("start", "end", "as_of"):
+            raw = kwargs.get(key)
+            kwargs[key] = parse_ledger_date(raw) if raw else None
+            if raw and kwargs[key] is None:
+                raise ValueError(f"Invalid date for '{key}': {raw}")
+
+        metric = (kwargs.get("metric") or "receita").lower()
+        if metric not in METRIC_ALIASES:
+            raise ValueError(f"Metric must be one of: {', '.join(METRIC_ALIASES)}.")
+        kwargs["metric"] = METRIC_ALIASES[metric]
+
+        try:
+            kwargs["window"] = max(1, int(kwargs.get("window") or 3))
+        except (TypeError, ValueError):
+            raise ValueError("Invalid number for 'window'.")
+        kwargs["client"] = kwargs.get("client") or None
+        return kwargs
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        store = FirmLedgerStore.instance()
+        store.sync(firm_ledger_paths(Config()))
+        analysis, freq = validated_data["analysis"], validated_data["freq"]
+        # Aging settles expenses against every earlier receipt, so it ignores 'start'.
+        start = None if analysis == "aging" else validated_data["start"]
+        df = ledger_analytics.prepare(store.frame(start, validated_data["end"], validated_data["client"]))
+
+        if analysis == "fluxo":
+            frame = ledger_analytics.cash_flow(df, freq)
+        elif analysis == "saldo":
+            frame = ledger_analytics.rolling_balance(df, freq, validated_data["window"])
+        elif analysis == "aging":
+            frame = ledger_analytics.receivables_aging(df, as_of=validated_data["as_of"])
+        else:
+            frame = ledger_analytics.year_over_year(df, validated_data["metric"], freq)
+
+        return {
+            "status": "OK",
+            "analysis": analysis,
+            "freq": freq,
+            "entries": len(df),
+            "rows": _records(frame),
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Firm Financial Analytics (POP).")
+    parser.add_argument("--analysis", default="fluxo", choices=ANALYSES, help="Analysis to run")
+    parser.add_argument("--period", default="mensal", help="mensal, trimestral or anual")
+    parser.add_argument("--start", help="Start date (YYYY-MM-DD or DD/MM/YYYY)")
+    parser.add_argument("--end", help="End date (inclusive)")
+    parser.add_argument("--client", help="Client folder name")
+    parser.add_argument("--window", type=int, default=3, help="Rolling window in periods (saldo)")
+    parser.add_argument("--as-of", help="Reference date for aging (default: today)")
+    parser.add_argument("--metric", default="receita", choices=list(METRIC_ALIASES), help="Metric (anual)")
+
+    args = parser.parse_args()
+
+    try:
+        op = OpFinanceAnalytics(actor="CLI_User")
+        result = op.execute(
+            client_id=args.client or "FIRM",
+            analysis=args.analysis,
+            period=args.period,
+            start=args.start,
+            end=args.end,
+            client=args.client,
+            window=args.window,
+            as_of=args.as_of,
+            metric=args.metric,
+        )
+        for row in result["rows"]:
+            print("  " + " | ".join(f"{k}: {v:.2f}" if isinstance(v, float) else f"{k}: {v}" for k, v in row.items()))
+        print(f"SUCCESS: {len(result['rows'])} rows from {result['entries']} entries")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
@@ -0,0 +1,125 @@
+from typing import Dict, Any
+import json
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.core.ops.op_finance_entry import resolve_client_folder
+from foton_system.modules.finance.application.use_cases.finance_service import FinanceService
+from foton_system.modules.finance.infrastructure.repositories.csv_finance_repository import CSVFinanceRepository
+from foton_system.modules.finance.infrastructure.repositories.firm_ledger_store import parse_ledger_date
+from foton_system.modules.shared.infrastructure.config.config import Config
+
+MAX_BATCH = 500
+
+
+class OpFinanceBatchEntry(BaseOp):
+    """
+    Standard Operation to register many financial entries for one client.
+    All entries are validated first and written in a single locked append
+    (all or nothing), with one audit event for the batch.
+    """
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        """
+        Requires:
+        - client_name (str) OR client_path (str)
+        - entries (list or JSON str): [{description, value, type?, date?}, ...]
+          ('descricao'/'valor'/'tipo'/'data' are accepted too)
+        """
+        client = kwargs.get("client_name") or kwargs.get("client_path")
+        if not client:
+            raise ValueError("Must provide 'client_name' or 'client_path'.")
+
+        entries = kwargs.get("entries") or []
+        if isinstance(entries, str):
+            try:
+                entries = json.loads(entries)
+            except (json.JSONDecodeError, TypeError):
+                raise ValueError("entries must be a JSON list.")
+        if not isinstance(entries, list) or not entries:
+            raise ValueError("Provide at least one entry.")
+        if len(entries) > MAX_BATCH:
+            raise ValueError(f"At most {MAX_BATCH} entries per batch.")
+
+        clean, errors = [], []
+        for i, raw in enumerate(entries, 1):
+            try:
+                clean.append(self._validate_entry(raw))
+            except ValueError as e:
+                errors.append(f"#{i}: {e}")
+        if errors:
+            raise ValueError("Invalid entries — " + "; ".join(errors))
+
+        kwargs["entries"] = clean
+        return kwargs
+
+    @staticmethod
+    def _validate_entry(raw) -> Dict[str, Any]:
+        if not isinstance(raw, dict):
+            raise ValueError("entry must be an object")
+        desc = raw.get("description") or raw.get("descricao")
+        if not desc:
+            raise ValueError("description is required")
+
+        try:
+            value = float(raw.get("value", raw.get("valor", 0)))
+        except (TypeError, ValueError):
+            raise ValueError("invalid number for 'value'")
+        if value <= 0:
+            raise ValueError("value must be positive")
+
+        entry_type = str(raw.get("type") or raw.get("tipo") or "ENTRADA").upper()
+        if entry_type not in ["ENTRADA", "SAIDA"]:
+            raise ValueError("type must be 'ENTRADA' or 'SAIDA'")
+
+        raw_date = raw.get("date") or raw.get("data")
+        date = parse_ledger_date(raw_date) if raw_date else None
+        if raw_date and date is None:
+            raise ValueError(f"invalid date: {raw_date}")
+
+        return {"description": str(desc), "value": value, "type": entry_type, "date": date}
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        client_path = resolve_client_folder(validated_data.get("client_name") or validated_data.get("client_path"))
+
+        # Config-aware repository: ledger in 01_ADM (legacy root file still honoured)
+        service = FinanceService(CSVFinanceRepository(Config()))
+        entries = validated_data["entries"]
+        summary = service.add_entries(client_path, entries)
+
+        total_in = sum(e["value"] for e in entries if e["type"] == "ENTRADA")
+        total_out = sum(e["value"] for e in entries if e["type"] == "SAIDA")
+        return {
+            "status": "REGISTERED",
+            "client": client_path.name,
+            "count": len(entries),
+            "batch_in": total_in,
+            "batch_out": total_out,
+            "new_balance": summary["saldo"],
+            "total_in": summary["total_entradas"],
+            "total_out": summary["total_saidas"],
+            "message": f"{len(entries)} entries registered. New Balance: R$ {summary['saldo']:.2f}"
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Register a Batch of Finance Entries (POP).")
+    parser.add_argument("--client", required=True, help="Client Name or Path")
+    parser.add_argument("--entries", required=True,
+                        help='JSON list, e.g. \'[{"description": "Sinal", "value": 1000, "type": "ENTRADA"}]\' '
+                             'or @file.json')
+
+    args = parser.parse_args()
+
+    try:
+        raw_entries = args.entries
+        if raw_entries.startswith("@"):
+            with open(raw_entries[1:], "r", encoding="utf-8") as f:
+                raw_entries = f.read()
+        op = OpFinanceBatchEntry(actor="CLI_User")
+        result = op.execute(client_id=args.client, client_name=args.client, entries=raw_entries)
+        print(f"SUCCESS: {result['message']}")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
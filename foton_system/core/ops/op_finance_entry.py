@@ -5,6 +5,16 @@ from foton_system.modules.finance.application.use_cases.finance_service import F
 from foton_system.modules.finance.infrastructure.repositories.csv_finance_repository import CSVFinanceRepository
 from foton_system.modules.shared.infrastructure.config.config import Config
 
+def resolve_client_folder(raw_client: str) -> Path:
+    """Client folder from a name (under base_pasta_clientes) or an absolute path."""
+    client_path = Path(raw_client)
+    if not client_path.is_absolute():
+        client_path = Config().base_pasta_clientes / raw_client
+    if not client_path.exists():
+        raise FileNotFoundError(f"Client folder not found: {client_path}")
+    return client_path
+
+
 class OpFinanceEntry(BaseOp):
     """
     Standard Operation to register a financial entry (Income/Expense).
@@ -44,21 +54,10 @@ class OpFinanceEntry(BaseOp):
 
     def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
         # 1. Resolve Client Path
-        # This logic mimics _get_client_path but is self-contained or reuses service
-        raw_client = validated_data.get("client_name") or validated_data.get("client_path")
-        
-        # Try to resolve if it's just a name
-        client_path = Path(raw_client)
-        if not client_path.is_absolute():
-             base = Config().base_pasta_clientes
-             client_path = base / raw_client
-        
-        if not client_path.exists():
-            raise FileNotFoundError(f"Client folder not found: {client_path}")
+        client_path = resolve_client_folder(validated_data.get("client_name") or validated_data.get("client_path"))
 
-        # 2. Setup Service
-        repo = CSVFinanceRepository()
-        service = FinanceService(repo)
+        # 2. Setup Service (shared across items when run through OpBatch)
+        service = self.get_service("finance", lambda: FinanceService(CSVFinanceRepository()))
 
         # 3. Execute
         summary = service.add_entry(
@@ -0,0 +1,122 @@
+from typing import Dict, Any
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.modules.finance.infrastructure.repositories.firm_ledger_store import (
+    FirmLedgerStore, firm_ledger_paths, parse_ledger_date,
+)
+from foton_system.modules.shared.infrastructure.config.config import Config
+
+QUERIES = ("total", "mensal", "clientes")
+
+
+class OpFinanceQuery(BaseOp):
+    """
+    Standard Operation for period queries over the consolidated firm ledger.
+    Syncs the SQLite materialization from the dispersed CSVs (incremental)
+    and answers one aggregate query.
+    """
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        """
+        Requires:
+        - query (str): 'total', 'mensal' or 'clientes'
+        Optional:
+        - start / end (str): dates (YYYY-MM-DD or DD/MM/YYYY), inclusive
+        - type (str): 'ENTRADA' or 'SAIDA'
+        - client (str), min_value (float), limit (int)
+        """
+        query = (kwargs.get("query") or "total").lower()
+        if query not in QUERIES:
+            raise ValueError(f"Query must be one of: {', '.join(QUERIES)}.")
+        kwargs["query"] = query
+
+        for key in ("start", "end"):
+            raw = kwargs.get(key)
+            if raw:
+                parsed = parse_ledger_date(raw)
+                if parsed is None:
+                    raise ValueError(f"Invalid date for '{key}': {raw}")
+                kwargs[key] = parsed
+            else:
+                kwargs[key] = None
+
+        entry_type = (kwargs.get("type") or "").upper() or None
+        if entry_type not in (None, "ENTRADA", "SAIDA"):
+            raise ValueError("Type must be 'ENTRADA' or 'SAIDA'.")
+        kwargs["type"] = entry_type
+
+        try:
+            kwargs["min_value"] = float(kwargs["min_value"]) if kwargs.get("min_value") else None
+            kwargs["limit"] = int(kwargs.get("limit") or 10)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid number for 'min_value' or 'limit'.")
+        kwargs["client"] = kwargs.get("client") or None
+        return kwargs
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        store = FirmLedgerStore.instance()
+        sync = store.sync(firm_ledger_paths(Config()))
+
+        query = validated_data["query"]
+        start, end = validated_data["start"], validated_data["end"]
+        if query == "total":
+            result = store.totals(start, end, client=validated_data["client"],
+                                  tipo=validated_data["type"], min_value=validated_data["min_value"])
+        elif query == "mensal":
+            result = store.monthly(start, end, client=validated_data["client"], tipo=validated_data["type"])
+        else:
+            result = store.top_clients(start, end, tipo=validated_data["type"] or "ENTRADA",
+                                       limit=validated_data["limit"])
+
+        return {
+            "status": "OK",
+            "query": query,
+            "start": start,
+            "end": end,
+            "result": result,
+            "sync": sync,
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Firm Ledger Query (POP).")
+    parser.add_argument("--query", default="total", choices=QUERIES, help="Aggregation")
+    parser.add_argument("--start", help="Start date (YYYY-MM-DD or DD/MM/YYYY)")
+    parser.add_argument("--end", help="End date (inclusive)")
+    parser.add_argument("--type", choices=["ENTRADA", "SAIDA"], help="Entry type filter")
+    parser.add_argument("--client", help="Client folder name (total/mensal)")
+    parser.add_argument("--min-value", type=float, help="Only entries >= this value (total)")
+    parser.add_argument("--limit", type=int, default=10, help="Clients to list (clientes)")
+
+    args = parser.parse_args()
+
+    try:
+        op = OpFinanceQuery(actor="CLI_User")
+        result = op.execute(
+            client_id=args.client or "FIRM",
+            query=args.query,
+            start=args.start,
+            end=args.end,
+            type=args.type,
+            client=args.client,
+            min_value=args.min_value,
+            limit=args.limit,
+        )
+        data = result["result"]
+        if args.query == "total":
+            print(f"SUCCESS: {data['count']} entries | In: {data['income']:.2f} | "
+                  f"Out: {data['expense']:.2f} | Balance: {data['balance']:.2f}")
+        elif args.query == "mensal":
+            for row in data:
+                print(f"  {row['month']}: In {row['income']:.2f} | Out {row['expense']:.2f} | "
+                      f"Balance {row['balance']:.2f}")
+            print(f"SUCCESS: {len(data)} months")
+        else:
+            for row in data:
+                print(f"  {row['name']}: {row['total']:.2f} ({row['count']} entries)")
+            print(f"SUCCESS: {len(data)} clients")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
@@ -10,6 +10,9 @@ class OpIndexKnowledge(BaseOp):
     Standard Operation to index files into the Vector Store ("The Harvester").
     Scans client folders, chunks content, and updates ChromaDB.
     """
+
+    # Re-indexing replaces chunks by id: an interrupted run can start over
+    retryable = True
     
     def validate(self, **kwargs) -> Dict[str, Any]:
         """
@@ -67,7 +70,8 @@ class OpIndexKnowledge(BaseOp):
         ids_to_add = []
         metadatas_to_add = []
         
-        for file_path in files_to_process:
+        for n, file_path in enumerate(files_to_process):
+            self.report_progress(n, len(files_to_process), "arquivos")
             try:
                 # 1. Check Hash to avoid re-indexing
                 # (Simplification: We query by ID=filepath to check metadata hash)
@@ -112,6 +116,7 @@ class OpIndexKnowledge(BaseOp):
             # Add in batches of 100 to avoid memory spikes
             batch_size = 100
             for i in range(0, len(docs_to_add), batch_size):
+                self.report_progress(i, len(docs_to_add), "chunks")
                 store.add_documents(
                     documents=docs_to_add[i:i+batch_size],
                     metadatas=metadatas_to_add[i:i+batch_size],
@@ -0,0 +1,60 @@
+from typing import Dict, Any
+from foton_system.core.ops.base_op import BaseOp
+
+ACTIONS = ("sincronizar_base", "exportar_clientes", "exportar_servicos")
+
+
+class OpMaintenance(BaseOp):
+    """
+    Standard Operation for database maintenance tasks (dashboard sync and
+    INFO exports), so they can be audited and run as background jobs.
+    """
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        """
+        Requires:
+        - action (str): 'sincronizar_base', 'exportar_clientes' or 'exportar_servicos'
+        """
+        action = (kwargs.get("action") or "").strip().lower()
+        if action not in ACTIONS:
+            raise ValueError(f"Action must be one of: {', '.join(ACTIONS)}.")
+        kwargs["action"] = action
+        return kwargs
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        action = validated_data["action"]
+
+        if action == "sincronizar_base":
+            from foton_system.modules.sync.sync_service import SyncService
+            records = SyncService().sync_dashboard() or 0
+            return {"status": "SYNCED", "action": action, "records": records,
+                    "message": f"Dashboard synchronized! Records: {records}"}
+
+        from foton_system.modules.clients.infrastructure.repositories.excel_client_repository import (
+            ExcelClientRepository,
+        )
+        from foton_system.modules.clients.application.use_cases.client_service import ClientService
+        service = ClientService(ExcelClientRepository())
+        if action == "exportar_clientes":
+            service.export_client_data()
+        else:
+            service.export_service_data()
+        return {"status": "EXPORTED", "action": action, "message": f"{action} concluído"}
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Maintenance Tasks (POP).")
+    parser.add_argument("action", choices=ACTIONS, help="Task to run")
+
+    args = parser.parse_args()
+
+    try:
+        op = OpMaintenance(actor="CLI_User")
+        result = op.execute(client_id="SYSTEM", action=args.action)
+        print(f"SUCCESS: {result['message']}")
+    except Exception as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
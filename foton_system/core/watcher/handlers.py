@@ -4,6 +4,7 @@ FotonFileSystemEventHandler - Watcher Proativo
 Monitora mudanças no sistema de arquivos e:
 1. Reindexação automática no banco vetorial (RAG)
 2. Emissão de sugestões proativas ao usuário
+3. Atualização do livro-caixa consolidado quando um FINANCEIRO.csv muda
 
 DESIGN NOTES:
 - Lazy loading de dependências RAG para não travar se chromadb não existir
@@ -115,11 +116,51 @@ class FotonFileSystemEventHandler(FileSystemEventHandler):
             print(f"  {matched['message']}")
             print(f"  💡 {matched['suggestion']}")
             print(f"  📄 Arquivo: {path.name}")
+            self._print_stale_outputs(path)
             print(f"{'='*60}\n")
             logger.info(f"Sugestão proativa emitida para: {path.name} em {client_folder}")
 
+    def _print_stale_outputs(self, path: Path) -> None:
+        """Lista os documentos gerados a partir deste INFO que ficaram desatualizados."""
+        try:
+            from foton_system.modules.documents.application.use_cases.generation_ledger import stale_outputs_for
+            stale = stale_outputs_for(path)
+        except Exception as e:
+            logger.debug(f"Ledger de gerações indisponível: {e}")
+            return
+        if not stale:
+            return
+        print(f"  📑 Documentos desatualizados ({len(stale)}):")
+        for record in stale[:10]:
+            output = Path(record.output)
+            print(f"     - {output.relative_to(path.parent) if output.is_relative_to(path.parent) else output}")
+        if len(stale) > 10:
+            print(f"     ... e mais {len(stale) - 10}")
+        print("  🔁 Use 'regenerar_documentos_desatualizados' para regenerar apenas estes.")
+
+    def _refresh_firm_ledger(self, event) -> None:
+        """Leva as linhas novas de um FINANCEIRO.csv para o livro-caixa consolidado (SQLite).
+
+        Sem debounce: o sync é incremental e idempotente, e descartar o último
+        evento perderia a última gravação.
+        """
+        if event.is_directory or Path(event.src_path).name != 'FINANCEIRO.csv':
+            return
+        try:
+            from foton_system.modules.finance.infrastructure.repositories.firm_ledger_store import (
+                FirmLedgerStore, client_of_ledger,
+            )
+            from foton_system.modules.shared.infrastructure.config.config import Config
+            client = client_of_ledger(Path(event.src_path), Config())
+            if client:
+                status, rows = FirmLedgerStore.instance().sync_ledger(client, Path(event.src_path))
+                logger.info(f"Livro-caixa consolidado ({client}): {status}, {rows} linha(s)")
+        except Exception as e:
+            logger.error(f"Watcher: falha ao consolidar livro-caixa {event.src_path}: {e}")
+
     def on_modified(self, event) -> None:
         """Callback acionado em modificação de arquivo — dispara análise e reindexação."""
+        self._refresh_firm_ledger(event)
         if self._should_process(event):
             print(f"👀 Watcher detectou modificação: {Path(event.src_path).name}")
             self._analyze_for_suggestions(event.src_path)
@@ -127,6 +168,7 @@ class FotonFileSystemEventHandler(FileSystemEventHandler):
 
     def on_created(self, event) -> None:
         """Callback acionado em criação de arquivo — dispara análise e reindexação."""
+        self._refresh_firm_ledger(event)
         if self._should_process(event):
             print(f"👀 Watcher detectou criação: {Path(event.src_path).name}")
             self._analyze_for_suggestions(event.src_path)
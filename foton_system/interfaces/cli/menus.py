@@ -387,6 +387,7 @@ class MenuSystem:
             TUILayout.print_header("SINCRONIZAR CADASTRO (CLIENTES)")
             TUILayout.print_menu_option("1", "Exportar (DB -> Arquivo INFO)")
             TUILayout.print_menu_option("2", "Importar (Arquivo INFO -> DB)")
+            TUILayout.print_menu_option("3", "Sincronização Completa (Plano + Aplicar)")
             TUILayout.print_menu_option("0", "Voltar")
             TUILayout.print_footer()
 
@@ -397,11 +398,39 @@ class MenuSystem:
             elif sub == '2':
                 self.client_service.import_client_data()
                 input("Pressione Enter para continuar...")
+            elif sub == '3':
+                self.full_sync_ui()
+                input("Pressione Enter para continuar...")
             elif sub == '0':
                 break
             else:
                 self.print_error("Opção inválida.")
 
+    def full_sync_ui(self):
+        """Shows the full sync plan (dry-run) and applies it on confirmation."""
+        try:
+            plan = self.client_service.plan_sync()
+        except Exception as e:
+            self.print_error(f"Erro ao planejar sincronização: {e}")
+            return
+
+        if plan.is_empty:
+            self.print_success("Nada a sincronizar — base e pastas estão alinhadas.")
+            return
+
+        print(f"\n{Fore.CYAN}Plano de sincronização:{Style.RESET_ALL}")
+        for line in plan.describe(Config().base_pasta_clientes):
+            print(f"  {line}")
+        print(f"\n{Fore.YELLOW}{plan.summary()}{Style.RESET_ALL}")
+
+        if input(f"\n{Fore.YELLOW}Aplicar? (S/N): {Style.RESET_ALL}").upper() == 'S':
+            try:
+                self.client_service.apply_sync_plan(plan)
+                self.print_success("Sincronização aplicada.")
+            except Exception as e:
+                logger.error(f"Erro ao aplicar sincronização: {e}", exc_info=True)
+                self.print_error(f"Erro ao aplicar sincronização: {e}")
+
     def handle_services(self):
         while True:
             choice = self.display_services_menu()
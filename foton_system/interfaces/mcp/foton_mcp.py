@@ -72,6 +72,10 @@ def _find_system_python() -> Path:
 
 # --- LOGGING SETUP (file only, never stdout) ---
 from foton_system.modules.shared.infrastructure.services.path_manager import PathManager
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
+from foton_system.modules.documents.infrastructure.services.template_cache import TemplateCache
+from foton_system.modules.documents.infrastructure.services.context_resolver import ContextResolver
+from foton_system.modules.finance.infrastructure.services.ledger_totals_cache import LedgerTotalsCache
 
 _logger = logging.getLogger("foton_mcp")
 
@@ -259,6 +263,32 @@ def info_sistema() -> str:
             f"  🧹 Limpar variáveis faltantes: {config.clean_missing_variables}\n"
             f"  📝 Placeholder: '{config.missing_variable_placeholder}'\n"
         )
+        info_stats = InfoFileStore.instance().stats()
+        output += (
+            f"  🗂️ Cache INFO: {info_stats['entries']} arquivo(s), "
+            f"taxa de acerto {info_stats['hit_rate']:.0%}\n"
+        )
+        template_stats = TemplateCache.instance().stats()
+        output += (
+            f"  📐 Cache de templates: {template_stats['entries']} compilado(s), "
+            f"taxa de acerto {template_stats['hit_rate']:.0%}\n"
+        )
+        context_stats = ContextResolver.instance().stats()
+        output += (
+            f"  🧭 Cache de contexto: {context_stats['chains']} pasta(s), "
+            f"taxa de acerto {context_stats['hit_rate']:.0%}\n"
+        )
+        ledger_stats = LedgerTotalsCache.instance().stats()
+        output += (
+            f"  💰 Cache financeiro: {ledger_stats['entries']} livro(s)-caixa, "
+            f"taxa de acerto {ledger_stats['hit_rate']:.0%}\n"
+        )
+        from foton_system.core.ops.audit_logger import AuditLogger
+        audit_stats = AuditLogger().writer.stats()
+        output += (
+            f"  🧾 Auditoria: {audit_stats['written']} evento(s) em {audit_stats['batches']} lote(s), "
+            f"{audit_stats['pending']} pendente(s)\n"
+        )
         return output
     except OSError as e:
         _logger.error(f"info_sistema I/O error: {e}", exc_info=True)
@@ -488,6 +518,32 @@ def registrar_financeiro(cliente: str, descricao: str, valor: float, tipo: str =
         return f"❌ Error: {e}"
 
 
+@mcp.tool()
+@_log_tool_call
+def registrar_financeiro_lote(cliente: str, lancamentos: list) -> str:
+    """
+    Records several financial entries for one client in a single locked write.
+    lancamentos: [{"descricao": "...", "valor": 100.0, "tipo": "ENTRADA"|"SAIDA", "data": "DD/MM/YYYY"}]
+    ('data' is optional). All entries are validated first: if any is invalid, nothing is written.
+    """
+    try:
+        from foton_system.core.ops.op_finance_batch import OpFinanceBatchEntry
+        op = OpFinanceBatchEntry(actor="Agent_MCP")
+        result = op.execute(client_name=cliente, entries=lancamentos)
+        return (
+            f"✅ {result['message']} (POP Auditado)\n"
+            f"   Lote: +R$ {result['batch_in']:.2f} / -R$ {result['batch_out']:.2f}"
+        )
+    except ValueError as e:
+        return f"❌ Invalid data: {e}"
+    except OSError as e:
+        _logger.error(f"registrar_financeiro_lote I/O: {e}", exc_info=True)
+        return f"❌ File system error: {e}"
+    except Exception as e:
+        _logger.error(f"registrar_financeiro_lote failed: {e}", exc_info=True)
+        return f"❌ Error: {e}"
+
+
 @mcp.tool()
 @_log_tool_call
 def consultar_financeiro(cliente: str) -> str:
@@ -553,6 +609,114 @@ def resumo_financeiro_geral() -> str:
         return f"❌ Error: {e}"
 
 
+@mcp.tool()
+@_log_tool_call
+def consultar_financeiro_periodo(consulta: str = "total", inicio: str = "", fim: str = "", tipo: str = "",
+                                 cliente: str = "", valor_minimo: float = 0, limite: int = 10) -> str:
+    """
+    Period queries over the consolidated firm ledger (all clients' FINANCEIRO.csv, indexed).
+    'consulta': 'total' (income/expense/balance), 'mensal' (monthly rollup) or 'clientes' (top clients).
+    'inicio'/'fim': inclusive dates (YYYY-MM-DD or DD/MM/YYYY); empty = unbounded.
+    'tipo': 'ENTRADA' or 'SAIDA' (for 'clientes', default ENTRADA). 'valor_minimo' filters entries ('total').
+    EXAMPLE: revenue per month in 2025 -> consulta='mensal', inicio='2025-01-01', fim='2025-12-31'.
+    """
+    try:
+        from foton_system.core.ops.op_finance_query import OpFinanceQuery
+        op = OpFinanceQuery(actor="Agent_MCP")
+        result = op.execute(
+            client_id=cliente or "FIRM",
+            query=consulta,
+            start=inicio,
+            end=fim,
+            type=tipo,
+            client=cliente,
+            min_value=valor_minimo,
+            limit=limite,
+        )
+        period = f"{result['start'] or '...'} a {result['end'] or '...'}"
+        data = result["result"]
+        if result["query"] == "total":
+            emoji = "🟢" if data['balance'] >= 0 else "🔴"
+            return (
+                f"📊 Financeiro ({period}){f' — {cliente}' if cliente else ''}: {data['count']} lançamento(s)\n"
+                f"   Receita:  R$ {data['income']:,.2f}\n"
+                f"   Despesa:  R$ {data['expense']:,.2f}\n"
+                f"   {emoji} Saldo:    R$ {data['balance']:,.2f}"
+            )
+        if not data:
+            return f"📭 Nenhum lançamento em {period}."
+        if result["query"] == "mensal":
+            output = f"📅 Financeiro mensal ({period}):\n"
+            for row in data:
+                emoji = "🟢" if row['balance'] >= 0 else "🔴"
+                output += (f"   {emoji} {row['month']}: R$ {row['balance']:,.2f} "
+                           f"(E: {row['income']:,.2f} | S: {row['expense']:,.2f})\n")
+            return output.rstrip()
+        output = f"🏆 Clientes por {'despesa' if (tipo or '').upper() == 'SAIDA' else 'receita'} ({period}):\n"
+        for i, row in enumerate(data, 1):
+            output += f"   {i}. {row['name']}: R$ {row['total']:,.2f} ({row['count']} lançamento(s))\n"
+        return output.rstrip()
+    except ValueError as e:
+        return f"❌ Consulta inválida: {e}"
+    except Exception as e:
+        _logger.error(f"consultar_financeiro_periodo failed: {e}", exc_info=True)
+        return f"❌ Error: {e}"
+
+
+@mcp.tool()
+@_log_tool_call
+def analise_financeira(analise: str = "fluxo", periodo: str = "mensal", inicio: str = "", fim: str = "",
+                       cliente: str = "", janela: int = 3, metrica: str = "receita", limite: int = 24) -> str:
+    """
+    Firm-wide financial analytics over all ledgers (vectorized).
+    'analise': 'fluxo' (cash flow per period), 'saldo' (per-client running balance + rolling net over
+    'janela' periods), 'aging' (amounts still owed per client by age: 0-30/31-60/61-90/90+ days),
+    'anual' (year-over-year of 'metrica': receita, despesa or saldo).
+    'periodo': mensal, trimestral or anual. 'inicio'/'fim': inclusive dates; 'cliente' limits to one client.
+    """
+    try:
+        from foton_system.core.ops.op_finance_analytics import OpFinanceAnalytics
+        op = OpFinanceAnalytics(actor="Agent_MCP")
+        result = op.execute(
+            client_id=cliente or "FIRM",
+            analysis=analise,
+            period=periodo,
+            start=inicio,
+            end=fim,
+            client=cliente,
+            window=janela,
+            metric=metrica,
+        )
+        rows = result["rows"]
+        titles = {"fluxo": "💸 Fluxo de caixa", "saldo": "📈 Saldo por cliente",
+                  "aging": "⏳ Valores a receber por idade", "anual": "📆 Comparativo anual"}
+        if not rows:
+            return f"📭 Nenhum lançamento para a análise '{result['analysis']}'."
+
+        def fmt(value):
+            if value is None:
+                return "-"
+            return f"{value:,.2f}" if isinstance(value, float) else str(value)
+
+        output = f"{titles[result['analysis']]} ({result['entries']} lançamento(s)):\n"
+        header = list(rows[0])
+        output += "   " + " | ".join(header) + "\n"
+        # Time series keep the most recent periods
+        recent_first = result["analysis"] in ("fluxo", "saldo")
+        if len(rows) > limite and recent_first:
+            output += f"   ... {len(rows) - limite} período(s) anterior(es) omitido(s)\n"
+        for row in (rows[-limite:] if recent_first else rows[:limite]):
+            output += "   " + " | ".join(fmt(row[k]) for k in header) + "\n"
+        if len(rows) > limite and not recent_first:
+            output += f"   ... e mais {len(rows) - limite} linha(s)\n"
+        return output.rstrip()
+    except ValueError as e:
+        return f"❌ Análise inválida: {e}"
+    except Exception as e:
+        _logger.error(f"analise_financeira failed: {e}", exc_info=True)
+        return f"❌ Error: {e}"
+
+
 # ==============================================================================
 # DOCUMENT TOOLS
 # ==============================================================================
@@ -675,6 +839,92 @@ def gerar_documento(cliente: str, nome_template: str, dados_extras: dict = {}) -
         return f"❌ Erro POP: {e}"
 
 
+@mcp.tool()
+@_log_tool_call
+def gerar_documentos_lote(nome_template: str, clientes: str = "", filtro: str = "", servico: str = "",
+                          dados_extras: dict = {}, simular: bool = False, limite: int = 30) -> str:
+    """
+    Batch Merging Engine: one template for many clients/services in parallel.
+    SELECTION: 'clientes' = comma-separated names (or 'Cliente/Servico'); 'filtro' = glob or
+    substring over client folder names ('7*', 'silva'); 'servico' = subfolder used in every client.
+    'dados_extras' is applied to every item. Use 'simular=True' to preview targets.
+    Failures are isolated per item; a JSON manifest with status and timing is saved.
+    """
+    try:
+        _validate_dados_extras(dados_extras)
+        from foton_system.core.ops.op_doc_batch import OpBatchGenerateDocuments
+        op = OpBatchGenerateDocuments(actor="Agent_MCP")
+        result = op.execute(
+            client_id="BATCH",
+            template_name=nome_template,
+            clients=clientes,
+            filter=filtro,
+            service=servico,
+            extra_data=dados_extras,
+            dry_run=simular,
+        )
+        summary = result["summary"]
+        title = "🔎 Lote (simulação)" if simular else "✅ Lote Gerado (POP Auditado)"
+        output = (
+            f"{title}: {result['template']}\n"
+            f"   Itens: {summary['total']} | Gerados: {summary['gerados']} | Erros: {summary['erros']}"
+            f" | {result['elapsed']}s ({result['workers']} worker(s))\n"
+        )
+        for item in result["items"][:limite]:
+            if item["status"] == "ERROR":
+                output += f"   ❌ {item['target']}: {item['error']}\n"
+            else:
+                output += f"   {'📄' if item['status'] == 'GENERATED' else '•'} {item['target']} ({item['seconds']}s)\n"
+        if len(result["items"]) > limite:
+            output += f"   ... e mais {len(result['items']) - limite} item(ns)\n"
+        output += f"   Manifesto: {result['manifest_path']}"
+        return output
+    except ValueError as e:
+        return f"❌ Lote inválido: {e}"
+    except Exception as e:
+        _logger.error(f"gerar_documentos_lote failed: {e}", exc_info=True)
+        return f"❌ Erro POP: {e}"
+
+
+@mcp.tool()
+@_log_tool_call
+def regenerar_documentos_desatualizados(cliente: str = "", simular: bool = True, limite: int = 30,
+                                        incluir_ausentes: bool = False) -> str:
+    """
+    Incremental regeneration: lists (and optionally rebuilds) ONLY the generated documents whose
+    template, data file or INFO context changed since they were generated (generation ledger).
+    'cliente' limits the scan to one client folder (empty = all clients).
+    Default 'simular=True' only reports; call again with 'simular=False' to regenerate.
+    Documents deleted by the user are skipped unless 'incluir_ausentes=True'.
+    """
+    try:
+        factory = _get_factory()
+        root = factory.get_client_service().resolve_client_path(cliente) if cliente else None
+        results = factory.get_document_service().regenerate_stale(root, dry_run=simular,
+                                                                   include_missing=incluir_ausentes)
+        if not results:
+            return "✅ Nenhum documento desatualizado."
+
+        errors = sum(1 for r in results if r['status'] == 'ERROR')
+        title = "🔎 Documentos desatualizados" if simular else "🔁 Documentos regenerados"
+        output = f"{title}: {len(results)}" + (f" | Erros: {errors}" if errors else "") + "\n"
+        for item in results[:limite]:
+            icon = {'ERROR': '❌', 'REGENERATED': '📄'}.get(item['status'], '•')
+            output += f"   {icon} {Path(item['output']).name} — {'; '.join(item['reasons'])}\n"
+            if item.get('error'):
+                output += f"      {item['error']}\n"
+        if len(results) > limite:
+            output += f"   ... e mais {len(results) - limite} documento(s)\n"
+        if simular:
+            output += "   💡 Use simular=False para regenerar."
+        return output.rstrip()
+    except ValueError as e:
+        return f"❌ {e}"
+    except Exception as e:
+        _logger.error(f"regenerar_documentos_desatualizados failed: {e}", exc_info=True)
+        return f"❌ Erro: {e}"
+
+
 @mcp.tool()
 @_log_tool_call
 def validar_template(cliente: str, nome_template: str, arquivo_dados: str = "") -> str:
@@ -916,9 +1166,7 @@ def sincronizar_clientes() -> str:
     Discovers new client/service folders and adds them to the Excel database.
     """
     try:
-        svc = _get_factory().get_client_service()
-        svc.sync_clients_db_from_folders()
-        svc.sync_services_db_from_folders()
+        _get_factory().get_client_service().sync_db_from_folders()
         return "✅ Client & service databases synchronized!"
     except OSError as e:
         return f"❌ File access error: {e}"
@@ -926,6 +1174,37 @@ def sincronizar_clientes() -> str:
         return f"❌ Client sync error: {e}"
 
 
+@mcp.tool()
+@_log_tool_call
+def sincronizacao_completa(simular: bool = True, limite: int = 50) -> str:
+    """
+    Full DB <-> folders sync planned from a single scan: folders to create,
+    rows to add, INFO files to rewrite and service rows to import.
+    PARAMETERS:
+      simular: True (default) only shows the plan (dry-run); False applies it
+      limite: Max actions listed in the output
+    """
+    try:
+        result = _get_factory().get_client_service().full_sync(dry_run=simular)
+        summary = result['summary']
+        actions = result['actions']
+        if not actions:
+            return "✅ Nada a sincronizar — base e pastas estão alinhadas."
+
+        header = "🔍 Plano de sincronização (simulação)" if simular else "✅ Sincronização aplicada"
+        lines = [header, " | ".join(f"{k}: {v}" for k, v in summary.items()), ""]
+        lines.extend(f"  {a}" for a in actions[:limite])
+        if len(actions) > limite:
+            lines.append(f"  ... (+{len(actions) - limite} ações)")
+        if simular:
+            lines.append("\n💡 Use simular=False para aplicar.")
+        return "\n".join(lines)
+    except OSError as e:
+        return f"❌ File access error: {e}"
+    except Exception as e:
+        return f"❌ Sync error: {e}"
+
+
 @mcp.tool()
 @_log_tool_call
 def sincronizar_pastas_clientes() -> str:
@@ -1192,15 +1471,27 @@ def verificar_atualizacao() -> str:
 
 @mcp.tool()
 @_log_tool_call
-def consultar_auditoria(limite: int = 10) -> str:
+def consultar_auditoria(limite: int = 10, operacao: str = "", cliente: str = "",
+                        desde: str = "", ate: str = "", status: str = "") -> str:
     """
-    Shows the most recent audit events (POP operations).
+    Shows the most recent audit events (POP operations), newest first.
     PARAMETERS:
       limite: Number of events to show (default 10)
+      operacao: Op name filter (e.g. 'OpFinanceEntry')
+      cliente: Client filter (client_id as logged)
+      desde / ate: Date range, YYYY-MM-DD (inclusive)
+      status: 'SUCCESS' or 'ERROR'
     """
     try:
+        from datetime import datetime
         from foton_system.core.ops.audit_logger import AuditLogger
-        events = AuditLogger().get_recent_events(limit=limite)
+        for value in (desde, ate):
+            if value:
+                datetime.strptime(value, "%Y-%m-%d")  # ValueError -> invalid parameter
+        events = AuditLogger().query_events(
+            limit=limite, op=operacao or None, client_id=cliente or None,
+            since=desde or None, until=ate or None, status=status or None,
+        )
         if not events:
             return "📭 No audit events found."
 
@@ -1212,7 +1503,9 @@ def consultar_auditoria(limite: int = 10) -> str:
             actor = e.get('actor', '?')
             client = e.get('client_id', '?')
             status = e.get('status', '?')
-            output += f"  [{ts}] {op} by {actor} → {client} [{status}]\n"
+            duration = e.get('duration_ms')
+            timing = f" {duration:.0f} ms" if isinstance(duration, (int, float)) else ""
+            output += f"  [{ts}] {op} by {actor} → {client} [{status}]{timing}\n"
         return output
     except ValueError as e:
         return f"❌ Invalid parameter: {e}"
@@ -1224,6 +1517,118 @@ def consultar_auditoria(limite: int = 10) -> str:
         return f"❌ Audit error: {e}"
 
 
+# ==============================================================================
+# BACKGROUND JOBS
+# ==============================================================================
+
+_JOB_ICONS = {"QUEUED": "🕒", "RUNNING": "⏳", "SUCCESS": "✅", "ERROR": "❌", "CANCELLED": "⛔"}
+
+
+def _format_job(job: dict, detailed: bool = False) -> str:
+    icon = _JOB_ICONS.get(job['status'], "•")
+    line = f"{icon} [{job['id']}] {job['op']} — {job['status']}"
+    if job.get('done') is not None:
+        progress = f"{job['done']}/{job['total']}" if job.get('total') else str(job['done'])
+        if job.get('message'):
+            progress += f" {job['message']}"
+        line += f" ({progress})"
+    if not detailed:
+        return line
+    lines = [line, f"  Criada: {job['created_at']}  Início: {job.get('started_at') or '-'}  "
+                   f"Fim: {job.get('finished_at') or '-'}"]
+    if job.get('error'):
+        lines.append(f"  Erro: {job['error']}")
+    result = job.get('result')
+    if isinstance(result, dict) and result.get('message'):
+        lines.append(f"  Resultado: {result['message']}")
+    elif result:
+        lines.append(f"  Resultado: {json.dumps(result, ensure_ascii=False, default=str)[:500]}")
+    return "\n".join(lines)
+
+
+@mcp.tool()
+@_log_tool_call
+def enfileirar_tarefa(operacao: str, parametros: dict = {}, cliente: str = "") -> str:
+    """
+    Queues a long-running operation to run in the background and returns a job id
+    immediately. Jobs survive a server restart. Follow up with status_tarefa.
+    PARAMETERS:
+      operacao: 'indexar_conhecimento', 'gerar_documentos_lote', 'gerar_documento',
+                'registrar_financeiro_lote', 'analise_financeira', 'manutencao' or 'lote_operacoes'
+      parametros: The op parameters (same names as the op, e.g. {"target_path": "..."},
+                  {"action": "sincronizar_base"} for manutencao,
+                  {"op": "OpCreateClient", "items": [{"name": "..."}, ...]} for lote_operacoes)
+      cliente: Client id for the audit trail (optional)
+    """
+    try:
+        from foton_system.core.ops.job_queue import JobQueue
+        if not isinstance(parametros, dict):
+            raise ValueError("parametros must be an object.")
+        job_id = JobQueue.instance().submit(operacao.strip(), parametros, client_id=cliente.strip() or None,
+                                            actor="Agent_MCP")
+        return f"🕒 Tarefa enfileirada: {job_id} ({operacao})\n💡 Acompanhe com status_tarefa(\"{job_id}\")."
+    except ValueError as e:
+        return f"❌ Invalid parameters: {e}"
+    except OSError as e:
+        _logger.error(f"enfileirar_tarefa I/O: {e}", exc_info=True)
+        return f"❌ File access error: {e}"
+    except Exception as e:
+        _logger.error(f"enfileirar_tarefa failed: {e}", exc_info=True)
+        return f"❌ Job queue error: {e}"
+
+
+@mcp.tool()
+@_log_tool_call
+def status_tarefa(tarefa_id: str = "", limite: int = 10) -> str:
+    """
+    Shows a background job (progress, result or error). Without tarefa_id,
+    lists the most recent jobs.
+    """
+    try:
+        from foton_system.core.ops.job_queue import JobQueue
+        queue = JobQueue.instance()
+        if tarefa_id.strip():
+            job = queue.get(tarefa_id.strip())
+            if job is None:
+                return f"❌ Tarefa não encontrada: {tarefa_id}"
+            return _format_job(job, detailed=True)
+        jobs = queue.list(limit=limite)
+        if not jobs:
+            return "📭 Nenhuma tarefa na fila."
+        return f"📋 Últimas {len(jobs)} tarefas:\n" + "\n".join(_format_job(j) for j in jobs)
+    except OSError as e:
+        _logger.error(f"status_tarefa I/O: {e}", exc_info=True)
+        return f"❌ File access error: {e}"
+    except Exception as e:
+        _logger.error(f"status_tarefa failed: {e}", exc_info=True)
+        return f"❌ Job queue error: {e}"
+
+
+@mcp.tool()
+@_log_tool_call
+def cancelar_tarefa(tarefa_id: str) -> str:
+    """
+    Cancels a background job. Queued jobs are cancelled at once; running jobs
+    stop at their next progress checkpoint.
+    """
+    try:
+        from foton_system.core.ops.job_queue import JobQueue
+        status = JobQueue.instance().cancel(tarefa_id.strip())
+        if status is None:
+            return f"❌ Tarefa não encontrada: {tarefa_id}"
+        if status == "CANCELLED":
+            return f"⛔ Tarefa {tarefa_id} cancelada."
+        if status == "RUNNING":
+            return f"⏳ Cancelamento solicitado; a tarefa {tarefa_id} para no próximo ponto de controle."
+        return f"⚠️ Tarefa {tarefa_id} já finalizada ({status})."
+    except OSError as e:
+        _logger.error(f"cancelar_tarefa I/O: {e}", exc_info=True)
+        return f"❌ File access error: {e}"
+    except Exception as e:
+        _logger.error(f"cancelar_tarefa failed: {e}", exc_info=True)
+        return f"❌ Job queue error: {e}"
+
+
 # ==============================================================================
 # HELPER: dados_extras Validation
 # ==============================================================================
@@ -1305,9 +1710,9 @@ def resource_cliente_servicos(nome: str) -> str:
 def resource_financeiro_resumo() -> str:
     """Retorna o dashboard financeiro geral do escritório."""
     try:
-        summary = _get_factory().get_finance_service().get_general_summary()
-        total_entradas = summary.get('total_entradas', 0)
-        total_saidas = summary.get('total_saidas', 0)
+        results = _get_factory().get_finance_service().get_firm_summary()
+        total_entradas = sum(r['income'] for r in results)
+        total_saidas = sum(r['expense'] for r in results)
         saldo = total_entradas - total_saidas
         return (
             f"📊 Resumo Financeiro Geral\n"
@@ -1315,7 +1720,7 @@ def resource_financeiro_resumo() -> str:
             f"  ✅ Entradas: R$ {total_entradas:,.2f}\n"
             f"  ❌ Saídas:   R$ {total_saidas:,.2f}\n"
             f"  {'🟢' if saldo >= 0 else '🔴'} Saldo:    R$ {saldo:,.2f}\n"
-            f"  📁 Clientes: {summary.get('total_clientes', 0)}\n"
+            f"  📁 Clientes: {len(results)}\n"
         )
     except Exception as e:
         _logger.error(f"resource_financeiro_resumo failed: {e}", exc_info=True)
@@ -1330,6 +1735,11 @@ def run_server():
     _logger.info("Starting MCP stdio loop...")
     sys.stderr.write("[MCP] Foton server ready.\n")
     sys.stderr.flush()
+    try:
+        from foton_system.core.ops.job_queue import JobQueue
+        JobQueue.instance().start()  # resumes jobs left queued by a previous session
+    except Exception as e:
+        _logger.error(f"Job queue failed to start: {e}", exc_info=True)
     try:
         mcp.run()
     except Exception as e:
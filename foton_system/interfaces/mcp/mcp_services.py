@@ -51,8 +51,9 @@ class DocumentServiceProtocol(Protocol):
     def list_data_files(self) -> list: ...
     def list_client_data_files(self, client_path) -> list: ...
     def create_custom_data_file(self, client_path, cod, ver='00', rev='R00', desc='PROPOSTA'): ...
-    def generate_document(self, template_path: str, data_path: str, output_path: str, doc_type: str) -> None: ...
+    def generate_document(self, template_path: str, data_path: str = None, output_path=None, doc_type: str = None, extra_data: dict = None, *, data: dict = None, context_dir=None) -> Optional[bytes]: ...
     def validate_template_keys(self, template_path: str, data_path: str, doc_type: str) -> list: ...
+    def regenerate_stale(self, root=None, dry_run: bool = False, include_missing: bool = False) -> list: ...
 
 
 class ClientServiceProtocol(Protocol):
@@ -111,20 +112,9 @@ class ClientPathResolver:
         if not base or not base.exists():
             raise ValueError(f"Pasta de clientes não configurada ou não encontrada: {base}")
         
-        client_path = base / safe_name
-        
-        if not client_path.exists():
-            # Try partial match
-            matches = [
-                d for d in base.iterdir() 
-                if d.is_dir() and safe_name.lower() in d.name.lower()
-            ]
-            if matches:
-                client_path = matches[0]
-            else:
-                raise ValueError(f"Cliente '{safe_name}' não encontrado em {base}")
-        
-        return client_path
+        from foton_system.modules.clients.application.use_cases.client_name_index import get_client_index
+        ignored = set(getattr(self._config, 'ignored_folders', None) or []) | {'.obsidian'}
+        return get_client_index(base, ignored).resolve_path(safe_name)
 
 
 # ==============================================================================
@@ -186,6 +176,30 @@ class MCPClientService:
         """Delegate to the underlying ClientService."""
         return self._client.update_client_info(client_name, section, content)
 
+    def take_snapshot(self):
+        """Single-pass scan of the client tree (see ClientTreeSnapshot)."""
+        return self._client.take_snapshot()
+
+    def sync_db_from_folders(self) -> str:
+        """Clients + services DB <- folders, sharing one scan of the tree."""
+        snapshot = self._client.take_snapshot()
+        self._client.sync_clients_db_from_folders(snapshot=snapshot)
+        self._client.sync_services_db_from_folders(snapshot=snapshot)
+        return "Client & service databases synchronized with folders."
+
+    def full_sync(self, dry_run: bool = True) -> dict:
+        """Plans a full DB <-> folders sync and optionally applies it.
+
+        Returns {summary, actions, applied}.
+        """
+        plan = self._client.plan_sync()
+        base = self._config.base_pasta_clientes if self._config else None
+        result = {'summary': plan.summary(), 'actions': plan.describe(base), 'applied': False}
+        if not dry_run and not plan.is_empty:
+            self._client.apply_sync_plan(plan)
+            result['applied'] = True
+        return result
+
     def sync_clients_db_from_folders(self) -> str:
         self._client.sync_clients_db_from_folders()
         return "Client database synchronized with folders."
@@ -285,20 +299,24 @@ class MCPFinanceService:
         except Exception as e:
             return FinanceResult(success=False, message=f"Erro: {e}")
 
-    def get_firm_summary(self) -> list:
+    def get_firm_summary(self, snapshot=None) -> list:
         """Firm-wide financial dashboard.
 
-        Enumerates client folders via config, then delegates aggregation
-        to the domain FinanceService.
+        Enumerates client folders via config (or an existing
+        ClientTreeSnapshot), then delegates aggregation to the domain
+        FinanceService.
         Returns list of dicts: {name, income, expense, balance}.
         """
         clients_dir = self._config.base_pasta_clientes
         ignored = set((self._config.ignored_folders if self._config else []) + ['.obsidian'])
 
-        client_paths = []
-        for d in sorted(clients_dir.iterdir()):
-            if d.is_dir() and d.name not in ignored:
-                client_paths.append(d)
+        if snapshot is not None:
+            client_paths = [node.path for node in snapshot.iter_clients(ignored)]
+        else:
+            client_paths = []
+            for d in sorted(clients_dir.iterdir()):
+                if d.is_dir() and d.name not in ignored:
+                    client_paths.append(d)
 
         return self._finance.get_firm_summary(client_paths)
 
@@ -344,6 +362,10 @@ class MCPDocumentService:
         """Delegate key validation to the domain DocumentService."""
         return self._documents.validate_template_keys(template_path, data_path, doc_type)
 
+    def regenerate_stale(self, root=None, dry_run: bool = False, include_missing: bool = False) -> list:
+        """Regenerate only the outputs whose recorded inputs changed."""
+        return self._documents.regenerate_stale(root, dry_run, include_missing)
+
     def list_data_files(self) -> list:
         """List available data files (JSON/TXT) in templates dir."""
         return self._documents.list_data_files()
@@ -2,6 +2,7 @@ import sys
 import os
 import time
 import logging
+import multiprocessing
 
 _logger = logging.getLogger("foton_bootstrap")
 
@@ -69,6 +70,9 @@ _bootstrap_start: float = 0.0
 # Ultra-Safe Entry Point
 def safety_entry():
     """Provides immediate visual feedback and robust error handling."""
+    # Frozen exe: pool children (batch generation, OpBatch) re-run this entry
+    # point; this makes them run their task and exit before any output or bootstrap.
+    multiprocessing.freeze_support()
     global _bootstrap_start
     _bootstrap_start = time.perf_counter()
 
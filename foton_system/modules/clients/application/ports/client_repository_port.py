@@ -18,6 +18,11 @@ class ClientRepositoryPort(ABC):
     def save_services(self, df: pd.DataFrame):
         pass
 
+    def save_all(self, clients_df: pd.DataFrame, services_df: pd.DataFrame):
+        """Persists both sheets. Adapters should override with a single write."""
+        self.save_clients(clients_df)
+        self.save_services(services_df)
+
     @abstractmethod
     def list_client_folders(self) -> set:
         pass
@@ -6,9 +6,11 @@ import pandas as pd
 from foton_system.modules.shared.infrastructure.config.config import Config
 from foton_system.modules.shared.infrastructure.config.logger import setup_logger
 from foton_system.modules.shared.infrastructure.validators import validate_filename
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
 from foton_system.modules.shared.domain.exceptions import InvalidAliasError, DatabaseLockError, ValidationError
 from foton_system.modules.clients.application.use_cases.client_validation import normalize_client_name, format_columns
 from foton_system.modules.clients.application.use_cases.client_query import resolve_client_path, generate_client_code, list_service_nodes
+from foton_system.modules.clients.application.use_cases.info_revisions import InfoRevisionIndex
 
 logger = setup_logger()
 
@@ -197,33 +199,68 @@ def _increment_revision(rev):
 
 
 def _get_latest_file(folder, alias):
-    if not folder.exists():
+    return InfoRevisionIndex.instance().latest(folder, alias)
+
+
+def _folder_listing(repository, snapshot=None, client_name=None):
+    """Client (or service) folder names, from the snapshot when one is given."""
+    if snapshot is not None:
+        return snapshot.service_names(client_name) if client_name else snapshot.client_names()
+    if client_name:
+        return repository.list_service_folders(client_name)
+    return repository.list_client_folders()
+
+
+def _latest_info_path(folder, alias, snapshot=None, client_alias=None, service_alias=None):
+    """Latest revision of '*_INFO-{alias}.md', resolved from the snapshot when available."""
+    if snapshot is None:
+        return _get_latest_file(folder, alias)
+    node = snapshot.get_client(client_alias)
+    if node is not None and service_alias is not None:
+        node = snapshot.get_service(client_alias, service_alias)
+    if node is None:
         return None
-    files = list(folder.glob(f"*_INFO-{alias}.md"))
-    if not files:
+    info = node.latest_info(alias)
+    return info.path if info else None
+
+
+def _read_file_content(path):
+    return InfoFileStore.instance().read(path)
+
+
+def _next_info_revision(latest_file, file_data):
+    """(data, ver, rev) for a new INFO revision, or None if the latest file is up to date."""
+    if not latest_file:
+        return file_data, "00", "R00"
+
+    existing_data = _read_file_content(latest_file)
+    merged_data = {**existing_data, **file_data}
+    if not any(str(v) != existing_data.get(k) for k, v in merged_data.items()):
         return None
 
-    def sort_key(f):
-        ver, rev = _parse_filename(f)
-        return (ver, rev)
+    ver, rev = _parse_filename(latest_file)
+    return merged_data, ver, _increment_revision(rev)
+
 
-    files.sort(key=sort_key, reverse=True)
-    return files[0]
+def _service_row_from_info(df, client_alias, service_alias, latest_file):
+    """Row to append to baseServicos when the INFO file differs from the last DB row."""
+    if not latest_file:
+        return None
+    file_data = _read_file_content(latest_file)
+    if not file_data:
+        return None
 
+    db_entry = df[(df['AliasCliente'] == client_alias) & (df['Alias'] == service_alias)]
+    if not db_entry.empty:
+        last_db_row = db_entry.iloc[-1]
+        is_different = any(k not in last_db_row or str(last_db_row[k]) != str(v) for k, v in file_data.items())
+        if not is_different:
+            return None
 
-def _read_file_content(path):
-    data = {}
-    if not path.exists():
-        return data
-    with open(path, 'r', encoding='utf-8') as f:
-        for line in f:
-            if ';' in line:
-                key, value = line.split(';', 1)
-                data[key.strip()] = value.strip()
-            elif ':' in line:
-                key, value = line.split(':', 1)
-                data[key.strip()] = value.strip()
-    return data
+    file_data['DataAtualizacao'] = pd.Timestamp.now()
+    file_data['AliasCliente'] = client_alias
+    file_data['Alias'] = service_alias
+    return file_data
 
 
 def _write_formatted_file_content(path, data, template_str):
@@ -296,7 +333,7 @@ def create_client(name: str, repository, config: Config, tax_id: str = "",
     return CreatedClient(codigo=codigo, caminho=caminho, dados=dados)
 
 
-def export_client_data(repository, config: Config):
+def export_client_data(repository, config: Config, snapshot=None):
     logger.info("Exporting client data to files...")
     count = 0
     try:
@@ -311,34 +348,21 @@ def export_client_data(repository, config: Config):
                 cod = generate_client_code(row.get('NomeCliente', ''), set())
 
             folder = config.base_pasta_clientes / alias
-            if not folder.exists():
+            if snapshot is not None:
+                if snapshot.get_client(alias) is None:
+                    continue
+            elif not folder.exists():
                 continue
 
             file_data = row.dropna().to_dict()
-            latest_file = _get_latest_file(folder, alias)
-
-            should_create = False
-            ver, rev = "00", "R00"
-            existing_data = {}
-
-            if latest_file:
-                existing_data = _read_file_content(latest_file)
-                merged_data = {**existing_data, **file_data}
-
-                is_different = any(str(v) != existing_data.get(k) for k, v in merged_data.items())
+            latest_file = _latest_info_path(folder, alias, snapshot, alias)
 
-                if is_different:
-                    should_create = True
-                    ver, rev = _parse_filename(latest_file)
-                    rev = _increment_revision(rev)
-
-                file_data = merged_data
-            else:
-                should_create = True
-
-            if should_create:
+            revision = _next_info_revision(latest_file, file_data)
+            if revision:
+                file_data, ver, rev = revision
                 filename = _generate_filename(cod, alias, ver, rev)
                 _write_formatted_file_content(folder / filename, file_data, client_template)
+                InfoRevisionIndex.instance().record(folder / filename)
                 count += 1
 
         logger.info(f"{count} arquivos de cliente exportados/atualizados.")
@@ -346,7 +370,7 @@ def export_client_data(repository, config: Config):
         logger.error(f"Erro ao exportar dados de clientes: {e}")
 
 
-def export_service_data(repository, config: Config):
+def export_service_data(repository, config: Config, snapshot=None):
     logger.info("Exporting service data to files...")
     count = 0
     try:
@@ -363,36 +387,23 @@ def export_service_data(repository, config: Config):
                 cod = _generate_service_code(client_alias, service_alias)
 
             folder = config.base_pasta_clientes / client_alias / service_alias
-            if not folder.exists():
+            if snapshot is not None:
+                if snapshot.get_service(client_alias, service_alias) is None:
+                    continue
+            elif not folder.exists():
                 continue
 
             file_data = row.dropna().to_dict()
             file_data['CodServico'] = cod
 
-            latest_file = _get_latest_file(folder, service_alias)
-
-            should_create = False
-            ver, rev = "00", "R00"
-            existing_data = {}
-
-            if latest_file:
-                existing_data = _read_file_content(latest_file)
-                merged_data = {**existing_data, **file_data}
-
-                is_different = any(str(v) != existing_data.get(k) for k, v in merged_data.items())
+            latest_file = _latest_info_path(folder, service_alias, snapshot, client_alias, service_alias)
 
-                if is_different:
-                    should_create = True
-                    ver, rev = _parse_filename(latest_file)
-                    rev = _increment_revision(rev)
-
-                file_data = merged_data
-            else:
-                should_create = True
-
-            if should_create:
+            revision = _next_info_revision(latest_file, file_data)
+            if revision:
+                file_data, ver, rev = revision
                 filename = _generate_filename(cod, service_alias, ver, rev)
                 _write_formatted_file_content(folder / filename, file_data, service_template)
+                InfoRevisionIndex.instance().record(folder / filename)
                 count += 1
 
         logger.info(f"{count} arquivos de serviço exportados/atualizados.")
@@ -400,48 +411,26 @@ def export_service_data(repository, config: Config):
         logger.error(f"Erro ao exportar dados de serviços: {e}")
 
 
-def import_service_data(repository, config: Config):
+def import_service_data(repository, config: Config, snapshot=None):
     import pandas as pd
     logger.info("Importing service data from files...")
     count = 0
     try:
         df = repository.get_services_dataframe()
-        folder_clients = repository.list_client_folders()
+        folder_clients = _folder_listing(repository, snapshot)
 
         new_rows = []
 
         for client_alias in folder_clients:
-            service_folders = repository.list_service_folders(client_alias)
+            service_folders = _folder_listing(repository, snapshot, client_alias)
             for service_alias in service_folders:
                 folder = config.base_pasta_clientes / client_alias / service_alias
-                latest_file = _get_latest_file(folder, service_alias)
+                latest_file = _latest_info_path(folder, service_alias, snapshot, client_alias, service_alias)
 
-                if not latest_file:
+                file_data = _service_row_from_info(df, client_alias, service_alias, latest_file)
+                if file_data is None:
                     continue
 
-                file_data = _read_file_content(latest_file)
-                if not file_data:
-                    continue
-
-                db_entry = df[(df['AliasCliente'] == client_alias) & (df['Alias'] == service_alias)]
-                if not db_entry.empty:
-                    last_db_row = db_entry.iloc[-1]
-                    is_different = False
-                    for k, v in file_data.items():
-                        if k in last_db_row and str(last_db_row[k]) != str(v):
-                            is_different = True
-                            break
-                        if k not in last_db_row:
-                            is_different = True
-                            break
-
-                    if not is_different:
-                        continue
-
-                file_data['DataAtualizacao'] = pd.Timestamp.now()
-                file_data['AliasCliente'] = client_alias
-                file_data['Alias'] = service_alias
-
                 new_rows.append(file_data)
                 count += 1
 
@@ -457,12 +446,12 @@ def import_service_data(repository, config: Config):
         logger.error(f"Erro ao importar dados de serviços: {e}")
 
 
-def sync_clients_db_from_folders(repository):
+def sync_clients_db_from_folders(repository, snapshot=None):
     logger.info("Sincronizando base de clientes a partir das pastas...")
     try:
         db_clients = repository.get_clients_dataframe()
         existing_aliases = set(db_clients['Alias'].dropna().unique())
-        folder_aliases = repository.list_client_folders()
+        folder_aliases = _folder_listing(repository, snapshot)
 
         new_aliases = folder_aliases - existing_aliases
 
@@ -479,12 +468,12 @@ def sync_clients_db_from_folders(repository):
         logger.error(f"Erro na sincronização de clientes (DB <- Pastas): {e}")
 
 
-def sync_client_folders_from_db(repository, config: Config):
+def sync_client_folders_from_db(repository, config: Config, snapshot=None):
     logger.info("Sincronizando pastas de clientes a partir da base...")
     try:
         db_clients = repository.get_clients_dataframe()
         existing_aliases = set(db_clients['Alias'].dropna().unique())
-        folder_aliases = repository.list_client_folders()
+        folder_aliases = _folder_listing(repository, snapshot)
 
         missing_folders = existing_aliases - folder_aliases
 
@@ -501,18 +490,18 @@ def sync_client_folders_from_db(repository, config: Config):
         logger.error(f"Erro na sincronização de clientes (Pastas <- DB): {e}")
 
 
-def sync_services_db_from_folders(repository, config: Config):
+def sync_services_db_from_folders(repository, config: Config, snapshot=None):
     logger.info("Sincronizando base de serviços a partir das pastas...")
     try:
         db_services = repository.get_services_dataframe()
         registered_services = db_services.groupby('AliasCliente')['Alias'].apply(set).to_dict()
 
-        folder_clients = repository.list_client_folders()
+        folder_clients = _folder_listing(repository, snapshot)
         new_services_list = []
         ignored = set(config.ignored_folders)
 
         for client in folder_clients:
-            client_services = repository.list_service_folders(client)
+            client_services = _folder_listing(repository, snapshot, client)
             known_services = registered_services.get(client, set())
             actual_services = {s for s in client_services if s not in ignored}
             missing_in_db = actual_services - known_services
@@ -533,14 +522,14 @@ def sync_services_db_from_folders(repository, config: Config):
         logger.error(f"Erro na sincronização de serviços (DB <- Pastas): {e}")
 
 
-def sync_service_folders_from_db(repository, config: Config, client_alias=None):
+def sync_service_folders_from_db(repository, config: Config, client_alias=None, snapshot=None):
     logger.info(f"Sincronizando pastas de serviços a partir da base... {'(Cliente: ' + client_alias + ')' if client_alias else '(Todos)'}")
     try:
         db_services = repository.get_services_dataframe()
         if client_alias:
             db_services = db_services[db_services['AliasCliente'] == client_alias]
 
-        folder_clients = repository.list_client_folders()
+        folder_clients = _folder_listing(repository, snapshot)
 
         count = 0
         for index, row in db_services.iterrows():
@@ -553,7 +542,11 @@ def sync_service_folders_from_db(repository, config: Config, client_alias=None):
                 continue
 
             service_path = config.base_pasta_clientes / client / service
-            if not service_path.exists():
+            if snapshot is not None:
+                service_exists = service in snapshot.service_names(client)
+            else:
+                service_exists = service_path.exists()
+            if not service_exists:
                 repository.create_folder(service_path)
                 count += 1
 
@@ -0,0 +1,192 @@
+"""
+ClientNameIndex - ranked, accent-insensitive client name resolution.
+
+Built once from a ClientTreeSnapshot: every client folder name is
+normalized (accents stripped, lowercase, separators collapsed) and split into
+trigrams. A lookup ranks candidates in tiers:
+
+    0. exact folder name
+    1. exact normalized name        ('residencia silva' == 'Residência_Silva')
+    2. word prefix                  ('sil' -> '730_Residencia_Silva')
+    3. substring                    ('dencia' -> '730_Residencia_Silva')
+    4. trigram similarity           ('Residensia Silva', typos)
+
+`resolve()` only returns a result when the best of tiers 0-3 has a single
+winner; otherwise it raises ValueError listing the candidates. Trigram
+matches are never resolved (a new client sharing a surname must not land in
+another client's folder); they only appear as suggestions in the error.
+
+`get_client_index()` keeps one index per clients dir, revalidated with a
+single stat of the root folder, so repeated lookups (every MCP tool call that
+takes `cliente`) do not touch the tree.
+"""
+
+import os
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from foton_system.modules.clients.application.use_cases.client_snapshot import ClientTreeSnapshot
+
+TIER_EXACT = 0
+TIER_NORMALIZED = 1
+TIER_PREFIX = 2
+TIER_SUBSTRING = 3
+TIER_FUZZY = 4
+
+MIN_SIMILARITY = 0.3
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name: str) -> str:
+    """'730_Residência-Silva' -> '730 residencia silva'."""
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(' ', stripped.lower()).strip()
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Word-padded trigrams ('  s', ' si', 'sil', ...)."""
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class ClientNameIndex:
+
+    def __init__(self, names: Iterable[str], base_path: Optional[Path] = None):
+        self.base_path = Path(base_path) if base_path else None
+        self._names: List[str] = sorted(set(names))
+        self._normalized: List[str] = [normalize_name(n) for n in self._names]
+        self._by_name: Dict[str, int] = {n: i for i, n in enumerate(self._names)}
+        self._by_normalized: Dict[str, List[int]] = defaultdict(list)
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._gram_counts: List[int] = []
+        for i, norm in enumerate(self._normalized):
+            self._by_normalized[norm].append(i)
+            grams = trigrams(norm)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].add(i)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ClientTreeSnapshot, ignored: Optional[Iterable[str]] = None) -> "ClientNameIndex":
+        return cls(snapshot.client_names(ignored), base_path=snapshot.clients_dir)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def path_for(self, name: str) -> Path:
+        return self.base_path / name if self.base_path else Path(name)
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, int, float]]:
+        """Ranked matches as (name, tier, similarity), best first."""
+        query = query.strip()
+        if not query:
+            return []
+
+        results: Dict[int, Tuple[int, float]] = {}
+        if query in self._by_name:
+            results[self._by_name[query]] = (TIER_EXACT, 1.0)
+
+        norm = normalize_name(query)
+        if norm:
+            for i in self._by_normalized.get(norm, ()):
+                results.setdefault(i, (TIER_NORMALIZED, 1.0))
+
+            query_grams = trigrams(norm)
+            shared: Dict[int, int] = defaultdict(int)
+            for gram in query_grams:
+                for i in self._postings.get(gram, ()):
+                    shared[i] += 1
+
+            # Short queries have too few trigrams to prefilter substrings reliably.
+            substring_pool = range(len(self._names)) if len(norm) < 3 else shared.keys()
+            for i in substring_pool:
+                if i in results:
+                    continue
+                target = self._normalized[i]
+                if any(word.startswith(norm) for word in target.split()) or target.startswith(norm):
+                    results[i] = (TIER_PREFIX, self._similarity(shared.get(i, 0), len(query_grams), i))
+                elif norm in target:
+                    results[i] = (TIER_SUBSTRING, self._similarity(shared.get(i, 0), len(query_grams), i))
+
+            for i, count in shared.items():
+                if i in results:
+                    continue
+                similarity = self._similarity(count, len(query_grams), i)
+                if similarity >= MIN_SIMILARITY:
+                    results[i] = (TIER_FUZZY, similarity)
+
+        ranked = sorted(results.items(), key=lambda kv: (kv[1][0], -kv[1][1], len(self._names[kv[0]]), self._names[kv[0]]))
+        return [(self._names[i], tier, round(sim, 3)) for i, (tier, sim) in ranked[:limit]]
+
+    def _similarity(self, shared: int, query_count: int, i: int) -> float:
+        union = query_count + self._gram_counts[i] - shared
+        return shared / union if union else 0.0
+
+    def resolve(self, query: str) -> str:
+        """Single best client name for `query`; ValueError if none or ambiguous."""
+        matches = self.search(query, limit=10)
+        if not matches or matches[0][1] == TIER_FUZZY:
+            suggestions = ", ".join(m[0] for m in matches[:3])
+            hint = f"Você quis dizer: {suggestions}? " if suggestions else ""
+            raise ValueError(
+                f"Cliente '{query}' não encontrado. {hint}"
+                f"Use 'listar_clientes' para ver os clientes disponíveis."
+            )
+
+        best_tier = matches[0][1]
+        tied = [m for m in matches if m[1] == best_tier]
+        if len(tied) == 1:
+            return tied[0][0]
+
+        names = [m[0] for m in tied]
+        raise ValueError(
+            f"Nome de cliente ambíguo '{query}'. Encontrados {len(names)} correspondências: "
+            f"{', '.join(names)}. Por favor, seja mais específico."
+        )
+
+    def resolve_path(self, query: str) -> Path:
+        return self.path_for(self.resolve(query))
+
+
+_cache: Dict[Tuple[str, frozenset], Tuple[int, ClientTreeSnapshot, ClientNameIndex]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_client_index(clients_dir, ignored: Optional[Iterable[str]] = None) -> ClientNameIndex:
+    """Shared index for `clients_dir`, rebuilt only when the root folder changes."""
+    clients_dir = Path(clients_dir)
+    key = (str(clients_dir), frozenset(ignored or ()))
+    try:
+        mtime_ns = os.stat(clients_dir).st_mtime_ns
+    except OSError:
+        raise ValueError(f"Diretório de clientes não encontrado: {clients_dir}")
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[2]
+        if cached is not None:
+            snapshot = cached[1]
+            snapshot.refresh()
+        else:
+            snapshot = ClientTreeSnapshot.build(clients_dir)
+        index = ClientNameIndex.from_snapshot(snapshot, key[1])
+        _cache[key] = (snapshot.mtime_ns, snapshot, index)
+        return index
+
+
+def clear_client_index_cache():
+    with _cache_lock:
+        _cache.clear()
@@ -2,54 +2,45 @@ from pathlib import Path
 from typing import Optional, Set
 
 from foton_system.modules.shared.infrastructure.config.config import Config
+from foton_system.modules.clients.application.use_cases.client_snapshot import ClientTreeSnapshot
+from foton_system.modules.clients.application.use_cases.client_name_index import ClientNameIndex, get_client_index
 
 
-def resolve_client_path(client_name: str, clients_dir: Path, ignored: Optional[Set[str]] = None) -> Path:
+def resolve_client_path(client_name: str, clients_dir: Path, ignored: Optional[Set[str]] = None,
+                        snapshot: Optional[ClientTreeSnapshot] = None) -> Path:
     """
     Resolves a client name to a validated directory path.
-    Supports exact match and partial/fuzzy matching.
+    Only exact, accent-insensitive and prefix/substring matches resolve
+    (ClientNameIndex; the best-ranked unique match wins). Trigram (typo)
+    matches never resolve: they are only suggested in the error message.
     Raises ValueError if not found or ambiguous.
+    When a snapshot is given, no filesystem access happens.
     """
     if ignored is None:
         ignored = {'.obsidian'}
 
-    if not clients_dir.exists():
-        raise ValueError(f"Diretório de clientes não encontrado: {clients_dir}")
-
-    exact = clients_dir / client_name
-    if exact.exists() and exact.is_dir():
-        return exact
-
-    search = client_name.lower()
-    matches = []
-    for d in clients_dir.iterdir():
-        if d.is_dir() and d.name not in ignored:
-            if search in d.name.lower():
-                matches.append(d)
-
-    if len(matches) == 1:
-        return matches[0]
-    elif len(matches) > 1:
-        names = [m.name for m in matches]
-        raise ValueError(
-            f"Nome de cliente ambíguo '{client_name}'. Encontrados {len(matches)} correspondências: "
-            f"{', '.join(names)}. Por favor, seja mais específico."
-        )
+    if snapshot is not None:
+        if not snapshot.exists:
+            raise ValueError(f"Diretório de clientes não encontrado: {clients_dir}")
+        index = ClientNameIndex.from_snapshot(snapshot, ignored)
     else:
-        raise ValueError(
-            f"Cliente '{client_name}' não encontrado. "
-            f"Use 'listar_clientes' para ver os clientes disponíveis."
-        )
+        index = get_client_index(clients_dir, ignored)
+
+    return index.resolve_path(client_name)
 
 
-def list_service_nodes(client_name: str, clients_dir: Path, ignored: Optional[Set[str]] = None) -> list[dict]:
+def list_service_nodes(client_name: str, clients_dir: Path, ignored: Optional[Set[str]] = None,
+                       snapshot: Optional[ClientTreeSnapshot] = None) -> list[dict]:
     if ignored is None:
         ignored = set()
-    client_path = resolve_client_path(client_name, clients_dir, ignored)
+    client_path = resolve_client_path(client_name, clients_dir, ignored, snapshot=snapshot)
+    if snapshot is not None:
+        client_node = snapshot.get_client(client_path.name)
+        entries = [client_path / name for name in client_node.subdirs] if client_node else []
+    else:
+        entries = [e for e in sorted(client_path.iterdir()) if e.is_dir()]
     nodes = []
-    for entry in sorted(client_path.iterdir()):
-        if not entry.is_dir():
-            continue
+    for entry in entries:
         if entry.name.startswith('_'):
             continue
         if entry.name in ignored:
@@ -66,7 +57,8 @@ def list_service_nodes(client_name: str, clients_dir: Path, ignored: Optional[Se
     return nodes
 
 
-def list_clients(clients_dir: Path, ignored: Optional[set] = None) -> list:
+def list_clients(clients_dir: Path, ignored: Optional[set] = None,
+                 snapshot: Optional[ClientTreeSnapshot] = None) -> list:
     """List all client folders with metadata.
 
     Returns list of dicts: {name, has_info, service_count, services}.
@@ -74,6 +66,18 @@ def list_clients(clients_dir: Path, ignored: Optional[set] = None) -> list:
     if ignored is None:
         ignored = {'.obsidian'}
 
+    if snapshot is not None:
+        clients = []
+        for node in snapshot.iter_clients(ignored):
+            services = [s for s in node.subdirs if s not in ignored]
+            clients.append({
+                'name': node.name,
+                'has_info': len(node.info_files) > 0,
+                'service_count': len(services),
+                'services': services,
+            })
+        return clients
+
     if not clients_dir.exists():
         return []
 
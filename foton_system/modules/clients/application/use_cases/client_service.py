@@ -5,7 +5,9 @@ from typing import Optional
 from foton_system.modules.shared.infrastructure.config.config import Config
 from foton_system.modules.shared.infrastructure.config.logger import setup_logger
 from foton_system.modules.clients.application.ports.client_repository_port import ClientRepositoryPort
-from foton_system.modules.clients.application.use_cases import client_validation, client_query, client_crud
+from foton_system.modules.clients.application.use_cases import client_validation, client_query, client_crud, client_sync_plan
+from foton_system.modules.clients.application.use_cases.client_snapshot import ClientTreeSnapshot
+from foton_system.modules.clients.application.use_cases.client_sync_plan import SyncPlan
 
 logger = setup_logger()
 
@@ -26,19 +28,23 @@ class ClientService:
     def normalize_client_name(name: Optional[str]) -> str:
         return client_validation.normalize_client_name(name)
 
-    def list_service_nodes(self, client_name: str) -> list[dict]:
+    def take_snapshot(self) -> ClientTreeSnapshot:
+        """Scans the client tree once; pass the result to the methods below."""
+        return ClientTreeSnapshot.build(self._config.base_pasta_clientes)
+
+    def list_service_nodes(self, client_name: str, snapshot: Optional[ClientTreeSnapshot] = None) -> list[dict]:
         ignored = set(self._config.ignored_folders)
         return client_query.list_service_nodes(
-            client_name, self._config.base_pasta_clientes, ignored
+            client_name, self._config.base_pasta_clientes, ignored, snapshot=snapshot
         )
 
     def _get_template_sections(self):
         return client_crud.get_template_sections(self._config)
 
-    def resolve_client_path(self, client_name: str) -> Path:
+    def resolve_client_path(self, client_name: str, snapshot: Optional[ClientTreeSnapshot] = None) -> Path:
         ignored = set(self._config.ignored_folders + ['.obsidian'])
         return client_query.resolve_client_path(
-            client_name, self._config.base_pasta_clientes, ignored
+            client_name, self._config.base_pasta_clientes, ignored, snapshot=snapshot
         )
 
     def generate_client_code(self, name):
@@ -56,9 +62,9 @@ class ClientService:
             tax_id=tax_id, email=email, phone=phone, alias=alias
         )
 
-    def list_clients(self) -> list:
+    def list_clients(self, snapshot: Optional[ClientTreeSnapshot] = None) -> list:
         ignored = set(self._config.ignored_folders + ['.obsidian'])
-        return client_query.list_clients(self._config.base_pasta_clientes, ignored)
+        return client_query.list_clients(self._config.base_pasta_clientes, ignored, snapshot=snapshot)
 
     def read_client_info(self, client_name: str) -> dict:
         client_path = self.resolve_client_path(client_name)
@@ -68,24 +74,32 @@ class ClientService:
         client_path = self.resolve_client_path(client_name)
         return client_crud.update_client_info_file(client_path, section, content)
 
-    def sync_clients_db_from_folders(self):
-        client_crud.sync_clients_db_from_folders(self.repository)
+    def sync_clients_db_from_folders(self, snapshot: Optional[ClientTreeSnapshot] = None):
+        client_crud.sync_clients_db_from_folders(self.repository, snapshot=snapshot)
+
+    def sync_client_folders_from_db(self, snapshot: Optional[ClientTreeSnapshot] = None):
+        client_crud.sync_client_folders_from_db(self.repository, self._config, snapshot=snapshot)
 
-    def sync_client_folders_from_db(self):
-        client_crud.sync_client_folders_from_db(self.repository, self._config)
+    def sync_services_db_from_folders(self, snapshot: Optional[ClientTreeSnapshot] = None):
+        client_crud.sync_services_db_from_folders(self.repository, self._config, snapshot=snapshot)
 
-    def sync_services_db_from_folders(self):
-        client_crud.sync_services_db_from_folders(self.repository, self._config)
+    def sync_service_folders_from_db(self, client_alias=None, snapshot: Optional[ClientTreeSnapshot] = None):
+        client_crud.sync_service_folders_from_db(
+            self.repository, self._config, client_alias=client_alias, snapshot=snapshot
+        )
 
-    def sync_service_folders_from_db(self, client_alias=None):
-        client_crud.sync_service_folders_from_db(self.repository, self._config, client_alias=client_alias)
+    def export_client_data(self, snapshot: Optional[ClientTreeSnapshot] = None):
+        client_crud.export_client_data(self.repository, self._config, snapshot=snapshot)
 
-    def export_client_data(self):
-        client_crud.export_client_data(self.repository, self._config)
+    def export_service_data(self, snapshot: Optional[ClientTreeSnapshot] = None):
+        client_crud.export_service_data(self.repository, self._config, snapshot=snapshot)
 
-    def export_service_data(self):
-        client_crud.export_service_data(self.repository, self._config)
+    def import_service_data(self, snapshot: Optional[ClientTreeSnapshot] = None):
+        client_crud.import_service_data(self.repository, self._config, snapshot=snapshot)
 
-    def import_service_data(self):
-        client_crud.import_service_data(self.repository, self._config)
+    def plan_sync(self, snapshot: Optional[ClientTreeSnapshot] = None) -> SyncPlan:
+        """Full sync plan (dry-run): nothing is written until apply_sync_plan."""
+        return client_sync_plan.build_sync_plan(self.repository, self._config, snapshot=snapshot)
 
+    def apply_sync_plan(self, plan: SyncPlan) -> dict:
+        return client_sync_plan.apply_sync_plan(plan, self.repository)
@@ -0,0 +1,253 @@
+"""
+ClientTreeSnapshot - single-pass view of the client folder tree.
+
+One ``os.scandir`` walk collects clients, services (including the ``__``
+hierarchy), INFO files with parsed revisions and ledgers. Sync and query
+functions receive the snapshot instead of re-listing the tree, which keeps a
+full sync cycle to one stat per folder (important on SMB/OneDrive shares).
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+LEDGER_FILENAME = 'FINANCEIRO.csv'
+
+
+def parse_revision(filename: str) -> Tuple[str, str]:
+    """Extracts (ver, rev) from '{COD}_DOC_CD_{VER}_{REV}_INFO-{ALIAS}.md'.
+
+    Falls back to ("00", "R00") for names outside the convention
+    (e.g. INFO-CLIENTE.md).
+    """
+    parts = Path(filename).stem.split('_')
+    if len(parts) >= 6:
+        return parts[3], parts[4]
+    return "00", "R00"
+
+
+def revision_number(ver: str, rev: str) -> Tuple[int, int]:
+    """Numeric sort key for a (ver, rev) pair. Non-numeric parts count as 0."""
+    ver_num = int(ver) if ver.isdigit() else 0
+    rev_digits = rev[1:] if rev[:1].upper() == 'R' else rev
+    rev_num = int(rev_digits) if rev_digits.isdigit() else 0
+    return ver_num, rev_num
+
+
+@dataclass
+class InfoFile:
+    """An INFO markdown file found during the scan."""
+    path: Path
+    mtime_ns: int
+    size: int
+    ver: str = "00"
+    rev: str = "R00"
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def alias(self) -> str:
+        """Alias after the last 'INFO-' marker ('' for bare INFO files)."""
+        stem = self.path.stem
+        idx = stem.upper().rfind('INFO-')
+        return stem[idx + 5:] if idx != -1 else ''
+
+    @property
+    def revision(self) -> Tuple[int, int]:
+        return revision_number(self.ver, self.rev)
+
+
+@dataclass
+class TreeNode:
+    """A scanned folder: a client (depth 1) or one of its subfolders (depth 2)."""
+    name: str
+    path: Path
+    mtime_ns: int
+    info_files: List[InfoFile] = field(default_factory=list)
+    subdirs: List[str] = field(default_factory=list)
+    has_ledger: bool = False
+    children: Dict[str, "TreeNode"] = field(default_factory=dict)
+
+    @property
+    def depth(self) -> int:
+        """Service hierarchy depth derived from the '__' separator."""
+        return len(self.name.split('__')) - 1
+
+    @property
+    def parent(self) -> Optional[str]:
+        return self.name.split('__')[0] if self.depth >= 1 else None
+
+    def latest_info(self, alias: Optional[str] = None) -> Optional[InfoFile]:
+        """Highest (ver, rev) INFO file, optionally restricted to '*_INFO-{alias}.md'."""
+        candidates = self.info_files
+        if alias is not None:
+            suffix = f"_INFO-{alias}.md"
+            candidates = [f for f in candidates if f.name.endswith(suffix)]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda f: f.revision)
+
+    def newest_info(self) -> Optional[InfoFile]:
+        """Most recently modified INFO file (mtime order, as the INFO readers use)."""
+        if not self.info_files:
+            return None
+        return max(self.info_files, key=lambda f: f.mtime_ns)
+
+
+def _dir_mtime_ns(path: Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _scan_folder(path: Path, name: str, mtime_ns: int, descend: bool) -> TreeNode:
+    """Lists one folder with a single scandir; optionally descends one level."""
+    node = TreeNode(name=name, path=path, mtime_ns=mtime_ns)
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return node
+
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                node.subdirs.append(entry.name)
+                if descend:
+                    child_path = Path(entry.path)
+                    child_mtime = entry.stat().st_mtime_ns
+                    node.children[entry.name] = _scan_folder(child_path, entry.name, child_mtime, descend=False)
+            elif entry.is_file():
+                if entry.name == LEDGER_FILENAME:
+                    node.has_ledger = True
+                elif 'INFO' in entry.name and entry.name.endswith('.md'):
+                    st = entry.stat()
+                    ver, rev = parse_revision(entry.name)
+                    node.info_files.append(
+                        InfoFile(Path(entry.path), st.st_mtime_ns, st.st_size, ver, rev)
+                    )
+        except OSError:
+            continue
+
+    node.subdirs.sort()
+    return node
+
+
+class ClientTreeSnapshot:
+    """In-memory picture of ``base_pasta_clientes`` built from one scandir walk.
+
+    Build it once per operation and pass it to every sync/query function
+    involved, so the tree is listed only once. ``refresh()`` re-lists only the
+    folders whose directory mtime changed since the last scan.
+    """
+
+    def __init__(self, clients_dir: Path):
+        self.clients_dir = Path(clients_dir)
+        self.mtime_ns: int = -1
+        self.clients: Dict[str, TreeNode] = {}
+
+    @classmethod
+    def build(cls, clients_dir: Path) -> "ClientTreeSnapshot":
+        snapshot = cls(clients_dir)
+        snapshot._scan_root(previous={})
+        return snapshot
+
+    @property
+    def exists(self) -> bool:
+        return self.mtime_ns != -1
+
+    def _scan_root(self, previous: Dict[str, TreeNode]) -> int:
+        """Lists the root folder, reusing unchanged client nodes from `previous`."""
+        self.mtime_ns = _dir_mtime_ns(self.clients_dir)
+        self.clients = {}
+        if not self.exists:
+            return 0
+
+        rescanned = 0
+        try:
+            with os.scandir(self.clients_dir) as it:
+                entries = [e for e in it if e.is_dir()]
+        except OSError:
+            return 0
+
+        for entry in entries:
+            mtime_ns = entry.stat().st_mtime_ns
+            old = previous.get(entry.name)
+            if old is not None and old.mtime_ns == mtime_ns:
+                rescanned += self._refresh_children(old)
+                self.clients[entry.name] = old
+            else:
+                self.clients[entry.name] = _scan_folder(Path(entry.path), entry.name, mtime_ns, descend=True)
+                rescanned += 1
+        return rescanned
+
+    @staticmethod
+    def _refresh_children(client: TreeNode) -> int:
+        rescanned = 0
+        for name, child in list(client.children.items()):
+            mtime_ns = _dir_mtime_ns(child.path)
+            if mtime_ns != child.mtime_ns:
+                client.children[name] = _scan_folder(child.path, name, mtime_ns, descend=False)
+                rescanned += 1
+        return rescanned
+
+    def refresh(self) -> int:
+        """Re-scans only the subtrees whose directory mtime changed.
+
+        Returns the number of folders that were listed again.
+        """
+        current = _dir_mtime_ns(self.clients_dir)
+        if current != self.mtime_ns:
+            return self._scan_root(previous=self.clients) + 1
+
+        rescanned = 0
+        for name, client in list(self.clients.items()):
+            mtime_ns = _dir_mtime_ns(client.path)
+            if mtime_ns == -1:
+                del self.clients[name]
+                rescanned += 1
+            elif mtime_ns != client.mtime_ns:
+                self.clients[name] = _scan_folder(client.path, name, mtime_ns, descend=True)
+                rescanned += 1
+            else:
+                rescanned += self._refresh_children(client)
+        return rescanned
+
+    # --- Queries -----------------------------------------------------------
+
+    def client_names(self, ignored: Optional[Iterable[str]] = None) -> Set[str]:
+        ignored = set(ignored or ())
+        return {name for name in self.clients if name not in ignored}
+
+    def iter_clients(self, ignored: Optional[Iterable[str]] = None) -> List[TreeNode]:
+        """Client nodes sorted by name, skipping ignored folders."""
+        ignored = set(ignored or ())
+        return [self.clients[n] for n in sorted(self.clients) if n not in ignored]
+
+    def get_client(self, name: str) -> Optional[TreeNode]:
+        return self.clients.get(name)
+
+    def service_names(self, client_name: str) -> Set[str]:
+        client = self.clients.get(client_name)
+        return set(client.subdirs) if client else set()
+
+    def get_service(self, client_name: str, service_name: str) -> Optional[TreeNode]:
+        client = self.clients.get(client_name)
+        return client.children.get(service_name) if client else None
+
+    def ledger_path(self, client_name: str, adm_folder: Optional[str] = None) -> Optional[Path]:
+        """Existing ledger for a client: '{ADM}/FINANCEIRO.csv', then the legacy root file."""
+        client = self.clients.get(client_name)
+        if client is None:
+            return None
+        if adm_folder:
+            adm = client.children.get(adm_folder)
+            if adm is not None and adm.has_ledger:
+                return adm.path / LEDGER_FILENAME
+        if client.has_ledger:
+            return client.path / LEDGER_FILENAME
+        return None
@@ -0,0 +1,219 @@
+"""
+Sync planner - full DB <-> folders synchronization in one pass.
+
+`build_sync_plan` reads both sheets once and the folder tree once (via a
+ClientTreeSnapshot) and computes everything a full sync would do:
+folders to create, rows to add, INFO files to (re)write and service rows
+to import. Nothing is touched until `apply_sync_plan`, which creates the
+folders in one batch and performs exactly one repository write.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from foton_system.modules.shared.infrastructure.config.config import Config
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.clients.application.use_cases import client_crud
+from foton_system.modules.clients.application.use_cases.client_query import generate_client_code
+from foton_system.modules.clients.application.use_cases.client_snapshot import ClientTreeSnapshot
+from foton_system.modules.clients.application.use_cases.info_revisions import InfoRevisionIndex
+
+logger = setup_logger()
+
+
+@dataclass
+class InfoWrite:
+    """A new INFO revision to be written on apply."""
+    path: Path
+    data: dict
+    template: str
+
+
+@dataclass
+class SyncPlan:
+    client_rows: List[dict] = field(default_factory=list)
+    service_rows: List[dict] = field(default_factory=list)
+    imported_rows: List[dict] = field(default_factory=list)
+    folders: List[Path] = field(default_factory=list)
+    info_writes: List[InfoWrite] = field(default_factory=list)
+    clients_df: Optional[pd.DataFrame] = None
+    services_df: Optional[pd.DataFrame] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.client_rows or self.service_rows or self.imported_rows
+                    or self.folders or self.info_writes)
+
+    @property
+    def needs_db_write(self) -> bool:
+        return bool(self.client_rows or self.service_rows or self.imported_rows)
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'clientes_novos': len(self.client_rows),
+            'servicos_novos': len(self.service_rows),
+            'servicos_importados': len(self.imported_rows),
+            'pastas_criar': len(self.folders),
+            'info_gravar': len(self.info_writes),
+        }
+
+    def describe(self, base_path: Optional[Path] = None) -> List[str]:
+        """Human-readable dry-run lines."""
+        def rel(path: Path) -> str:
+            if base_path is not None:
+                try:
+                    return str(path.relative_to(base_path))
+                except ValueError:
+                    pass
+            return str(path)
+
+        lines = []
+        for row in self.client_rows:
+            lines.append(f"[DB+] cliente {row['Alias']}")
+        for row in self.service_rows:
+            lines.append(f"[DB+] serviço {row['AliasCliente']}/{row['Alias']}")
+        for row in self.imported_rows:
+            lines.append(f"[DB<] serviço {row['AliasCliente']}/{row['Alias']} (INFO)")
+        for folder in self.folders:
+            lines.append(f"[DIR] {rel(folder)}")
+        for write in self.info_writes:
+            lines.append(f"[INFO] {rel(write.path)}")
+        return lines
+
+
+def _aliases(df: pd.DataFrame, column: str = 'Alias') -> set:
+    if column not in df:
+        return set()
+    return set(df[column].dropna().unique())
+
+
+def _batch_folders(paths: List[Path]) -> List[Path]:
+    """Drops folders that are created anyway as parents of another planned folder."""
+    unique = sorted(set(paths))
+    return [p for i, p in enumerate(unique)
+            if not (i + 1 < len(unique) and p in unique[i + 1].parents)]
+
+
+def build_sync_plan(repository, config: Config, snapshot: Optional[ClientTreeSnapshot] = None,
+                    export_info: bool = True, import_info: bool = True) -> SyncPlan:
+    """Computes a full sync without touching disk or the workbook.
+
+    Service INFO files that differ from the DB are imported and therefore
+    not exported back in the same plan (the file is the newer source).
+    """
+    if snapshot is None:
+        snapshot = ClientTreeSnapshot.build(config.base_pasta_clientes)
+
+    base = config.base_pasta_clientes
+    ignored = set(config.ignored_folders)
+    plan = SyncPlan()
+    clients_df = repository.get_clients_dataframe()
+    services_df = repository.get_services_dataframe()
+
+    # --- Clients: folders <-> DB ---
+    folder_clients = snapshot.client_names()
+    db_clients = _aliases(clients_df)
+
+    plan.client_rows = [{'Alias': alias} for alias in sorted(folder_clients - db_clients)]
+    missing_client_folders = db_clients - folder_clients
+    folders = [base / alias for alias in missing_client_folders]
+    all_clients = folder_clients | missing_client_folders
+
+    # --- Services: folders <-> DB ---
+    registered = {}
+    if {'AliasCliente', 'Alias'}.issubset(services_df.columns) and not services_df.empty:
+        registered = services_df.groupby('AliasCliente')['Alias'].apply(set).to_dict()
+
+    for client in sorted(folder_clients):
+        actual = {s for s in snapshot.service_names(client) if s not in ignored}
+        for service in sorted(actual - registered.get(client, set())):
+            plan.service_rows.append({'AliasCliente': client, 'Alias': service})
+
+    for client, services in registered.items():
+        if pd.isna(client) or client not in all_clients:
+            continue
+        existing = snapshot.service_names(client)
+        folders.extend(base / client / s for s in services if not pd.isna(s) and s not in existing)
+
+    plan.folders = _batch_folders(folders)
+
+    # --- INFO -> DB (services) ---
+    imported = set()
+    if import_info:
+        for client in sorted(folder_clients):
+            for service in sorted(snapshot.service_names(client)):
+                latest = client_crud._latest_info_path(base / client / service, service, snapshot, client, service)
+                row = client_crud._service_row_from_info(services_df, client, service, latest)
+                if row is not None:
+                    plan.imported_rows.append(row)
+                    imported.add((client, service))
+
+    # --- DB -> INFO ---
+    if export_info:
+        client_template, service_template = client_crud.get_template_sections(config)
+        if 'Alias' in clients_df and not clients_df.empty:
+            for _, row in clients_df.groupby('Alias').last().reset_index().iterrows():
+                alias = row['Alias']
+                if alias not in all_clients:
+                    continue
+                cod = row.get('CodCliente')
+                if not cod or pd.isna(cod):
+                    cod = generate_client_code(row.get('NomeCliente', ''), set())
+                folder = base / alias
+                latest = client_crud._latest_info_path(folder, alias, snapshot, alias)
+                revision = client_crud._next_info_revision(latest, row.dropna().to_dict())
+                if revision:
+                    data, ver, rev = revision
+                    path = folder / client_crud._generate_filename(cod, alias, ver, rev)
+                    plan.info_writes.append(InfoWrite(path, data, client_template))
+
+        if {'AliasCliente', 'Alias'}.issubset(services_df.columns) and not services_df.empty:
+            latest_services = services_df.groupby(['AliasCliente', 'Alias']).last().reset_index()
+            for _, row in latest_services.iterrows():
+                client, service = row['AliasCliente'], row['Alias']
+                if client not in all_clients or (client, service) in imported:
+                    continue
+                cod = row.get('CodServico')
+                if not cod or pd.isna(cod):
+                    cod = client_crud._generate_service_code(client, service)
+                folder = base / client / service
+                file_data = row.dropna().to_dict()
+                file_data['CodServico'] = cod
+                latest = client_crud._latest_info_path(folder, service, snapshot, client, service)
+                revision = client_crud._next_info_revision(latest, file_data)
+                if revision:
+                    data, ver, rev = revision
+                    path = folder / client_crud._generate_filename(cod, service, ver, rev)
+                    plan.info_writes.append(InfoWrite(path, data, service_template))
+
+    plan.clients_df = clients_df
+    plan.services_df = services_df
+    return plan
+
+
+def apply_sync_plan(plan: SyncPlan, repository) -> Dict[str, int]:
+    """Executes a plan: batched mkdirs, INFO writes, then one repository write."""
+    for folder in plan.folders:
+        repository.create_folder(folder)
+
+    for write in plan.info_writes:
+        write.path.parent.mkdir(parents=True, exist_ok=True)
+        client_crud._write_formatted_file_content(write.path, write.data, write.template)
+        InfoRevisionIndex.instance().record(write.path)
+
+    if plan.needs_db_write:
+        clients_df = plan.clients_df
+        if plan.client_rows:
+            clients_df = pd.concat([clients_df, pd.DataFrame(plan.client_rows)], ignore_index=True)
+        services_df = plan.services_df
+        new_services = plan.service_rows + plan.imported_rows
+        if new_services:
+            services_df = pd.concat([services_df, pd.DataFrame(new_services)], ignore_index=True)
+        repository.save_all(clients_df, services_df)
+
+    summary = plan.summary()
+    logger.info(f"Sincronização aplicada: {summary}")
+    return summary
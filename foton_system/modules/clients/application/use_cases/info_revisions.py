@@ -0,0 +1,212 @@
+"""
+INFO revision manager.
+
+Each export that detects a change writes a new
+``{COD}_DOC_CD_{VER}_{REV}_INFO-{ALIAS}.md``. Two helpers keep that cheap:
+
+- ``InfoRevisionIndex``: remembers the latest revision per alias, validated
+  by the folder mtime. A lookup costs one ``stat``; the folder is only
+  re-listed when its contents changed. Recording a new revision also writes
+  a tiny ``.info_index.json`` so other processes skip the listing (lookups
+  never write, so read-only folders stay untouched).
+- ``compact_revisions`` / ``compact_tree``: move all but the newest N
+  revisions of each alias into one ``_INFO_REVISOES.zip`` per folder.
+"""
+
+import json
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.clients.application.use_cases.client_snapshot import (
+    ClientTreeSnapshot, parse_revision, revision_number,
+)
+
+logger = setup_logger()
+
+INDEX_FILENAME = ".info_index.json"
+ARCHIVE_FILENAME = "_INFO_REVISOES.zip"
+DEFAULT_KEEP = 3
+
+
+def _alias_of(filename: str) -> Optional[str]:
+    """Alias of a revisioned INFO file ('..._INFO-{ALIAS}.md'), None otherwise."""
+    if not filename.endswith('.md') or '_INFO-' not in filename:
+        return None
+    return filename[filename.rfind('_INFO-') + 6:-3]
+
+
+def _list_revisions(folder: Path) -> Dict[str, List[Tuple[Tuple[int, int], str]]]:
+    """{alias: [((ver, rev), filename), ...]} sorted oldest -> newest."""
+    revisions: Dict[str, List[Tuple[Tuple[int, int], str]]] = {}
+    with os.scandir(folder) as it:
+        for entry in it:
+            alias = _alias_of(entry.name)
+            if alias is None or not entry.is_file():
+                continue
+            ver, rev = parse_revision(entry.name)
+            revisions.setdefault(alias, []).append((revision_number(ver, rev), entry.name))
+    for items in revisions.values():
+        items.sort()
+    return revisions
+
+
+class InfoRevisionIndex:
+    """Latest INFO revision per alias, per folder, without globbing."""
+
+    _instance: Optional["InfoRevisionIndex"] = None
+
+    def __init__(self):
+        self._folders: Dict[str, Tuple[int, Dict[str, str]]] = {}
+
+    @classmethod
+    def instance(cls) -> "InfoRevisionIndex":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    def latest(self, folder, alias: str) -> Optional[Path]:
+        """Path of the latest '*_INFO-{alias}.md' in `folder`, or None."""
+        folder = Path(folder)
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except OSError:
+            return None
+
+        key = str(folder)
+        cached = self._folders.get(key)
+        if cached is None or cached[0] != mtime_ns:
+            cached = self._load_index(folder, mtime_ns) or self._rebuild(folder, persist=False)
+        if cached is None:
+            return None
+        name = cached[1].get(alias)
+        return folder / name if name else None
+
+    def record(self, path) -> None:
+        """Registers a freshly written revision as the latest of its alias."""
+        path = Path(path)
+        alias = _alias_of(path.name)
+        if alias is None:
+            return
+        folder = path.parent
+        cached = self._folders.get(str(folder))
+        if cached is None:
+            self._rebuild(folder)
+            return
+        latest = dict(cached[1])
+        current = latest.get(alias)
+        if current is None or revision_number(*parse_revision(path.name)) >= revision_number(*parse_revision(current)):
+            latest[alias] = path.name
+        self._store(folder, latest)
+
+    def _load_index(self, folder: Path, mtime_ns: int) -> Optional[Tuple[int, Dict[str, str]]]:
+        try:
+            with open(folder / INDEX_FILENAME, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if raw.get('mtime_ns') != mtime_ns or not isinstance(raw.get('latest'), dict):
+            return None
+        cached = (mtime_ns, raw['latest'])
+        self._folders[str(folder)] = cached
+        return cached
+
+    def _rebuild(self, folder: Path, persist: bool = True) -> Optional[Tuple[int, Dict[str, str]]]:
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+            revisions = _list_revisions(folder)
+        except OSError:
+            return None
+        latest = {alias: items[-1][1] for alias, items in revisions.items()}
+        if persist:
+            return self._store(folder, latest)
+        cached = (mtime_ns, latest)
+        self._folders[str(folder)] = cached
+        return cached
+
+    def _store(self, folder: Path, latest: Dict[str, str]) -> Optional[Tuple[int, Dict[str, str]]]:
+        """Writes the index file; the recorded mtime is taken after the write."""
+        index_path = folder / INDEX_FILENAME
+        try:
+            # Creating the file bumps the folder mtime; rewriting it does not.
+            if not index_path.exists():
+                index_path.touch()
+            mtime_ns = os.stat(folder).st_mtime_ns
+            with open(index_path, 'w', encoding='utf-8') as f:
+                json.dump({'mtime_ns': mtime_ns, 'latest': latest}, f, ensure_ascii=False)
+        except OSError as e:
+            logger.debug(f"Índice de revisões não gravado em {folder}: {e}")
+            try:
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                return None
+        cached = (mtime_ns, latest)
+        self._folders[str(folder)] = cached
+        return cached
+
+
+def compact_revisions(folder, keep: int = DEFAULT_KEEP, dry_run: bool = False) -> List[str]:
+    """Archives all but the newest `keep` revisions of each alias in `folder`.
+
+    Old files are appended to ``_INFO_REVISOES.zip`` (deflate) and removed.
+    Returns the archived file names.
+    """
+    folder = Path(folder)
+    keep = max(1, int(keep))
+    try:
+        revisions = _list_revisions(folder)
+    except OSError as e:
+        logger.error(f"Erro ao listar revisões em {folder}: {e}")
+        return []
+
+    to_archive = [name for items in revisions.values() for _, name in items[:-keep]]
+    if not to_archive or dry_run:
+        return to_archive
+
+    archive_path = folder / ARCHIVE_FILENAME
+    with zipfile.ZipFile(archive_path, 'a', compression=zipfile.ZIP_DEFLATED) as zf:
+        existing = set(zf.namelist())
+        for name in to_archive:
+            data = (folder / name).read_bytes()
+            arcname = name
+            # Same name already archived (e.g. restored and edited since): keep both versions
+            n = 1
+            while arcname in existing:
+                if zf.read(arcname) == data:
+                    break
+                arcname = f"{name[:-3]}~{n}.md"
+                n += 1
+            else:
+                zf.writestr(arcname, data)
+                existing.add(arcname)
+
+    for name in to_archive:
+        (folder / name).unlink()
+
+    InfoRevisionIndex.instance()._rebuild(folder, persist=False)
+    logger.info(f"{len(to_archive)} revisões arquivadas em {archive_path}")
+    return to_archive
+
+
+def compact_tree(clients_dir, ignored=None, keep: int = DEFAULT_KEEP, dry_run: bool = False,
+                 snapshot: Optional[ClientTreeSnapshot] = None) -> Dict[Path, List[str]]:
+    """Runs `compact_revisions` on every client/service folder with more than `keep` revisions."""
+    if snapshot is None:
+        snapshot = ClientTreeSnapshot.build(clients_dir)
+    ignored = set(ignored or ())
+
+    report: Dict[Path, List[str]] = {}
+    for client in snapshot.iter_clients(ignored):
+        for node in [client, *client.children.values()]:
+            if len(node.info_files) <= keep:
+                continue
+            archived = compact_revisions(node.path, keep=keep, dry_run=dry_run)
+            if archived:
+                report[node.path] = archived
+    return report
@@ -380,6 +380,25 @@ class ExcelClientRepository(ClientRepositoryPort):
             logger.error(f"Erro ao salvar base de serviços: {e}")
             raise
 
+    @retry_with_backoff(max_retries=3, base_delay=0.5)
+    def save_all(self, clients_df: pd.DataFrame, services_df: pd.DataFrame):
+        """Writes both sheets in a single workbook save (used by the sync planner)."""
+        try:
+            self._ensure_database_exists()
+
+            with pd.ExcelWriter(self.base_dados, engine="openpyxl", mode='w') as writer:
+                clients_df.to_excel(writer, sheet_name='baseClientes', index=False)
+                services_df.to_excel(writer, sheet_name='baseServicos', index=False)
+
+            self._invalidate_cache()
+            self._create_smart_backup()
+            logger.info("Base de clientes e serviços salva")
+        except DatabaseLockError:
+            raise
+        except Exception as e:
+            logger.error(f"Erro ao salvar base de dados: {e}")
+            raise
+
     def create_folder(self, path: str):
         path = Path(path)
         try:
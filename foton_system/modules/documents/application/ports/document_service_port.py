@@ -12,3 +12,19 @@ class DocumentServicePort(ABC):
     @abstractmethod
     def replace_text(self, document, replacements: dict):
         pass
+
+    def replace_compiled(self, document, replacements: dict, template):
+        """Replaces only the paragraphs recorded in a CompiledTemplate (default: full pass)."""
+        return self.replace_text(document, replacements)
+
+    def render_to_file(self, template_path: str, replacements: dict, output_path, template=None):
+        """Load + replace + save in one call; adapters may override with a faster path.
+
+        `output_path` is a path or a writable binary buffer.
+        """
+        document = self.load_document(template_path)
+        if template is not None:
+            document = self.replace_compiled(document, replacements, template)
+        else:
+            document = self.replace_text(document, replacements)
+        self.save_document(document, output_path)
@@ -0,0 +1,275 @@
+"""
+Batch document generation - one template, many clients/services.
+
+The template is compiled once in the parent process (TemplateCache) and
+handed to every worker through the pool initializer, so workers never
+re-parse it. Workers are spawned (see process_pool), so the compiled
+template and the settings dict travel pickled. Targets are resolved once up front with the shared client
+index. Each item runs in isolation: a failure (missing folder, bad data,
+render error) is recorded in the manifest and never aborts the batch.
+
+    targets = resolve_batch_targets(config, names=['Silva', 'Costa/Reforma'])
+    manifest = run_batch(template_path, targets, extra_data={'@Mes': 'Junho'}, workers=4)
+    manifest.save(path)
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.clients.application.use_cases.client_name_index import get_client_index, normalize_name
+from foton_system.modules.documents.infrastructure.services.template_cache import CompiledTemplate, TemplateCache
+from foton_system.modules.shared.infrastructure.services.process_pool import pool_context
+
+logger = setup_logger()
+
+STATUS_GENERATED = "GENERATED"
+STATUS_ERROR = "ERROR"
+STATUS_PLANNED = "PLANNED"
+MAX_WORKERS = 8
+
+
+@dataclass
+class BatchTarget:
+    label: str
+    folder: Optional[Path] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchItemResult:
+    target: str
+    status: str
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+
+@dataclass
+class BatchManifest:
+    template: str
+    started_at: str
+    items: List[BatchItemResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    workers: int = 1
+
+    def summary(self) -> Dict[str, int]:
+        counts = {STATUS_GENERATED: 0, STATUS_ERROR: 0, STATUS_PLANNED: 0}
+        for item in self.items:
+            counts[item.status] = counts.get(item.status, 0) + 1
+        return {
+            'total': len(self.items),
+            'gerados': counts[STATUS_GENERATED],
+            'erros': counts[STATUS_ERROR],
+            'planejados': counts[STATUS_PLANNED],
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            'template': self.template,
+            'started_at': self.started_at,
+            'elapsed': round(self.elapsed, 3),
+            'workers': self.workers,
+            'summary': self.summary(),
+            'items': [asdict(item) for item in self.items],
+        }
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+
+def resolve_batch_targets(config, names: Optional[Iterable[str]] = None, filtro: str = "",
+                          service: str = "") -> List[BatchTarget]:
+    """Target folders for a batch.
+
+    - `names`: client queries ('Silva') or 'cliente/servico' pairs, resolved
+      with the shared ranked index (ambiguous/unknown names and names that only
+      look similar to a client become error items, never another client's folder)
+    - `filtro`: glob or substring over client folder names ('7*', 'silva')
+    - `service`: when set, every selected client targets that subfolder
+    """
+    clients_dir = Path(config.base_pasta_clientes)
+    index = get_client_index(clients_dir, set(config.ignored_folders) | {'.obsidian'})
+    targets: List[BatchTarget] = []
+    selected: List[str] = []
+
+    for query in names or ():
+        query = str(query).strip()
+        if not query:
+            continue
+        client_query, _, service_query = query.partition('/')
+        try:
+            client = index.resolve(client_query)
+        except ValueError as e:
+            targets.append(BatchTarget(query, error=str(e)))
+            continue
+        if service_query:
+            targets.append(_service_target(clients_dir, client, service_query.strip()))
+        else:
+            selected.append(client)
+
+    if filtro:
+        if any(c in filtro for c in '*?['):
+            selected.extend(n for n in index.names if fnmatch(n.lower(), filtro.lower()))
+        else:
+            needle = normalize_name(filtro)
+            selected.extend(n for n in index.names if needle and needle in normalize_name(n))
+
+    seen = set()
+    for client in selected:
+        if client in seen:
+            continue
+        seen.add(client)
+        if service:
+            targets.append(_service_target(clients_dir, client, service))
+        else:
+            targets.append(BatchTarget(client, clients_dir / client))
+    return targets
+
+
+def _service_target(clients_dir: Path, client: str, service: str) -> BatchTarget:
+    folder = clients_dir / client / service
+    label = f"{client}/{service}"
+    if not folder.is_dir():
+        return BatchTarget(label, error=f"Serviço '{service}' não encontrado em {client}")
+    return BatchTarget(label, folder)
+
+
+# --- Worker side ---------------------------------------------------------------
+
+_worker_service = None
+_worker_template: Optional[CompiledTemplate] = None
+
+
+def _init_worker(compiled: CompiledTemplate, settings: Dict[str, object]):
+    """Pool initializer: seeds the template cache and builds one DocumentService per process."""
+    global _worker_service, _worker_template
+    from foton_system.modules.shared.infrastructure.config.config import Config
+    from foton_system.modules.documents.application.use_cases.document_service import DocumentService
+    from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
+    from foton_system.modules.documents.infrastructure.adapters.python_pptx_adapter import PythonPPTXAdapter
+
+    config = Config()
+    for key, value in settings.items():
+        config.set(key, value)
+    TemplateCache.instance().put(compiled)
+    _worker_template = compiled
+    _worker_service = DocumentService(PythonDocxAdapter(), PythonPPTXAdapter(), config)
+
+
+def _generate_one(service, compiled: CompiledTemplate, label: str, folder: str,
+                  output_name: str, extra_data: Optional[dict]) -> BatchItemResult:
+    start = time.perf_counter()
+    output_path = Path(folder) / output_name
+    try:
+        service.generate_document(
+            template_path=compiled.path,
+            output_path=str(output_path),
+            doc_type=compiled.doc_type,
+            data=extra_data or {},
+            context_dir=folder,
+        )
+        return BatchItemResult(label, STATUS_GENERATED, str(output_path), seconds=round(time.perf_counter() - start, 3))
+    except Exception as e:
+        return BatchItemResult(label, STATUS_ERROR, error=str(e), seconds=round(time.perf_counter() - start, 3))
+
+
+def _worker_generate(label, folder, output_name, extra_data) -> BatchItemResult:
+    return _generate_one(_worker_service, _worker_template, label, folder, output_name, extra_data)
+
+
+# --- Orchestration -------------------------------------------------------------
+
+def default_workers(n_items: int) -> int:
+    return max(1, min(n_items, os.cpu_count() or 1, MAX_WORKERS))
+
+
+def run_batch(template_path, targets: List[BatchTarget], extra_data: Optional[dict] = None,
+              workers: Optional[int] = None, output_name: Optional[str] = None,
+              dry_run: bool = False, config=None, document_service=None,
+              on_progress: Optional[Callable[[int, int], None]] = None) -> BatchManifest:
+    """Generates `template_path` for every target and returns the manifest.
+
+    workers <= 1 (or a single item) runs inline with `document_service`;
+    otherwise a process pool is used. `on_progress(done, total)` is called
+    after each generated item; if it raises (e.g. cancellation), items not
+    yet started are cancelled and the exception propagates.
+    """
+    if config is None:
+        from foton_system.modules.shared.infrastructure.config.config import Config
+        config = Config()
+
+    template_path = Path(template_path)
+    doc_type = template_path.suffix.lstrip('.').lower()
+    compiled = TemplateCache.instance().get(template_path, doc_type)
+    output_name = output_name or f"GERADO_{template_path.name}"
+
+    manifest = BatchManifest(template=template_path.name, started_at=datetime.now().isoformat(timespec='seconds'))
+    start = time.perf_counter()
+    results: Dict[int, BatchItemResult] = {}
+    pending = []
+    for i, target in enumerate(targets):
+        if target.error:
+            results[i] = BatchItemResult(target.label, STATUS_ERROR, error=target.error)
+        elif dry_run:
+            results[i] = BatchItemResult(target.label, STATUS_PLANNED, str(target.folder / output_name))
+        else:
+            pending.append(i)
+
+    workers = default_workers(len(pending)) if workers is None else max(1, int(workers))
+    manifest.workers = min(workers, len(pending)) or 1
+
+    if manifest.workers <= 1:
+        service = document_service or _inline_service(config)
+        for done, i in enumerate(pending, 1):
+            target = targets[i]
+            results[i] = _generate_one(service, compiled, target.label, str(target.folder), output_name, extra_data)
+            if on_progress is not None:
+                on_progress(done, len(pending))
+    elif pending:
+        settings = {
+            'caminho_pastaClientes': str(config.base_pasta_clientes),
+            'clean_missing_variables': bool(config.clean_missing_variables),
+            'missing_variable_placeholder': str(config.missing_variable_placeholder),
+        }
+        with ProcessPoolExecutor(max_workers=manifest.workers, initializer=_init_worker,
+                                 initargs=(compiled, settings), mp_context=pool_context()) as pool:
+            futures = {
+                pool.submit(_worker_generate, targets[i].label, str(targets[i].folder), output_name, extra_data): i
+                for i in pending
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:  # worker crashed (BrokenProcessPool, pickling, ...)
+                    results[i] = BatchItemResult(targets[i].label, STATUS_ERROR, error=f"Falha no worker: {e}")
+                if on_progress is not None:
+                    try:
+                        on_progress(done, len(pending))
+                    except BaseException:
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        raise
+
+    manifest.items = [results[i] for i in range(len(targets))]
+    manifest.elapsed = time.perf_counter() - start
+    logger.info(f"Lote '{template_path.name}': {manifest.summary()} em {manifest.elapsed:.2f}s")
+    return manifest
+
+
+def _inline_service(config):
+    from foton_system.modules.documents.application.use_cases.document_service import DocumentService
+    from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
+    from foton_system.modules.documents.infrastructure.adapters.python_pptx_adapter import PythonPPTXAdapter
+    return DocumentService(PythonDocxAdapter(), PythonPPTXAdapter(), config)
@@ -1,5 +1,5 @@
-﻿import os
-import re
+﻿import io
+import os
 import json
 from pathlib import Path
 from datetime import datetime
@@ -9,7 +9,13 @@ from foton_system.modules.shared.infrastructure.config.logger import setup_logge
 from foton_system.modules.documents.application.ports.document_service_port import DocumentServicePort
 from foton_system.modules.shared.infrastructure.utils.formatting import FotonFormatter
 from foton_system.modules.shared.infrastructure.services.cub_service import CubService
-from foton_system.modules.shared.domain.services.safe_math import safe_eval
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
+from foton_system.modules.shared.infrastructure.services import tracing
+from foton_system.modules.documents.domain.services.placeholder_engine import KEY_PATTERN
+from foton_system.modules.documents.domain.services.formula_graph import FormulaGraph
+from foton_system.modules.documents.infrastructure.services.template_cache import TemplateCache
+from foton_system.modules.documents.infrastructure.services.context_resolver import ContextResolver
+from foton_system.modules.documents.application.use_cases import generation_ledger
 from foton_system.modules.shared.domain.exceptions import (
     TemplateNotFoundError,
     DocumentGenerationError
@@ -130,14 +136,38 @@ class DocumentService:
             logger.error(f"Erro ao parsear TXT {path}: {e}")
         return replacements
 
-    def generate_document(self, template_path, data_path, output_path, doc_type):
+    def generate_document(self, template_path, data_path=None, output_path=None, doc_type=None, extra_data=None,
+                          *, data=None, context_dir=None):
+        """Renders `template_path` with system < INFO context < document data.
+
+        - `data_path`: data file (JSON/TXT/MD); its folder anchors the INFO chain
+        - `data` (dict): document data in memory instead of a data file
+        - `context_dir`: folder whose INFO chain is used (default: the data file's folder)
+        - `extra_data` (dict): overrides the document data
+        - `output_path`: file path, a writable binary buffer, or None to get the bytes back
+
+        Returns the bytes when `output_path` is None, the buffer when one is given.
+        """
+        if data_path is None and context_dir is None:
+            raise ValueError("Informe data_path ou context_dir")
+        if context_dir is not None:
+            anchor = Path(context_dir) / generation_ledger.IN_MEMORY_DATA_NAME
+        else:
+            anchor = Path(data_path)
+        doc_type = doc_type or Path(template_path).suffix.lstrip('.').lower()
         logger.info(f"Gerando documento do tipo {doc_type}...")
 
         # 1. Load Context Data (Centers of Truth)
-        context_data = self._load_context_data(Path(data_path))
-
-        # 2. Load Document Data
-        doc_data = self._load_data(data_path)
+        with tracing.span("context"):
+            context_data = self._load_context_data(anchor)
+
+            # 2. Load Document Data
+            if data is not None:
+                doc_data = {str(k).lower(): v for k, v in data.items()}
+            else:
+                doc_data = self._load_data(data_path) if data_path is not None else {}
+            if extra_data:
+                doc_data.update({str(k).lower(): v for k, v in extra_data.items()})
         
         # 3. Inject System Variables (Auto-Context)
         system_vars = self._get_system_variables()
@@ -149,14 +179,18 @@ class DocumentService:
         # 4. Merge (System < Context < Document)
         replacements = {**system_vars, **context_data, **doc_data}
 
-        # 5. Resolve Operations (Calculated Fields)
-        self._resolve_operations(replacements)
+        with tracing.span("formulas"):
+            # 5. Resolve Operations (Calculated Fields)
+            self._resolve_operations(replacements)
 
-        # 6. Apply Formatting (Auto-Formatting Middleware)
-        self._apply_formatting(replacements)
+            # 6. Apply Formatting (Auto-Formatting Middleware)
+            self._apply_formatting(replacements)
 
-        # Validate Keys
-        missing_keys = self._validate_keys(template_path, replacements, doc_type)
+        # Validate Keys (compiled template: no document load)
+        with tracing.span("template", template=Path(template_path).name) as template_span:
+            compiled = self._compile_template(template_path, doc_type)
+            missing_keys = self._validate_keys(template_path, replacements, doc_type, compiled)
+            template_span.set(compiled=compiled is not None, missing=len(missing_keys or ()))
 
         # Clean missing variables
         if missing_keys and self._config.clean_missing_variables:
@@ -166,21 +200,36 @@ class DocumentService:
                 replacements[key] = placeholder
 
         if doc_type == 'pptx':
-            presentation = self.pptx_handler.load_document(template_path)
-            presentation = self.pptx_handler.replace_text(presentation, replacements)
-            self.pptx_handler.save_document(presentation, output_path)
-
+            handler = self.pptx_handler
         elif doc_type == 'docx':
-            document = self.docx_handler.load_document(template_path)
-            document = self.docx_handler.replace_text(document, replacements)
-            self.docx_handler.save_document(document, output_path)
-
+            handler = self.docx_handler
         else:
             logger.error(f"Tipo de documento desconhecido: {doc_type}")
             return
 
+        buffer = io.BytesIO() if output_path is None else None
+        target = buffer or output_path
+        if compiled is not None:
+            with tracing.span("render"):
+                handler.render_to_file(template_path, replacements, target, compiled)
+        else:
+            with tracing.span("load"):
+                document = handler.load_document(template_path)
+            with tracing.span("replace"):
+                document = handler.replace_text(document, replacements)
+            with tracing.span("save"):
+                handler.save_document(document, target)
+
+        if buffer is not None:
+            return buffer.getvalue()
+        if hasattr(output_path, 'write'):
+            return output_path
+
         # Log generation
-        self._log_generation(output_path, doc_type, template_path, data_path)
+        with tracing.span("record"):
+            data_source = data_path if data is None and data_path is not None else anchor
+            self._log_generation(output_path, doc_type, template_path, data_source)
+            self._record_generation(output_path, template_path, data_source, doc_type, replacements, doc_data, extra_data)
 
     def _get_system_variables(self):
         """Injects dynamic system variables"""
@@ -199,66 +248,28 @@ class DocumentService:
             # Apply smart formatting: literals in quotes remain raw, numbers get BR decimal format, % get percentage format
             replacements[key] = FotonFormatter.smart_format(key, value)
 
+    def _context_files(self, data_path):
+        """INFO file chosen in each folder from the clients root down to `data_path`'s folder."""
+        return ContextResolver.instance().info_files(Path(data_path).parent, self._config.base_pasta_clientes)
+
     def _load_context_data(self, data_path):
-        data = {}
+        """Merged, lowercased INFO variables of the data file's folder chain (memoized per folder)."""
         try:
-            base_clients = self._config.base_pasta_clientes
-            current_dir = data_path.parent
-
-            dirs_to_check = []
-            while current_dir != base_clients and current_dir != current_dir.parent:
-                dirs_to_check.append(current_dir)
-                current_dir = current_dir.parent
-
-            dirs_to_check.reverse()
-
-            for folder in dirs_to_check:
-                info_files = list(folder.glob("*INFO*.md"))
-                if info_files:
-                    canonical = [f for f in info_files if f.name.upper() in ('INFO-CLIENTE.MD', 'INFO-SERVICO.MD')]
-                    if canonical:
-                        info_file = canonical[0]
-                    else:
-                        info_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                        info_file = info_files[0]
-                    logger.info(f"Carregando contexto de: {info_file.name} em {folder.name}")
-                    folder_data = self._parse_md_data(info_file)
-                    normalized_folder_data = {k.lower(): v for k, v in folder_data.items()}
-                    data.update(normalized_folder_data)
-
+            return ContextResolver.instance().resolve(Path(data_path).parent, self._config.base_pasta_clientes).data
         except Exception as e:
             logger.warning(f"Erro ao carregar dados de contexto: {e}")
-
-        return data
+            return {}
 
     @staticmethod
     def _parse_md_data(file_path):
         """
-        Parses metadata from an MD file.
+        Parses metadata from an MD file (cached, see InfoFileStore).
         Format: @Variable; Value
         """
-        data = {}
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('@'):
-                        if ';' in line:
-                            parts = line.split(';', 1)
-                            key = parts[0].strip()
-                            value = parts[1].strip()
-                            data[key] = value
-                        elif ':' in line: # Fallback for older files
-                            parts = line.split(':', 1)
-                            key = parts[0].strip()
-                            value = parts[1].strip()
-                            data[key] = value
-        except Exception as e:
-            logger.error(f"Erro ao parsear {file_path}: {e}")
-        return data
+        return InfoFileStore.instance().read(file_path)
 
     def _get_latest_info_file(self, folder, alias):
-        # This method is now deprecated by the new glob logic in _load_context_data
+        # This method is now deprecated by ContextResolver (see _load_context_data)
         # but kept for potential backward compatibility if called elsewhere.
         files = list(folder.glob("*INFO*.md"))
         if not files:
@@ -277,7 +288,25 @@ class DocumentService:
         replacements = {**context_data, **doc_data}
         return self._validate_keys(template_path, replacements, doc_type)
 
-    def _validate_keys(self, template_path, replacements, doc_type):
+    @staticmethod
+    def _compile_template(template_path, doc_type):
+        """CompiledTemplate from the shared cache, or None when the file cannot be parsed."""
+        try:
+            return TemplateCache.instance().get(template_path, doc_type)
+        except Exception as e:
+            logger.debug(f"Template não compilado ({template_path}): {e}")
+            return None
+
+    def _validate_keys(self, template_path, replacements, doc_type, compiled=None):
+        if compiled is None:
+            compiled = self._compile_template(template_path, doc_type)
+        if compiled is not None:
+            missing_keys = compiled.missing_keys(replacements)
+            if missing_keys:
+                logger.warning(f"CHAVES FALTANDO: {missing_keys}")
+            return missing_keys
+
+        # Fallback: walk the loaded document
         required_keys = set()
         try:
             if doc_type == 'docx':
@@ -343,44 +372,68 @@ class DocumentService:
         except Exception as e:
             logger.error(f"Erro ao gravar log de geração: {e}")
 
+    def _record_generation(self, output_path, template_path, data_path, doc_type, replacements, doc_data, extra_data):
+        """Appends the inputs of this generation to the output folder ledger (never fails generation)."""
+        try:
+            # Transient data files (temp JSON) are kept as extra_data so the output can be rebuilt.
+            if Path(data_path).name in generation_ledger.TRANSIENT_DATA_NAMES:
+                extra_data = doc_data
+            generation_ledger.record_generation(
+                output_path, template_path, data_path, self._context_files(data_path), doc_type,
+                replacements, extra_data, exclude_keys=self._get_system_variables().keys(),
+            )
+        except Exception as e:
+            logger.warning(f"Erro ao registrar geração no ledger: {e}")
+
+    def find_stale_documents(self, root=None, include_missing=False):
+        """[(GenerationRecord, reasons)] for generated documents whose inputs changed."""
+        root = Path(root) if root else self._config.base_pasta_clientes
+        return generation_ledger.find_stale(root, self._context_files, self._config.ignored_folders,
+                                            include_missing)
+
+    def regenerate_stale(self, root=None, dry_run=False, include_missing=False):
+        """Rebuilds only the outputs whose template, data or INFO chain changed.
+
+        Deleted outputs are left alone unless `include_missing` is set.
+        Returns one dict per stale output: output, reasons, status (PLANNED/REGENERATED/ERROR).
+        """
+        results = []
+        for record, reasons in self.find_stale_documents(root, include_missing):
+            item = {'output': record.output, 'reasons': reasons, 'status': 'PLANNED'}
+            if not dry_run:
+                try:
+                    template_path = Path(record.template)
+                    if not template_path.exists():
+                        template_path = self._config.templates_path / template_path.name
+                    self.generate_document(str(template_path), record.data, record.output,
+                                           record.doc_type, extra_data=record.extra_data)
+                    item['status'] = 'REGENERATED'
+                except Exception as e:
+                    item['status'] = 'ERROR'
+                    item['error'] = str(e)
+            results.append(item)
+        return results
+
     def _extract_keys_from_text(self, text, keys_set):
         """Extracts keys from text and normalizes them to lowercase for consistent validation."""
         if text and '@' in text:
-            found = re.findall(r'(?<![\w.])@[\w%]+(?!\.[a-z]{2,}\b)', text)
-            for k in found:
+            for k in KEY_PATTERN.findall(text):
                 keys_set.add(k.lower())
 
     def _resolve_operations(self, replacements):
         """
-        Resolves mathematical operations.
-        Improvement: Handles Brazilian number formats during calculation.
+        Resolves [calculo: ...] fields in dependency order (FormulaGraph).
+        Handles Brazilian number formats; results are stored with .2f precision.
+        Failed formulas keep their original value and are logged with the exact cause.
         """
-        for _ in range(3):
-            # Normalize keys for lookup
-            current_keys = list(replacements.keys())
-            for key in current_keys:
-                value = replacements[key]
-                if isinstance(value, str) and '[calculo:' in value:
-                    match = re.search(r'\[calculo:\s*(.+?)\]', value)
-                    if match:
-                        expression = match.group(1)
-                        # Sort keys by length to avoid partial matches during calculation replacement
-                        for k in sorted(current_keys, key=len, reverse=True):
-                            v = replacements[k]
-                            if k.lower() in expression.lower() and k != key:
-                                try:
-                                    # Normalize to float for calculation
-                                    float_val = FotonFormatter.parse_br_number(v)
-                                    # Case-insensitive replacement of variable in expression
-                                    expression = re.sub(re.escape(k), str(float_val), expression, flags=re.IGNORECASE)
-                                except (ValueError, TypeError):
-                                    pass
-                        try:
-                            if not re.match(r'^[\d\.\-\+\*\/\(\)\s]+$', expression):
-                                raise ValueError("Expressão contém caracteres inválidos")
-
-                            result = safe_eval(expression)
-                            # Store with .2f precision for financial consistency
-                            replacements[key] = f"{result:.2f}"
-                        except Exception as e:
-                            logger.warning(f"Falha ao calcular {key}: {e}")
+        graph = FormulaGraph.compile(replacements)
+        if not graph:
+            return {}
+        results, errors = graph.evaluate(replacements, to_number=FotonFormatter.parse_br_number)
+        for name, formula in graph.formulas.items():
+            if name in results:
+                # Store with .2f precision for financial consistency
+                replacements[formula.key] = f"{results[name]:.2f}"
+            else:
+                logger.warning(f"Falha ao calcular {formula.key}: {errors.get(name)}")
+        return errors
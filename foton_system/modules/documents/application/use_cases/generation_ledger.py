@@ -0,0 +1,209 @@
+"""
+Generation ledger - which inputs produced each generated document.
+
+Every successful ``DocumentService.generate_document`` appends one JSON line
+to ``.geracoes.jsonl`` in the output folder (next to ``history.log``):
+
+    output, doc_type, template, data file, INFO context chain,
+    sha256 of each of those inputs, sha256 of the resolved replacement map,
+    and the doc-level data needed to rebuild it (extra_data)
+
+The latest line per output wins. A record is stale when any input hash
+differs from the file on disk, or when the INFO chain would now pick other
+files (e.g. a new revision). A deleted output is only reported when asked
+(``include_missing``): deleting a document is usually intentional.
+``find_stale`` / ``outputs_depending_on`` scan the ledgers under a folder;
+regeneration lives in ``DocumentService.regenerate_stale``.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+
+logger = setup_logger()
+
+LEDGER_FILENAME = ".geracoes.jsonl"
+# Anchor name recorded for in-memory data (generate_document(data=..., context_dir=...)).
+IN_MEMORY_DATA_NAME = "_dados_memoria.json"
+# Data files that only exist during one generation; their content is kept in
+# the record's extra_data instead of a hash.
+TRANSIENT_DATA_NAMES = {IN_MEMORY_DATA_NAME, "temp_pop_data.json", "_lote_dados.json"}
+
+_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+_hash_lock = threading.Lock()
+_write_lock = threading.Lock()
+
+
+def file_sha256(path) -> Optional[str]:
+    """sha256 of a file (memoized by mtime/size), None if it does not exist."""
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return None
+    with _hash_lock:
+        cached = _hash_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+    digest = hashlib.sha256()
+    try:
+        with open(key, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    value = digest.hexdigest()
+    with _hash_lock:
+        _hash_cache[key] = (st.st_mtime_ns, st.st_size, value)
+    return value
+
+
+def values_sha256(replacements: Dict[str, object], exclude: Iterable[str] = ()) -> str:
+    excluded = {k.lower() for k in exclude}
+    items = sorted((str(k).lower(), str(v)) for k, v in replacements.items() if str(k).lower() not in excluded)
+    return hashlib.sha256(json.dumps(items, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class GenerationRecord:
+    output: str
+    doc_type: str
+    template: str
+    data: str
+    context: List[str] = field(default_factory=list)
+    inputs: Dict[str, Optional[str]] = field(default_factory=dict)
+    values_sha: str = ""
+    extra_data: Dict[str, object] = field(default_factory=dict)
+    generated_at: str = ""
+
+    def stale_reasons(self, context_resolver: Callable[[Path], List[Path]],
+                      include_missing: bool = False) -> List[str]:
+        """Why this output is out of date ([] when fresh). Deleted outputs only with `include_missing`."""
+        reasons = []
+        if not Path(self.output).exists():
+            if not include_missing:
+                return []
+            reasons.append("saída ausente")
+        for path, recorded in self.inputs.items():
+            if file_sha256(path) != recorded:
+                reasons.append(f"alterado: {Path(path).name}")
+        current = [str(p) for p in context_resolver(Path(self.data))]
+        if current != self.context:
+            added = sorted(set(current) - set(self.context))
+            reasons.append("novo contexto: " + (", ".join(Path(p).name for p in added) or "arquivos removidos"))
+        return reasons
+
+
+def record_generation(output_path, template_path, data_path, context_files: Iterable[Path], doc_type: str,
+                      replacements: Dict[str, object], extra_data: Optional[dict] = None,
+                      exclude_keys: Iterable[str] = ()) -> GenerationRecord:
+    """Appends the record for `output_path` to its folder ledger."""
+    output_path = Path(output_path)
+    data_path = Path(data_path)
+    context = [str(p) for p in context_files]
+
+    inputs = {str(template_path): file_sha256(template_path)}
+    if data_path.name not in TRANSIENT_DATA_NAMES and data_path.exists():
+        inputs[str(data_path)] = file_sha256(data_path)
+    for path in context:
+        inputs[path] = file_sha256(path)
+
+    record = GenerationRecord(
+        output=str(output_path),
+        doc_type=doc_type,
+        template=str(template_path),
+        data=str(data_path),
+        context=context,
+        inputs=inputs,
+        values_sha=values_sha256(replacements, exclude_keys),
+        extra_data=dict(extra_data or {}),
+        generated_at=datetime.now().isoformat(timespec='seconds'),
+    )
+    line = json.dumps(asdict(record), ensure_ascii=False) + "\n"
+    with _write_lock:
+        with open(output_path.parent / LEDGER_FILENAME, 'a', encoding='utf-8') as f:
+            f.write(line)
+    return record
+
+
+def load_ledger(ledger_path) -> Dict[str, GenerationRecord]:
+    """Latest record per output in one ledger file."""
+    records: Dict[str, GenerationRecord] = {}
+    try:
+        with open(ledger_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    raw = json.loads(line)
+                    records[raw['output']] = GenerationRecord(**raw)
+                except (ValueError, TypeError, KeyError):
+                    logger.debug(f"Linha inválida no ledger {ledger_path}")
+    except OSError:
+        pass
+    return records
+
+
+def iter_ledgers(root, ignored: Iterable[str] = ()) -> Iterator[Path]:
+    ignored = set(ignored)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in ignored and not d.startswith('.')]
+        if LEDGER_FILENAME in filenames:
+            yield Path(dirpath) / LEDGER_FILENAME
+
+
+def iter_records(root, ignored: Iterable[str] = ()) -> Iterator[GenerationRecord]:
+    for ledger in iter_ledgers(root, ignored):
+        yield from load_ledger(ledger).values()
+
+
+def find_stale(root, context_resolver: Callable[[Path], List[Path]], ignored: Iterable[str] = (),
+               include_missing: bool = False) -> List[Tuple[GenerationRecord, List[str]]]:
+    stale = []
+    for record in iter_records(root, ignored):
+        reasons = record.stale_reasons(context_resolver, include_missing)
+        if reasons:
+            stale.append((record, reasons))
+    return stale
+
+
+def outputs_depending_on(input_path, root=None) -> List[GenerationRecord]:
+    """Records under `root` (default: the input's folder) that used `input_path`."""
+    input_path = str(Path(input_path))
+    root = Path(root) if root else Path(input_path).parent
+    return [r for r in iter_records(root) if input_path in r.inputs]
+
+
+def info_base_name(filename: str) -> str:
+    """'C01_DOC_CD_00_R03_INFO-ACME.md' -> 'info-acme.md' (same for every revision)."""
+    lowered = filename.lower()
+    start = lowered.rfind('info-')
+    return lowered[start:] if start >= 0 else lowered
+
+
+def stale_outputs_for(input_path, root=None) -> List[GenerationRecord]:
+    """Records made from `input_path`, or from another revision of the same INFO
+    in its folder, whose recorded input differs from this file now."""
+    input_path = Path(input_path)
+    root = Path(root) if root else input_path.parent
+    base = info_base_name(input_path.name)
+    current = file_sha256(input_path)
+
+    stale = []
+    for record in iter_records(root):
+        for path, recorded in record.inputs.items():
+            path = Path(path)
+            if path.parent != input_path.parent or info_base_name(path.name) != base:
+                continue
+            if path != input_path or recorded != current:
+                stale.append(record)
+                break
+    return stale
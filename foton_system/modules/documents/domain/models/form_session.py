@@ -3,9 +3,11 @@ FormSession Domain Model - Gerencia o estado e lógica do formulário MD.
 """
 
 import re
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
-from foton_system.modules.shared.domain.services.safe_math import safe_eval
+from dataclasses import dataclass, replace
+from typing import List, Dict, Optional, Any, Iterable
+from foton_system.modules.documents.domain.services.formula_graph import Formula, FormulaGraph
+
+_INVALID_CHARS = re.compile(r'[^0-9+\-*/().\s]')
 
 @dataclass
 class FormField:
@@ -26,6 +28,9 @@ class FormSession:
         self.var_pattern: re.Pattern = re.compile(r'^@([\w%]+);\s*(.*)$')
         self.calc_pattern: re.Pattern = re.compile(r'^\[calculo:\s*(.*?)\]\s*(.*)$')
         self.hint_pattern: re.Pattern = re.compile(r'(?:por exemplo|exemplo)\s*:?\s*(.+)$', re.IGNORECASE)
+        self._graph: FormulaGraph = FormulaGraph({}, set())
+        self._by_key: Dict[str, FormField] = {}
+        self._formulas: Dict[str, Formula] = {}
 
     def parse_markdown(self, md_text: str) -> None:
         self.fields = []
@@ -70,15 +75,29 @@ class FormSession:
                 self.structure.append({"type": "text", "content": line})
         
         self.cursor = 0
+        self._compile()
         self.recalculate_all()
 
+    def _compile(self) -> None:
+        """Builds the dependency graph of the calculated fields (once per parse)."""
+        self._by_key = {f"@{f.name}".lower(): f for f in self.fields}
+        self._graph = FormulaGraph.from_expressions(
+            {f"@{f.name}": f.formula for f in self.fields if f.is_calculated},
+            known=self._by_key,
+        )
+        # Lenient like the old string replacement: stray characters are dropped.
+        self._formulas = {
+            name: replace(formula, chunks=tuple(_INVALID_CHARS.sub('', c) for c in formula.chunks))
+            for name, formula in self._graph.formulas.items()
+        }
+
     def update_current(self, value: str) -> None:
         if not value.strip(): return
         f = self.get_current_field()
         if f and not f.is_calculated:
             f.current_value = value
             f.is_dirty = True
-            self.recalculate_all()
+            self._recalculate(self._graph.affected_by([f"@{f.name}"]))
 
     def get_current_field(self) -> Optional[FormField]:
         return self.fields[self.cursor] if self.fields else None
@@ -90,13 +109,35 @@ class FormSession:
         if self.cursor > 0: self.cursor -= 1
 
     def recalculate_all(self) -> None:
-        var_map = {f.name: f.current_value for f in self.fields}
-        for f in self.fields:
-            if f.is_calculated:
-                res = self._evaluate(f.formula, var_map)
-                f.current_value = f"{res:.2f}"
-                if f.name.endswith('%'): f.current_value = f"{res*100:.2f}%"
-                var_map[f.name] = f.current_value
+        self._recalculate(set(self._formulas))
+
+    def _recalculate(self, names: Iterable[str]) -> None:
+        """Re-evaluates `names` (lowercased '@field' keys) in dependency order."""
+        names = set(names)
+        for name in [*self._graph.order, *self._graph.cycles]:
+            if name not in names:
+                continue
+            f = self._by_key[name]
+            res = 0.0 if name in self._graph.cycles else self._evaluate_formula(self._formulas[name])
+            f.current_value = f"{res:.2f}"
+            if f.name.endswith('%'): f.current_value = f"{res*100:.2f}%"
+
+    def _evaluate_formula(self, formula: Formula) -> float:
+        try:
+            numbers = {}
+            for ref in formula.refs:
+                field = self._by_key.get(ref)
+                if field is None:
+                    return 0.0
+                numbers[ref] = self._to_number(field.current_value)
+            return formula.evaluate(numbers)
+        except (ValueError, TypeError): return 0.0
+
+    @staticmethod
+    def _to_number(value: str) -> float:
+        raw_val = value.replace('%', '').replace(',', '.')
+        try: return float(raw_val) if raw_val.strip() else 0.0
+        except (ValueError, TypeError): return 0.0
 
     def generate_markdown(self) -> str:
         field_dict = {f.name: f for f in self.fields}
@@ -117,16 +158,3 @@ class FormSession:
                         val += f.original_value
                 output.append(val)
         return "\n".join(output)
-
-    def _evaluate(self, expr: str, var_map: Dict[str, str]) -> float:
-        try:
-            safe_expr = expr
-            sorted_vars = sorted(var_map.keys(), key=len, reverse=True)
-            for var in sorted_vars:
-                raw_val = var_map[var].replace('%', '').replace(',', '.')
-                try: val = float(raw_val) if raw_val.strip() else 0.0
-                except (ValueError, TypeError): val = 0.0
-                safe_expr = safe_expr.replace(f"@{var}", str(val))
-            safe_expr = re.sub(r'[^0-9+\-*/().\s]', '', safe_expr)
-            return float(safe_eval(safe_expr)) if safe_expr.strip() else 0.0
-        except (ValueError, TypeError): return 0.0
@@ -0,0 +1,212 @@
+"""
+FormulaGraph - dependency graph of ``[calculo: ...]`` fields.
+
+Each formula is compiled once: its ``@variable`` references are extracted
+(case-insensitive, same key shape as templates) and renamed to positional
+slots, and the resulting expression is validated by ``compile_expression``
+(LRU-cached, so every formula with the same shape shares one evaluator). Formulas that reference other
+formulas become edges of a DAG, evaluated in topological order — any chain
+depth resolves in one pass.
+
+    graph = FormulaGraph.compile(values)        # {key: raw value}
+    results, errors = graph.evaluate(values, to_number=parse_br_number)
+
+Errors never raise: they name the exact missing dependency, the cycle, or the
+failing upstream formula, per key.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from foton_system.modules.shared.domain.services.safe_math import CompiledExpression, compile_expression
+
+FORMULA_PATTERN = re.compile(r'\[calculo:\s*(.+?)\]')
+REFERENCE_PATTERN = re.compile(r'@[\w%]+')
+# What may remain of an expression once its references are taken out.
+_SKELETON_CHARS = re.compile(r'^[\d\.\-\+\*\/\(\)\s]*$')
+
+
+def extract_formula(value) -> Optional[str]:
+    """Expression inside '[calculo: ...]', or None when `value` is not a formula."""
+    if not isinstance(value, str) or '[calculo:' not in value:
+        return None
+    match = FORMULA_PATTERN.search(value)
+    return match.group(1) if match else None
+
+
+@dataclass(frozen=True)
+class Formula:
+    key: str
+    expression: str
+    refs: Tuple[str, ...]            # lowercased, in order of first use
+    chunks: Tuple[str, ...]          # literal text between references
+    slots: Tuple[str, ...]           # lowercased reference per gap between chunks
+
+    @classmethod
+    def parse(cls, key: str, expression: str) -> "Formula":
+        chunks, slots = [], []
+        last = 0
+        for match in REFERENCE_PATTERN.finditer(expression):
+            chunks.append(expression[last:match.start()])
+            slots.append(match.group(0).lower())
+            last = match.end()
+        chunks.append(expression[last:])
+        refs = tuple(dict.fromkeys(slots))
+        return cls(key, expression, refs, tuple(chunks), tuple(slots))
+
+    @cached_property
+    def source(self) -> str:
+        """Expression with each reference renamed to a positional slot ('_v0', '_v1', ...)."""
+        index = {ref: i for i, ref in enumerate(self.refs)}
+        parts = [self.chunks[0]]
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            parts.append(f" _v{index[slot]} ")
+            parts.append(chunk)
+        return ''.join(parts)
+
+    @cached_property
+    def _slot_names(self) -> Tuple[str, ...]:
+        return tuple(f"_v{i}" for i in range(len(self.refs)))
+
+    @cached_property
+    def _compiled(self) -> CompiledExpression:
+        return compile_expression(self.source, list(self._slot_names))
+
+    def compiled(self) -> CompiledExpression:
+        """Validated evaluator, built on first use and kept on this formula
+        (the LRU only shares it between formulas with the same shape)."""
+        return self._compiled
+
+    def evaluate(self, numbers: Mapping[str, float]) -> float:
+        return self._compiled(dict(zip(self._slot_names, (numbers[ref] for ref in self.refs))))
+
+    def check_syntax(self) -> Optional[str]:
+        if not _SKELETON_CHARS.match(''.join(self.chunks)):
+            return "Expressão contém caracteres inválidos"
+        return None
+
+
+class FormulaGraph:
+    """Compiled formulas of one value map, with their evaluation order."""
+
+    def __init__(self, formulas: Dict[str, Formula], known: Set[str]):
+        self.formulas = formulas                      # lowercased key -> Formula
+        self._known = known                           # every lowercased key in the map
+        # reference (formula or plain value) -> formulas that use it directly
+        self.dependents: Dict[str, Set[str]] = {}
+        for name, formula in formulas.items():
+            for ref in formula.refs:
+                self.dependents.setdefault(ref, set()).add(name)
+        self.order, self.cycles = self._toposort()
+
+    @classmethod
+    def compile(cls, values: Mapping[str, object]) -> "FormulaGraph":
+        formulas, known = {}, set()
+        for key, value in values.items():
+            lower = str(key).lower()
+            known.add(lower)
+            expression = extract_formula(value)
+            if expression is not None and lower not in formulas:
+                formulas[lower] = Formula.parse(str(key), expression)
+        return cls(formulas, known)
+
+    @classmethod
+    def from_expressions(cls, expressions: Mapping[str, str], known: Iterable[str]) -> "FormulaGraph":
+        """Graph from bare expressions (no '[calculo:' wrapper), e.g. form fields."""
+        formulas = {str(k).lower(): Formula.parse(str(k), e) for k, e in expressions.items()}
+        return cls(formulas, {str(k).lower() for k in known} | set(formulas))
+
+    def __len__(self) -> int:
+        return len(self.formulas)
+
+    # --- Structure ---------------------------------------------------------
+
+    def _toposort(self) -> Tuple[List[str], Dict[str, List[str]]]:
+        pending = {k: sum(1 for r in f.refs if r in self.formulas) for k, f in self.formulas.items()}
+        ready = [k for k, n in pending.items() if n == 0]
+        order = []
+        while ready:
+            name = ready.pop()
+            order.append(name)
+            for dependent in sorted(self.dependents.get(name, ())):
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        cyclic = [k for k in self.formulas if k not in set(order)]
+        return order, {k: self._cycle_from(k, set(cyclic)) for k in cyclic}
+
+    def _cycle_from(self, start: str, cyclic: Set[str]) -> List[str]:
+        """One dependency cycle reachable from `start` (lowercased keys, first key repeated at the end)."""
+        path, seen = [start], {start: 0}
+        current = start
+        while True:
+            nxt = next((r for r in self.formulas[current].refs if r in cyclic), None)
+            if nxt is None:
+                return path
+            if nxt in seen:
+                return path[seen[nxt]:] + [nxt]
+            seen[nxt] = len(path)
+            path.append(nxt)
+            current = nxt
+
+    def affected_by(self, keys: Iterable[str]) -> Set[str]:
+        """Formulas that transitively depend on any of `keys` (lowercased)."""
+        affected: Set[str] = set()
+        stack = [str(k).lower() for k in keys]
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+        return affected
+
+    # --- Evaluation --------------------------------------------------------
+
+    def evaluate(self, values: Mapping[str, object], to_number: Callable[[object], float] = float,
+                 only: Optional[Set[str]] = None,
+                 computed: Optional[Mapping[str, float]] = None) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """Evaluates formulas in dependency order.
+
+        `values` maps keys (any case) to raw values; `computed` holds results of
+        formulas outside `only` (incremental recalculation). Returns
+        ({lower_key: result}, {lower_key: error}).
+        """
+        lookup = {str(k).lower(): v for k, v in values.items()}
+        results: Dict[str, float] = dict(computed or {})
+        errors: Dict[str, str] = {}
+
+        for name, cycle in self.cycles.items():
+            if only is None or name in only:
+                errors[name] = "Dependência circular: " + " -> ".join(self.formulas[k].key for k in cycle)
+
+        for name in self.order:
+            if only is not None and name not in only:
+                continue
+            formula = self.formulas[name]
+            try:
+                numbers = {}
+                for ref in formula.refs:
+                    numbers[ref] = self._number(ref, lookup, results, errors, to_number)
+                syntax_error = formula.check_syntax()
+                if syntax_error:
+                    raise ValueError(syntax_error)
+                results[name] = formula.evaluate(numbers)
+            except ValueError as e:
+                results.pop(name, None)
+                errors[name] = str(e)
+        return results, errors
+
+    def _number(self, ref: str, lookup, results, errors, to_number) -> float:
+        if ref in self.formulas:
+            if ref in results:
+                return results[ref]
+            reason = errors.get(ref, "não calculada")
+            raise ValueError(f"Dependência {self.formulas[ref].key} não resolvida ({reason})")
+        if ref not in self._known or ref not in lookup:
+            raise ValueError(f"Variável ausente: {ref}")
+        try:
+            return float(to_number(lookup[ref]))
+        except (ValueError, TypeError):
+            raise ValueError(f"Valor não numérico em {ref}: {lookup[ref]!r}")
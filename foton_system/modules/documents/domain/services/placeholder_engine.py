@@ -0,0 +1,62 @@
+"""
+PlaceholderEngine - single-pass @variable substitution.
+
+All replacement keys are compiled into one alternation regex (longest key
+first, case-insensitive) and every match is resolved with a dict lookup, so a
+text is scanned once no matter how many variables the INFO chain provides.
+
+Boundary rules (shared with template key extraction):
+- ``(?<![\\w.])``        a key never starts inside a word or after a dot
+- ``(?!\\.[a-z]{2,}\\b)`` e-mail guard: '@empresa.com' is not a key
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Mapping, Tuple, Union
+
+KEY_PREFIX = r'(?<![\w.])'
+KEY_SUFFIX = r'(?!\.[a-z]{2,}\b)'
+KEY_PATTERN = re.compile(KEY_PREFIX + r'@[\w%]+' + KEY_SUFFIX)
+
+
+class PlaceholderEngine:
+    """Compiled replacement table for one generation."""
+
+    def __init__(self, replacements: Mapping[str, object]):
+        ordered = sorted((str(k) for k in replacements), key=len, reverse=True)
+        self._values: Dict[str, str] = {}
+        for key in ordered:
+            # First key wins for case-only duplicates (same as the old per-key loop).
+            self._values.setdefault(key.lower(), str(replacements[key]))
+
+        keys = [k for k in ordered if k]
+        self._all_at = all(k.startswith('@') for k in keys)
+        self._regex = None
+        if keys:
+            alternation = '|'.join(re.escape(k) for k in keys)
+            self._regex = re.compile(KEY_PREFIX + '(?:' + alternation + ')' + KEY_SUFFIX, re.IGNORECASE)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _lookup(self, match: "re.Match") -> str:
+        return self._values[match.group(0).lower()]
+
+    def replace(self, text: str) -> str:
+        if not text or self._regex is None:
+            return text
+        if self._all_at and '@' not in text:
+            return text
+        return self._regex.sub(self._lookup, text)
+
+    @classmethod
+    def of(cls, replacements: Union["PlaceholderEngine", Mapping[str, object]]) -> "PlaceholderEngine":
+        """Returns `replacements` if already compiled, otherwise a (cached) engine."""
+        if isinstance(replacements, PlaceholderEngine):
+            return replacements
+        return _compile_cached(tuple((str(k), str(v)) for k, v in replacements.items()))
+
+
+@lru_cache(maxsize=32)
+def _compile_cached(items: Tuple[Tuple[str, str], ...]) -> PlaceholderEngine:
+    return PlaceholderEngine(dict(items))
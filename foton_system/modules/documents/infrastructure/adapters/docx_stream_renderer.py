@@ -0,0 +1,192 @@
+"""
+DocxStreamRenderer - fast-path DOCX rendering on the raw XML.
+
+Skips the python-docx object model: ``word/document.xml``, headers and
+footers are streamed through ``lxml.etree.iterparse`` and only ``w:p``
+elements whose text contains ``@`` get their runs merged and substituted,
+with the same rules as ``PythonDocxAdapter`` (merge direct runs into the
+first one, then one PlaceholderEngine pass per run).
+
+Every other zip entry (media, styles, numbering, untouched parts) is copied
+byte-for-byte, compressed data included, so it is never inflated/deflated.
+"""
+
+import copy
+import io
+import os
+import struct
+import zipfile
+from typing import Dict, Optional
+
+from lxml import etree
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.documents.domain.services.placeholder_engine import PlaceholderEngine
+from foton_system.modules.documents.infrastructure.services.template_cache import (
+    PART_PATTERNS, W_NS,
+)
+
+logger = setup_logger()
+
+_W = f'{{{W_NS}}}'
+W_P, W_R, W_T, W_RPR, W_HYPERLINK = _W + 'p', _W + 'r', _W + 't', _W + 'rPr', _W + 'hyperlink'
+W_TAB, W_BR, W_CR, W_PTAB, W_NOBREAKHYPHEN = _W + 'tab', _W + 'br', _W + 'cr', _W + 'ptab', _W + 'noBreakHyphen'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+_LOCAL_HEADER_SIZE = 30
+
+
+# --- Run/paragraph text, mirroring python-docx ------------------------------
+
+def run_text(r) -> str:
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or '')
+        elif tag in (W_TAB, W_PTAB):
+            parts.append('\t')
+        elif tag == W_BR:
+            if child.get(_W + 'type') in (None, 'textWrapping'):
+                parts.append('\n')
+        elif tag == W_CR:
+            parts.append('\n')
+        elif tag == W_NOBREAKHYPHEN:
+            parts.append('-')
+    return ''.join(parts)
+
+
+def paragraph_text(p) -> str:
+    """Direct runs plus hyperlink runs (python-docx ``Paragraph.text``)."""
+    parts = []
+    for child in p:
+        if child.tag == W_R:
+            parts.append(run_text(child))
+        elif child.tag == W_HYPERLINK:
+            parts.extend(run_text(r) for r in child if r.tag == W_R)
+    return ''.join(parts)
+
+
+def set_run_text(r, text: str) -> None:
+    """Replaces run content (keeps w:rPr); tabs -> w:tab, newlines -> w:br."""
+    for child in list(r):
+        if child.tag != W_RPR:
+            r.remove(child)
+
+    buffer = []
+
+    def flush():
+        if buffer:
+            value = ''.join(buffer)
+            t = etree.SubElement(r, W_T)
+            t.text = value
+            if len(value.strip()) < len(value):
+                t.set(XML_SPACE, 'preserve')
+            buffer.clear()
+
+    for char in text:
+        if char == '\t':
+            flush()
+            etree.SubElement(r, W_TAB)
+        elif char in '\r\n':
+            flush()
+            etree.SubElement(r, W_BR)
+        else:
+            buffer.append(char)
+    flush()
+
+
+def render_paragraph(p, engine: PlaceholderEngine) -> bool:
+    """Merges and substitutes one w:p. Returns True when the paragraph changed."""
+    if '@' not in paragraph_text(p):
+        return False
+
+    runs = [child for child in p if child.tag == W_R]
+    if len(runs) > 1:
+        set_run_text(runs[0], ''.join(run_text(r) for r in runs))
+        for r in runs[1:]:
+            set_run_text(r, '')
+
+    for r in runs:
+        text = run_text(r)
+        if text:
+            # Rewritten even when unchanged, like ``run.text = ...`` in the adapter.
+            set_run_text(r, engine.replace(text))
+    return True
+
+
+def render_part(xml: bytes, engine: PlaceholderEngine) -> Optional[bytes]:
+    """Streams one XML part; returns the new bytes, or None if nothing changed."""
+    changed = False
+    context = etree.iterparse(io.BytesIO(xml), events=('end',), tag=W_P, huge_tree=True)
+    for _, p in context:
+        changed = render_paragraph(p, engine) or changed
+    if not changed:
+        return None
+    return etree.tostring(context.root, encoding='UTF-8', xml_declaration=True, standalone=True)
+
+
+# --- Zip helpers --------------------------------------------------------------
+
+def _copy_raw(src: zipfile.ZipFile, info: zipfile.ZipInfo, dst: zipfile.ZipFile) -> None:
+    """Copies an entry's compressed bytes as-is (no inflate/deflate).
+
+    zipfile has no public API for this, so the local header is rebuilt from
+    the central-directory ZipInfo and the entry is registered on `dst` the
+    same way ``ZipFile.open(..., 'w')`` does.
+    """
+    src.fp.seek(info.header_offset)
+    header = src.fp.read(_LOCAL_HEADER_SIZE)
+    name_len, extra_len = struct.unpack('<HH', header[26:30])
+    src.fp.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len)
+    raw = src.fp.read(info.compress_size)
+
+    out = copy.copy(info)
+    out.flag_bits &= ~0x08  # sizes are known: no trailing data descriptor
+    out.header_offset = dst.fp.tell()
+    dst.fp.write(out.FileHeader())
+    dst.fp.write(raw)
+    dst.filelist.append(out)
+    dst.NameToInfo[out.filename] = out
+    dst.start_dir = dst.fp.tell()
+    dst._didModify = True
+
+
+class DocxStreamRenderer:
+    """Renders a .docx template straight to `output_path`."""
+
+    def __init__(self):
+        self._pattern = PART_PATTERNS['docx']
+
+    def render(self, template_path, replacements, output_path, template=None) -> Dict[str, int]:
+        """Writes the rendered document; `template` (CompiledTemplate) narrows the parts parsed.
+
+        Returns counters: parts rendered and entries copied raw.
+        """
+        engine = PlaceholderEngine.of(replacements)
+        targets = set(template.locations) if template is not None else None
+        stats = {'rendered': 0, 'copied': 0}
+
+        with zipfile.ZipFile(template_path) as src, \
+                zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as dst:
+            for info in src.infolist():
+                candidate = (info.filename in targets) if targets is not None else bool(self._pattern.match(info.filename))
+                new_xml = None
+                if candidate:
+                    xml = src.read(info)
+                    if b'@' in xml:
+                        new_xml = render_part(xml, engine)
+
+                if new_xml is None:
+                    _copy_raw(src, info, dst)
+                    stats['copied'] += 1
+                else:
+                    out = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                    out.compress_type = zipfile.ZIP_DEFLATED
+                    out.external_attr = info.external_attr
+                    dst.writestr(out, new_xml)
+                    stats['rendered'] += 1
+
+        target = output_path if isinstance(output_path, (str, os.PathLike)) else "buffer"
+        logger.info(f"Documento salvo em: {target} ({stats['rendered']} parte(s) renderizada(s))")
+        return stats
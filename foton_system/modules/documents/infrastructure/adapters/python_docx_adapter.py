@@ -1,5 +1,4 @@
 import os
-import re
 from typing import Dict, Any
 from docx import Document
 from docx.oxml import CT_P
@@ -10,9 +9,12 @@ from docx.section import Section
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.table import CT_Tbl
 from docx.document import Document as DocumentType
+from docx.oxml.ns import qn
 from lxml.etree import _Element
 from foton_system.modules.shared.infrastructure.config.logger import setup_logger
 from foton_system.modules.documents.application.ports.document_service_port import DocumentServicePort
+from foton_system.modules.documents.domain.services.placeholder_engine import PlaceholderEngine
+from foton_system.modules.documents.infrastructure.adapters.docx_stream_renderer import DocxStreamRenderer
 
 logger = setup_logger()
 
@@ -41,6 +43,7 @@ class PythonDocxAdapter(DocumentServicePort):
     def replace_text(self, document: DocumentType, replacements: Dict[str, str]) -> DocumentType:
         """Substitui chaves por valores em parágrafos, tabelas, headers/footers e shapes."""
         logger.info('Iniciando substituição de textos no DOCX...')
+        replacements = PlaceholderEngine.of(replacements)
 
         for paragraph in document.paragraphs:
             self._replace_in_paragraph(paragraph, replacements)
@@ -52,7 +55,8 @@ class PythonDocxAdapter(DocumentServicePort):
                         self._replace_in_paragraph(paragraph, replacements)
 
         for shape in document.inline_shapes:
-            if shape.has_text_frame:
+            # InlineShape (imagens) não expõe has_text_frame
+            if getattr(shape, 'has_text_frame', False):
                 self._replace_in_text_frame(shape.text_frame, replacements)
 
         for section in document.sections:
@@ -62,6 +66,41 @@ class PythonDocxAdapter(DocumentServicePort):
         logger.info('Substituição de textos concluída.')
         return document
 
+    def replace_compiled(self, document: DocumentType, replacements: Dict[str, str], template: Any) -> DocumentType:
+        """Substitui chaves apenas nos parágrafos registrados no template compilado."""
+        logger.info(f'Iniciando substituição em {template.paragraph_count} parágrafos do DOCX...')
+        replacements = PlaceholderEngine.of(replacements)
+        parts = {str(part.partname).lstrip('/'): part for part in document.part.package.iter_parts()}
+
+        for part_name, indices in template.locations.items():
+            part = parts.get(part_name)
+            if part is None:
+                continue
+            p_elements = list(part.element.iter(qn('w:p')))
+            for i in indices:
+                if i < len(p_elements):
+                    self._replace_in_paragraph(Paragraph(p_elements[i], None), replacements)
+
+        logger.info('Substituição de textos concluída.')
+        return document
+
+    def render_to_file(self, template_path: str, replacements: Dict[str, str], output_path: Any, template: Any = None) -> None:
+        """Fast path: renderiza direto no XML do zip (DocxStreamRenderer).
+
+        Em caso de falha, volta ao fluxo python-docx (load/replace/save).
+        """
+        if not os.path.exists(template_path):
+            raise FileNotFoundError(f"Arquivo DOCX não encontrado: {template_path}")
+        try:
+            DocxStreamRenderer().render(template_path, replacements, output_path, template)
+            return
+        except Exception as e:
+            logger.warning(f"Renderização rápida falhou, usando python-docx: {e}")
+            if hasattr(output_path, 'truncate'):
+                output_path.seek(0)
+                output_path.truncate()
+        super().render_to_file(template_path, replacements, output_path, template)
+
     def _replace_in_header_footer(self, header_footer: Any, replacements: Dict[str, str]) -> None:
         """Substitui chaves no header ou footer do documento."""
         if header_footer:
@@ -92,13 +131,8 @@ class PythonDocxAdapter(DocumentServicePort):
                 run.text = ""
 
     def _replace_keys_in_text(self, text: str, replacements: Dict[str, str]) -> str:
-        """Substitui chaves no texto usando regex case-insensitive."""
-        sorted_keys = sorted(replacements.keys(), key=len, reverse=True)
-        for key in sorted_keys:
-            pattern = r'(?<![\w.])' + re.escape(key) + r'(?!\.[a-z]{2,}\b)'
-            new_val: str = str(replacements[key])
-            text = re.sub(pattern, new_val, text, flags=re.IGNORECASE)
-        return text
+        """Substitui chaves no texto em uma única passada (PlaceholderEngine)."""
+        return PlaceholderEngine.of(replacements).replace(text)
 
     def _replace_in_shapes(self, shapes: Any, replacements: Dict[str, str]) -> None:
         """Substitui chaves em shapes com text_frame."""
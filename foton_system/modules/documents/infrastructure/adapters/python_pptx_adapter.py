@@ -1,13 +1,15 @@
 import os
-import re
 from typing import Dict, Any
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.slide import Slide
 from pptx.shapes.base import BaseShape
 from pptx.table import Table, _Cell, _Row
+from pptx.oxml.ns import qn
+from pptx.text.text import _Paragraph
 from foton_system.modules.shared.infrastructure.config.logger import setup_logger
 from foton_system.modules.documents.application.ports.document_service_port import DocumentServicePort
+from foton_system.modules.documents.domain.services.placeholder_engine import PlaceholderEngine
 
 logger = setup_logger()
 
@@ -36,6 +38,7 @@ class PythonPPTXAdapter(DocumentServicePort):
     def replace_text(self, document: Presentation, replacements: Dict[str, str]) -> Presentation:
         """Substitui chaves por valores em todos os slides e tabelas."""
         logger.info('Iniciando substituição de textos no PPTX...')
+        replacements = PlaceholderEngine.of(replacements)
 
         for slide in document.slides:
             for shape in slide.shapes:
@@ -47,6 +50,27 @@ class PythonPPTXAdapter(DocumentServicePort):
         logger.info('Substituição de textos concluída.')
         return document
 
+    def replace_compiled(self, document: Presentation, replacements: Dict[str, str], template: Any) -> Presentation:
+        """Substitui chaves apenas nos parágrafos registrados no template compilado."""
+        logger.info(f'Iniciando substituição em {template.paragraph_count} parágrafos do PPTX...')
+        replacements = PlaceholderEngine.of(replacements)
+        parts = {str(part.partname).lstrip('/'): part for part in document.part.package.iter_parts()}
+
+        for part_name, indices in template.locations.items():
+            part = parts.get(part_name)
+            if part is None:
+                continue
+            p_elements = list(part._element.iter(qn('a:p')))
+            for i in indices:
+                if i < len(p_elements):
+                    paragraph = _Paragraph(p_elements[i], None)
+                    self._consolidate_runs(paragraph)
+                    for run in paragraph.runs:
+                        run.text = self._replace_keys_in_text(run.text, replacements)
+
+        logger.info('Substituição de textos concluída.')
+        return document
+
     def _replace_in_text_frame(self, text_frame: Any, replacements: Dict[str, str]) -> None:
         """Substitui chaves no text frame, consolidando runs antes."""
         for paragraph in text_frame.paragraphs:
@@ -69,10 +93,5 @@ class PythonPPTXAdapter(DocumentServicePort):
                 self._replace_in_text_frame(cell.text_frame, replacements)
 
     def _replace_keys_in_text(self, text: str, replacements: Dict[str, str]) -> str:
-        """Substitui chaves no texto usando regex case-insensitive."""
-        sorted_keys = sorted(replacements.keys(), key=len, reverse=True)
-        for key in sorted_keys:
-            pattern = r'(?<![\w.])' + re.escape(key) + r'(?!\.[a-z]{2,}\b)'
-            new_val: str = str(replacements[key])
-            text = re.sub(pattern, new_val, text, flags=re.IGNORECASE)
-        return text
+        """Substitui chaves no texto em uma única passada (PlaceholderEngine)."""
+        return PlaceholderEngine.of(replacements).replace(text)
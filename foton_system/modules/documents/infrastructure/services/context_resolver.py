@@ -0,0 +1,207 @@
+"""
+ContextResolver - merged INFO context per directory.
+
+Document data inherits the INFO files of every folder between the clients
+root and the data file (client < service < subfolder). For each folder the
+canonical ``INFO-CLIENTE.md`` / ``INFO-SERVICO.md`` wins, otherwise the most
+recently modified ``*INFO*.md``.
+
+The resolver memoizes, per folder:
+
+- the INFO candidates, keyed by the folder mtime plus (mtime_ns, size) of
+  each candidate (a new/removed file bumps the folder mtime; an edit changes
+  the file's own stat);
+- the merged, lowercased variable map of the whole chain, keyed by the
+  (file, mtime_ns, size) of the chosen file at every level.
+
+A warm lookup costs one ``stat`` per folder and per candidate: no glob, no
+sort, no parse. Generating ten documents for one service reads each INFO
+file once.
+"""
+
+import fnmatch
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
+
+logger = setup_logger()
+
+INFO_GLOB = "*INFO*.md"
+CANONICAL_NAMES = ('INFO-CLIENTE.MD', 'INFO-SERVICO.MD')
+
+# (name, mtime_ns, size)
+_Candidate = Tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class _FolderEntry:
+    mtime_ns: int
+    candidates: Tuple[_Candidate, ...]
+    chosen: Optional[_Candidate]
+
+
+@dataclass(frozen=True)
+class ResolvedContext:
+    files: List[Path]
+    data: Dict[str, str]
+
+
+def _choose(candidates: Tuple[_Candidate, ...]) -> Optional[_Candidate]:
+    if not candidates:
+        return None
+    for candidate in candidates:
+        if candidate[0].upper() in CANONICAL_NAMES:
+            return candidate
+    return max(candidates, key=lambda c: c[1])
+
+
+def chain_dirs(folder: Path, base: Path) -> List[Path]:
+    """Folders from just below `base` down to `folder` (stops at the filesystem root)."""
+    dirs = []
+    current = Path(folder)
+    while current != base and current != current.parent:
+        dirs.append(current)
+        current = current.parent
+    dirs.reverse()
+    return dirs
+
+
+class ContextResolver:
+    """Per-directory memo of the INFO chain and its merged variables."""
+
+    _instance: Optional["ContextResolver"] = None
+    DEFAULT_MAX_ENTRIES = 2048
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, store: Optional[InfoFileStore] = None):
+        self.max_entries = max_entries
+        self._store = store
+        self._folders: "OrderedDict[str, _FolderEntry]" = OrderedDict()
+        self._merged: "OrderedDict[Tuple[str, str], Tuple[tuple, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def instance(cls) -> "ContextResolver":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    @property
+    def store(self) -> InfoFileStore:
+        return self._store or InfoFileStore.instance()
+
+    # --- Lookup ------------------------------------------------------------
+
+    def info_files(self, folder, base) -> List[Path]:
+        """Chosen INFO file of each folder in the chain, root first."""
+        return [Path(d) / c[0] for d, c in self._chain(Path(folder), Path(base)) if c]
+
+    def resolve(self, folder, base) -> ResolvedContext:
+        """INFO files and merged lowercased variables for `folder` (data returned as a copy)."""
+        folder, base = Path(folder), Path(base)
+        chain = self._chain(folder, base)
+        signature = tuple((str(d), c) for d, c in chain if c)
+        files = [Path(d) / c[0] for d, c in chain if c]
+        key = (str(folder), str(base))
+
+        with self._lock:
+            cached = self._merged.get(key)
+            if cached is not None and cached[0] == signature:
+                self._merged.move_to_end(key)
+                self.hits += 1
+                return ResolvedContext(files, dict(cached[1]))
+            self.misses += 1
+
+        data: Dict[str, str] = {}
+        for path in files:
+            logger.info(f"Carregando contexto de: {path.name} em {path.parent.name}")
+            data.update({k.lower(): v for k, v in self.store.read(path).items()})
+
+        with self._lock:
+            self._merged[key] = (signature, data)
+            self._merged.move_to_end(key)
+            while len(self._merged) > self.max_entries:
+                self._merged.popitem(last=False)
+        return ResolvedContext(files, dict(data))
+
+    def _chain(self, folder: Path, base: Path) -> List[Tuple[Path, Optional[_Candidate]]]:
+        return [(d, self._folder_entry(d).chosen) for d in chain_dirs(folder, base)]
+
+    def _folder_entry(self, folder: Path) -> _FolderEntry:
+        key = str(folder)
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except OSError:
+            return _FolderEntry(0, (), None)
+
+        with self._lock:
+            entry = self._folders.get(key)
+        if entry is not None and entry.mtime_ns == mtime_ns and self._unchanged(folder, entry.candidates):
+            return entry
+
+        entry = self._scan(folder, mtime_ns)
+        with self._lock:
+            self._folders[key] = entry
+            self._folders.move_to_end(key)
+            while len(self._folders) > self.max_entries:
+                self._folders.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _unchanged(folder: Path, candidates: Tuple[_Candidate, ...]) -> bool:
+        for name, mtime_ns, size in candidates:
+            try:
+                st = os.stat(os.path.join(folder, name))
+            except OSError:
+                return False
+            if st.st_mtime_ns != mtime_ns or st.st_size != size:
+                return False
+        return True
+
+    @staticmethod
+    def _scan(folder: Path, mtime_ns: int) -> _FolderEntry:
+        candidates = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if fnmatch.fnmatch(entry.name, INFO_GLOB) and entry.is_file():
+                        st = entry.stat()
+                        candidates.append((entry.name, st.st_mtime_ns, st.st_size))
+        except OSError as e:
+            logger.debug(f"Pasta de contexto ilegível {folder}: {e}")
+        candidates.sort()
+        candidates = tuple(candidates)
+        return _FolderEntry(mtime_ns, candidates, _choose(candidates))
+
+    def invalidate(self, folder=None):
+        """Drops one folder (and every merged chain through it), or everything."""
+        with self._lock:
+            if folder is None:
+                self._folders.clear()
+                self._merged.clear()
+                return
+            prefix = str(Path(folder))
+            self._folders.pop(prefix, None)
+            for key in [k for k in self._merged if k[0] == prefix or k[0].startswith(prefix + os.sep)]:
+                del self._merged[key]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'folders': len(self._folders),
+            'chains': len(self._merged),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
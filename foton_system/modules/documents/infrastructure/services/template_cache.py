@@ -0,0 +1,176 @@
+"""
+TemplateCache - compiled .docx/.pptx templates.
+
+A template is parsed once, straight from its zip parts with lxml (no
+python-docx/python-pptx object model), into a ``CompiledTemplate``:
+
+- ``required_keys``: every ``@variavel`` found in the template (lowercase)
+- ``locations``: per XML part, the document-order indices of the paragraphs
+  (``w:p`` / ``a:p``) whose text contains ``@``
+
+Validation becomes a set difference and rendering only visits the recorded
+paragraphs. Entries are keyed by template path and revalidated with
+(mtime_ns, size), so editing a template recompiles it on next use.
+"""
+
+import os
+import re
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.documents.domain.services.placeholder_engine import KEY_PATTERN
+
+logger = setup_logger()
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+
+# Parts visited by the adapters: body, headers and footers / slides.
+PART_PATTERNS = {
+    'docx': re.compile(r'^word/(document|header\d*|footer\d*)\.xml$'),
+    'pptx': re.compile(r'^ppt/slides/slide\d+\.xml$'),
+}
+PARAGRAPH_TAGS = {
+    'docx': f'{{{W_NS}}}p',
+    'pptx': f'{{{A_NS}}}p',
+}
+# Text of a paragraph as the adapters see it: its own runs and hyperlinks
+# (nested text boxes are separate paragraphs). Tabs/breaks count as whitespace.
+_RUN_TEXT = {
+    'docx': etree.XPath('./w:r/*[self::w:t or self::w:tab or self::w:br or self::w:cr]'
+                        ' | ./w:hyperlink/w:r/*[self::w:t or self::w:tab or self::w:br or self::w:cr]',
+                        namespaces={'w': W_NS}),
+    'pptx': etree.XPath('./a:r/a:t | ./a:br', namespaces={'a': A_NS}),
+}
+_TEXT_TAGS = {f'{{{W_NS}}}t', f'{{{A_NS}}}t'}
+
+
+def paragraph_text(p_element, doc_type: str) -> str:
+    return ''.join(
+        (node.text or '') if node.tag in _TEXT_TAGS else ' '
+        for node in _RUN_TEXT[doc_type](p_element)
+    )
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    path: str
+    doc_type: str
+    mtime_ns: int
+    size: int
+    required_keys: FrozenSet[str]
+    locations: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+
+    @property
+    def paragraph_count(self) -> int:
+        return sum(len(indices) for indices in self.locations.values())
+
+    def missing_keys(self, available: Iterable[str]) -> List[str]:
+        """Required keys not present in `available` (case-insensitive), sorted."""
+        return sorted(self.required_keys - {str(k).lower() for k in available})
+
+
+def compile_template(path, doc_type: str) -> CompiledTemplate:
+    """Parses a template once. Raises OSError / zipfile.BadZipFile / ValueError."""
+    if doc_type not in PART_PATTERNS:
+        raise ValueError(f"Tipo de documento desconhecido: {doc_type}")
+
+    path = str(path)
+    st = os.stat(path)
+    pattern = PART_PATTERNS[doc_type]
+    tag = PARAGRAPH_TAGS[doc_type]
+    required = set()
+    locations: Dict[str, Tuple[int, ...]] = {}
+
+    with zipfile.ZipFile(path) as zf:
+        for name in zf.namelist():
+            if not pattern.match(name):
+                continue
+            root = etree.fromstring(zf.read(name))
+            hits = []
+            for i, p in enumerate(root.iter(tag)):
+                text = paragraph_text(p, doc_type)
+                if '@' in text:
+                    hits.append(i)
+                    required.update(k.lower() for k in KEY_PATTERN.findall(text))
+            if hits:
+                locations[name] = tuple(hits)
+
+    return CompiledTemplate(path, doc_type, st.st_mtime_ns, st.st_size, frozenset(required), locations)
+
+
+class TemplateCache:
+    """Bounded LRU of CompiledTemplate, revalidated by (mtime_ns, size)."""
+
+    _instance: Optional["TemplateCache"] = None
+    DEFAULT_MAX_ENTRIES = 128
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], CompiledTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def instance(cls) -> "TemplateCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    def get(self, path, doc_type: str) -> CompiledTemplate:
+        key = (str(path), doc_type)
+        st = os.stat(key[0])
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        compiled = compile_template(key[0], doc_type)
+        logger.debug(f"Template compilado: {key[0]} ({len(compiled.required_keys)} chaves, "
+                     f"{compiled.paragraph_count} parágrafos)")
+
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def put(self, compiled: CompiledTemplate) -> None:
+        """Seeds the cache with an already compiled template (e.g. in pool workers)."""
+        with self._lock:
+            self._entries[(compiled.path, compiled.doc_type)] = compiled
+            self._entries.move_to_end((compiled.path, compiled.doc_type))
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == str(path)]:
+                    del self._entries[key]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
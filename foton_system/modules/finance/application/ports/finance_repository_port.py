@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class FinanceRepositoryPort(ABC):
     @abstractmethod
@@ -8,7 +8,20 @@ class FinanceRepositoryPort(ABC):
         """Saves a financial entry to the client's ledger."""
         pass
 
+    def save_entries(self, client_path: Path, entries: List[List[str]], headers: List[str]) -> None:
+        """Saves several entries at once (repositories may write them in one operation)."""
+        for entry in entries:
+            self.save_entry(client_path, entry, headers)
+
     @abstractmethod
     def get_entries(self, client_path: Path) -> List[Dict[str, Any]]:
         """Retrieves all financial entries for a client."""
         pass
+
+    def get_totals(self, client_path: Path) -> Optional[Dict[str, float]]:
+        """Precomputed {total_entradas, total_saidas, saldo}, or None to sum get_entries()."""
+        return None
+
+    def get_totals_many(self, client_paths: List[Path]) -> Dict[Path, Optional[Dict[str, float]]]:
+        """get_totals for several clients at once (repositories may batch/cache this)."""
+        return {p: self.get_totals(p) for p in client_paths}
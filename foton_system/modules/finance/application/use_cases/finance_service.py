@@ -1,6 +1,6 @@
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from foton_system.modules.shared.infrastructure.utils.formatting import FotonFormatter
 from foton_system.modules.finance.application.ports.finance_repository_port import FinanceRepositoryPort
 
@@ -13,27 +13,47 @@ class FinanceService:
         """
         Adiciona uma movimentação financeira e retorna o resumo.
         """
+        entry = self._build_entry(description, value, entry_type)
+        self.repository.save_entry(client_path, entry, self.headers)
+        
+        return self.get_summary(client_path)
+
+    def add_entries(self, client_path: Path, entries: List[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Adiciona várias movimentações de uma vez (uma única gravação no livro-caixa)
+        e retorna o resumo. Cada item: {description, value, type, date (opcional, YYYY-MM-DD)}.
+        """
+        rows = [
+            self._build_entry(e['description'], e['value'], e.get('type', 'ENTRADA'), e.get('date'))
+            for e in entries
+        ]
+        self.repository.save_entries(client_path, rows, self.headers)
+        return self.get_summary(client_path)
+
+    @staticmethod
+    def _build_entry(description: str, value: Any, entry_type: str, date: Optional[str] = None) -> List[str]:
         # Garantir que o valor seja float (converte se necessário usando o formatador do sistema)
         if isinstance(value, str):
             clean_value = FotonFormatter.parse_br_number(value)
         else:
             clean_value = float(value)
 
-        entry = [
-            datetime.now().strftime('%Y-%m-%d'),
+        return [
+            date or datetime.now().strftime('%Y-%m-%d'),
             description,
             entry_type,
             f"{clean_value:.2f}"
         ]
 
-        self.repository.save_entry(client_path, entry, self.headers)
-        
-        return self.get_summary(client_path)
-
     def get_summary(self, client_path: Path) -> Dict[str, float]:
         """
-        Calcula o resumo financeiro a partir das entradas do repositório.
+        Calcula o resumo financeiro. Usa os totais acumulados do repositório
+        quando disponíveis; senão soma todas as entradas.
         """
+        totals = self.repository.get_totals(client_path)
+        if totals is not None:
+            return totals
+
         entries = self.repository.get_entries(client_path)
         
         entradas = 0.0
@@ -59,12 +79,14 @@ class FinanceService:
         """Aggregate financial summaries across multiple clients.
 
         Each entry: {name, income, expense, balance}.
-        Clients without any financial data are omitted.
+        Clients without any financial data are omitted. Totals come from
+        the repository in one batch (cached per ledger by the CSV repository).
         """
+        totals = self.repository.get_totals_many(client_paths)
         results = []
         for p in client_paths:
             try:
-                summary = self.get_summary(p)
+                summary = totals.get(p) or self.get_summary(p)
             except Exception:
                 continue
             if summary.get('total_entradas', 0) == 0 and summary.get('total_saidas', 0) == 0:
@@ -0,0 +1,166 @@
+"""
+Ledger analytics - vectorized pandas operations over the firm's entries.
+
+Entries are loaded once into typed columns (``prepare``):
+
+    client  category
+    data    datetime64
+    tipo    category (ENTRADA | SAIDA)
+    valor   float64 (always positive, as written in FINANCEIRO.csv)
+    signed  float64 (+valor for ENTRADA, -valor for SAIDA)
+
+and every analysis is a groupby / cumsum / rolling over those columns — no
+per-row Python. ``freq`` is a pandas period alias: 'M', 'Q' or 'Y'
+(``PERIOD_ALIASES`` maps the PT-BR names used by the CLI/MCP).
+"""
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+ENTRADA = 'ENTRADA'
+SAIDA = 'SAIDA'
+PERIOD_ALIASES = {
+    'mensal': 'M', 'trimestral': 'Q', 'anual': 'Y',
+    'm': 'M', 'q': 'Q', 'y': 'Y',
+}
+METRICS = ('income', 'expense', 'net')
+
+
+def period_alias(value: str) -> str:
+    """'mensal'/'M' -> 'M', etc. Raises ValueError for unknown periods."""
+    freq = PERIOD_ALIASES.get(str(value or 'M').strip().lower())
+    if freq is None:
+        raise ValueError(f"Período inválido: {value} (use mensal, trimestral ou anual)")
+    return freq
+
+
+def prepare(raw: pd.DataFrame) -> pd.DataFrame:
+    """Typed, date-sorted frame from rows with client/data/tipo/valor columns.
+
+    Dates must be ISO ('YYYY-MM-DD', as stored by FirmLedgerStore); rows with
+    an invalid date or value are dropped. Any type other than ENTRADA counts
+    as SAIDA, same rule as the ledger totals.
+    """
+    is_income = (raw['tipo'] == ENTRADA).to_numpy()
+    df = pd.DataFrame({
+        'client': raw['client'].astype('category'),
+        'data': pd.to_datetime(raw['data'], format='%Y-%m-%d', errors='coerce'),
+        'tipo': pd.Categorical.from_codes(np.where(is_income, 0, 1), categories=[ENTRADA, SAIDA]),
+        'valor': pd.to_numeric(raw['valor'], errors='coerce').astype('float64'),
+    })
+    df['signed'] = np.where(is_income, df['valor'], -df['valor'])
+    df = df.dropna(subset=['data', 'valor'])
+    return df.sort_values('data', kind='stable').reset_index(drop=True)
+
+
+def _income_expense(df: pd.DataFrame):
+    income = df['valor'].where(df['tipo'] == ENTRADA, 0.0)
+    return income, df['valor'] - income
+
+
+def _full_range(frame: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """Reindexes a period-indexed frame so periods without entries show as zero."""
+    if frame.empty:
+        return frame
+    full = pd.period_range(frame.index.min(), frame.index.max(), freq=freq)
+    return frame.reindex(full, fill_value=0.0)
+
+
+def cash_flow(df: pd.DataFrame, freq: str = 'M') -> pd.DataFrame:
+    """Income, expense, net and cumulative net per period (index: Period)."""
+    income, expense = _income_expense(df)
+    period = df['data'].dt.to_period(freq)
+    out = pd.DataFrame({'income': income, 'expense': expense}).groupby(period).sum()
+    out = _full_range(out, freq)
+    out['net'] = out['income'] - out['expense']
+    out['cumulative'] = out['net'].cumsum()
+    out.index.name = 'period'
+    return out
+
+
+def rolling_balance(df: pd.DataFrame, freq: str = 'M', window: int = 3) -> pd.DataFrame:
+    """Per-client running balance and rolling net over `window` periods.
+
+    Columns: period, client, net, balance, rolling_net — one row per client
+    and period from the client's first entry on.
+    """
+    columns = ['period', 'client', 'net', 'balance', 'rolling_net']
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    period = df['data'].dt.to_period(freq).rename('period')
+    grouped = df.groupby([period, df['client']], observed=True)['signed']
+    net = _full_range(grouped.sum().unstack(fill_value=0.0), freq)
+    active = _full_range(grouped.size().unstack(fill_value=0), freq).cumsum() > 0
+
+    wide = {
+        'net': net,
+        'balance': net.cumsum(),
+        'rolling_net': net.rolling(window, min_periods=1).sum(),
+    }
+    out = pd.concat({name: frame.where(active).stack() for name, frame in wide.items()}, axis=1)
+    out = out.dropna(subset=['balance'])
+    out.index.names = ['period', 'client']
+    return out.reset_index()[columns]
+
+
+def receivables_aging(df: pd.DataFrame, as_of=None, buckets: Iterable[int] = (30, 60, 90)) -> pd.DataFrame:
+    """Amounts still owed per client, bucketed by age in days.
+
+    Per-client ledgers record receipts (ENTRADA) and what was spent on the
+    client (SAIDA). Receipts settle the oldest expenses first (FIFO); what
+    is left of each expense is outstanding and ages from its date.
+    Columns: one per bucket ('0-30', '31-60', '61-90', '90+'), total and
+    oldest_days; only clients with something outstanding, largest first.
+    """
+    buckets = sorted(int(b) for b in buckets)
+    labels = [f"{lo + 1 if lo else 0}-{hi}" for lo, hi in zip([0] + buckets[:-1], buckets)] + [f"{buckets[-1]}+"]
+    if df.empty:
+        return pd.DataFrame(columns=labels + ['total', 'oldest_days'])
+
+    as_of = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp.today()
+    as_of = as_of.normalize()
+    income, expense = _income_expense(df)
+    by_client = df['client']
+    received = income.groupby(by_client, observed=True).transform('sum')
+    spent_so_far = expense.groupby(by_client, observed=True).cumsum()
+    outstanding = np.minimum(expense, (spent_so_far - received).clip(lower=0.0))
+
+    owed = outstanding > 0
+    age = (as_of - df.loc[owed, 'data']).dt.days.clip(lower=0)
+    bucket = pd.cut(age, bins=[-np.inf] + buckets + [np.inf], labels=labels)
+    table = (outstanding[owed].groupby([by_client[owed], bucket], observed=False).sum()
+             .unstack(fill_value=0.0).reindex(columns=labels, fill_value=0.0))
+    table.columns = table.columns.astype(str)
+    table.columns.name = None
+    table['total'] = table[labels].sum(axis=1)
+    table = table[table['total'] > 0].copy()
+    table['oldest_days'] = age.groupby(by_client[owed], observed=True).max().reindex(table.index).astype(int)
+    table.index.name = 'client'
+    return table.sort_values('total', ascending=False)
+
+
+def year_over_year(df: pd.DataFrame, metric: str = 'income', freq: str = 'M') -> pd.DataFrame:
+    """`metric` per month (or quarter) of the year, one column per year, plus
+    '<year>/<previous> %' change columns (NaN where the previous year is zero)."""
+    if metric not in METRICS:
+        raise ValueError(f"Métrica inválida: {metric} (use {', '.join(METRICS)})")
+    income, expense = _income_expense(df)
+    values = {'income': income, 'expense': expense, 'net': df['signed']}[metric]
+    dates = df['data']
+    if freq == 'Q':
+        slot, slots = dates.dt.quarter.rename('quarter'), list(range(1, 5))
+    elif freq == 'Y':
+        slot, slots = pd.Series('total', index=df.index, name='period'), ['total']
+    else:
+        slot, slots = dates.dt.month.rename('month'), list(range(1, 13))
+
+    table = values.groupby([slot, dates.dt.year.rename('year')]).sum().unstack(fill_value=0.0)
+    table = table.reindex(slots, fill_value=0.0)
+    years = sorted(table.columns)
+    table = table[years]
+    table.columns = [str(y) for y in years]
+    for prev, cur in zip(years, years[1:]):
+        table[f"{cur}/{prev} %"] = (table[str(cur)] / table[str(prev)].replace(0.0, np.nan) - 1.0) * 100.0
+    return table
@@ -2,6 +2,8 @@ import csv
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from foton_system.modules.finance.application.ports.finance_repository_port import FinanceRepositoryPort
+from foton_system.modules.finance.infrastructure.repositories.ledger_writer import append_rows
+from foton_system.modules.finance.infrastructure.services.ledger_totals_cache import LedgerTotalsCache
 from foton_system.modules.shared.infrastructure.config.logger import setup_logger
 from foton_system.modules.shared.infrastructure.config.config import Config
 
@@ -24,15 +26,13 @@ class CSVFinanceRepository(FinanceRepositoryPort):
         return new_path
 
     def save_entry(self, client_path: Path, entry: List[str], headers: List[str]) -> None:
+        self.save_entries(client_path, [entry], headers)
+
+    def save_entries(self, client_path: Path, entries: List[List[str]], headers: List[str]) -> None:
+        """Appends all rows under the ledger lock, in one write and one fsync."""
         file_path = self._get_ledger_path(client_path)
-        is_new = not file_path.exists()
-        
         try:
-            with open(file_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                if is_new:
-                    writer.writerow(headers)
-                writer.writerow(entry)
+            append_rows(file_path, entries, headers)
         except Exception as e:
             logger.error(f"Erro ao salvar entrada financeira em {file_path}: {e}")
             raise
@@ -54,3 +54,13 @@ class CSVFinanceRepository(FinanceRepositoryPort):
             return []
         
         return entries
+
+    def get_totals(self, client_path: Path) -> Dict[str, float]:
+        """Running totals from the ledger sidecar (only newly appended lines are parsed)."""
+        return self.get_totals_many([client_path])[client_path]
+
+    def get_totals_many(self, client_paths: List[Path]) -> Dict[Path, Dict[str, float]]:
+        """Totals per client through LedgerTotalsCache: unchanged ledgers cost one stat."""
+        ledgers = {p: self._get_ledger_path(p) for p in client_paths}
+        totals = LedgerTotalsCache.instance().totals(ledgers.values())
+        return {p: totals[ledger] for p, ledger in ledgers.items()}
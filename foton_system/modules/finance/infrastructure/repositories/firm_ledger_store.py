@@ -0,0 +1,279 @@
+"""
+FirmLedgerStore - consolidated, indexed copy of every client's FINANCEIRO.csv.
+
+The dispersed CSVs stay the source of truth; this is a materialized view in
+SQLite (``financeiro.sqlite`` in the app data dir) with one row per entry:
+
+    entries(client, data ISO 'YYYY-MM-DD', descricao, tipo ENTRADA|SAIDA, valor)
+
+indexed by date, (client, date) and (tipo, date), so period questions become
+one aggregate query instead of a scan of every ledger.
+
+Sync is incremental per ledger, with the same rules as the totals sidecar
+(``ledger_summary``): unchanged (size, mtime) -> skipped; grew with the
+consumed bytes intact -> only the appended rows are inserted; anything else
+-> that client's rows are replaced. ``sync`` covers the whole firm (and drops
+clients whose ledger disappeared); the watcher calls ``sync_ledger`` when a
+FINANCEIRO.csv changes.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import pandas as pd
+
+from foton_system.modules.finance.infrastructure.repositories.csv_finance_repository import CSVFinanceRepository
+from foton_system.modules.finance.infrastructure.repositories.ledger_summary import (
+    complete_lines, consumed_digest, parse_rows, read_appended,
+)
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+from foton_system.modules.shared.infrastructure.services.path_manager import PathManager
+
+logger = setup_logger()
+
+DB_FILENAME = "financeiro.sqlite"
+LEDGER_FILENAME = "FINANCEIRO.csv"
+_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%d/%m/%y', '%d-%m-%Y')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledgers (
+    client   TEXT PRIMARY KEY,
+    path     TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset   INTEGER NOT NULL,
+    tail     TEXT NOT NULL,
+    header   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    client    TEXT NOT NULL,
+    data      TEXT,
+    descricao TEXT,
+    tipo      TEXT NOT NULL,
+    valor     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_data ON entries(data);
+CREATE INDEX IF NOT EXISTS idx_entries_client_data ON entries(client, data);
+CREATE INDEX IF NOT EXISTS idx_entries_tipo_data ON entries(tipo, data);
+"""
+
+_SUMS = ("COALESCE(SUM(CASE WHEN tipo = 'ENTRADA' THEN valor END), 0) AS income, "
+         "COALESCE(SUM(CASE WHEN tipo = 'SAIDA' THEN valor END), 0) AS expense, "
+         "COUNT(*) AS count")
+
+
+def parse_ledger_date(value) -> Optional[str]:
+    """ISO date ('YYYY-MM-DD') of a ledger/user date, or None when unparseable."""
+    text = str(value or '').strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return None
+
+
+def firm_ledger_paths(config) -> Dict[str, Path]:
+    """{client folder name: FINANCEIRO.csv path} for every client folder."""
+    base = config.base_pasta_clientes
+    ignored = set(config.ignored_folders + ['.obsidian'])
+    repo = CSVFinanceRepository(config)
+    if not base or not base.exists():
+        return {}
+    return {d.name: repo._get_ledger_path(d) for d in sorted(base.iterdir())
+            if d.is_dir() and d.name not in ignored}
+
+
+def client_of_ledger(path: Path, config) -> Optional[str]:
+    """Client folder owning `path`, if it is that client's active ledger."""
+    try:
+        client = Path(path).relative_to(config.base_pasta_clientes).parts[0]
+    except (ValueError, IndexError):
+        return None
+    client_dir = config.base_pasta_clientes / client
+    if Path(path) != CSVFinanceRepository(config)._get_ledger_path(client_dir):
+        return None
+    return client
+
+
+class FirmLedgerStore:
+    """SQLite materialization of the firm's ledgers (see module docstring)."""
+
+    _instance: Optional["FirmLedgerStore"] = None
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else PathManager.get_app_data_dir() / DB_FILENAME
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def instance(cls) -> "FirmLedgerStore":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # --- Sync --------------------------------------------------------------
+
+    def sync(self, ledgers: Mapping[str, Path]) -> Dict[str, int]:
+        """Brings every client in `ledgers` up to date and drops the others."""
+        stats = {'unchanged': 0, 'appended': 0, 'rebuilt': 0, 'removed': 0, 'rows': 0}
+        for client, path in ledgers.items():
+            status, rows = self.sync_ledger(client, path)
+            stats[status] += 1
+            stats['rows'] += rows
+        with self._lock, closing(self._connect()) as conn, conn:
+            known = [r['client'] for r in conn.execute("SELECT client FROM ledgers")]
+            for client in known:
+                if client not in ledgers:
+                    self._drop(conn, client)
+                    stats['removed'] += 1
+        return stats
+
+    def sync_ledger(self, client: str, path: Path) -> tuple:
+        """Syncs one client's ledger. Returns (status, rows inserted)."""
+        path = Path(path)
+        with self._lock, closing(self._connect()) as conn, conn:
+            state = conn.execute("SELECT * FROM ledgers WHERE client = ?", (client,)).fetchone()
+            try:
+                st = os.stat(path)
+            except OSError:
+                if state is None:
+                    return 'unchanged', 0
+                self._drop(conn, client)
+                return 'removed', 0
+
+            if (state is not None and state['path'] == str(path)
+                    and state['size'] == st.st_size and state['mtime_ns'] == st.st_mtime_ns):
+                return 'unchanged', 0
+
+            try:
+                with open(path, 'rb') as f:
+                    appended = None
+                    if state is not None and state['path'] == str(path):
+                        appended = read_appended(f, state['offset'], state['tail'])
+                    if appended is not None:
+                        status, header, offset = 'appended', json.loads(state['header']), state['offset']
+                        rows = parse_rows(appended)
+                    else:
+                        f.seek(0)
+                        appended = complete_lines(f.read())
+                        status, offset = 'rebuilt', 0
+                        rows = parse_rows(appended)
+                        header = next(rows, [])
+                        self._drop(conn, client)
+                    inserted = self._insert(conn, client, header, rows)
+                    offset += len(appended)
+                    tail = consumed_digest(f, offset)
+            except (OSError, UnicodeDecodeError) as e:
+                conn.rollback()
+                logger.error(f"Erro ao consolidar livro-caixa {path}: {e}")
+                return 'unchanged', 0
+
+            conn.execute(
+                "INSERT OR REPLACE INTO ledgers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (client, str(path), st.st_size, st.st_mtime_ns, offset, tail, json.dumps(header)),
+            )
+        return status, inserted
+
+    @staticmethod
+    def _drop(conn, client: str) -> None:
+        conn.execute("DELETE FROM entries WHERE client = ?", (client,))
+        conn.execute("DELETE FROM ledgers WHERE client = ?", (client,))
+
+    @staticmethod
+    def _insert(conn, client: str, header: List[str], rows: Iterable[List[str]]) -> int:
+        try:
+            idx = {name: header.index(name) for name in ('Data', 'Descricao', 'Tipo', 'Valor')}
+        except ValueError:
+            return 0
+        batch = []
+        for row in rows:
+            try:
+                valor = float(row[idx['Valor']])
+                tipo = 'ENTRADA' if row[idx['Tipo']] == 'ENTRADA' else 'SAIDA'
+            except (ValueError, IndexError):
+                continue
+            batch.append((client, parse_ledger_date(row[idx['Data']]), row[idx['Descricao']], tipo, valor))
+        conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?)", batch)
+        return len(batch)
+
+    # --- Queries -----------------------------------------------------------
+
+    @staticmethod
+    def _where(start=None, end=None, client=None, tipo=None, min_value=None):
+        clauses, params = [], []
+        if start:
+            clauses.append("data >= ?")
+            params.append(start)
+        if end:
+            clauses.append("data <= ?")
+            params.append(end)
+        if client:
+            clauses.append("client = ?")
+            params.append(client)
+        if tipo:
+            clauses.append("tipo = ?")
+            params.append(tipo)
+        if min_value is not None:
+            clauses.append("valor >= ?")
+            params.append(min_value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _query(self, sql: str, params) -> List[sqlite3.Row]:
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def totals(self, start: Optional[str] = None, end: Optional[str] = None, client: Optional[str] = None,
+               tipo: Optional[str] = None, min_value: Optional[float] = None) -> Dict[str, Any]:
+        """{income, expense, balance, count} of the entries in [start, end] (ISO dates, inclusive)."""
+        where, params = self._where(start, end, client, tipo, min_value)
+        row = self._query(f"SELECT {_SUMS} FROM entries{where}", params)[0]
+        return {'income': row['income'], 'expense': row['expense'],
+                'balance': row['income'] - row['expense'], 'count': row['count']}
+
+    def monthly(self, start: Optional[str] = None, end: Optional[str] = None, client: Optional[str] = None,
+                tipo: Optional[str] = None) -> List[Dict[str, Any]]:
+        """[{month 'YYYY-MM', income, expense, balance, count}] in chronological order."""
+        where, params = self._where(start, end, client, tipo)
+        where += (" AND" if where else " WHERE") + " data IS NOT NULL"
+        rows = self._query(
+            f"SELECT substr(data, 1, 7) AS month, {_SUMS} FROM entries{where} GROUP BY month ORDER BY month",
+            params,
+        )
+        return [{'month': r['month'], 'income': r['income'], 'expense': r['expense'],
+                 'balance': r['income'] - r['expense'], 'count': r['count']} for r in rows]
+
+    def top_clients(self, start: Optional[str] = None, end: Optional[str] = None, tipo: str = 'ENTRADA',
+                    limit: int = 10) -> List[Dict[str, Any]]:
+        """[{name, total, count}] of the clients with the largest `tipo` total in the period."""
+        where, params = self._where(start, end, tipo=tipo)
+        rows = self._query(
+            f"SELECT client, SUM(valor) AS total, COUNT(*) AS count FROM entries{where} "
+            f"GROUP BY client ORDER BY total DESC, client LIMIT ?",
+            params + [int(limit)],
+        )
+        return [{'name': r['client'], 'total': r['total'], 'count': r['count']} for r in rows]
+
+    def frame(self, start: Optional[str] = None, end: Optional[str] = None,
+              client: Optional[str] = None) -> pd.DataFrame:
+        """Raw entries (client, data, tipo, valor) in one read, for vectorized analytics."""
+        where, params = self._where(start, end, client)
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(f"SELECT client, data, tipo, valor FROM entries{where}", conn, params=params)
@@ -0,0 +1,176 @@
+"""
+Running totals for FINANCEIRO.csv ledgers.
+
+Each ledger gets a small sidecar (``.FINANCEIRO.csv.resumo.json``, next to the
+CSV) with the totals, the entry count and the byte offset already consumed:
+
+    {"entradas": 1500.0, "saidas": 300.0, "count": 3, "offset": 187,
+     "size": 187, "mtime_ns": ..., "header": [...], "tail": "<sha1 of the last bytes read>"}
+
+``summarize_ledger`` validates the sidecar against the CSV:
+
+- same (size, mtime_ns)           -> totals returned as-is (no read)
+- grew and the consumed tail still -> only the appended bytes are parsed
+  matches (append-only writes)
+- anything else (shrunk, edited     -> full rebuild
+  in a spreadsheet, no sidecar)
+
+Only complete lines are consumed: a row still being written (no trailing
+newline yet) is left for the next call, and the offset/tail stop before it.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+
+logger = setup_logger()
+
+SIDECAR_SUFFIX = ".resumo.json"
+_TAIL_BYTES = 64
+
+
+def sidecar_path(csv_path: Path) -> Path:
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f".{csv_path.name}{SIDECAR_SUFFIX}")
+
+
+@dataclass
+class LedgerSummary:
+    entradas: float = 0.0
+    saidas: float = 0.0
+    count: int = 0
+    offset: int = 0
+    size: int = 0
+    mtime_ns: int = 0
+    header: List[str] = field(default_factory=list)
+    tail: str = ""
+
+    @property
+    def saldo(self) -> float:
+        return self.entradas - self.saidas
+
+    def totals(self) -> Dict[str, float]:
+        """Same shape as FinanceService.get_summary."""
+        return {'total_entradas': self.entradas, 'total_saidas': self.saidas, 'saldo': self.saldo}
+
+    def fold(self, rows) -> None:
+        """Adds rows (lists in header order) to the totals; malformed rows are skipped."""
+        try:
+            tipo_idx, valor_idx = self.header.index('Tipo'), self.header.index('Valor')
+        except ValueError:
+            return
+        for row in rows:
+            try:
+                val = float(row[valor_idx])
+            except (ValueError, IndexError):
+                continue
+            if row[tipo_idx] == 'ENTRADA':
+                self.entradas += val
+            else:
+                self.saidas += val
+            self.count += 1
+
+
+def _tail_digest(data: bytes) -> str:
+    return hashlib.sha1(data[-_TAIL_BYTES:]).hexdigest()
+
+
+def _load_sidecar(path: Path) -> Optional[LedgerSummary]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return LedgerSummary(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _save_sidecar(path: Path, summary: LedgerSummary) -> None:
+    try:
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(asdict(summary), f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Resumo do livro-caixa não gravado em {path}: {e}")
+
+
+def _read_tail(f, offset: int) -> bytes:
+    """The last bytes before `offset` (what the sidecar digest covers)."""
+    start = max(0, offset - _TAIL_BYTES)
+    f.seek(start)
+    return f.read(offset - start)
+
+
+def consumed_digest(f, offset: int) -> str:
+    """Digest of the bytes just before `offset` in the open (binary) ledger."""
+    return _tail_digest(_read_tail(f, offset))
+
+
+def complete_lines(data: bytes) -> bytes:
+    """`data` up to (and including) its last newline; a torn last row is dropped."""
+    return data[:data.rfind(b'\n') + 1]
+
+
+def read_appended(f, offset: int, tail: str) -> Optional[bytes]:
+    """Complete lines written after `offset`, or None when the part already
+    consumed changed (shrunk or edited in place) and the ledger must be re-read."""
+    if offset > os.fstat(f.fileno()).st_size or consumed_digest(f, offset) != tail:
+        return None
+    f.seek(offset)
+    return complete_lines(f.read())
+
+
+def parse_rows(data: bytes):
+    """CSV rows (lists) of a chunk of ledger bytes."""
+    return csv.reader(io.StringIO(data.decode('utf-8')))
+
+
+def _rebuild(f, st: os.stat_result) -> LedgerSummary:
+    f.seek(0)
+    data = complete_lines(f.read())
+    rows = parse_rows(data)
+    header = next(rows, [])
+    summary = LedgerSummary(header=header)
+    summary.fold(rows)
+    summary.offset = len(data)
+    summary.tail = _tail_digest(data)
+    summary.size, summary.mtime_ns = st.st_size, st.st_mtime_ns
+    return summary
+
+
+def summarize_ledger(csv_path, persist: bool = True) -> LedgerSummary:
+    """Totals of `csv_path`, reading only what was appended since the last call."""
+    csv_path = Path(csv_path)
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return LedgerSummary()
+
+    side = sidecar_path(csv_path)
+    summary = _load_sidecar(side)
+    if summary is not None and summary.size == st.st_size and summary.mtime_ns == st.st_mtime_ns:
+        return summary
+
+    try:
+        with open(csv_path, 'rb') as f:
+            appended = read_appended(f, summary.offset, summary.tail) if summary and summary.header else None
+            if appended is not None:
+                summary.fold(parse_rows(appended))
+                summary.offset += len(appended)
+                summary.tail = consumed_digest(f, summary.offset)
+                summary.size, summary.mtime_ns = st.st_size, st.st_mtime_ns
+            else:
+                summary = _rebuild(f, st)
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error(f"Erro ao ler livro-caixa {csv_path}: {e}")
+        return LedgerSummary()
+
+    if persist:
+        _save_sidecar(side, summary)
+    return summary
@@ -0,0 +1,134 @@
+"""
+Safe appends to FINANCEIRO.csv.
+
+Writers (MCP server, CLI, scripts) serialize on an advisory lock file next
+to the ledger (``.FINANCEIRO.csv.lock``; ``fcntl.flock`` on POSIX,
+``msvcrt.locking`` on Windows). Under the lock a batch of rows is written
+with a single write and a single fsync, the header only when the ledger is
+empty, and a newline first if a hand edit left the last line unterminated.
+
+Two kinds of contention are retried with exponential backoff:
+
+- the lock is held by another writer -> polled up to ``lock_timeout``
+- the ledger itself cannot be opened (``PermissionError``, e.g. OneDrive or
+  Excel holding it) -> same policy as the Excel repository's
+  ``retry_with_backoff`` (3 attempts, 0.5s doubling)
+
+Both end in ``LedgerLockError``.
+"""
+
+import csv
+import io
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, List, Sequence
+
+from foton_system.modules.shared.domain.exceptions import LedgerLockError
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = setup_logger()
+
+MAX_RETRIES = 3
+BASE_DELAY = 0.5
+LOCK_TIMEOUT = 10.0
+_LOCK_POLL = 0.01
+
+
+def lock_path(csv_path: Path) -> Path:
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f".{csv_path.name}.lock")
+
+
+def _try_lock(fh) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    else:
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def ledger_lock(csv_path: Path, timeout: float = LOCK_TIMEOUT):
+    """Exclusive advisory lock on `csv_path` across processes. Raises LedgerLockError on timeout."""
+    path = lock_path(csv_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fh = open(path, 'a+b')
+    try:
+        deadline = time.monotonic() + timeout
+        delay = _LOCK_POLL
+        while not _try_lock(fh):
+            if time.monotonic() >= deadline:
+                raise LedgerLockError(str(csv_path))
+            time.sleep(delay)
+            delay = min(delay * 2, BASE_DELAY)
+        try:
+            yield
+        finally:
+            _unlock(fh)
+    finally:
+        fh.close()
+
+
+def _encode_rows(rows: Iterable[Sequence], headers: Sequence = None) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if headers:
+        writer.writerow(headers)
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def _append_locked(csv_path: Path, rows: List[Sequence], headers: Sequence) -> None:
+    with open(csv_path, 'a+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        prefix = b''
+        if size:
+            f.seek(size - 1)
+            if f.read(1) not in (b'\n', b'\r'):
+                prefix = b'\r\n'
+        f.write(prefix + _encode_rows(rows, None if size else headers))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def append_rows(csv_path: Path, rows: Iterable[Sequence], headers: Sequence,
+                max_retries: int = MAX_RETRIES, base_delay: float = BASE_DELAY,
+                lock_timeout: float = LOCK_TIMEOUT) -> int:
+    """Appends `rows` to the ledger under the lock, in one write + fsync. Returns the row count."""
+    csv_path = Path(csv_path)
+    rows = list(rows)
+    if not rows:
+        return 0
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    for attempt in range(max_retries):
+        try:
+            with ledger_lock(csv_path, timeout=lock_timeout):
+                _append_locked(csv_path, rows, headers)
+            return len(rows)
+        except PermissionError:
+            delay = base_delay * (2 ** attempt)
+            logger.warning(f"Tentativa {attempt + 1}/{max_retries} falhou (livro-caixa bloqueado). "
+                           f"Aguardando {delay:.1f}s...")
+            time.sleep(delay)
+    raise LedgerLockError(str(csv_path))
@@ -0,0 +1,104 @@
+"""
+LedgerTotalsCache - firm-wide totals of every client's FINANCEIRO.csv.
+
+Totals are kept in memory per ledger path and revalidated with one
+``os.stat`` (size, mtime_ns): a warm dashboard costs a stat per client,
+and only ledgers that changed since the last call are summarized again
+(``summarize_ledger``, which itself reads just the appended bytes).
+
+On a cold start the stale ledgers are summarized on a thread pool — the
+work is dominated by file I/O (often a synced/network drive), so threads
+overlap the reads.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from foton_system.modules.finance.infrastructure.repositories.ledger_summary import summarize_ledger
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+
+logger = setup_logger()
+
+EMPTY_TOTALS = {'total_entradas': 0.0, 'total_saidas': 0.0, 'saldo': 0.0}
+
+
+class LedgerTotalsCache:
+    """Totals per ledger path, revalidated by (size, mtime_ns)."""
+
+    _instance: Optional["LedgerTotalsCache"] = None
+    DEFAULT_WORKERS = 8
+    # Below this many stale ledgers a pool costs more than it saves.
+    PARALLEL_MIN = 4
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS):
+        self.max_workers = max_workers
+        self._entries: Dict[str, Tuple[int, int, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def instance(cls) -> "LedgerTotalsCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    def totals(self, ledger_paths: Iterable[Path]) -> Dict[Path, Dict[str, float]]:
+        """{ledger_path: {total_entradas, total_saidas, saldo}}; missing ledgers are zero."""
+        results: Dict[Path, Dict[str, float]] = {}
+        stale = []
+        hits = 0
+        for path in ledger_paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                results[path] = dict(EMPTY_TOTALS)
+                continue
+            with self._lock:
+                entry = self._entries.get(str(path))
+            if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                results[path] = dict(entry[2])
+                hits += 1
+                continue
+            stale.append(path)
+
+        if stale:
+            if len(stale) >= self.PARALLEL_MIN and self.max_workers > 1:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as pool:
+                    summaries = list(pool.map(summarize_ledger, stale))
+            else:
+                summaries = [summarize_ledger(p) for p in stale]
+            logger.debug(f"Livros-caixa resumidos: {len(stale)} (em cache: {hits})")
+
+            with self._lock:
+                for path, summary in zip(stale, summaries):
+                    self._entries[str(path)] = (summary.size, summary.mtime_ns, summary.totals())
+                    results[path] = summary.totals()
+
+        with self._lock:
+            self.misses += len(stale)
+            self.hits += hits
+        return results
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
@@ -59,6 +59,24 @@ class DataIntegrityError(FotonError):
         super().__init__(f"Erro de integridade de dados: {message}")
 
 
+# --- Finance Errors ---
+
+class LedgerLockError(FotonError):
+    """Raised when a client ledger stays locked (another writer, sync client) after all retries."""
+    def __init__(self, path: str):
+        self.path = path
+        super().__init__(f"Livro-caixa bloqueado (em uso por outro processo ou sincronização): {path}")
+
+
+# --- Job Errors ---
+
+class OperationCancelledError(FotonError):
+    """Raised at a progress checkpoint when a background job was cancelled."""
+    def __init__(self, op_name: str):
+        self.op_name = op_name
+        super().__init__(f"Operação cancelada: {op_name}")
+
+
 # --- Document Errors ---
 
 class TemplateNotFoundError(FotonError):
@@ -1,7 +1,10 @@
 import ast
 import operator
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable, Mapping, Optional
 
 _MAX_TOKENS = 50
+_CACHE_SIZE = 512
 
 _ALLOWED_OPS = {
     ast.Add: operator.add,
@@ -14,43 +17,62 @@ _ALLOWED_OPS = {
 
 
 class _SafeVisitor(ast.NodeVisitor):
-    def __init__(self):
+    """Validates the AST once and builds a closure tree evaluating it."""
+
+    def __init__(self, variables=frozenset()):
         self._depth = 0
+        self._variables = variables
 
     def visit_Expression(self, node):
         self._depth = 0
         return self.visit(node.body)
 
     def visit_Constant(self, node):
-        if not isinstance(node.value, (int, float)):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
             raise ValueError("Valor não numérico")
-        return float(node.value)
+        value = float(node.value)
+        return lambda env: value
 
-    def visit_UnaryOp(self, node):
+    def _count(self):
         self._depth += 1
         if self._depth > _MAX_TOKENS:
             raise ValueError("Expressão muito longa")
+
+    def visit_UnaryOp(self, node):
+        self._count()
         op = _ALLOWED_OPS.get(type(node.op))
         if op is None:
             raise ValueError("Operador não permitido")
         operand = self.visit(node.operand)
-        return op(operand)
+        return lambda env: op(operand(env))
 
     def visit_BinOp(self, node):
-        self._depth += 1
-        if self._depth > _MAX_TOKENS:
-            raise ValueError("Expressão muito longa")
+        self._count()
         op = _ALLOWED_OPS.get(type(node.op))
         if op is None:
             raise ValueError("Operador não permitido")
         left = self.visit(node.left)
         right = self.visit(node.right)
-        if isinstance(node.op, ast.Div) and right == 0:
-            return 0.0
-        return op(left, right)
+        if isinstance(node.op, ast.Div):
+            def divide(env):
+                divisor = right(env)
+                return left(env) / divisor if divisor != 0 else 0.0
+            return divide
+        return lambda env: op(left(env), right(env))
 
     def visit_Name(self, node):
-        raise ValueError(f"Nome não permitido: {node.id}")
+        name = node.id
+        if name not in self._variables:
+            raise ValueError(f"Nome não permitido: {name}")
+
+        def lookup(env):
+            try:
+                return float(env[name])
+            except KeyError:
+                raise ValueError(f"Variável ausente: {name}")
+            except (TypeError, ValueError):
+                raise ValueError(f"Valor não numérico em {name}")
+        return lookup
 
     def visit_Call(self, node):
         raise ValueError("Funções não permitidas")
@@ -62,16 +84,30 @@ class _SafeVisitor(ast.NodeVisitor):
         raise ValueError("Subscrição não permitida")
 
     def generic_visit(self, node):
-        if isinstance(node, ast.Expression):
-            return super().generic_visit(node)
         raise ValueError(f"Construto não permitido: {type(node).__name__}")
 
 
-def safe_eval(expression: str) -> float:
-    if not expression or not expression.strip():
-        return 0.0
+class CompiledExpression:
+    """Validated arithmetic expression; call it with a {variable: number} mapping."""
+
+    __slots__ = ('expression', 'variables', '_fn')
+
+    def __init__(self, expression: str, variables: FrozenSet[str], fn: Callable[[Mapping[str, float]], float]):
+        self.expression = expression
+        self.variables = variables
+        self._fn = fn
+
+    def __call__(self, values: Optional[Mapping[str, float]] = None) -> float:
+        return float(self._fn(values or {}))
 
-    expression = expression.strip()
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.expression!r})"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _compile(expression: str, variables: FrozenSet[str]) -> CompiledExpression:
+    if not expression:
+        return CompiledExpression(expression, variables, lambda env: 0.0)
 
     if len(expression) > _MAX_TOKENS * 3:
         raise ValueError("Expressão muito longa")
@@ -81,5 +117,24 @@ def safe_eval(expression: str) -> float:
     except SyntaxError:
         raise ValueError("Expressão inválida")
 
-    visitor = _SafeVisitor()
-    return float(visitor.visit(tree))
+    return CompiledExpression(expression, variables, _SafeVisitor(variables).visit(tree))
+
+
+def compile_expression(expression: str, variables: Iterable[str] = ()) -> CompiledExpression:
+    """Parses and validates `expression` once (LRU-cached by text and variable names).
+
+    Only numbers, + - * / (unary and binary), parentheses and the given
+    variable names are accepted; division by zero evaluates to 0.
+
+        total = compile_expression("preco * (1 + taxa)", ["preco", "taxa"])
+        total({"preco": 100, "taxa": 0.1})   # 110.0
+    """
+    return _compile((expression or "").strip(), frozenset(variables))
+
+
+def compile_cache_info():
+    return _compile.cache_info()
+
+
+def safe_eval(expression: str) -> float:
+    return compile_expression(expression)()
@@ -0,0 +1,165 @@
+"""
+InfoFileStore: single parser + cache for INFO markdown files.
+
+Every reader of INFO-*.md files (document generation, client sync/export,
+dashboard sync, diagnostics scripts) goes through `InfoFileStore.instance()`.
+Parsed results are cached per file and keyed by (path, mtime_ns, size), so an
+unchanged file is never re-read within a process. The cache is an LRU with a
+bounded number of entries and tracks hits/misses.
+
+Optionally (settings key ``info_cache_persist``) the cache is saved as JSON in
+the app data dir and reused by the next process (CLI, MCP server, watcher).
+
+Format: ``@Variavel; Valor`` — ``:`` is accepted as a fallback separator for
+older files. Only lines starting with ``@`` are variables.
+"""
+
+import atexit
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from foton_system.modules.shared.infrastructure.config.logger import setup_logger
+
+logger = setup_logger()
+
+PERSIST_FILENAME = "info_cache.json"
+
+
+def parse_info_text(text: str) -> Dict[str, str]:
+    """Parses '@Key; value' lines (':' fallback). Later keys override earlier ones."""
+    data = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line.startswith('@'):
+            continue
+        sep = ';' if ';' in line else (':' if ':' in line else None)
+        if sep is None:
+            continue
+        key, value = line.split(sep, 1)
+        data[key.strip()] = value.strip()
+    return data
+
+
+class InfoFileStore:
+    """Bounded, mtime-validated cache of parsed INFO files."""
+
+    _instance: Optional["InfoFileStore"] = None
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, persist_path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._entries: "OrderedDict[str, Tuple[int, int, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if self.persist_path:
+            self._load_persisted()
+
+    @classmethod
+    def instance(cls) -> "InfoFileStore":
+        """Process-wide store. Persistence is opt-in via settings."""
+        if cls._instance is None:
+            persist_path = None
+            try:
+                from foton_system.modules.shared.infrastructure.config.config import Config
+                if Config().get('info_cache_persist', False):
+                    from foton_system.modules.shared.infrastructure.services.path_manager import PathManager
+                    persist_path = PathManager.get_app_data_dir() / PERSIST_FILENAME
+            except Exception:
+                persist_path = None
+            cls._instance = cls(persist_path=persist_path)
+            if persist_path:
+                atexit.register(cls._instance.save)
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        cls._instance = None
+
+    # --- Reading -----------------------------------------------------------
+
+    def read(self, path) -> Dict[str, str]:
+        """Parsed variables of `path` ({} if missing/unreadable). Returns a copy."""
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return {}
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry[2])
+            self.misses += 1
+
+        try:
+            with open(key, 'r', encoding='utf-8') as f:
+                data = parse_info_text(f.read())
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Erro ao parsear {path}: {e}")
+            return {}
+
+        with self._lock:
+            self._entries[key] = (st.st_mtime_ns, st.st_size, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+        return dict(data)
+
+    def keys(self, path) -> Set[str]:
+        return set(self.read(path))
+
+    def invalidate(self, path=None):
+        """Drops one entry, or the whole cache when `path` is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+            self._dirty = True
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
+
+    # --- Persistence -------------------------------------------------------
+
+    def _load_persisted(self):
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, (mtime_ns, size, data) in list(raw.items())[-self.max_entries:]:
+            self._entries[key] = (mtime_ns, size, data)
+
+    def save(self):
+        """Writes the cache to `persist_path` (no-op when not persistent or unchanged)."""
+        if not self.persist_path or not self._dirty:
+            return
+        with self._lock:
+            snapshot = {k: list(v) for k, v in self._entries.items()}
+            self._dirty = False
+        try:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.persist_path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp, self.persist_path)
+        except OSError as e:
+            logger.warning(f"Não foi possível salvar cache INFO: {e}")
@@ -0,0 +1,17 @@
+"""
+Start method for every process pool (OpBatch, batch document generation).
+
+Pools always spawn, as on Windows and in the frozen exe (where main.py calls
+``freeze_support`` first): forking a parent that already runs threads (audit
+writer, job-queue workers) can copy a held lock into the child and deadlock it.
+Everything handed to a worker (initargs, submitted arguments) must pickle.
+"""
+
+import multiprocessing
+
+START_METHOD = "spawn"
+
+
+def pool_context():
+    """Multiprocessing context for ``ProcessPoolExecutor(mp_context=...)``."""
+    return multiprocessing.get_context(START_METHOD)
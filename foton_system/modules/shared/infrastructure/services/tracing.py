@@ -0,0 +1,256 @@
+"""
+Lightweight tracing: nested timing spans for ops and services.
+
+    from foton_system.modules.shared.infrastructure.services import tracing
+
+    with tracing.span("template", template=name) as s:
+        ...
+        s.set(pages=3)
+
+Spans nest through a ContextVar (parent/child ids per thread or task);
+worker threads can pass ``parent=tracing.current_span()`` explicitly.
+When a root span ends, its finished tree goes to the registered exporters.
+
+Disabled by default. While disabled, ``span()`` returns a shared no-op
+object (one flag check per call), so instrumented code pays almost
+nothing. Enable with ``tracing.enable()`` or the environment:
+
+- ``FOTON_TRACE=1``               record spans (BaseOp attaches them to its audit event)
+- ``FOTON_TRACE_FILE=<path>``     also export: ``*.json`` -> Chrome trace format
+  (chrome://tracing, ui.perfetto.dev), anything else -> one JSON span per line
+"""
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+_enabled = False
+_exporters: List[Callable[[List["Span"]], None]] = []
+_current: ContextVar[Optional["Span"]] = ContextVar("foton_span", default=None)
+_ids = itertools.count(1)
+
+
+class Span:
+    """A timed section. Use through `span()`; `duration_ms` is set on exit."""
+
+    __slots__ = ("name", "span_id", "parent", "attrs", "children", "start_ns", "wall_us",
+                 "duration_ms", "thread_id", "error", "_token")
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, **attrs):
+        self.name = name
+        self.span_id = next(_ids)
+        self.parent = parent
+        self.attrs = attrs
+        self.children: List[Span] = []
+        self.start_ns = 0
+        self.wall_us = 0
+        self.duration_ms: Optional[float] = None
+        self.thread_id = 0
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set(self, **attrs) -> "Span":
+        self.attrs.update(attrs)
+        return self
+
+    def __bool__(self):
+        return True
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        self.wall_us = time.time_ns() // 1000
+        self.thread_id = threading.get_ident()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration_ms = (time.perf_counter_ns() - self.start_ns) / 1e6
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        _current.reset(self._token)
+        if self.parent is not None:
+            self.parent.children.append(self)
+        else:
+            _export(self.walk())
+        return False
+
+    def walk(self) -> List["Span"]:
+        """This span and its finished descendants, depth first."""
+        spans = [self]
+        for child in self.children:
+            spans.extend(child.walk())
+        return spans
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "id": self.span_id,
+            "parent": self.parent.span_id if self.parent is not None else None,
+            "name": self.name,
+            "ms": round(self.duration_ms, 3) if self.duration_ms is not None else None,
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error:
+            data["error"] = self.error
+        return data
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Flattened span tree for the audit event."""
+        return [s.to_dict() for s in self.walk()]
+
+
+class _NoopSpan:
+    """Returned by `span()` while tracing is disabled."""
+
+    __slots__ = ()
+    duration_ms = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __bool__(self):
+        return False
+
+    def set(self, **attrs):
+        return self
+
+    def summary(self):
+        return None
+
+
+NOOP = _NoopSpan()
+
+
+def span(name: str, parent: Optional[Span] = None, **attrs):
+    """Context manager timing a section; child of the current span (or of `parent`)."""
+    if not _enabled:
+        return NOOP
+    return Span(name, parent if parent is not None else _current.get(), **attrs)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def traced(name: Optional[str] = None):
+    """Decorator form of `span()` (defaults to the function's qualified name)."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable(flag: bool = True) -> None:
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+# --- Exporters ---
+
+def add_exporter(exporter: Callable[[List[Span]], None]) -> None:
+    """`exporter(spans)` is called with each finished root span tree."""
+    _exporters.append(exporter)
+
+
+def clear_exporters() -> None:
+    _exporters.clear()
+
+
+def _export(spans: List[Span]) -> None:
+    for exporter in list(_exporters):
+        try:
+            exporter(spans)
+        except Exception as e:
+            # Tracing must never break the traced code
+            print(f"[TRACE FAIL] {exporter!r}: {e}")
+
+
+class JsonlExporter:
+    """One JSON object per span (with trace id and wall-clock start)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, spans: List[Span]) -> None:
+        root = spans[0].span_id
+        lines = "".join(
+            json.dumps(dict(s.to_dict(), trace=root, start_us=s.wall_us), ensure_ascii=False, default=str) + "\n"
+            for s in spans
+        )
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+
+class ChromeTraceExporter:
+    """
+    Chrome trace event format ("X" complete events). The file is a JSON
+    array left open so it can be appended to; trace viewers accept the
+    missing closing bracket.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, spans: List[Span]) -> None:
+        pid = os.getpid()
+        events = "".join(
+            json.dumps({
+                "name": s.name,
+                "cat": "foton",
+                "ph": "X",
+                "ts": s.wall_us,
+                "dur": round((s.duration_ms or 0.0) * 1000, 1),
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": dict(s.attrs, id=s.span_id,
+                             parent=s.parent.span_id if s.parent is not None else None),
+            }, ensure_ascii=False, default=str) + ",\n"
+            for s in spans
+        )
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            new = not self.path.exists() or self.path.stat().st_size == 0
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(("[\n" if new else "") + events)
+
+
+def exporter_for(path: Path) -> Callable[[List[Span]], None]:
+    """Chrome trace for *.json, JSONL otherwise."""
+    path = Path(path)
+    return ChromeTraceExporter(path) if path.suffix.lower() == ".json" else JsonlExporter(path)
+
+
+def configure_from_env() -> None:
+    """Reads FOTON_TRACE / FOTON_TRACE_FILE (see module docstring)."""
+    trace_file = os.environ.get("FOTON_TRACE_FILE")
+    if os.environ.get("FOTON_TRACE", "").lower() in ("1", "true", "on") or trace_file:
+        enable(True)
+    if trace_file:
+        add_exporter(exporter_for(Path(trace_file)))
+
+
+configure_from_env()
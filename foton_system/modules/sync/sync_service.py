@@ -2,7 +2,7 @@
 from pathlib import Path
 from foton_system.modules.shared.infrastructure.config.config import Config
 from foton_system.modules.shared.infrastructure.config.logger import setup_logger
-from foton_system.modules.documents.application.use_cases.document_service import DocumentService
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
 
 logger = setup_logger()
 
@@ -22,7 +22,7 @@ class SyncService:
 
         logger.info(f"Iniciando sincronização de {base_path} para {db_path}...")
 
-        _parse_md = DocumentService._parse_md_data
+        store = InfoFileStore.instance()
 
         records = []
 
@@ -30,7 +30,7 @@ class SyncService:
             if client_dir.is_dir():
                 info_file = list(client_dir.glob("INFO-CLIENTE.md"))
                 if info_file:
-                    data = _parse_md(info_file[0])
+                    data = store.read(info_file[0])
                     data['Origem'] = str(client_dir)
                     data['UltimaAtualizacao'] = pd.Timestamp.now()
                     records.append(data)
@@ -44,7 +44,7 @@ class SyncService:
 
         try:
             df.to_excel(db_path, index=False)
-            logger.info(f"Dashboard atualizado com sucesso: {len(records)} registros.")
+            logger.info(f"Dashboard atualizado com sucesso: {len(records)} registros. Cache INFO: {store.stats()}")
             return len(records)
         except Exception as e:
             logger.error(f"Erro ao salvar Dashboard: {e}")
@@ -0,0 +1,65 @@
+"""
+Compactação de revisões INFO.
+
+Move as revisões antigas de cada arquivo INFO (mantendo as N mais recentes)
+para um único `_INFO_REVISOES.zip` por pasta de cliente/serviço.
+
+Usage:
+    python compact_info_revisions.py              # interativo
+    python compact_info_revisions.py --dry-run    # apenas relatório
+    python compact_info_revisions.py --keep 5     # manter 5 revisões
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from colorama import init, Fore
+
+# Initialize colorama
+init(autoreset=True)
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from foton_system.modules.shared.infrastructure.config.config import Config
+from foton_system.modules.clients.application.use_cases.info_revisions import compact_tree, DEFAULT_KEEP
+
+__title__ = "Compactar Revisões INFO (Arquivo ZIP)"
+
+
+def main(argv=None):
+    config = Config()
+    parser = argparse.ArgumentParser(description="Arquiva revisões antigas de arquivos INFO.")
+    parser.add_argument("--keep", type=int, default=config.get('info_revisions_keep', DEFAULT_KEEP),
+                        help="Revisões mantidas por arquivo (padrão: settings 'info_revisions_keep' ou 3).")
+    parser.add_argument("--dry-run", action="store_true", help="Apenas lista o que seria arquivado.")
+    parser.add_argument("--force", action="store_true", help="Não pede confirmação.")
+    args, _ = parser.parse_known_args(argv)
+
+    clients_dir = config.base_pasta_clientes
+    ignored = config.ignored_folders + ['.obsidian']
+
+    print(Fore.CYAN + f"=== COMPACTAÇÃO DE REVISÕES INFO (manter {args.keep}) ===")
+    report = compact_tree(clients_dir, ignored, keep=args.keep, dry_run=True)
+    total = sum(len(files) for files in report.values())
+
+    if not total:
+        print(Fore.GREEN + "Nenhuma revisão antiga para arquivar.")
+        return
+
+    for folder, files in report.items():
+        print(Fore.YELLOW + f"{folder.relative_to(clients_dir)}: {len(files)} revisão(ões)")
+
+    print(f"\nTotal: {total} arquivo(s) em {len(report)} pasta(s).")
+    if args.dry_run:
+        return
+
+    if not args.force and input(Fore.YELLOW + "Arquivar agora? (S/N): ").strip().upper() != 'S':
+        print("Cancelado.")
+        return
+
+    done = compact_tree(clients_dir, ignored, keep=args.keep)
+    print(Fore.GREEN + f"✔ {sum(len(f) for f in done.values())} revisão(ões) arquivada(s).")
+
+
+if __name__ == "__main__":
+    main()
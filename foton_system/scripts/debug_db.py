@@ -14,6 +14,8 @@ try:
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
     from foton_system.modules.shared.infrastructure.config.config import Config
     from foton_system.modules.clients.infrastructure.repositories.excel_client_repository import ExcelClientRepository
+    from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
+    from foton_system.modules.clients.application.use_cases.info_revisions import InfoRevisionIndex
     config = Config()
 except ImportError as e:
     print(Fore.RED + f"Erro: Não foi possível importar módulos do sistema: {e}")
@@ -220,28 +222,12 @@ class DatabaseDebugger:
 
     def _get_latest_info_file(self, folder, alias, suffix):
         """Helper to find latest INFO file."""
-        files = list(folder.glob(f"*_INFO-{alias}.md"))
-        if not files:
-            return None
-        # Sort by name (assuming standard naming convention)
-        files.sort(key=lambda f: f.name, reverse=True)
-        return files[0]
+        return InfoRevisionIndex.instance().latest(folder, alias)
 
     def _read_keys_from_md(self, path):
-        """Reads keys from MD file."""
-        keys = set()
-        data = {}
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        keys.add(key)
-                        data[key] = value.strip()
-        except Exception as e:
-            self.log(f"Erro ao ler {path.name}: {e}", Fore.RED)
-        return keys, data
+        """Reads keys from MD file (shared INFO parser/cache)."""
+        data = InfoFileStore.instance().read(path)
+        return set(data), data
 
     def analyze_info_files(self):
         self.print_header("ANÁLISE DE ARQUIVOS INFO")
@@ -339,6 +325,7 @@ class DatabaseDebugger:
             self.analyze_services()
             self.analyze_folders()
             self.analyze_info_files()
+            self.log(f"Cache INFO: {InfoFileStore.instance().stats()}")
         
         sep = '='*60
         self.log(f"\n{sep}", Fore.CYAN)
@@ -11,6 +11,7 @@ init(autoreset=True)
 try:
     sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
     from foton_system.modules.shared.infrastructure.config.config import Config
+    from foton_system.modules.clients.application.use_cases.info_revisions import InfoRevisionIndex
     config = Config()
 except ImportError:
     print(Fore.RED + "Erro: Configuração não encontrada.")
@@ -59,11 +60,7 @@ def parse_template(path):
     return client_keys, service_keys
 
 def get_latest_info_file(folder, alias, suffix):
-    files = list(folder.glob(f"*_INFO-{alias}.md"))
-    if not files:
-        return None
-    files.sort(key=lambda f: f.name, reverse=True)
-    return files[0]
+    return InfoRevisionIndex.instance().latest(folder, alias)
 
 def fix_file(path, required_keys):
     """Appends missing keys to the file."""
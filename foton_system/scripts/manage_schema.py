@@ -13,6 +13,8 @@ sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 from foton_system.modules.shared.infrastructure.config.config import Config
 from foton_system.modules.clients.infrastructure.repositories.excel_client_repository import ExcelClientRepository
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
+from foton_system.modules.clients.application.use_cases.info_revisions import InfoRevisionIndex
 from foton_system.scripts.fix_info_files import batch_fix
 
 class SchemaManager:
@@ -66,21 +68,13 @@ class SchemaManager:
             
             folder = self.repository.base_pasta / client
             # Find INFO-CLIENTE
-            files = list(folder.glob(f"*_INFO-{client}.md"))
-            if files:
-                self._extract_keys(files[0])
+            latest = InfoRevisionIndex.instance().latest(folder, client)
+            if latest:
+                self._extract_keys(latest)
                 count += 1
                 
     def _extract_keys(self, path):
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if ':' in line:
-                        key = line.split(':', 1)[0].strip()
-                        if key.startswith('@'):
-                            self.info_keys.add(key)
-        except (IOError, OSError):
-            pass
+        self.info_keys.update(InfoFileStore.instance().keys(path))
 
     def analyze(self):
         self.discover_excel_variables()
@@ -0,0 +1,118 @@
+"""
+Benchmark: placeholder substitution per template.
+
+Compares the legacy per-key substitution (one re.sub per variable) with the
+compiled PlaceholderEngine, end to end through PythonDocxAdapter /
+PythonPPTXAdapter (load -> replace_text -> save), and for DOCX the raw-XML
+DocxStreamRenderer fast path (compiled template -> zip).
+
+Usage:
+    python tests/benchmarks/bench_document_generation.py                 # synthetic 40-page DOCX
+    python tests/benchmarks/bench_document_generation.py TEMPLATES_DIR   # every .docx/.pptx in a folder
+    python tests/benchmarks/bench_document_generation.py --vars 200 --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
+from foton_system.modules.documents.infrastructure.adapters.python_pptx_adapter import PythonPPTXAdapter
+from foton_system.modules.documents.infrastructure.adapters.docx_stream_renderer import DocxStreamRenderer
+from foton_system.modules.documents.infrastructure.services.template_cache import compile_template
+
+
+def legacy_replace_keys_in_text(text, replacements):
+    for key in sorted(replacements.keys(), key=len, reverse=True):
+        pattern = r'(?<![\w.])' + re.escape(key) + r'(?!\.[a-z]{2,}\b)'
+        text = re.sub(pattern, str(replacements[key]), text, flags=re.IGNORECASE)
+    return text
+
+
+def make_replacements(n_vars):
+    return {f"@variavel{i:03d}": f"Valor {i}" for i in range(n_vars)}
+
+
+def make_synthetic_docx(path, replacements, paragraphs=1200):
+    from docx import Document
+    keys = list(replacements)
+    doc = Document()
+    for i in range(paragraphs):
+        k1, k2 = keys[i % len(keys)], keys[(i * 7) % len(keys)]
+        doc.add_paragraph(f"Cláusula {i}: o contratante {k1} declara que {k2} é válido; contato@empresa.com.")
+        if i % 30 == 0:
+            doc.add_page_break()
+    doc.save(path)
+
+
+def time_generation(adapter, template, replacements, out_dir, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        document = adapter.load_document(str(template))
+        adapter.replace_text(document, replacements)
+        adapter.save_document(document, str(out_dir / f"out{template.suffix}"))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_stream(template, replacements, out_dir, repeat):
+    compiled = compile_template(template, 'docx')
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        DocxStreamRenderer().render(str(template), replacements, str(out_dir / "stream.docx"), compiled)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(templates, replacements, repeat):
+    adapters = {'.docx': PythonDocxAdapter, '.pptx': PythonPPTXAdapter}
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        print(f"{'template':40s} {'legacy (s)':>12s} {'engine (s)':>12s} {'stream (s)':>12s} {'speedup':>9s}")
+        for template in templates:
+            adapter_cls = adapters[template.suffix.lower()]
+            engine_time = time_generation(adapter_cls(), template, replacements, out_dir, repeat)
+
+            legacy = adapter_cls()
+            # replace_text hands the adapter a compiled engine; the legacy loop uses the raw dict.
+            legacy._replace_keys_in_text = lambda text, _engine: legacy_replace_keys_in_text(text, replacements)
+            legacy_time = time_generation(legacy, template, replacements, out_dir, repeat)
+
+            best = engine_time
+            stream_col = f"{'-':>12s}"
+            if template.suffix.lower() == '.docx':
+                stream_time = time_stream(template, replacements, out_dir, repeat)
+                best = min(best, stream_time)
+                stream_col = f"{stream_time:12.3f}"
+
+            print(f"{template.name[:40]:40s} {legacy_time:12.3f} {engine_time:12.3f} {stream_col} {legacy_time / best:8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("templates_dir", nargs="?", help="Folder with .docx/.pptx templates")
+    parser.add_argument("--vars", type=int, default=120, help="Number of @variables (default 120)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per template; best time is reported")
+    args = parser.parse_args()
+
+    replacements = make_replacements(args.vars)
+    if args.templates_dir:
+        templates = sorted(p for p in Path(args.templates_dir).iterdir() if p.suffix.lower() in ('.docx', '.pptx'))
+        run(templates, replacements, args.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / "contrato_sintetico.docx"
+        make_synthetic_docx(template, replacements)
+        run([template], replacements, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: firm ledger analytics on synthetic entries.
+
+Compares the per-row Python loop FinanceService used for totals (dict rows,
+float(row['Valor'])) extended to a monthly cash flow, with the vectorized
+ledger_analytics functions over typed columns.
+
+Usage:
+    python tests/benchmarks/bench_ledger_analytics.py                   # 1M entries, 300 clients
+    python tests/benchmarks/bench_ledger_analytics.py --entries 200000 --clients 50 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from foton_system.modules.finance.domain.services import ledger_analytics
+
+
+def make_entries(n_entries, n_clients, seed=42):
+    """Raw entries as FirmLedgerStore.frame() returns them (strings for dates)."""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, 5 * 365, n_entries)
+    dates = (np.datetime64('2021-01-01') + days.astype('timedelta64[D]')).astype(str)
+    return pd.DataFrame({
+        'client': np.char.add('7', rng.integers(0, n_clients, n_entries).astype(str)),
+        'data': dates,
+        'tipo': np.where(rng.random(n_entries) < 0.55, 'ENTRADA', 'SAIDA'),
+        'valor': np.round(rng.gamma(2.0, 800.0, n_entries), 2),
+    })
+
+
+def legacy_cash_flow(rows):
+    flow = {}
+    for row in rows:
+        month = row['data'][:7]
+        income, expense = flow.get(month, (0.0, 0.0))
+        val = float(row['valor'])
+        if row['tipo'] == 'ENTRADA':
+            income += val
+        else:
+            expense += val
+        flow[month] = (income, expense)
+    return flow
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=1_000_000, help="Synthetic entries (default 1M)")
+    parser.add_argument("--clients", type=int, default=300, help="Distinct clients (default 300)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; best time is reported")
+    args = parser.parse_args()
+
+    raw = make_entries(args.entries, args.clients)
+    rows = raw.to_dict(orient='records')
+    print(f"{args.entries:,} entries, {args.clients} clients")
+
+    legacy = best_of(lambda: legacy_cash_flow(rows), args.repeat)
+    prepare = best_of(lambda: ledger_analytics.prepare(raw), args.repeat)
+    df = ledger_analytics.prepare(raw)
+    as_of = df['data'].max()
+
+    timings = {
+        'prepare (typed columns)': prepare,
+        'cash_flow M': best_of(lambda: ledger_analytics.cash_flow(df, 'M'), args.repeat),
+        'rolling_balance M/3': best_of(lambda: ledger_analytics.rolling_balance(df, 'M', 3), args.repeat),
+        'receivables_aging': best_of(lambda: ledger_analytics.receivables_aging(df, as_of=as_of), args.repeat),
+        'year_over_year M': best_of(lambda: ledger_analytics.year_over_year(df, 'income', 'M'), args.repeat),
+    }
+
+    print(f"{'operation':28s} {'time (s)':>10s}")
+    print(f"{'legacy loop cash flow':28s} {legacy:10.3f}")
+    for name, seconds in timings.items():
+        print(f"{name:28s} {seconds:10.3f}")
+    print(f"cash flow speedup (excluding prepare): {legacy / timings['cash_flow M']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
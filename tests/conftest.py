@@ -6,6 +6,7 @@ Provides:
 - Common fixtures: FakeClientRepository, reset_factory, mock_config
 """
 
+import os
 import sys
 import pytest
 import pandas as pd
@@ -16,6 +17,9 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+# Audit events are written inline in tests (no background writer thread)
+os.environ.setdefault("FOTON_AUDIT_SYNC", "1")
+
 
 @pytest.fixture
 def fake_client_repository():
@@ -65,7 +69,7 @@ def fake_client_repository():
 
 @pytest.fixture(autouse=True)
 def reset_singletons(request):
-    """Reset MCPServiceFactory + Config singletons before/after each test.
+    """Reset MCPServiceFactory + Config + INFO cache singletons before/after each test.
 
     Autouse=True because both singletons are global state that pollutes
     across tests in unpredictable ways. Tests that need different behavior
@@ -78,11 +82,38 @@ def reset_singletons(request):
     """
     from foton_system.interfaces.mcp.mcp_services import MCPServiceFactory
     from foton_system.modules.shared.infrastructure.config.config import Config
+    from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
+    from foton_system.modules.clients.application.use_cases.info_revisions import InfoRevisionIndex
+    from foton_system.modules.clients.application.use_cases.client_name_index import clear_client_index_cache
+    from foton_system.modules.documents.infrastructure.services.template_cache import TemplateCache
+    from foton_system.modules.documents.infrastructure.services.context_resolver import ContextResolver
+    from foton_system.modules.finance.infrastructure.services.ledger_totals_cache import LedgerTotalsCache
+    from foton_system.modules.finance.infrastructure.repositories.firm_ledger_store import FirmLedgerStore
+    from foton_system.core.ops.audit_logger import AuditLogger
+    from foton_system.core.ops.job_queue import JobQueue
     MCPServiceFactory.reset()
     Config._instance = None
+    InfoFileStore.reset()
+    InfoRevisionIndex.reset()
+    TemplateCache.reset()
+    ContextResolver.reset()
+    LedgerTotalsCache.reset()
+    FirmLedgerStore.reset()
+    AuditLogger.reset()
+    JobQueue.reset()
+    clear_client_index_cache()
     yield
     MCPServiceFactory.reset()
     Config._instance = None
+    InfoFileStore.reset()
+    InfoRevisionIndex.reset()
+    TemplateCache.reset()
+    ContextResolver.reset()
+    LedgerTotalsCache.reset()
+    FirmLedgerStore.reset()
+    AuditLogger.reset()
+    JobQueue.reset()
+    clear_client_index_cache()
 
 
 @pytest.fixture
@@ -1,5 +1,5 @@
 import unittest
-from foton_system.modules.shared.domain.services.safe_math import safe_eval
+from foton_system.modules.shared.domain.services.safe_math import safe_eval, compile_expression
 
 
 class TestSafeEval(unittest.TestCase):
@@ -97,5 +97,35 @@ class TestSafeEval(unittest.TestCase):
             safe_eval("lambda x: x")
 
 
+class TestCompileExpression(unittest.TestCase):
+    """Tests for compile_expression — validated once, evaluated many times."""
+
+    def test_reusable_with_different_values(self):
+        fn = compile_expression("preco * (1 + taxa) - desconto", ["preco", "taxa", "desconto"])
+        self.assertAlmostEqual(fn({"preco": 100, "taxa": 0.1, "desconto": 10}), 100.0)
+        self.assertEqual(fn({"preco": 200, "taxa": 0.5, "desconto": 0}), 300.0)
+
+    def test_cached_by_text_and_variables(self):
+        a = compile_expression("x + y", ["x", "y"])
+        self.assertIs(compile_expression("x + y", ("y", "x")), a)
+        self.assertIsNot(compile_expression("x + y", ["x", "y", "z"]), a)
+
+    def test_division_by_zero_variable_returns_zero(self):
+        self.assertEqual(compile_expression("a / b", ["a", "b"])({"a": 5, "b": 0}), 0.0)
+
+    def test_unknown_name_rejected_at_compile_time(self):
+        with self.assertRaises(ValueError):
+            compile_expression("x + y", ["x"])
+
+    def test_missing_value_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            compile_expression("x + 1", ["x"])({})
+
+    def test_safety_guarantees_kept(self):
+        for expr in ("x ** 2", "x.real", "f(x)", "x[0]", "+".join(["x"] * 60), "True + x"):
+            with self.subTest(expr=expr), self.assertRaises(ValueError):
+                compile_expression(expr, ["x", "f"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,168 @@
+"""
+Tests for AuditStore (segmented, indexed audit trail).
+
+Covers:
+- read_lines_reversed across block boundaries and without trailing newline
+- Rotation by size / by day: gzip segment + index entry, active file restarted
+- Filtered queries newest first across active + closed segments, index skips segments
+- AuditLogger.query_events and consultar_auditoria filters
+"""
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from foton_system.core.ops.audit_logger import AuditLogger
+from foton_system.core.ops.audit_store import AuditStore, read_lines_reversed
+
+
+def _event(i, op="OpFinanceEntry", client="730_Silva", day="2025-03-05", status="SUCCESS"):
+    return {"timestamp": f"{day}T10:00:{i % 60:02d}", "op": op, "actor": "test",
+            "client_id": client, "payload": {"n": i}, "result": {}, "status": status}
+
+
+class TestAuditStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.active = self.tmp / "audit_events.jsonl"
+        self.store = AuditStore(self.active, rotate_bytes=10 ** 9)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _write(self, *events):
+        with open(self.active, "a", encoding="utf-8") as f:
+            for e in events:
+                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+
+    def test_read_lines_reversed_small_blocks(self):
+        lines = [f"linha {i} " + "x" * (i * 7) for i in range(40)]
+        self.active.write_text("\n".join(lines), encoding="utf-8")  # no trailing newline
+        self.assertEqual(list(read_lines_reversed(self.active, block_size=16)), lines[::-1])
+
+    def test_read_lines_reversed_utf8_split(self):
+        self.active.write_text("ação\nçãé\n", encoding="utf-8")
+        self.assertEqual(list(read_lines_reversed(self.active, block_size=3)), ["çãé", "ação"])
+
+    def test_rotate_gzips_and_indexes(self):
+        self._write(_event(1), _event(2, op="OpDocGen", client="731_Costa", day="2025-03-06"))
+        segment = self.store.rotate()
+
+        self.assertFalse(self.active.exists())
+        self.assertEqual(segment.name, "audit_events.20250305T100001000000-000.jsonl.gz")
+        with gzip.open(segment, "rt", encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+        entry = json.loads(self.store.index_file.read_text(encoding="utf-8"))[segment.name]
+        self.assertEqual(entry["count"], 2)
+        self.assertEqual(entry["ops"], ["OpDocGen", "OpFinanceEntry"])
+        self.assertEqual(entry["days"], ["2025-03-05", "2025-03-06"])
+
+    def test_should_rotate_by_size_and_day(self):
+        self.assertFalse(self.store.should_rotate())  # no file
+        self._write(_event(1))
+        self.assertFalse(self.store.should_rotate())
+        self.store.rotate_bytes = 10
+        self.assertTrue(self.store.should_rotate())
+
+        daily = AuditStore(self.active, rotate_daily=True)
+        self.assertFalse(daily.should_rotate())
+        yesterday = time.time() - 86400
+        os.utime(self.active, (yesterday, yesterday))
+        self.assertTrue(daily.should_rotate())
+
+    def test_query_spans_segments_newest_first(self):
+        self._write(*[_event(i) for i in range(3)])
+        self.store.rotate()
+        self._write(*[_event(i, day="2025-03-07") for i in range(3, 5)])
+
+        events = self.store.query(limit=4)
+        self.assertEqual([e["payload"]["n"] for e in events], [4, 3, 2, 1])
+
+    def test_index_skips_segments_that_cannot_match(self):
+        self._write(_event(1, op="OpDocGen"))
+        self.store.rotate()
+        self._write(_event(2, op="OpFinanceEntry", day="2025-03-06"))
+        self.store.rotate()
+
+        opened = []
+        real = AuditStore._read_segment
+
+        def spy(path):
+            opened.append(path.name)
+            return real(path)
+
+        with patch.object(AuditStore, "_read_segment", side_effect=spy):
+            by_op = self.store.query(op="OpDocGen")
+            by_day = self.store.query(since="2025-03-06")
+            by_client = self.store.query(client_id="999_Nobody")
+        self.assertEqual([e["payload"]["n"] for e in by_op], [1])
+        self.assertEqual([e["payload"]["n"] for e in by_day], [2])
+        self.assertEqual(by_client, [])
+        self.assertEqual(opened, ["audit_events.20250305T100001000000-000.jsonl.gz",
+                                  "audit_events.20250306T100002000000-000.jsonl.gz"])
+
+    def test_missing_index_is_rebuilt(self):
+        self._write(_event(1))
+        self.store.rotate()
+        self.store.index_file.unlink()
+        self.assertEqual(self.store.stats()["archived_events"], 1)
+        self.assertTrue(self.store.index_file.exists())
+
+    def test_corrupt_lines_are_skipped(self):
+        self._write(_event(1))
+        with open(self.active, "a", encoding="utf-8") as f:
+            f.write('{"op": "torn"\n')
+        self._write(_event(2))
+        self.assertEqual([e["payload"]["n"] for e in self.store.query()], [2, 1])
+
+
+class TestAuditLoggerQueries(unittest.TestCase):
+
+    def setUp(self):
+        AuditLogger._instance = None
+        self.tmp = Path(tempfile.mkdtemp())
+        patcher = patch("foton_system.core.ops.audit_logger.BootstrapService")
+        self.addCleanup(patcher.stop)
+        patcher.start().get_user_config_dir.return_value = self.tmp
+        self.logger = AuditLogger()
+
+    def tearDown(self):
+        AuditLogger._instance = None
+        shutil.rmtree(self.tmp)
+
+    def test_log_event_rotates_when_full(self):
+        self.logger.store.rotate_bytes = 200
+        for i in range(6):
+            self.logger.log_event("OpFinanceEntry", "test", "730_Silva", {"n": i}, {}, "SUCCESS")
+        self.assertGreater(len(self.logger.store.segments()), 0)
+        events = self.logger.get_recent_events(limit=10)
+        self.assertEqual([e["payload"]["n"] for e in events], [5, 4, 3, 2, 1, 0])
+
+    def test_rotation_failure_keeps_event(self):
+        self.logger.log_event("OpA", "test", "c", {}, {}, "SUCCESS")
+        with patch.object(self.logger.store, "should_rotate", return_value=True), \
+                patch.object(self.logger.store, "rotate", side_effect=OSError("disk")):
+            self.logger.log_event("OpB", "test", "c", {}, {}, "SUCCESS")
+        self.assertEqual([e["op"] for e in self.logger.get_recent_events()], ["OpB", "OpA"])
+
+    def test_consultar_auditoria_filters(self):
+        from foton_system.interfaces.mcp.foton_mcp import consultar_auditoria
+        self.logger.log_event("OpFinanceEntry", "test", "730_Silva", {}, {}, "SUCCESS")
+        self.logger.log_event("OpDocGen", "test", "731_Costa", {}, {}, "ERROR")
+
+        output = consultar_auditoria(limite=5, cliente="731_Costa")
+        self.assertIn("OpDocGen by test → 731_Costa [ERROR]", output)
+        self.assertNotIn("OpFinanceEntry", output)
+        self.assertIn("📭", consultar_auditoria(operacao="OpCreateClient"))
+        self.assertIn("❌", consultar_auditoria(desde="05/03/2025"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Tests for AuditWriter (background, batched audit writes) and payload compaction.
+
+Covers:
+- compact: long strings / bytes -> prefix + length + sha256, recursive, small values untouched
+- Batching by size and by interval, flush() / close() drain the queue
+- Full queue falls back to a synchronous write (no event dropped)
+- Signal hook runs the flush and then the previous handler
+- AuditLogger in async mode: read-your-writes, reset() flushes
+"""
+
+import hashlib
+import json
+import shutil
+import signal
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from foton_system.core.ops import audit_writer
+from foton_system.core.ops.audit_logger import AuditLogger
+from foton_system.core.ops.audit_writer import AuditWriter, compact
+
+
+class TestCompact(unittest.TestCase):
+
+    def test_long_string_truncated_with_hash(self):
+        text = "parágrafo " * 5000
+        out = compact({"conteudo": text, "cliente": "730_Silva", "valor": 10.5})
+        self.assertEqual(out["cliente"], "730_Silva")
+        self.assertEqual(out["valor"], 10.5)
+        self.assertEqual(out["conteudo"]["_length"], len(text))
+        self.assertEqual(out["conteudo"]["_sha256"], hashlib.sha256(text.encode("utf-8")).hexdigest())
+        self.assertEqual(out["conteudo"]["_truncated"], text[:audit_writer.PREVIEW_CHARS])
+
+    def test_nested_and_bytes(self):
+        out = compact({"entries": [{"d": "x" * 3000}], "doc": b"\x00" * 10, "tags": ("a", "b")})
+        self.assertEqual(out["entries"][0]["d"]["_length"], 3000)
+        self.assertEqual(out["doc"], {"_bytes": 10, "_sha256": hashlib.sha256(b"\x00" * 10).hexdigest()})
+        self.assertEqual(out["tags"], ["a", "b"])
+        json.dumps(out)
+
+    def test_does_not_mutate_input(self):
+        payload = {"conteudo": "y" * 5000}
+        compact(payload)
+        self.assertEqual(len(payload["conteudo"]), 5000)
+
+
+class TestAuditWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.writer = AuditWriter(self.batches.append, flush_interval=60, flush_size=3)
+        hooks = patch.object(audit_writer, "_install_signal_handlers")
+        self.addCleanup(hooks.stop)
+        hooks.start()
+        atexit = patch.object(audit_writer.atexit, "register")
+        self.addCleanup(atexit.stop)
+        atexit.start()
+
+    def tearDown(self):
+        self.writer.close()
+
+    def test_batches_by_size(self):
+        for i in range(7):
+            self.writer.submit({"n": i})
+        self.assertTrue(self.writer.flush())
+        self.assertEqual([len(b) for b in self.batches], [3, 3, 1])
+        self.assertEqual([e["n"] for b in self.batches for e in b], list(range(7)))
+
+    def test_batches_by_interval(self):
+        self.writer.flush_interval = 0.05
+        self.writer.submit({"n": 1})
+        deadline = time.monotonic() + 2
+        while not self.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.batches, [[{"n": 1}]])
+
+    def test_close_drains_and_stops(self):
+        self.writer.submit({"n": 1})
+        self.writer.close()
+        self.assertFalse(self.writer.running)
+        self.assertEqual(self.batches, [[{"n": 1}]])
+        self.writer.submit({"n": 2})  # restarts
+        self.writer.flush()
+        self.assertEqual(self.batches[-1], [{"n": 2}])
+
+    def test_full_queue_writes_inline(self):
+        gate = threading.Event()
+        writer = AuditWriter(lambda batch: (gate.wait(2), self.batches.append(batch)),
+                             flush_interval=60, flush_size=1, queue_size=1)
+        try:
+            writer.submit({"n": 0})  # taken by the thread, blocked in write
+            time.sleep(0.05)
+            writer.submit({"n": 1})  # fills the queue
+            threading.Timer(0.1, gate.set).start()
+            writer.submit({"n": 2})  # overflow -> written by the caller
+            self.assertEqual(writer.stats()["overflow"], 1)
+            writer.flush()
+        finally:
+            gate.set()
+            writer.close()
+        self.assertEqual(sorted(e["n"] for b in self.batches for e in b), [0, 1, 2])
+
+    def test_write_error_does_not_kill_thread(self):
+        calls = []
+
+        def flaky(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise PermissionError("locked")
+
+        writer = AuditWriter(flaky, flush_interval=60, flush_size=1)
+        try:
+            writer.submit({"n": 1})
+            writer.submit({"n": 2})
+            writer.flush()
+            self.assertTrue(writer.running)
+            self.assertEqual(writer.stats()["written"], 1)
+        finally:
+            writer.close()
+
+    def test_signal_handler_flushes_then_chains(self):
+        callback, previous = MagicMock(), MagicMock()
+        audit_writer._on_signal(callback, previous, signal.SIGTERM, None)
+        callback.assert_called_once()
+        previous.assert_called_once_with(signal.SIGTERM, None)
+
+        with self.assertRaises(SystemExit):
+            audit_writer._on_signal(MagicMock(), signal.SIG_DFL, signal.SIGTERM, None)
+
+
+class TestAuditLoggerAsync(unittest.TestCase):
+
+    def setUp(self):
+        AuditLogger._instance = None
+        self.tmp = Path(tempfile.mkdtemp())
+        for target in ("foton_system.core.ops.audit_writer._install_signal_handlers",
+                       "foton_system.core.ops.audit_writer.atexit.register"):
+            p = patch(target)
+            self.addCleanup(p.stop)
+            p.start()
+        bs = patch("foton_system.core.ops.audit_logger.BootstrapService")
+        self.addCleanup(bs.stop)
+        bs.start().get_user_config_dir.return_value = self.tmp
+        self.logger = AuditLogger()
+        self.logger.synchronous = False
+
+    def tearDown(self):
+        AuditLogger.reset()
+        shutil.rmtree(self.tmp)
+
+    def test_log_event_is_queued_and_readable(self):
+        self.logger.writer.flush_interval = 60
+        self.logger.log_event("OpDocGen", "test", "730_Silva", {"conteudo": "z" * 60000}, {"ok": True}, "SUCCESS")
+        self.assertTrue(self.logger.writer.running)
+
+        events = self.logger.get_recent_events()  # flushes first
+        self.assertEqual(events[0]["op"], "OpDocGen")
+        self.assertEqual(events[0]["payload"]["conteudo"]["_length"], 60000)
+        self.assertLess((self.tmp / "audit_events.jsonl").stat().st_size, 1000)
+
+    def test_reset_flushes_pending(self):
+        self.logger.writer.flush_interval = 60
+        self.logger.log_event("OpA", "test", "c", {}, {}, "SUCCESS")
+        AuditLogger.reset()
+        lines = (self.tmp / "audit_events.jsonl").read_text(encoding="utf-8").splitlines()
+        self.assertEqual(json.loads(lines[0])["op"], "OpA")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Tests for batch document generation.
+
+Covers:
+- Target resolution (names, 'cliente/servico', glob/substring filter, service)
+- Per-item failure isolation and manifest summary
+- Inline and process-pool execution produce the same documents; the pool spawns its workers
+- Progress callback per item; an exception from it stops the batch
+- Names that only look similar to a client are reported, not generated
+- Frozen entry point calls freeze_support before anything else (pool children)
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from docx import Document
+
+from foton_system.modules.documents.application.use_cases import batch_generation
+from foton_system.modules.documents.application.use_cases.batch_generation import (
+    BatchTarget, STATUS_ERROR, STATUS_GENERATED, STATUS_PLANNED,
+    resolve_batch_targets, run_batch,
+)
+
+
+def _config(base: Path):
+    config = MagicMock()
+    config.base_pasta_clientes = base
+    config.ignored_folders = []
+    config.clean_missing_variables = False
+    config.missing_variable_placeholder = "___"
+    return config
+
+
+class TestBatchGeneration(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.base = self.tmp / "clientes"
+        for client, name in (("730_Residencia_Silva", "Silva"), ("731_Loja_Costa", "Costa"), ("800_Galpao_Souza", "Souza")):
+            folder = self.base / client
+            (folder / "Reforma").mkdir(parents=True)
+            (folder / "INFO-CLIENTE.md").write_text(f"@NomeCliente; {name}\n", encoding="utf-8")
+        self.template = self.tmp / "RECIBO.docx"
+        doc = Document()
+        doc.add_paragraph("Recibo de @NomeCliente referente a @Mes.")
+        doc.save(self.template)
+        self.config = _config(self.base)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _text(self, path):
+        return [p.text for p in Document(str(path)).paragraphs][0]
+
+    def test_resolve_names_services_and_filter(self):
+        targets = resolve_batch_targets(self.config, names=["silva", "Costa/Reforma", "Inexistente"])
+        labels = [t.label for t in targets]
+        self.assertIn("730_Residencia_Silva", labels)
+        self.assertIn("731_Loja_Costa/Reforma", labels)
+        errors = [t for t in targets if t.error]
+        self.assertEqual([t.label for t in errors], ["Inexistente"])
+
+        by_glob = resolve_batch_targets(self.config, filtro="73*")
+        self.assertEqual([t.label for t in by_glob], ["730_Residencia_Silva", "731_Loja_Costa"])
+
+        by_substring = resolve_batch_targets(self.config, filtro="galpão", service="Reforma")
+        self.assertEqual([t.label for t in by_substring], ["800_Galpao_Souza/Reforma"])
+        self.assertEqual(by_substring[0].folder, self.base / "800_Galpao_Souza" / "Reforma")
+
+    def test_similar_name_is_reported_not_generated(self):
+        targets = resolve_batch_targets(self.config, names=["Residencia Pereira", "Loja Costta"])
+        self.assertTrue(all(t.error for t in targets))
+        self.assertIn("Você quis dizer", targets[0].error)
+        manifest = run_batch(self.template, targets, extra_data={"@Mes": "Junho"}, workers=1, config=self.config)
+        self.assertEqual(manifest.summary()['gerados'], 0)
+        self.assertFalse(list(self.base.rglob("GERADO_*")))
+
+    def test_frozen_entry_point_calls_freeze_support_first(self):
+        from foton_system import main as entry
+        with patch.object(entry.multiprocessing, "freeze_support", side_effect=SystemExit) as freeze, \
+                patch.object(entry, "_start_mcp") as start_mcp, patch.object(sys, "argv", ["foton", "--mcp"]):
+            with self.assertRaises(SystemExit):
+                entry.safety_entry()
+        freeze.assert_called_once()
+        start_mcp.assert_not_called()
+
+    def test_inline_batch_isolates_failures(self):
+        targets = resolve_batch_targets(self.config, filtro="*") + [BatchTarget("Fantasma", self.tmp / "nao_existe")]
+        manifest = run_batch(self.template, targets, extra_data={"@Mes": "Junho"}, workers=1, config=self.config)
+
+        self.assertEqual(manifest.summary(), {'total': 4, 'gerados': 3, 'erros': 1, 'planejados': 0})
+        self.assertEqual(manifest.items[-1].status, STATUS_ERROR)
+        silva = self.base / "730_Residencia_Silva" / "GERADO_RECIBO.docx"
+        self.assertEqual(self._text(silva), "Recibo de Silva referente a Junho.")
+        self.assertFalse((self.base / "730_Residencia_Silva" / "_lote_dados.json").exists())
+
+    def test_service_targets_inherit_client_context(self):
+        targets = resolve_batch_targets(self.config, names=["Souza/Reforma"])
+        manifest = run_batch(self.template, targets, extra_data={"@Mes": "Maio"}, workers=1, config=self.config)
+        self.assertEqual(manifest.items[0].status, STATUS_GENERATED)
+        self.assertEqual(self._text(manifest.items[0].output_path), "Recibo de Souza referente a Maio.")
+
+    def test_dry_run_plans_without_writing(self):
+        targets = resolve_batch_targets(self.config, filtro="*")
+        manifest = run_batch(self.template, targets, dry_run=True, config=self.config)
+        self.assertTrue(all(item.status == STATUS_PLANNED for item in manifest.items))
+        self.assertFalse(list(self.base.rglob("GERADO_*")))
+
+    def test_process_pool_matches_inline(self):
+        targets = resolve_batch_targets(self.config, filtro="*")
+        manifest = run_batch(self.template, targets, extra_data={"@Mes": "Julho"}, workers=2, config=self.config)
+        self.assertEqual(manifest.workers, 2)
+        self.assertEqual(manifest.summary()['gerados'], 3, [i.error for i in manifest.items])
+        for item in manifest.items:
+            self.assertIn("referente a Julho.", self._text(item.output_path))
+
+    def test_process_mode_spawns_workers(self):
+        targets = resolve_batch_targets(self.config, names=["Silva", "Costa"])
+        with patch.object(batch_generation, "ProcessPoolExecutor",
+                          wraps=batch_generation.ProcessPoolExecutor) as pool:
+            manifest = run_batch(self.template, targets, extra_data={"@Mes": "Agosto"}, workers=2, config=self.config)
+        self.assertEqual(pool.call_args.kwargs["mp_context"].get_start_method(), "spawn")
+        self.assertEqual([i.status for i in manifest.items], [STATUS_GENERATED, STATUS_GENERATED],
+                         [i.error for i in manifest.items])
+        self.assertEqual([self._text(i.output_path) for i in manifest.items],
+                         ["Recibo de Silva referente a Agosto.", "Recibo de Costa referente a Agosto."])
+
+    def test_progress_callback_and_cancellation(self):
+        targets = resolve_batch_targets(self.config, filtro="*")
+        calls = []
+        run_batch(self.template, targets, extra_data={"@Mes": "Junho"}, workers=1, config=self.config,
+                  on_progress=lambda done, total: calls.append((done, total)))
+        self.assertEqual(calls, [(1, 3), (2, 3), (3, 3)])
+
+        def cancel(done, total):
+            raise KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            run_batch(self.template, targets, workers=1, output_name="CANCELADO.docx", config=self.config,
+                      on_progress=cancel)
+        self.assertEqual(len(list(self.base.rglob("CANCELADO.docx"))), 1)
+
+    def test_manifest_save(self):
+        targets = resolve_batch_targets(self.config, names=["Silva"])
+        manifest = run_batch(self.template, targets, extra_data={"@Mes": "Junho"}, workers=1, config=self.config)
+        path = manifest.save(self.tmp / "lotes" / "m.json")
+        data = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(data['template'], "RECIBO.docx")
+        self.assertEqual(data['summary']['gerados'], 1)
+        self.assertIn('seconds', data['items'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit Tests for ClientNameIndex (trigram + normalized client name resolution).
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from foton_system.modules.clients.application.use_cases.client_name_index import (
+    ClientNameIndex, get_client_index, clear_client_index_cache, normalize_name,
+    TIER_EXACT, TIER_NORMALIZED, TIER_PREFIX, TIER_FUZZY,
+)
+
+NAMES = ["730_Residência_Silva", "731_Residencia_Souza", "ACME_Engenharia", "BETA", "ALFABETO"]
+
+
+class TestNormalization(unittest.TestCase):
+
+    def test_strips_accents_and_separators(self):
+        self.assertEqual(normalize_name("730_Residência-Silva"), "730 residencia silva")
+
+
+class TestClientNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ClientNameIndex(NAMES, base_path=Path("/clientes"))
+
+    def test_exact_name_wins(self):
+        self.assertEqual(self.index.search("BETA")[0][:2], ("BETA", TIER_EXACT))
+
+    def test_accent_insensitive_normalized_match(self):
+        self.assertEqual(self.index.search("730 residencia silva")[0][:2], ("730_Residência_Silva", TIER_NORMALIZED))
+
+    def test_prefix_ranks_above_substring(self):
+        self.assertEqual(self.index.resolve("bet"), "BETA")
+        self.assertEqual(self.index.search("bet")[0][1], TIER_PREFIX)
+
+    def test_typo_is_only_suggested(self):
+        match = self.index.search("Engenharya")[0]
+        self.assertEqual(match[0], "ACME_Engenharia")
+        self.assertEqual(match[1], TIER_FUZZY)
+        with self.assertRaises(ValueError) as ctx:
+            self.index.resolve_path("Engenharya")
+        self.assertIn("não encontrado", str(ctx.exception))
+        self.assertIn("Você quis dizer: ACME_Engenharia", str(ctx.exception))
+
+    def test_unknown_name_sharing_a_word_raises(self):
+        index = ClientNameIndex(["Joao_Pereira", "730_Residencia_Silva"])
+        for query in ("Maria Pereira", "Residencia Souza"):
+            with self.assertRaises(ValueError) as ctx:
+                index.resolve(query)
+            self.assertIn("não encontrado", str(ctx.exception))
+
+    def test_ambiguous_query_raises_with_candidates(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.index.resolve("residencia")
+        self.assertIn("ambíguo", str(ctx.exception))
+        self.assertIn("731_Residencia_Souza", str(ctx.exception))
+
+    def test_not_found_raises(self):
+        with self.assertRaises(ValueError):
+            self.index.resolve("xyzzy")
+
+
+class TestSharedIndex(unittest.TestCase):
+
+    def setUp(self):
+        clear_client_index_cache()
+        self.root = Path(tempfile.mkdtemp())
+        for name in ("ACME", "BETA", ".obsidian"):
+            (self.root / name).mkdir()
+
+    def tearDown(self):
+        clear_client_index_cache()
+        shutil.rmtree(self.root)
+
+    def test_cached_until_root_changes(self):
+        first = get_client_index(self.root, {'.obsidian'})
+        self.assertIs(get_client_index(self.root, {'.obsidian'}), first)
+        self.assertEqual(len(first), 2)
+
+        (self.root / "GAMA").mkdir()
+        st = os.stat(self.root)
+        os.utime(self.root, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        refreshed = get_client_index(self.root, {'.obsidian'})
+        self.assertEqual(refreshed.resolve("gama"), "GAMA")
+
+    def test_missing_root_raises(self):
+        with self.assertRaises(ValueError):
+            get_client_index(self.root / "nope")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Unit Tests for ClientTreeSnapshot
+
+Covers the single-pass scan, revision parsing, mtime-based refresh and
+the snapshot-aware paths of client_query / client_crud.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from foton_system.modules.clients.application.use_cases import client_crud, client_query
+from foton_system.modules.clients.application.use_cases.client_snapshot import (
+    ClientTreeSnapshot, parse_revision, revision_number,
+)
+
+
+def _touch(path: Path, content: str = "@Key; value\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def _bump_mtime(path: Path, delta_ns: int = 5_000_000_000):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + delta_ns))
+
+
+class TestRevisionParsing(unittest.TestCase):
+
+    def test_parse_revision_from_convention(self):
+        self.assertEqual(parse_revision("C01_DOC_CD_01_R03_INFO-ACME.md"), ("01", "R03"))
+
+    def test_parse_revision_fallback(self):
+        self.assertEqual(parse_revision("INFO-CLIENTE.md"), ("00", "R00"))
+
+    def test_revision_number_is_numeric(self):
+        self.assertGreater(revision_number("00", "R10"), revision_number("00", "R09"))
+
+
+class TestClientTreeSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        _touch(self.root / "ACME" / "C01_DOC_CD_00_R00_INFO-ACME.md")
+        _touch(self.root / "ACME" / "C01_DOC_CD_00_R02_INFO-ACME.md")
+        _touch(self.root / "ACME" / "PROJ" / "S01_DOC_CD_00_R01_INFO-PROJ.md")
+        _touch(self.root / "ACME" / "01_ADM" / "FINANCEIRO.csv", "Data,Descricao,Tipo,Valor\n")
+        (self.root / "ACME" / "PROJ__FASE1").mkdir()
+        (self.root / "BETA").mkdir()
+        (self.root / ".obsidian").mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_build_collects_clients_services_and_info(self):
+        snap = ClientTreeSnapshot.build(self.root)
+        self.assertEqual(snap.client_names({'.obsidian'}), {"ACME", "BETA"})
+        self.assertEqual(snap.service_names("ACME"), {"PROJ", "PROJ__FASE1", "01_ADM"})
+        latest = snap.get_client("ACME").latest_info("ACME")
+        self.assertEqual(latest.name, "C01_DOC_CD_00_R02_INFO-ACME.md")
+        self.assertEqual(snap.get_service("ACME", "PROJ__FASE1").parent, "PROJ")
+
+    def test_ledger_path_prefers_adm_folder(self):
+        snap = ClientTreeSnapshot.build(self.root)
+        self.assertEqual(snap.ledger_path("ACME", "01_ADM"), self.root / "ACME" / "01_ADM" / "FINANCEIRO.csv")
+        self.assertIsNone(snap.ledger_path("BETA", "01_ADM"))
+
+    def test_missing_root(self):
+        snap = ClientTreeSnapshot.build(self.root / "nope")
+        self.assertFalse(snap.exists)
+        self.assertEqual(snap.client_names(), set())
+
+    def test_refresh_noop_when_unchanged(self):
+        snap = ClientTreeSnapshot.build(self.root)
+        self.assertEqual(snap.refresh(), 0)
+
+    def test_refresh_rescans_only_changed_folder(self):
+        snap = ClientTreeSnapshot.build(self.root)
+        _touch(self.root / "BETA" / "B01_DOC_CD_00_R00_INFO-BETA.md")
+        _bump_mtime(self.root / "BETA")
+
+        self.assertEqual(snap.refresh(), 1)
+        self.assertIsNotNone(snap.get_client("BETA").latest_info("BETA"))
+
+    def test_refresh_picks_up_new_client(self):
+        snap = ClientTreeSnapshot.build(self.root)
+        (self.root / "GAMA").mkdir()
+        _bump_mtime(self.root)
+
+        snap.refresh()
+        self.assertIn("GAMA", snap.client_names())
+
+
+class TestSnapshotAwareUseCases(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "ACME" / "PROJ").mkdir(parents=True)
+        (self.root / "ACME" / "_ARQUIVO").mkdir()
+        _touch(self.root / "ACME" / "C01_DOC_CD_00_R00_INFO-ACME.md")
+        (self.root / "BETA").mkdir()
+        self.snap = ClientTreeSnapshot.build(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_query_results_match_filesystem_path(self):
+        def normalized(clients):
+            return [{**c, 'services': sorted(c['services'])} for c in clients]
+
+        self.assertEqual(
+            normalized(client_query.list_clients(self.root, snapshot=self.snap)),
+            normalized(client_query.list_clients(self.root)),
+        )
+        self.assertEqual(
+            client_query.list_service_nodes("ACME", self.root, snapshot=self.snap),
+            client_query.list_service_nodes("ACME", self.root),
+        )
+        self.assertEqual(client_query.resolve_client_path("bet", self.root, snapshot=self.snap), self.root / "BETA")
+
+    def test_sync_uses_snapshot_instead_of_repository_listing(self):
+        repo = MagicMock()
+        repo.get_clients_dataframe.return_value = pd.DataFrame({'Alias': ['ACME']})
+
+        client_crud.sync_clients_db_from_folders(repo, snapshot=self.snap)
+
+        repo.list_client_folders.assert_not_called()
+        saved = repo.save_clients.call_args[0][0]
+        self.assertEqual(set(saved['Alias']), {"ACME", "BETA"})
+
+
+if __name__ == '__main__':
+    unittest.main()
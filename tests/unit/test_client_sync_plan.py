@@ -0,0 +1,110 @@
+"""
+Unit Tests for the sync planner (build_sync_plan / apply_sync_plan).
+
+Uses real temporary folders with an in-memory repository that counts writes.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from foton_system.modules.clients.application.ports.client_repository_port import ClientRepositoryPort
+from foton_system.modules.clients.application.use_cases.client_sync_plan import build_sync_plan, apply_sync_plan
+
+
+class CountingRepository(ClientRepositoryPort):
+    def __init__(self, clients_df, services_df):
+        self._clients = clients_df
+        self._services = services_df
+        self.writes = 0
+        self.created = []
+
+    def get_clients_dataframe(self):
+        return self._clients.copy()
+
+    def get_services_dataframe(self):
+        return self._services.copy()
+
+    def save_clients(self, df):
+        self.writes += 1
+        self._clients = df.copy()
+
+    def save_services(self, df):
+        self.writes += 1
+        self._services = df.copy()
+
+    def save_all(self, clients_df, services_df):
+        self.writes += 1
+        self._clients = clients_df.copy()
+        self._services = services_df.copy()
+
+    def list_client_folders(self):
+        raise AssertionError("planner must use the snapshot")
+
+    def list_service_folders(self, client_name):
+        raise AssertionError("planner must use the snapshot")
+
+    def create_folder(self, path):
+        Path(path).mkdir(parents=True, exist_ok=True)
+        self.created.append(Path(path))
+
+
+class TestSyncPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "ACME" / "PROJ").mkdir(parents=True)
+        (self.root / "ACME" / "DOC").mkdir()
+        self.config = MagicMock()
+        self.config.base_pasta_clientes = self.root
+        self.config.ignored_folders = ["DOC"]
+        self.repo = CountingRepository(
+            pd.DataFrame({'Alias': ['BETA'], 'CodCliente': ['B01']}),
+            pd.DataFrame({'AliasCliente': ['BETA'], 'Alias': ['OBRA'], 'CodServico': ['BETOBR01']}),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_dry_run_touches_nothing(self):
+        plan = build_sync_plan(self.repo, self.config, export_info=False)
+
+        self.assertEqual([r['Alias'] for r in plan.client_rows], ['ACME'])
+        self.assertEqual(plan.service_rows, [{'AliasCliente': 'ACME', 'Alias': 'PROJ'}])
+        self.assertEqual(plan.folders, [self.root / "BETA" / "OBRA"])
+        self.assertTrue(plan.describe(self.root))
+        self.assertFalse((self.root / "BETA").exists())
+        self.assertEqual(self.repo.writes, 0)
+
+    def test_apply_does_one_write_and_batches_folders(self):
+        plan = build_sync_plan(self.repo, self.config)
+        summary = apply_sync_plan(plan, self.repo)
+
+        self.assertEqual(self.repo.writes, 1)
+        self.assertEqual(self.repo.created, [self.root / "BETA" / "OBRA"])
+        self.assertTrue((self.root / "BETA" / "OBRA").is_dir())
+        self.assertEqual(set(self.repo._clients['Alias']), {'ACME', 'BETA'})
+        self.assertEqual(summary['clientes_novos'], 1)
+        self.assertTrue(list((self.root / "BETA").glob("*_INFO-BETA.md")))
+
+    def test_second_plan_is_empty_after_apply(self):
+        apply_sync_plan(build_sync_plan(self.repo, self.config), self.repo)
+        plan = build_sync_plan(self.repo, self.config, export_info=False, import_info=False)
+        self.assertTrue(plan.is_empty)
+
+    def test_import_rows_from_info_file(self):
+        info = self.root / "ACME" / "PROJ" / "S01_DOC_CD_00_R00_INFO-PROJ.md"
+        info.write_text("@Area; 120\n", encoding='utf-8')
+
+        plan = build_sync_plan(self.repo, self.config, export_info=False)
+
+        self.assertEqual(len(plan.imported_rows), 1)
+        self.assertEqual(plan.imported_rows[0]['@Area'], '120')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for ContextResolver (memoized INFO chain per directory).
+
+Covers:
+- Same selection rules as before (canonical name wins, else newest *INFO*.md)
+- Client < service merge order with lowercased keys
+- Warm lookups parse nothing; edits, new files and removals are picked up
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from foton_system.modules.documents.infrastructure.services.context_resolver import ContextResolver
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore
+
+
+def _write(path: Path, text: str, offset: float = 0.0):
+    path.write_text(text, encoding="utf-8")
+    stamp = time.time() + offset
+    os.utime(path, (stamp, stamp))
+
+
+class TestContextResolver(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp())
+        self.client = self.base / "730_Silva"
+        self.service = self.client / "Reforma"
+        self.service.mkdir(parents=True)
+        _write(self.client / "INFO-CLIENTE.md", "@NomeCliente; Silva\n@Cidade; Porto\n")
+        _write(self.service / "INFO-SERVICO.md", "@Cidade; Braga\n@Servico; Reforma\n")
+        self.store = InfoFileStore()
+        self.resolver = ContextResolver(store=self.store)
+
+    def tearDown(self):
+        shutil.rmtree(self.base)
+
+    def test_merges_client_then_service(self):
+        ctx = self.resolver.resolve(self.service, self.base)
+        self.assertEqual(ctx.files, [self.client / "INFO-CLIENTE.md", self.service / "INFO-SERVICO.md"])
+        self.assertEqual(ctx.data, {'@nomecliente': 'Silva', '@cidade': 'Braga', '@servico': 'Reforma'})
+
+    def test_canonical_wins_else_newest(self):
+        _write(self.client / "730_DOC_CD_00_R01_INFO-SILVA.md", "@NomeCliente; Revisão\n", offset=10)
+        self.assertEqual(self.resolver.resolve(self.client, self.base).data['@nomecliente'], 'Silva')
+
+        (self.client / "INFO-CLIENTE.md").unlink()
+        _write(self.client / "730_DOC_CD_00_R02_INFO-SILVA.md", "@NomeCliente; Mais nova\n", offset=20)
+        self.assertEqual(self.resolver.resolve(self.client, self.base).data['@nomecliente'], 'Mais nova')
+
+    def test_ten_lookups_parse_each_file_once(self):
+        for _ in range(10):
+            self.resolver.resolve(self.service, self.base)
+        self.assertEqual(self.store.misses, 2)
+        self.assertEqual(self.store.hits, 0)
+        self.assertEqual(self.resolver.stats()['hits'], 9)
+
+    def test_edit_invalidates_chain(self):
+        self.resolver.resolve(self.service, self.base)
+        _write(self.client / "INFO-CLIENTE.md", "@NomeCliente; Silva Filho\n", offset=5)
+        self.assertEqual(self.resolver.resolve(self.service, self.base).data['@nomecliente'], 'Silva Filho')
+
+    def test_newer_revision_is_picked_after_edit_of_other_candidate(self):
+        (self.service / "INFO-SERVICO.md").unlink()
+        old = self.service / "730_DOC_CD_00_R01_INFO-REFORMA.md"
+        new = self.service / "730_DOC_CD_00_R02_INFO-REFORMA.md"
+        _write(old, "@Servico; Antigo\n", offset=1)
+        _write(new, "@Servico; Novo\n", offset=2)
+        self.assertEqual(self.resolver.resolve(self.service, self.base).data['@servico'], 'Novo')
+
+        # Touching the older candidate makes it the newest (same folder mtime)
+        _write(old, "@Servico; Reeditado\n", offset=30)
+        self.assertEqual(self.resolver.resolve(self.service, self.base).data['@servico'], 'Reeditado')
+
+    def test_missing_folder_yields_empty_context(self):
+        ctx = self.resolver.resolve(self.base / "nao_existe", self.base)
+        self.assertEqual((ctx.files, ctx.data), ([], {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
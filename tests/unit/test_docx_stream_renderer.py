@@ -0,0 +1,150 @@
+"""
+Tests for DocxStreamRenderer (raw-XML fast path).
+
+The rendered paragraphs must be equivalent (canonical XML) to what
+PythonDocxAdapter produces, and untouched zip entries must be copied with
+their compressed bytes unchanged.
+"""
+
+import shutil
+import struct
+import tempfile
+import unittest
+import zlib
+import zipfile
+from pathlib import Path
+
+from docx import Document
+from docx.shared import Inches, Pt
+from lxml import etree
+
+from foton_system.modules.documents.infrastructure.adapters.docx_stream_renderer import DocxStreamRenderer
+from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
+from foton_system.modules.documents.infrastructure.services.template_cache import compile_template
+
+REPLACEMENTS = {
+    '@NomeCliente': 'Residência Silva',
+    '@CodCliente': '730',
+    '@Valor': '1.234,56',
+    '@Valor%': '12,5%',
+    '@Area': '120\t m²',
+    '@Endereco': 'Rua A\nBairro B',
+}
+
+RENDERED_PARTS = ('word/document.xml', 'word/header1.xml', 'word/footer1.xml')
+
+
+def _png() -> bytes:
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+    ihdr = struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', ihdr) + chunk(b'IDAT', zlib.compress(b'\x00\xff\x00\x00')) + chunk(b'IEND', b'')
+
+
+def _paragraphs(xml: bytes) -> list:
+    """Canonical XML of every w:p (section properties differ when python-docx adds headers)."""
+    root = etree.fromstring(xml)
+    return [etree.tostring(p, method='c14n') for p in root.iter('{%s}p' % root.nsmap['w'])]
+
+
+def _raw_entry(path, name) -> bytes:
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+        zf.fp.seek(info.header_offset)
+        header = zf.fp.read(30)
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        zf.fp.seek(info.header_offset + 30 + name_len + extra_len)
+        return zf.fp.read(info.compress_size)
+
+
+class TestDocxStreamRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.templates = [self._contract(), self._receipt_with_image()]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _contract(self) -> Path:
+        path = self.tmp / "CONTRATO.docx"
+        doc = Document()
+        section = doc.sections[0]
+        section.header.paragraphs[0].text = "Contrato nº @CodCliente"
+        section.footer.paragraphs[0].text = "@NomeCliente — página"
+        doc.add_paragraph("Cláusula sem variáveis.")
+        p = doc.add_paragraph("Contratante: ")
+        bold = p.add_run("@Nome")
+        bold.bold = True
+        p.add_run("Cliente").font.size = Pt(14)
+        p.add_run(", e-mail contato@empresa.com")
+        doc.add_paragraph("Valor @Valor\t(@Valor%)")
+        doc.add_paragraph("Endereço: @Endereco")
+        doc.add_paragraph("Chave ausente @NaoExiste fica como está.")
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Área"
+        table.cell(0, 1).text = "@Area"
+        table.cell(1, 0).text = "Cliente"
+        table.cell(1, 1).text = "@NomeCliente"
+        doc.save(path)
+        return path
+
+    def _receipt_with_image(self) -> Path:
+        image = self.tmp / "logo.png"
+        image.write_bytes(_png())
+        path = self.tmp / "RECIBO.docx"
+        doc = Document()
+        doc.add_picture(str(image), width=Inches(1))
+        doc.add_paragraph("Recebemos de @NomeCliente a quantia de @Valor.")
+        doc.save(path)
+        return path
+
+    def _render_both(self, template, compiled=None):
+        adapter = PythonDocxAdapter()
+        expected = self.tmp / f"{template.stem}_adapter.docx"
+        adapter.save_document(adapter.replace_text(adapter.load_document(str(template)), REPLACEMENTS), str(expected))
+        actual = self.tmp / f"{template.stem}_stream.docx"
+        DocxStreamRenderer().render(str(template), REPLACEMENTS, str(actual), compiled)
+        return expected, actual
+
+    def test_output_matches_adapter_on_template_set(self):
+        for template in self.templates:
+            for compiled in (None, compile_template(template, 'docx')):
+                with self.subTest(template=template.name, compiled=compiled is not None):
+                    expected, actual = self._render_both(template, compiled)
+                    with zipfile.ZipFile(template) as t, zipfile.ZipFile(expected) as e, zipfile.ZipFile(actual) as a:
+                        # (python-docx adds empty header/footer parts when a section has none)
+                        self.assertEqual(a.namelist(), t.namelist())
+                        for name in RENDERED_PARTS:
+                            if name in a.namelist():
+                                self.assertEqual(_paragraphs(a.read(name)), _paragraphs(e.read(name)), name)
+
+    def test_text_is_substituted(self):
+        _, actual = self._render_both(self.templates[0])
+        texts = [p.text for p in Document(str(actual)).paragraphs]
+        self.assertIn("Contratante: Residência Silva, e-mail contato@empresa.com", texts)
+        self.assertIn("Endereço: Rua A\nBairro B", texts)
+        self.assertIn("Chave ausente @NaoExiste fica como está.", texts)
+
+    def test_untouched_entries_copied_byte_for_byte(self):
+        template = self.templates[1]
+        actual = self.tmp / "out.docx"
+        stats = DocxStreamRenderer().render(str(template), REPLACEMENTS, str(actual))
+        self.assertEqual(stats['rendered'], 1)
+
+        with zipfile.ZipFile(template) as zf:
+            names = [n for n in zf.namelist() if n != 'word/document.xml']
+        for name in names:
+            self.assertEqual(_raw_entry(actual, name), _raw_entry(template, name), name)
+        with zipfile.ZipFile(actual) as zf:
+            self.assertIsNone(zf.testzip())
+
+    def test_adapter_render_to_file_uses_fast_path(self):
+        template = self.templates[0]
+        out = self.tmp / "via_adapter.docx"
+        PythonDocxAdapter().render_to_file(str(template), REPLACEMENTS, str(out), compile_template(template, 'docx'))
+        self.assertIn("Valor 1.234,56\t(12,5%)", [p.text for p in Document(str(out)).paragraphs])
+
+
+if __name__ == '__main__':
+    unittest.main()
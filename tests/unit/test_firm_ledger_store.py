@@ -0,0 +1,153 @@
+"""
+Tests for FirmLedgerStore (consolidated SQLite firm ledger).
+
+Covers:
+- Full sync from dispersed ledgers (01_ADM and legacy location)
+- Incremental sync: unchanged skipped, appends inserted, edits rebuilt, removed clients dropped
+- A torn last row is left out until its newline lands
+- Period totals, monthly rollup and top clients
+- Watcher keeps the store fresh; OpFinanceQuery / MCP tool end to end
+"""
+
+import csv
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from foton_system.modules.finance.infrastructure.repositories.firm_ledger_store import (
+    FirmLedgerStore, client_of_ledger, firm_ledger_paths, parse_ledger_date,
+)
+
+HEADERS = ['Data', 'Descricao', 'Tipo', 'Valor']
+
+
+class MockEvent:
+    def __init__(self, src_path, is_directory=False):
+        self.src_path = str(src_path)
+        self.is_directory = is_directory
+
+
+class TestFirmLedgerStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.base = self.tmp / "clientes"
+        self.config = MagicMock()
+        self.config.base_pasta_clientes = self.base
+        self.config.folder_adm = "01_ADM"
+        self.config.ignored_folders = ["01_ADM"]
+
+        self.silva = self._ledger("730_Silva", [
+            ['2025-01-10', 'Sinal', 'ENTRADA', '1000.00'],
+            ['2025-01-20', 'Material', 'SAIDA', '200.00'],
+            ['15/02/2025', 'Parcela', 'ENTRADA', '500.00'],
+        ])
+        self.costa = self._ledger("731_Costa", [
+            ['2025-02-01', 'Projeto', 'ENTRADA', '3000.00'],
+            ['2025-03-05', 'Terceiros', 'SAIDA', '6000.00'],
+        ], legacy=True)
+        (self.base / "732_SemFinanceiro").mkdir()
+        self.store = FirmLedgerStore(self.tmp / "financeiro.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _ledger(self, client, rows, legacy=False):
+        folder = self.base / client if legacy else self.base / client / "01_ADM"
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / "FINANCEIRO.csv"
+        self._append(path, [HEADERS] + rows)
+        return path
+
+    @staticmethod
+    def _append(path, rows):
+        with open(path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+
+    def test_full_sync_and_queries(self):
+        stats = self.store.sync(firm_ledger_paths(self.config))
+        self.assertEqual((stats['rebuilt'], stats['rows']), (2, 5))
+
+        self.assertEqual(self.store.totals(), {'income': 4500.0, 'expense': 6200.0, 'balance': -1700.0, 'count': 5})
+        self.assertEqual(self.store.totals('2025-02-01', '2025-02-28')['income'], 3500.0)
+        self.assertEqual(self.store.totals(tipo='SAIDA', min_value=5000)['count'], 1)
+        self.assertEqual([(m['month'], m['balance']) for m in self.store.monthly('2025-01-01', '2025-12-31')],
+                         [('2025-01', 800.0), ('2025-02', 3500.0), ('2025-03', -6000.0)])
+        self.assertEqual([c['name'] for c in self.store.top_clients()], ['731_Costa', '730_Silva'])
+        self.assertEqual(self.store.top_clients(tipo='SAIDA', limit=1)[0]['total'], 6000.0)
+
+    def test_incremental_sync(self):
+        ledgers = firm_ledger_paths(self.config)
+        self.store.sync(ledgers)
+        self.assertEqual(self.store.sync(ledgers)['unchanged'], 3)
+
+        self._append(self.silva, [['2025-04-01', 'Final', 'ENTRADA', '250.00']])
+        stats = self.store.sync(ledgers)
+        self.assertEqual((stats['appended'], stats['rows']), (1, 1))
+        self.assertEqual(self.store.totals(client='730_Silva')['income'], 1750.0)
+
+        self.costa.write_text("Data,Descricao,Tipo,Valor\n2025-02-01,Projeto,ENTRADA,10.00\n", encoding='utf-8')
+        stats = self.store.sync(ledgers)
+        self.assertEqual(stats['rebuilt'], 1)
+        self.assertEqual(self.store.totals(client='731_Costa'), {'income': 10.0, 'expense': 0, 'balance': 10.0,
+                                                                 'count': 1})
+
+        shutil.rmtree(self.base / "731_Costa")
+        self.assertEqual(self.store.sync(firm_ledger_paths(self.config))['removed'], 1)
+        self.assertEqual(self.store.totals()['count'], 4)
+
+    def test_torn_append_is_synced_once_complete(self):
+        ledgers = firm_ledger_paths(self.config)
+        self.store.sync(ledgers)
+        with open(self.silva, 'ab') as f:
+            f.write(b'2025-04-01,Final,ENTRADA,2')  # writer caught mid-row
+        self.assertEqual(self.store.sync(ledgers)['rows'], 0)
+
+        fresh = FirmLedgerStore(self.tmp / "fresh.sqlite")  # rebuild path stops at the same boundary
+        self.assertEqual(fresh.sync(ledgers)['rows'], 5)
+
+        with open(self.silva, 'ab') as f:
+            f.write(b'50.00\r\n')
+        for store in (self.store, fresh):
+            self.assertEqual(store.sync(ledgers)['rows'], 1)
+            self.assertEqual(store.totals(client='730_Silva')['income'], 1750.0)
+
+    def test_dates_normalized(self):
+        self.assertEqual(parse_ledger_date('15/02/2025'), '2025-02-15')
+        self.assertIsNone(parse_ledger_date('ontem'))
+
+    def test_client_of_ledger_only_for_active_ledger(self):
+        self.assertEqual(client_of_ledger(self.silva, self.config), '730_Silva')
+        self.assertEqual(client_of_ledger(self.costa, self.config), '731_Costa')
+        self.assertIsNone(client_of_ledger(self.base / "730_Silva" / "FINANCEIRO.csv", self.config))
+        self.assertIsNone(client_of_ledger(self.tmp / "FINANCEIRO.csv", self.config))
+
+    def test_watcher_syncs_changed_ledger(self):
+        from foton_system.core.watcher.handlers import FotonFileSystemEventHandler
+        handler = FotonFileSystemEventHandler()
+        handler._rag_available = False
+        with patch('foton_system.modules.shared.infrastructure.config.config.Config', return_value=self.config), \
+                patch.object(FirmLedgerStore, 'instance', return_value=self.store):
+            handler.on_modified(MockEvent(self.silva))
+            self.assertEqual(self.store.totals()['count'], 3)
+            self._append(self.silva, [['2025-04-01', 'Final', 'SAIDA', '50.00']])
+            handler.on_modified(MockEvent(self.silva))
+        self.assertEqual(self.store.totals(client='730_Silva')['expense'], 250.0)
+
+    def test_mcp_tool_runs_query(self):
+        from foton_system.interfaces.mcp.foton_mcp import consultar_financeiro_periodo
+        with patch('foton_system.core.ops.op_finance_query.Config', return_value=self.config), \
+                patch.object(FirmLedgerStore, 'instance', return_value=self.store), \
+                patch('foton_system.core.ops.base_op.AuditLogger'):
+            output = consultar_financeiro_periodo(consulta="mensal", inicio="01/01/2025", fim="2025-02-28")
+            invalid = consultar_financeiro_periodo(consulta="semanal")
+        self.assertIn("2025-01: R$ 800.00", output)
+        self.assertIn("2025-02: R$ 3,500.00", output)
+        self.assertNotIn("2025-03", output)
+        self.assertIn("❌ Consulta inválida", invalid)
+
+
+if __name__ == '__main__':
+    unittest.main()
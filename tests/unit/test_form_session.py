@@ -58,5 +58,50 @@ class TestTUIFormFiller(unittest.TestCase):
         action = self.view.run_loop()
         self.assertEqual(action, "cancel")
 
+class TestFormSessionRecalculation(unittest.TestCase):
+    """Dependency-ordered, incremental recalculation of [calculo:] fields."""
+
+    MD = """@area; 100
+@custo_m2; 2000
+@outro; 5
+@base; [calculo: @area * @custo_m2] Custo base
+@bdi%; [calculo: 0.25] BDI
+@total; [calculo: @base * (1 + @bdi% / 100)] Total
+@dobro_outro; [calculo: @outro * 2]
+@antes; [calculo: @depois + 1] Definido antes da dependência
+@depois; [calculo: @area / 2]
+"""
+
+    def setUp(self):
+        self.session = FormSession()
+        self.session.parse_markdown(self.MD)
+        self.fields = {f.name: f for f in self.session.fields}
+
+    def _edit(self, name, value):
+        self.session.cursor = [f.name for f in self.session.fields].index(name)
+        self.session.update_current(value)
+
+    def test_chained_percent_formulas(self):
+        self.assertEqual(self.fields['bdi%'].current_value, "25.00%")
+        self.assertEqual(self.fields['total'].current_value, "250000.00")
+        # Order in the file no longer matters
+        self.assertEqual(self.fields['antes'].current_value, "51.00")
+
+    def test_edit_recomputes_only_dependents(self):
+        with patch.object(self.session, '_evaluate_formula', wraps=self.session._evaluate_formula) as spy:
+            self._edit('area', '10')
+        evaluated = [call.args[0].key for call in spy.call_args_list]
+        self.assertEqual(sorted(evaluated), ['@antes', '@base', '@depois', '@total'])
+        self.assertLess(evaluated.index('@base'), evaluated.index('@total'))
+        self.assertLess(evaluated.index('@depois'), evaluated.index('@antes'))
+        self.assertEqual(self.fields['total'].current_value, "25000.00")
+        self.assertEqual(self.fields['dobro_outro'].current_value, "10.00")
+
+    def test_missing_reference_and_cycle_yield_zero(self):
+        session = FormSession()
+        session.parse_markdown("@a; [calculo: @b + 1]\n@b; [calculo: @a + 1]\n@c; [calculo: @nada * 3]\n")
+        self.assertEqual([f.current_value for f in session.fields], ["0.00", "0.00", "0.00"])
+
+
 if __name__ == '__main__':
     unittest.main()
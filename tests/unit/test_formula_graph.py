@@ -0,0 +1,97 @@
+"""
+Tests for FormulaGraph ([calculo:] dependency evaluation).
+
+Covers:
+- Chains of any depth resolve in one pass, regardless of key order
+- Each formula compiles once; evaluations reuse the cached evaluator
+- Cycles are detected and reported with their path
+- Errors name the exact missing dependency / upstream failure
+- DocumentService._resolve_operations keeps its storage format
+"""
+
+import unittest
+from unittest.mock import patch
+
+from foton_system.modules.documents.domain.services.formula_graph import Formula, FormulaGraph
+from foton_system.modules.shared.domain.services.safe_math import compile_expression
+from foton_system.modules.shared.infrastructure.utils.formatting import FotonFormatter
+
+
+def _evaluate(values):
+    return FormulaGraph.compile(values).evaluate(values, to_number=FotonFormatter.parse_br_number)
+
+
+class TestFormulaGraph(unittest.TestCase):
+
+    def test_parse_extracts_references_once(self):
+        formula = Formula.parse('@total', '(@Valor + @valor%) * @Valor')
+        self.assertEqual(formula.refs, ('@valor', '@valor%'))
+        self.assertEqual(formula.source, '( _v0  +  _v1 ) *  _v0 ')
+        self.assertEqual(formula.evaluate({'@valor': 2.0, '@valor%': -0.5}), 3.0)
+        self.assertIs(formula.compiled(), Formula.parse('@x', '(@a + @b) * @a').compiled())
+
+    def test_compiled_once_per_formula(self):
+        formula = Formula.parse('@total', '@a * 2 + @b')
+        with patch('foton_system.modules.documents.domain.services.formula_graph.compile_expression',
+                   wraps=compile_expression) as compile_spy:
+            for i in range(5):
+                self.assertEqual(formula.evaluate({'@a': float(i), '@b': 1.0}), i * 2 + 1.0)
+        compile_spy.assert_called_once()
+
+    def test_deep_chain_resolves_in_one_pass(self):
+        values = {f'@n{i}': f'[calculo: @n{i + 1} + 1]' for i in range(6)}
+        values['@n6'] = '10'
+        results, errors = _evaluate(values)
+        self.assertEqual(errors, {})
+        self.assertEqual(results['@n0'], 16.0)
+
+    def test_order_independent_and_case_insensitive(self):
+        values = {
+            '@Total': '[calculo: @SUBTOTAL * (1 + @taxa)]',
+            '@subtotal': '[calculo: @Preco * @Qtd]',
+            '@preco': 'R$ 1.000,00',
+            '@qtd': '2',
+            '@taxa': '0,1',
+        }
+        results, errors = _evaluate(values)
+        self.assertEqual(errors, {})
+        self.assertAlmostEqual(results['@total'], 2200.0)
+
+    def test_cycle_is_reported(self):
+        values = {'@a': '[calculo: @b + 1]', '@b': '[calculo: @a * 2]', '@c': '[calculo: @a + 1]', '@d': '5'}
+        graph = FormulaGraph.compile(values)
+        self.assertEqual(set(graph.cycles), {'@a', '@b', '@c'})
+        _, errors = graph.evaluate(values)
+        self.assertEqual(errors['@a'], 'Dependência circular: @a -> @b -> @a')
+
+    def test_missing_and_upstream_errors_are_exact(self):
+        values = {'@base': '[calculo: @inexistente * 2]', '@final': '[calculo: @base + @texto]', '@texto': 'abc'}
+        results, errors = _evaluate(values)
+        self.assertEqual(results, {})
+        self.assertEqual(errors['@base'], 'Variável ausente: @inexistente')
+        self.assertEqual(errors['@final'], 'Dependência @base não resolvida (Variável ausente: @inexistente)')
+
+    def test_invalid_characters_and_division_by_zero(self):
+        values = {'@x': '[calculo: __import__("os")]', '@y': '[calculo: 10 / (@z - @z)]', '@z': '3'}
+        results, errors = _evaluate(values)
+        self.assertIn('caracteres inválidos', errors['@x'])
+        self.assertEqual(results['@y'], 0.0)
+
+    def test_affected_by_is_transitive(self):
+        values = {'@a': '1', '@b': '[calculo: @a * 2]', '@c': '[calculo: @b + 1]', '@d': '[calculo: 3]'}
+        graph = FormulaGraph.compile(values)
+        self.assertEqual(graph.affected_by(['@A']), {'@b', '@c'})
+
+    def test_document_service_stores_two_decimals(self):
+        from foton_system.modules.documents.application.use_cases.document_service import DocumentService
+        from unittest.mock import MagicMock
+        service = DocumentService(MagicMock(), MagicMock(), MagicMock())
+        data = {'@a': '1,5', '@b': '[calculo: @a * 3]', '@c': '[calculo: @b + @a]', '@d': '[calculo: @x]'}
+        errors = service._resolve_operations(data)
+        self.assertEqual((data['@b'], data['@c']), ('4.50', '6.00'))
+        self.assertEqual(data['@d'], '[calculo: @x]')
+        self.assertEqual(errors, {'@d': 'Variável ausente: @x'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for the generation ledger and incremental regeneration.
+
+Covers:
+- Each generation records its template/data/INFO inputs with hashes
+- Editing an INFO file (or adding one to the chain) makes the output stale
+- regenerate_stale rebuilds only the stale outputs
+- In-memory data is kept in the record
+- A new INFO revision file marks outputs of the previous revision stale (watcher)
+- Deleted outputs are only regenerated on request (include_missing)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from docx import Document
+
+from foton_system.modules.documents.application.use_cases import generation_ledger
+from foton_system.modules.documents.application.use_cases.document_service import DocumentService
+from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
+from foton_system.modules.documents.infrastructure.adapters.python_pptx_adapter import PythonPPTXAdapter
+
+
+def _touch_later(path: Path, text: str):
+    """Rewrites a file and bumps its mtime so (mtime, size) caches see the change."""
+    path.write_text(text, encoding="utf-8")
+    stamp = time.time() + 5
+    os.utime(path, (stamp, stamp))
+
+
+class TestGenerationLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.base = self.tmp / "clientes"
+        self.client = self.base / "730_Residencia_Silva"
+        self.service = self.client / "Reforma"
+        self.service.mkdir(parents=True)
+        self.client_info = self.client / "INFO-CLIENTE.md"
+        self.client_info.write_text("@NomeCliente; Silva\n", encoding="utf-8")
+
+        self.template = self.tmp / "RECIBO.docx"
+        doc = Document()
+        doc.add_paragraph("Recibo de @NomeCliente referente a @Mes.")
+        doc.save(self.template)
+
+        config = MagicMock()
+        config.base_pasta_clientes = self.base
+        config.ignored_folders = []
+        config.clean_missing_variables = False
+        config.missing_variable_placeholder = "___"
+        config.templates_path = self.tmp
+        self.service_obj = DocumentService(PythonDocxAdapter(), PythonPPTXAdapter(), config)
+
+        self.data = self.client / "dados.json"
+        self.data.write_text(json.dumps({"@Mes": "Junho"}), encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _generate(self, folder: Path, name="GERADO_RECIBO.docx", memory=None):
+        output = folder / name
+        if memory is not None:
+            self.service_obj.generate_document(str(self.template), output_path=str(output), data=memory,
+                                               context_dir=folder)
+        else:
+            self.service_obj.generate_document(str(self.template), str(self.data), str(output), 'docx')
+        return output
+
+    def _text(self, path):
+        return Document(str(path)).paragraphs[0].text
+
+    def test_generation_is_recorded(self):
+        output = self._generate(self.client)
+        records = generation_ledger.load_ledger(self.client / generation_ledger.LEDGER_FILENAME)
+        record = records[str(output)]
+        self.assertEqual(record.context, [str(self.client_info)])
+        self.assertEqual(set(record.inputs), {str(self.template), str(self.data), str(self.client_info)})
+        self.assertEqual(record.stale_reasons(self.service_obj._context_files), [])
+
+    def test_info_edit_marks_output_stale(self):
+        output = self._generate(self.client)
+        _touch_later(self.client_info, "@NomeCliente; Silva Filho\n")
+
+        stale = self.service_obj.find_stale_documents()
+        self.assertEqual([(r.output, reasons) for r, reasons in stale],
+                         [(str(output), ["alterado: INFO-CLIENTE.md"])])
+        self.assertEqual([r.output for r in generation_ledger.stale_outputs_for(self.client_info)], [str(output)])
+
+    def test_new_info_revision_marks_output_stale(self):
+        self.client_info.unlink()  # revisioned layout only
+        revision = self.client / "C01_DOC_CD_00_R00_INFO-SILVA.md"
+        revision.write_text("@NomeCliente; Silva\n", encoding="utf-8")
+        output = self._generate(self.client)
+        self.assertEqual(generation_ledger.stale_outputs_for(revision), [])
+
+        newer = self.client / "C01_DOC_CD_00_R01_INFO-SILVA.md"
+        newer.write_text("@NomeCliente; Silva Filho\n", encoding="utf-8")
+        self.assertEqual([r.output for r in generation_ledger.stale_outputs_for(newer)], [str(output)])
+        self.assertEqual(generation_ledger.stale_outputs_for(self.client / "INFO-OUTRO.md"), [])
+
+    def test_new_info_in_chain_marks_output_stale(self):
+        self._generate(self.service, memory={"@Mes": "Maio"})
+        (self.service / "INFO-SERVICO.md").write_text("@Mes; Agosto\n", encoding="utf-8")
+
+        (record, reasons), = self.service_obj.find_stale_documents()
+        self.assertEqual(reasons, ["novo contexto: INFO-SERVICO.md"])
+
+    def test_regenerate_only_stale_outputs(self):
+        fresh = self._generate(self.service, name="OUTRO.docx", memory={"@Mes": "Maio"})
+        stale = self._generate(self.client)
+        fresh_mtime = fresh.stat().st_mtime_ns
+        _touch_later(self.data, json.dumps({"@Mes": "Julho"}))
+
+        planned = self.service_obj.regenerate_stale(dry_run=True)
+        self.assertEqual([(r['output'], r['status']) for r in planned], [(str(stale), 'PLANNED')])
+
+        results = self.service_obj.regenerate_stale()
+        self.assertEqual([r['status'] for r in results], ['REGENERATED'])
+        self.assertEqual(self._text(stale), "Recibo de Silva referente a Julho.")
+        self.assertEqual(fresh.stat().st_mtime_ns, fresh_mtime)
+        self.assertEqual(self.service_obj.regenerate_stale(), [])
+
+    def test_in_memory_data_is_kept_in_record(self):
+        output = self._generate(self.client, memory={"@Mes": "Maio"})
+        record = generation_ledger.load_ledger(self.client / generation_ledger.LEDGER_FILENAME)[str(output)]
+        self.assertEqual(record.extra_data, {"@mes": "Maio"})
+        self.assertEqual(Path(record.data).name, generation_ledger.IN_MEMORY_DATA_NAME)
+        self.assertNotIn(record.data, record.inputs)
+
+        output.unlink()
+        self.assertEqual(self.service_obj.regenerate_stale(), [])  # deleted on purpose: left alone
+        (result,) = self.service_obj.regenerate_stale(include_missing=True)
+        self.assertEqual(result['reasons'], ["saída ausente"])
+        self.assertEqual(self._text(output), "Recibo de Silva referente a Maio.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for in-memory document generation.
+
+Covers:
+- generate_document(data=..., context_dir=...) without a data file
+- Rendered bytes returned (output_path=None) or written to a buffer
+- OpGenerateDocument no longer writes temp files in the client folder
+"""
+
+import io
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from docx import Document
+from pptx import Presentation
+from pptx.util import Inches
+
+from foton_system.modules.documents.application.use_cases.document_service import DocumentService
+from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
+from foton_system.modules.documents.infrastructure.adapters.python_pptx_adapter import PythonPPTXAdapter
+
+
+class TestInMemoryGeneration(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.base = self.tmp / "clientes"
+        self.client = self.base / "730_Residencia_Silva"
+        self.client.mkdir(parents=True)
+        (self.client / "INFO-CLIENTE.md").write_text("@NomeCliente; Silva\n", encoding="utf-8")
+
+        self.docx = self.tmp / "RECIBO.docx"
+        doc = Document()
+        doc.add_paragraph("Recibo de @NomeCliente referente a @Mes.")
+        doc.save(self.docx)
+
+        self.pptx = self.tmp / "CAPA.pptx"
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = "@NomeCliente - @Mes"
+        prs.save(self.pptx)
+
+        config = MagicMock()
+        config.base_pasta_clientes = self.base
+        config.ignored_folders = []
+        config.clean_missing_variables = False
+        config.missing_variable_placeholder = "___"
+        self.config = config
+        self.service = DocumentService(PythonDocxAdapter(), PythonPPTXAdapter(), config)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_returns_docx_bytes_without_touching_disk(self):
+        before = sorted(p.name for p in self.client.iterdir())
+        content = self.service.generate_document(str(self.docx), data={"@Mes": "Junho"}, context_dir=self.client)
+        self.assertIsInstance(content, bytes)
+        self.assertEqual(Document(io.BytesIO(content)).paragraphs[0].text, "Recibo de Silva referente a Junho.")
+        self.assertEqual(sorted(p.name for p in self.client.iterdir()), before)
+
+    def test_writes_pptx_into_buffer(self):
+        buffer = io.BytesIO()
+        result = self.service.generate_document(str(self.pptx), output_path=buffer, data={"@Mes": "Maio"},
+                                                context_dir=self.client)
+        self.assertIs(result, buffer)
+        buffer.seek(0)
+        texts = [s.text_frame.text for s in Presentation(buffer).slides[0].shapes if s.has_text_frame]
+        self.assertEqual(texts, ["Silva - Maio"])
+
+    def test_requires_data_path_or_context_dir(self):
+        with self.assertRaises(ValueError):
+            self.service.generate_document(str(self.docx), data={"@Mes": "Junho"})
+
+    def test_op_generate_document_writes_no_temp_file(self):
+        from foton_system.core.ops.op_doc_gen import OpGenerateDocument
+        self.config.templates_path = self.tmp
+        service = self.service
+        with patch('foton_system.core.ops.op_doc_gen.Config', return_value=self.config), \
+                patch('foton_system.core.ops.op_doc_gen.DocumentService', return_value=service), \
+                patch.object(service, '_load_data', wraps=service._load_data) as load_data:
+            result = OpGenerateDocument(actor="test").execute_logic(
+                {"client_name": "Silva", "template_name": "RECIBO", "extra_data": {"@Mes": "Julho"}}
+            )
+        load_data.assert_not_called()
+        self.assertEqual(Document(result["output_path"]).paragraphs[0].text, "Recibo de Silva referente a Julho.")
+        self.assertEqual(sorted(p.name for p in self.client.iterdir()),
+                         sorted([".geracoes.jsonl", "GERADO_RECIBO.docx", "INFO-CLIENTE.md", "history.log"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit Tests for InfoFileStore (shared INFO parser + mtime-keyed cache).
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from foton_system.modules.shared.infrastructure.services.info_file_store import InfoFileStore, parse_info_text
+
+
+class TestParseInfoText(unittest.TestCase):
+
+    def test_semicolon_and_colon_fallback(self):
+        data = parse_info_text("# Titulo\n@nome; João\n@hora: 10:30\nTexto: ignorado\n@vazio;\n")
+        self.assertEqual(data, {'@nome': 'João', '@hora': '10:30', '@vazio': ''})
+
+    def test_semicolon_wins_over_colon(self):
+        self.assertEqual(parse_info_text("@link; https://x.y"), {'@link': 'https://x.y'})
+
+
+class TestInfoFileStore(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.file = self.dir / "INFO-CLIENTE.md"
+        self.file.write_text("@nome; Ana\n", encoding='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_second_read_is_a_hit(self):
+        store = InfoFileStore()
+        self.assertEqual(store.read(self.file), {'@nome': 'Ana'})
+        self.assertEqual(store.read(self.file), {'@nome': 'Ana'})
+        self.assertEqual(store.stats()['hits'], 1)
+        self.assertEqual(store.stats()['hit_rate'], 0.5)
+
+    def test_change_in_mtime_or_size_reparses(self):
+        store = InfoFileStore()
+        store.read(self.file)
+        self.file.write_text("@nome; Beatriz\n", encoding='utf-8')
+        st = os.stat(self.file)
+        os.utime(self.file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(store.read(self.file), {'@nome': 'Beatriz'})
+        self.assertEqual(store.stats()['misses'], 2)
+
+    def test_returned_dict_is_a_copy(self):
+        store = InfoFileStore()
+        store.read(self.file)['@nome'] = 'X'
+        self.assertEqual(store.read(self.file), {'@nome': 'Ana'})
+
+    def test_bounded_size_evicts_oldest(self):
+        store = InfoFileStore(max_entries=2)
+        files = []
+        for i in range(3):
+            f = self.dir / f"INFO-{i}.md"
+            f.write_text(f"@i; {i}\n", encoding='utf-8')
+            files.append(f)
+            store.read(f)
+        self.assertEqual(store.stats()['entries'], 2)
+        store.read(files[0])
+        self.assertEqual(store.stats()['hits'], 0)
+
+    def test_missing_file_returns_empty(self):
+        self.assertEqual(InfoFileStore().read(self.dir / "nope.md"), {})
+
+    def test_persistent_cache_survives_new_instance(self):
+        cache = self.dir / "cache" / "info_cache.json"
+        first = InfoFileStore(persist_path=cache)
+        first.read(self.file)
+        first.save()
+
+        second = InfoFileStore(persist_path=cache)
+        self.assertEqual(second.read(self.file), {'@nome': 'Ana'})
+        self.assertEqual(second.stats()['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Unit Tests for the INFO revision index and compaction.
+"""
+
+import shutil
+import tempfile
+import unittest
+import zipfile
+import unittest.mock
+from pathlib import Path
+
+from foton_system.modules.clients.application.use_cases.info_revisions import (
+    InfoRevisionIndex, compact_revisions, compact_tree, ARCHIVE_FILENAME, INDEX_FILENAME,
+)
+
+
+def _write_revisions(folder: Path, alias: str, count: int, cod: str = "C01"):
+    folder.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (folder / f"{cod}_DOC_CD_00_R{i:02d}_INFO-{alias}.md").write_text(f"@rev; {i}\n", encoding='utf-8')
+
+
+class TestInfoRevisionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.folder = self.root / "ACME"
+        _write_revisions(self.folder, "ACME", 12)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_latest_uses_numeric_revision(self):
+        latest = InfoRevisionIndex().latest(self.folder, "ACME")
+        self.assertEqual(latest.name, "C01_DOC_CD_00_R11_INFO-ACME.md")
+
+    def test_lookup_never_writes_index(self):
+        index = InfoRevisionIndex()
+        index.latest(self.folder, "ACME")
+        self.assertIsNone(index.latest(self.root, "ACME"))  # folder without INFO files
+        self.assertFalse((self.folder / INDEX_FILENAME).exists())
+        self.assertFalse((self.root / INDEX_FILENAME).exists())
+
+    def test_index_file_is_reused_by_new_process(self):
+        new = self.folder / "C01_DOC_CD_00_R12_INFO-ACME.md"
+        new.write_text("@rev; 12\n", encoding='utf-8')
+        InfoRevisionIndex().record(new)
+        self.assertTrue((self.folder / INDEX_FILENAME).exists())
+        fresh = InfoRevisionIndex()
+        with unittest.mock.patch(
+            'foton_system.modules.clients.application.use_cases.info_revisions._list_revisions'
+        ) as listing:
+            self.assertEqual(fresh.latest(self.folder, "ACME").name, "C01_DOC_CD_00_R12_INFO-ACME.md")
+            listing.assert_not_called()
+
+    def test_new_file_invalidates_index(self):
+        index = InfoRevisionIndex()
+        index.latest(self.folder, "ACME")
+        (self.folder / "C01_DOC_CD_01_R00_INFO-ACME.md").write_text("@rev; new\n", encoding='utf-8')
+        self.assertEqual(index.latest(self.folder, "ACME").name, "C01_DOC_CD_01_R00_INFO-ACME.md")
+
+    def test_record_updates_latest(self):
+        index = InfoRevisionIndex()
+        index.latest(self.folder, "ACME")
+        new = self.folder / "C01_DOC_CD_00_R12_INFO-ACME.md"
+        new.write_text("@rev; 12\n", encoding='utf-8')
+        index.record(new)
+        self.assertEqual(index.latest(self.folder, "ACME"), new)
+
+    def test_missing_alias_or_folder(self):
+        index = InfoRevisionIndex()
+        self.assertIsNone(index.latest(self.folder, "OUTRO"))
+        self.assertIsNone(index.latest(self.root / "nope", "ACME"))
+
+
+class TestCompaction(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        _write_revisions(self.root / "ACME", "ACME", 6)
+        _write_revisions(self.root / "ACME" / "PROJ", "PROJ", 2, cod="S01")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_keep_n_archives_older_revisions(self):
+        archived = compact_revisions(self.root / "ACME", keep=2)
+
+        self.assertEqual(len(archived), 4)
+        remaining = sorted(p.name for p in (self.root / "ACME").glob("*_INFO-ACME.md"))
+        self.assertEqual(remaining, ["C01_DOC_CD_00_R04_INFO-ACME.md", "C01_DOC_CD_00_R05_INFO-ACME.md"])
+        with zipfile.ZipFile(self.root / "ACME" / ARCHIVE_FILENAME) as zf:
+            self.assertEqual(len(zf.namelist()), 4)
+
+    def test_name_already_archived_keeps_both_versions(self):
+        folder = self.root / "ACME"
+        compact_revisions(folder, keep=2)
+        # An old revision comes back with new content and is compacted again
+        restored = folder / "C01_DOC_CD_00_R00_INFO-ACME.md"
+        restored.write_text("@rev; editado\n", encoding='utf-8')
+        compact_revisions(folder, keep=2)
+
+        self.assertFalse(restored.exists())
+        with zipfile.ZipFile(folder / ARCHIVE_FILENAME) as zf:
+            self.assertEqual(zf.read("C01_DOC_CD_00_R00_INFO-ACME.md"), b"@rev; 0\n")
+            self.assertEqual(zf.read("C01_DOC_CD_00_R00_INFO-ACME~1.md"), b"@rev; editado\n")
+            self.assertEqual(len(zf.namelist()), 5)
+
+    def test_dry_run_and_tree_walk(self):
+        report = compact_tree(self.root, keep=2, dry_run=True)
+        self.assertEqual(list(report), [self.root / "ACME"])
+        self.assertEqual(len(list((self.root / "ACME").glob("*_INFO-ACME.md"))), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
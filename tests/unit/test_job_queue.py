@@ -0,0 +1,235 @@
+"""
+Tests for the persistent background job queue.
+
+Covers:
+- Submit -> run -> SUCCESS with the op result stored; errors -> ERROR
+- Progress reported through BaseOp.report_progress
+- Cancel: queued jobs at once, running jobs at the next checkpoint
+- Restart: stale RUNNING jobs of retryable ops re-queued (others, or past MAX_ATTEMPTS, failed), clean stop hands jobs back
+  (except those whose thread is still running)
+- Validation (unknown op, non-JSON params), MCP tools, OpMaintenance
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+from foton_system.core.ops import job_queue
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.core.ops.job_queue import JobQueue
+from foton_system.core.ops.op_maintenance import OpMaintenance
+from foton_system.modules.shared.domain.exceptions import OperationCancelledError
+
+
+class _CountOp(BaseOp):
+    retryable = True
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        if kwargs.get("fail"):
+            raise ValueError("bad input")
+        return kwargs
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        total = validated_data.get("n", 3)
+        for i in range(1, total + 1):
+            time.sleep(validated_data.get("delay", 0))
+            self.report_progress(i, total, "itens")
+        return {"status": "OK", "count": total}
+
+
+class _BlockingOp(_CountOp):
+    """No progress checkpoints: runs until `release` is set."""
+    release = threading.Event()
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        self.release.wait(5)
+        return {"status": "OK"}
+
+
+class _WriteOp(_CountOp):
+    retryable = False
+
+
+REGISTRY = {"contar": (__name__, "_CountOp"), "bloquear": (__name__, "_BlockingOp"),
+            "gravar": (__name__, "_WriteOp")}
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        bs = patch("foton_system.core.ops.audit_logger.BootstrapService")
+        self.addCleanup(bs.stop)
+        bs.start().get_user_config_dir.return_value = self.tmp
+        ae = patch.object(job_queue.atexit, "register")
+        self.addCleanup(ae.stop)
+        ae.start()
+        self.queue = JobQueue(self.tmp / "jobs.sqlite", workers=0, registry=REGISTRY)
+
+    def tearDown(self):
+        self.queue.stop()
+        shutil.rmtree(self.tmp)
+
+    def test_run_pending_success(self):
+        job_id = self.queue.submit("contar", {"n": 3}, client_id="730_Silva", actor="test")
+        self.assertEqual(self.queue.get(job_id)["status"], job_queue.QUEUED)
+
+        self.assertEqual(self.queue.run_pending(), 1)
+        job = self.queue.get(job_id)
+        self.assertEqual(job["status"], job_queue.SUCCESS)
+        self.assertEqual(job["result"], {"status": "OK", "count": 3})
+        self.assertEqual((job["done"], job["total"], job["message"]), (3, 3, "itens"))
+        self.assertEqual(job["attempts"], 1)
+        self.assertEqual(job["kwargs"], {"n": 3})
+
+    def test_error_is_stored(self):
+        job_id = self.queue.submit("contar", {"fail": True})
+        self.queue.run_pending()
+        job = self.queue.get(job_id)
+        self.assertEqual(job["status"], job_queue.ERROR)
+        self.assertIn("bad input", job["error"])
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            self.queue.submit("desconhecida", {})
+        with self.assertRaises(ValueError):
+            self.queue.submit("contar", {"x": object()})
+        self.assertEqual(self.queue.list(), [])
+
+    def test_cancel_queued(self):
+        job_id = self.queue.submit("contar", {})
+        self.assertEqual(self.queue.cancel(job_id), job_queue.CANCELLED)
+        self.assertEqual(self.queue.run_pending(), 0)
+        self.assertIsNone(self.queue.cancel("nao-existe"))
+
+    def test_cancel_running_in_worker_thread(self):
+        self.queue.workers = 1
+        job_id = self.queue.submit("contar", {"n": 200, "delay": 0.01})
+        self.assertTrue(_wait_for(lambda: (self.queue.get(job_id)["done"] or 0) > 0))
+
+        self.assertEqual(self.queue.cancel(job_id), job_queue.RUNNING)
+        self.assertTrue(_wait_for(lambda: self.queue.get(job_id)["status"] == job_queue.CANCELLED))
+        job = self.queue.get(job_id)
+        self.assertTrue(job["cancel_requested"])
+        self.assertLess(job["done"], 200)
+
+    def test_workers_drain_queue(self):
+        self.queue.workers = 2
+        ids = [self.queue.submit("contar", {"n": 2}) for _ in range(4)]
+        self.assertTrue(_wait_for(lambda: all(self.queue.get(i)["status"] == job_queue.SUCCESS for i in ids)))
+        self.assertEqual(self.queue.stats()[job_queue.SUCCESS], 4)
+
+    def test_stale_running_job_is_resumed_after_restart(self):
+        job_id = self.queue.submit("contar", {"n": 2})
+        self.queue._claim()  # owner dies mid-job
+        with closing(self.queue._connect()) as conn:
+            conn.execute("UPDATE jobs SET heartbeat = ?", (time.time() - job_queue.STALE_AFTER - 1,))
+
+        restarted = JobQueue(self.tmp / "jobs.sqlite", workers=0, registry=REGISTRY)
+        self.assertEqual(restarted.recover(), 1)
+        self.assertEqual(restarted.run_pending(), 1)
+        job = restarted.get(job_id)
+        self.assertEqual(job["status"], job_queue.SUCCESS)
+        self.assertEqual(job["attempts"], 2)
+
+    def test_stale_job_fails_after_max_attempts(self):
+        job_id = self.queue.submit("contar", {})
+        self.queue._claim()
+        with closing(self.queue._connect()) as conn:
+            conn.execute("UPDATE jobs SET heartbeat = 0, attempts = ?", (job_queue.MAX_ATTEMPTS,))
+        self.assertEqual(self.queue.recover(), 0)
+        self.assertEqual(self.queue.get(job_id)["status"], job_queue.ERROR)
+
+    def test_interrupted_non_retryable_job_is_failed_not_rerun(self):
+        job_id = self.queue.submit("gravar", {})
+        self.queue._claim()
+        with closing(self.queue._connect()) as conn:
+            conn.execute("UPDATE jobs SET heartbeat = 0")
+        self.assertEqual(self.queue.recover(), 0)
+        self.assertEqual(self.queue.run_pending(), 0)
+        job = self.queue.get(job_id)
+        self.assertEqual((job["status"], job["error"]), (job_queue.ERROR, job_queue.INTERRUPTED))
+
+        self.queue.workers = 1  # clean stop at a progress checkpoint
+        job_id = self.queue.submit("gravar", {"n": 200, "delay": 0.01})
+        self.assertTrue(_wait_for(lambda: (self.queue.get(job_id)["done"] or 0) > 0))
+        self.queue.stop()
+        self.assertEqual(self.queue.get(job_id)["status"], job_queue.ERROR)
+
+    def test_stop_hands_running_jobs_back(self):
+        job_id = self.queue.submit("contar", {})
+        self.queue._claim()
+        self.queue.stop()
+        job = self.queue.get(job_id)
+        self.assertEqual((job["status"], job["attempts"]), (job_queue.QUEUED, 0))
+
+    def test_stop_leaves_jobs_of_live_threads_running(self):
+        _BlockingOp.release.clear()
+        self.addCleanup(_BlockingOp.release.set)
+        self.queue.workers = 1
+        job_id = self.queue.submit("bloquear", {})
+        self.assertTrue(_wait_for(lambda: self.queue.get(job_id)["status"] == job_queue.RUNNING))
+
+        self.queue.stop(timeout=0.1)  # the thread outlives the join
+        self.assertEqual(self.queue.get(job_id)["status"], job_queue.RUNNING)
+        self.assertEqual(self.queue.run_pending(), 0)  # not handed to anyone else
+
+        _BlockingOp.release.set()
+        self.assertTrue(_wait_for(lambda: self.queue.get(job_id)["status"] == job_queue.SUCCESS))
+        self.assertEqual(self.queue.get(job_id)["attempts"], 1)
+
+    def test_report_progress_raises_when_cancelled(self):
+        op = _CountOp(actor="test")
+        op.cancel_event = threading.Event()
+        op.report_progress(1, 2)
+        op.cancel_event.set()
+        with self.assertRaises(OperationCancelledError):
+            op.report_progress(2, 2)
+
+    def test_mcp_tools(self):
+        from foton_system.interfaces.mcp import foton_mcp
+        with patch.object(JobQueue, "instance", return_value=self.queue):
+            output = foton_mcp.enfileirar_tarefa("contar", {"n": 1}, cliente="730_Silva")
+            self.assertIn("🕒", output)
+            job_id = self.queue.list()[0]["id"]
+            self.assertIn(job_id, foton_mcp.status_tarefa())
+
+            self.queue.run_pending()
+            detail = foton_mcp.status_tarefa(job_id)
+            self.assertIn("SUCCESS (1/1 itens)", detail)
+            self.assertIn('"count": 1', detail)
+            self.assertIn("já finalizada", foton_mcp.cancelar_tarefa(job_id))
+
+            self.assertIn("❌", foton_mcp.enfileirar_tarefa("desconhecida"))
+            self.assertIn("não encontrada", foton_mcp.status_tarefa("nao-existe"))
+
+
+class TestOpMaintenance(unittest.TestCase):
+
+    def test_rejects_unknown_action(self):
+        with self.assertRaises(ValueError):
+            OpMaintenance(actor="test").validate(action="apagar_tudo")
+        self.assertEqual(OpMaintenance(actor="test").validate(action=" Sincronizar_Base ")["action"],
+                         "sincronizar_base")
+
+    def test_registered_as_job(self):
+        self.assertEqual(job_queue.JOB_OPS["manutencao"][1], "OpMaintenance")
+
+
+if __name__ == "__main__":
+    unittest.main()
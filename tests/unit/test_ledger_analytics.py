@@ -0,0 +1,125 @@
+"""
+Tests for ledger_analytics (vectorized firm financial analytics).
+
+Covers:
+- prepare: typed columns, invalid rows dropped, non-ENTRADA counts as SAIDA
+- cash_flow / rolling_balance / receivables_aging (FIFO) / year_over_year
+- OpFinanceAnalytics + MCP tool over the consolidated ledger
+"""
+
+import csv
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from foton_system.modules.finance.domain.services import ledger_analytics
+from foton_system.modules.finance.infrastructure.repositories.firm_ledger_store import FirmLedgerStore
+
+RAW = pd.DataFrame({
+    'client': ['730_Silva', '730_Silva', '730_Silva', '731_Costa', '731_Costa', '731_Costa', '731_Costa'],
+    'data': ['2024-01-10', '2024-03-05', '2025-01-02', '2024-02-01', '2025-02-10', '2025-03-01', None],
+    'tipo': ['SAIDA', 'ENTRADA', 'SAIDA', 'ENTRADA', 'ENTRADA', 'Saida', 'ENTRADA'],
+    'valor': [100.0, 60.0, 50.0, 1000.0, 1500.0, 200.0, 99.0],
+})
+
+
+class TestLedgerAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        self.df = ledger_analytics.prepare(RAW)
+
+    def test_prepare_types(self):
+        self.assertEqual(len(self.df), 6)
+        self.assertEqual(str(self.df['client'].dtype), 'category')
+        self.assertTrue(str(self.df['data'].dtype).startswith('datetime64'))
+        self.assertEqual(list(self.df['tipo'].cat.categories), ['ENTRADA', 'SAIDA'])
+        self.assertEqual(self.df['signed'].sum(), 1000.0 + 1500.0 + 60.0 - 100.0 - 50.0 - 200.0)
+
+    def test_cash_flow_fills_empty_periods(self):
+        flow = ledger_analytics.cash_flow(self.df, 'Q')
+        self.assertEqual([str(p) for p in flow.index], ['2024Q1', '2024Q2', '2024Q3', '2024Q4', '2025Q1'])
+        self.assertEqual(flow.loc[pd.Period('2024Q1'), 'net'], 960.0)
+        self.assertEqual(flow['cumulative'].iloc[-1], 2210.0)
+
+    def test_rolling_balance_per_client(self):
+        out = ledger_analytics.rolling_balance(self.df, 'M', window=2)
+        silva = out[out['client'] == '730_Silva'].set_index('period')
+        self.assertEqual(silva.loc[pd.Period('2024-03', 'M'), 'balance'], -40.0)
+        self.assertEqual(silva.loc[pd.Period('2024-04', 'M'), 'rolling_net'], 60.0)
+        self.assertEqual(silva.loc[pd.Period('2025-03', 'M'), 'balance'], -90.0)
+        # Costa starts at its first entry
+        self.assertEqual(str(out[out['client'] == '731_Costa']['period'].min()), '2024-02')
+
+    def test_receivables_aging_settles_oldest_first(self):
+        aging = ledger_analytics.receivables_aging(self.df, as_of='2025-03-31')
+        self.assertEqual(list(aging.index), ['730_Silva'])
+        row = aging.loc['730_Silva']
+        self.assertEqual((row['61-90'], row['90+'], row['total']), (50.0, 40.0, 90.0))
+        self.assertEqual(row['oldest_days'], 446)
+
+    def test_year_over_year(self):
+        yoy = ledger_analytics.year_over_year(self.df, 'income', 'Q')
+        self.assertEqual(list(yoy.columns), ['2024', '2025', '2025/2024 %'])
+        self.assertAlmostEqual(yoy.loc[1, '2025/2024 %'], (1500.0 / 1060.0 - 1) * 100)
+        self.assertTrue(pd.isna(yoy.loc[2, '2025/2024 %']))
+        with self.assertRaises(ValueError):
+            ledger_analytics.year_over_year(self.df, 'lucro')
+
+    def test_period_alias(self):
+        self.assertEqual(ledger_analytics.period_alias('Trimestral'), 'Q')
+        with self.assertRaises(ValueError):
+            ledger_analytics.period_alias('semanal')
+
+
+class TestFinanceAnalyticsOp(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        base = self.tmp / "clientes"
+        for client, rows in RAW.dropna().groupby('client'):
+            folder = base / client / "01_ADM"
+            folder.mkdir(parents=True)
+            with open(folder / "FINANCEIRO.csv", 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Data', 'Descricao', 'Tipo', 'Valor'])
+                for _, r in rows.iterrows():
+                    writer.writerow([r['data'], 'x', r['tipo'], f"{r['valor']:.2f}"])
+        self.config = MagicMock()
+        self.config.base_pasta_clientes = base
+        self.config.folder_adm = "01_ADM"
+        self.config.ignored_folders = []
+        self.store = FirmLedgerStore(self.tmp / "financeiro.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _patches(self):
+        return (patch('foton_system.core.ops.op_finance_analytics.Config', return_value=self.config),
+                patch.object(FirmLedgerStore, 'instance', return_value=self.store),
+                patch('foton_system.core.ops.base_op.AuditLogger'))
+
+    def test_op_returns_json_rows(self):
+        from foton_system.core.ops.op_finance_analytics import OpFinanceAnalytics
+        p1, p2, p3 = self._patches()
+        with p1, p2, p3:
+            result = OpFinanceAnalytics(actor="test").execute(analysis="aging", as_of="31/03/2025")
+        self.assertEqual(result["rows"], [{'client': '730_Silva', '0-30': 0.0, '31-60': 0.0, '61-90': 50.0,
+                                           '90+': 40.0, 'total': 90.0, 'oldest_days': 446}])
+
+    def test_mcp_tool(self):
+        from foton_system.interfaces.mcp.foton_mcp import analise_financeira
+        p1, p2, p3 = self._patches()
+        with p1, p2, p3:
+            output = analise_financeira(analise="fluxo", periodo="anual")
+            invalid = analise_financeira(analise="fluxo", periodo="semanal")
+        self.assertIn("Fluxo de caixa (6 lançamento(s))", output)
+        self.assertIn("2025 | 1,500.00 | 250.00 | 1,250.00 | 2,210.00", output)
+        self.assertIn("❌ Análise inválida", invalid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests for the FINANCEIRO.csv running-total sidecar.
+
+Covers:
+- Sidecar created on first read, totals match a full DictReader pass
+- Appends parse only the new bytes (no rebuild); a torn last row waits for its newline
+- Out-of-band edits (spreadsheet, truncation) trigger a full rebuild
+- CSVFinanceRepository / FinanceService read totals through the sidecar
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from foton_system.modules.finance.application.use_cases.finance_service import FinanceService
+from foton_system.modules.finance.infrastructure.repositories import ledger_summary
+from foton_system.modules.finance.infrastructure.repositories.csv_finance_repository import CSVFinanceRepository
+from foton_system.modules.finance.infrastructure.repositories.ledger_summary import sidecar_path, summarize_ledger
+
+HEADERS = ['Data', 'Descricao', 'Tipo', 'Valor']
+
+
+def _expected(path: Path):
+    entradas = saidas = 0.0
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row['Tipo'] == 'ENTRADA':
+                entradas += float(row['Valor'])
+            else:
+                saidas += float(row['Valor'])
+    return {'total_entradas': entradas, 'total_saidas': saidas, 'saldo': entradas - saidas}
+
+
+class TestLedgerSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.csv = self.tmp / "FINANCEIRO.csv"
+        self._append([HEADERS, ['01/01/2024', 'Sinal', 'ENTRADA', '1000.0'],
+                      ['02/01/2024', 'Material', 'SAIDA', '250.5']])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _append(self, rows):
+        with open(self.csv, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+
+    def test_first_read_creates_sidecar(self):
+        summary = summarize_ledger(self.csv)
+        self.assertTrue(sidecar_path(self.csv).exists())
+        self.assertEqual(summary.totals(), _expected(self.csv))
+        self.assertEqual((summary.count, summary.offset), (2, self.csv.stat().st_size))
+
+    def test_unchanged_ledger_is_not_read(self):
+        summarize_ledger(self.csv)
+        with patch.object(ledger_summary, '_rebuild', side_effect=AssertionError("rebuild")), \
+                patch.object(ledger_summary, '_read_tail', side_effect=AssertionError("read")):
+            self.assertEqual(summarize_ledger(self.csv).count, 2)
+
+    def test_append_reads_only_tail(self):
+        first = summarize_ledger(self.csv)
+        self._append([['03/01/2024', 'Parcela', 'ENTRADA', '500'], ['04/01/2024', 'Taxa', 'SAIDA', '10']])
+        with patch.object(ledger_summary, '_rebuild', side_effect=AssertionError("rebuild")):
+            summary = summarize_ledger(self.csv)
+        self.assertEqual(summary.count, 4)
+        self.assertGreater(summary.offset, first.offset)
+        self.assertEqual(summary.totals(), _expected(self.csv))
+
+    def test_torn_append_waits_for_the_full_row(self):
+        summarize_ledger(self.csv)
+        with open(self.csv, 'ab') as f:
+            f.write(b'03/01/2024,Parcela,ENTRADA,5')  # writer caught mid-row
+        self.assertEqual(summarize_ledger(self.csv, persist=False).count, 2)  # append path
+        sidecar_path(self.csv).unlink()
+        torn = summarize_ledger(self.csv)  # rebuild path
+        self.assertEqual((torn.count, torn.totals()['total_entradas']), (2, 1000.0))
+
+        with open(self.csv, 'ab') as f:
+            f.write(b'00\r\n')
+        summary = summarize_ledger(self.csv)
+        self.assertEqual(summary.count, 3)
+        self.assertEqual(summary.totals(), _expected(self.csv))
+
+    def test_out_of_band_edit_rebuilds(self):
+        summarize_ledger(self.csv)
+        text = self.csv.read_text(encoding='utf-8').replace('250.5', '999.5')
+        self.csv.write_text(text, encoding='utf-8', newline='')
+        stamp = self.csv.stat().st_mtime + 5
+        os.utime(self.csv, (stamp, stamp))
+        with patch.object(ledger_summary, '_rebuild', wraps=ledger_summary._rebuild) as rebuild:
+            summary = summarize_ledger(self.csv)
+        rebuild.assert_called_once()
+        self.assertEqual(summary.totals()['total_saidas'], 999.5)
+
+    def test_truncated_ledger_rebuilds(self):
+        summarize_ledger(self.csv)
+        with open(self.csv, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([HEADERS, ['05/01/2024', 'Novo', 'ENTRADA', '42']])
+        self.assertEqual(summarize_ledger(self.csv).totals(), _expected(self.csv))
+
+    def test_corrupt_sidecar_and_missing_ledger(self):
+        sidecar_path(self.csv).write_text("{not json", encoding='utf-8')
+        self.assertEqual(summarize_ledger(self.csv).totals(), _expected(self.csv))
+        self.assertEqual(summarize_ledger(self.tmp / "nao_existe.csv").count, 0)
+
+
+class TestFinanceServiceUsesSidecar(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.service = FinanceService(CSVFinanceRepository())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_add_entry_updates_running_totals(self):
+        self.service.add_entry(self.tmp, "Sinal", 300, "ENTRADA")
+        with patch.object(CSVFinanceRepository, 'get_entries', side_effect=AssertionError("full scan")):
+            summary = self.service.add_entry(self.tmp, "Material", 120, "SAIDA")
+        self.assertEqual(summary, {'total_entradas': 300.0, 'total_saidas': 120.0, 'saldo': 180.0})
+        self.assertTrue(sidecar_path(self.tmp / "FINANCEIRO.csv").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
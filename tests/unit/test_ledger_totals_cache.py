@@ -0,0 +1,94 @@
+"""
+Tests for LedgerTotalsCache (firm-wide financial dashboard).
+
+Covers:
+- Cold start summarizes every ledger (on a pool past PARALLEL_MIN)
+- Warm calls summarize nothing; only changed ledgers are recomputed
+- FinanceService.get_firm_summary / MCP dashboard and resource
+"""
+
+import csv
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from foton_system.modules.finance.application.use_cases.finance_service import FinanceService
+from foton_system.modules.finance.infrastructure.repositories.csv_finance_repository import CSVFinanceRepository
+from foton_system.modules.finance.infrastructure.services import ledger_totals_cache
+from foton_system.modules.finance.infrastructure.services.ledger_totals_cache import LedgerTotalsCache
+
+
+def _write_ledger(folder: Path, rows):
+    with open(folder / "FINANCEIRO.csv", 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if f.tell() == 0:
+            writer.writerow(['Data', 'Descricao', 'Tipo', 'Valor'])
+        writer.writerows(rows)
+
+
+class TestLedgerTotalsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.base = Path(tempfile.mkdtemp())
+        self.clients = []
+        for i in range(6):
+            client = self.base / f"{700 + i}_Cliente"
+            client.mkdir()
+            _write_ledger(client, [['01/01/2024', 'Sinal', 'ENTRADA', str(100 * (i + 1))],
+                                   ['02/01/2024', 'Taxa', 'SAIDA', '10']])
+            self.clients.append(client)
+        (self.base / "799_SemFinanceiro").mkdir()
+        self.clients.append(self.base / "799_SemFinanceiro")
+        self.service = FinanceService(CSVFinanceRepository())
+
+    def tearDown(self):
+        shutil.rmtree(self.base)
+
+    def test_cold_start_then_warm(self):
+        with patch.object(ledger_totals_cache, 'ThreadPoolExecutor',
+                          wraps=ledger_totals_cache.ThreadPoolExecutor) as pool:
+            first = self.service.get_firm_summary(self.clients)
+        pool.assert_called_once()
+        self.assertEqual(len(first), 6)
+        self.assertEqual(first[2], {'name': '702_Cliente', 'income': 300.0, 'expense': 10.0, 'balance': 290.0})
+
+        with patch.object(ledger_totals_cache, 'summarize_ledger', side_effect=AssertionError("recomputed")):
+            self.assertEqual(self.service.get_firm_summary(self.clients), first)
+        self.assertEqual(LedgerTotalsCache.instance().stats()['hits'], 6)
+
+    def test_only_changed_ledger_is_recomputed(self):
+        self.service.get_firm_summary(self.clients)
+        _write_ledger(self.clients[0], [['03/01/2024', 'Parcela', 'ENTRADA', '50']])
+        with patch.object(ledger_totals_cache, 'summarize_ledger',
+                          wraps=ledger_totals_cache.summarize_ledger) as summarize:
+            results = self.service.get_firm_summary(self.clients)
+        self.assertEqual([c.args[0] for c in summarize.call_args_list], [self.clients[0] / "FINANCEIRO.csv"])
+        self.assertEqual(results[0]['income'], 150.0)
+
+    def test_get_totals_matches_entries(self):
+        totals = CSVFinanceRepository().get_totals(self.clients[1])
+        self.assertEqual(totals, {'total_entradas': 200.0, 'total_saidas': 10.0, 'saldo': 190.0})
+        self.assertEqual(CSVFinanceRepository().get_totals(self.clients[-1])['saldo'], 0.0)
+
+
+class TestFinancialResource(unittest.TestCase):
+
+    def test_resource_aggregates_firm_summary(self):
+        from foton_system.interfaces.mcp.foton_mcp import resource_financeiro_resumo
+        finance = MagicMock()
+        finance.get_firm_summary.return_value = [
+            {'name': 'A', 'income': 1000.0, 'expense': 200.0, 'balance': 800.0},
+            {'name': 'B', 'income': 0.0, 'expense': 300.0, 'balance': -300.0},
+        ]
+        with patch('foton_system.interfaces.mcp.foton_mcp._get_factory') as factory:
+            factory.return_value.get_finance_service.return_value = finance
+            output = resource_financeiro_resumo()
+        self.assertIn("Entradas: R$ 1,000.00", output)
+        self.assertIn("Saldo:    R$ 500.00", output)
+        self.assertIn("Clientes: 2", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Tests for ledger_writer (locked appends to FINANCEIRO.csv).
+
+Covers:
+- Header written once, unterminated last line fixed before appending
+- Concurrent writers (processes and threads) lose no rows
+- Lock held elsewhere / PermissionError -> retry, then LedgerLockError
+- FinanceService.add_entries writes a batch once; OpFinanceBatchEntry + MCP tool
+"""
+
+import csv
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from foton_system.modules.finance.application.use_cases.finance_service import FinanceService
+from foton_system.modules.finance.infrastructure.repositories import ledger_writer
+from foton_system.modules.finance.infrastructure.repositories.csv_finance_repository import CSVFinanceRepository
+from foton_system.modules.finance.infrastructure.repositories.ledger_writer import append_rows, ledger_lock
+from foton_system.modules.shared.domain.exceptions import LedgerLockError
+
+HEADERS = ['Data', 'Descricao', 'Tipo', 'Valor']
+
+
+def _append_many(csv_path, worker, count):
+    for i in range(count):
+        append_rows(csv_path, [['2025-01-01', f'w{worker}-{i}', 'ENTRADA', '1.00']], HEADERS)
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+class TestLedgerWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.csv = self.tmp / "01_ADM" / "FINANCEIRO.csv"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_header_written_once(self):
+        append_rows(self.csv, [['2025-01-01', 'a', 'ENTRADA', '10.00']], HEADERS)
+        append_rows(self.csv, [['2025-01-02', 'b', 'SAIDA', '4.00'],
+                               ['2025-01-03', 'c', 'ENTRADA', '1.00']], HEADERS)
+        rows = _read(self.csv)
+        self.assertEqual(rows[0], HEADERS)
+        self.assertEqual([r[1] for r in rows[1:]], ['a', 'b', 'c'])
+
+    def test_unterminated_last_line_gets_newline(self):
+        self.csv.parent.mkdir(parents=True)
+        self.csv.write_text("Data,Descricao,Tipo,Valor\r\n2025-01-01,manual,ENTRADA,5.00", encoding='utf-8')
+        append_rows(self.csv, [['2025-01-02', 'auto', 'SAIDA', '2.00']], HEADERS)
+        self.assertEqual([r[1] for r in _read(self.csv)[1:]], ['manual', 'auto'])
+
+    def test_empty_batch_does_nothing(self):
+        self.assertEqual(append_rows(self.csv, [], HEADERS), 0)
+        self.assertFalse(self.csv.exists())
+
+    def test_concurrent_processes_lose_no_rows(self):
+        ctx = multiprocessing.get_context('spawn')
+        procs = [ctx.Process(target=_append_many, args=(self.csv, w, 25)) for w in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(60)
+            self.assertEqual(p.exitcode, 0)
+        rows = _read(self.csv)
+        self.assertEqual(rows.count(HEADERS), 1)
+        self.assertEqual(len(rows), 1 + 4 * 25)
+        self.assertEqual(len({r[1] for r in rows[1:]}), 100)
+
+    def test_concurrent_threads_lose_no_rows(self):
+        threads = [threading.Thread(target=_append_many, args=(self.csv, w, 25)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(_read(self.csv)), 1 + 100)
+
+    def test_lock_timeout_raises(self):
+        self.csv.parent.mkdir(parents=True)
+        acquired, release = threading.Event(), threading.Event()
+
+        def holder():
+            with ledger_lock(self.csv):
+                acquired.set()
+                release.wait(5)
+
+        t = threading.Thread(target=holder)
+        t.start()
+        try:
+            acquired.wait(5)
+            with self.assertRaises(LedgerLockError):
+                append_rows(self.csv, [['2025-01-01', 'x', 'ENTRADA', '1.00']], HEADERS,
+                            lock_timeout=0.05)
+        finally:
+            release.set()
+            t.join()
+        self.assertFalse(self.csv.exists())
+
+    @patch.object(ledger_writer.time, 'sleep')
+    def test_permission_error_retried_with_backoff(self, mock_sleep):
+        calls = []
+        real_append = ledger_writer._append_locked
+
+        def flaky(*args):
+            calls.append(1)
+            if len(calls) < 3:
+                raise PermissionError("locked by OneDrive")
+            real_append(*args)
+
+        with patch.object(ledger_writer, '_append_locked', side_effect=flaky):
+            append_rows(self.csv, [['2025-01-01', 'x', 'ENTRADA', '1.00']], HEADERS)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
+        self.assertEqual(len(_read(self.csv)), 2)
+
+    @patch.object(ledger_writer.time, 'sleep')
+    def test_permission_error_exhausted_raises(self, mock_sleep):
+        with patch.object(ledger_writer, '_append_locked', side_effect=PermissionError("locked")):
+            with self.assertRaises(LedgerLockError) as ctx:
+                append_rows(self.csv, [['2025-01-01', 'x', 'ENTRADA', '1.00']], HEADERS)
+        self.assertEqual(mock_sleep.call_count, ledger_writer.MAX_RETRIES)
+        self.assertIn("FINANCEIRO.csv", str(ctx.exception))
+
+
+class TestBatchEntries(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.client = self.tmp / "730_Silva"
+        (self.client / "01_ADM").mkdir(parents=True)
+        self.config = MagicMock()
+        self.config.base_pasta_clientes = self.tmp
+        self.config.folder_adm = "01_ADM"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_add_entries_single_write(self):
+        service = FinanceService(CSVFinanceRepository(self.config))
+        with patch('foton_system.modules.finance.infrastructure.repositories.csv_finance_repository.append_rows',
+                   wraps=append_rows) as spy:
+            summary = service.add_entries(self.client, [
+                {'description': 'Sinal', 'value': 1000.0, 'type': 'ENTRADA', 'date': '2025-03-05'},
+                {'description': 'Taxa', 'value': '150,50', 'type': 'SAIDA'},
+            ])
+        spy.assert_called_once()
+        self.assertEqual(summary['saldo'], 849.5)
+        rows = _read(self.client / "01_ADM" / "FINANCEIRO.csv")
+        self.assertEqual(rows[1], ['2025-03-05', 'Sinal', 'ENTRADA', '1000.00'])
+
+    def _run_op(self, entries):
+        from foton_system.core.ops.op_finance_batch import OpFinanceBatchEntry
+        with patch('foton_system.core.ops.op_finance_entry.Config', return_value=self.config), \
+                patch('foton_system.core.ops.op_finance_batch.Config', return_value=self.config), \
+                patch('foton_system.core.ops.base_op.AuditLogger'):
+            return OpFinanceBatchEntry(actor="test").execute(client_name="730_Silva", entries=entries)
+
+    def test_op_registers_batch(self):
+        result = self._run_op('[{"descricao": "Parcela 1", "valor": 2500, "data": "05/03/2025"},'
+                              ' {"descricao": "Material", "valor": 300, "tipo": "saida"}]')
+        self.assertEqual((result["count"], result["new_balance"]), (2, 2200.0))
+        rows = _read(self.client / "01_ADM" / "FINANCEIRO.csv")
+        self.assertEqual(rows[1][0], '2025-03-05')
+        self.assertEqual(rows[2][2], 'SAIDA')
+
+    def test_op_is_all_or_nothing(self):
+        with self.assertRaises(ValueError) as ctx:
+            self._run_op([{"description": "ok", "value": 10},
+                          {"description": "bad", "value": -1},
+                          {"description": "date", "value": 5, "date": "31/31/2025"}])
+        self.assertIn("#2", str(ctx.exception))
+        self.assertIn("#3", str(ctx.exception))
+        self.assertFalse((self.client / "01_ADM" / "FINANCEIRO.csv").exists())
+
+    def test_mcp_tool(self):
+        from foton_system.interfaces.mcp.foton_mcp import registrar_financeiro_lote
+        with patch('foton_system.core.ops.op_finance_batch.OpFinanceBatchEntry') as MockOp:
+            MockOp.return_value.execute.return_value = {
+                "message": "2 entries registered. New Balance: R$ 700.00", "batch_in": 1000.0, "batch_out": 300.0}
+            output = registrar_financeiro_lote("730_Silva", [{"descricao": "x", "valor": 1}])
+            MockOp.return_value.execute.side_effect = ValueError("Provide at least one entry.")
+            invalid = registrar_financeiro_lote("730_Silva", [])
+        self.assertIn("✅ 2 entries registered", output)
+        self.assertIn("+R$ 1000.00 / -R$ 300.00", output)
+        self.assertIn("❌ Invalid data", invalid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests for OpBatch (one Op over many inputs).
+
+Covers:
+- Up-front validation: any invalid item aborts before running
+- Inline, thread and process pools give the same per-item results; failures collected
+- Process pools use the spawn start method (as the Windows exe does)
+- Shared service instances across items; max_batch_workers caps the pool
+- One audit event per item plus the aggregated OpBatch event (summary only)
+- Cancellation through report_progress
+"""
+
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+from foton_system.core.ops.audit_logger import AuditLogger
+from foton_system.core.ops import op_batch
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.core.ops.op_batch import OpBatch
+from foton_system.core.ops.op_create_client import OpCreateClient
+from foton_system.modules.shared.domain.exceptions import OperationCancelledError
+
+
+class _SquareOp(BaseOp):
+    built = 0
+
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        if not isinstance(kwargs.get("n"), int):
+            raise ValueError("n must be an integer")
+        return kwargs
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        self.get_service("calc", self._build)
+        if validated_data["n"] < 0:
+            raise RuntimeError("negative")
+        return {"square": validated_data["n"] ** 2}
+
+    @classmethod
+    def _build(cls):
+        cls.built += 1
+        return object()
+
+
+class _SerialOp(_SquareOp):
+    max_batch_workers = 1
+
+
+class TestOpBatch(unittest.TestCase):
+
+    def setUp(self):
+        AuditLogger._instance = None
+        self.tmp = Path(tempfile.mkdtemp())
+        bs = patch("foton_system.core.ops.audit_logger.BootstrapService")
+        self.addCleanup(bs.stop)
+        bs.start().get_user_config_dir.return_value = self.tmp
+        _SquareOp.built = 0
+
+    def tearDown(self):
+        AuditLogger.reset()
+        shutil.rmtree(self.tmp)
+
+    def _items(self, values):
+        return [{"client_name": f"C{v}", "n": v} for v in values]
+
+    def test_invalid_items_abort_before_running(self):
+        with self.assertRaises(ValueError) as ctx:
+            OpBatch(_SquareOp, actor="test").execute(items=[{"n": 1}, {"n": "x"}, "bad"])
+        self.assertIn("#2: n must be an integer", str(ctx.exception))
+        self.assertIn("#3: item must be an object", str(ctx.exception))
+        self.assertEqual(_SquareOp.built, 0)
+        with self.assertRaises(ValueError):
+            OpBatch(actor="test").execute(op="OpApagarTudo", items=[{}])
+
+    def test_modes_collect_results_and_errors(self):
+        for workers, processes, mode in ((1, False, "inline"), (4, False, "thread"), (2, True, "process")):
+            with self.subTest(mode=mode):
+                result = OpBatch(_SquareOp, actor="test", workers=workers, processes=processes).execute(
+                    items=self._items([1, 2, -3, 4]))
+                self.assertEqual(result["mode"], mode)
+                self.assertEqual((result["status"], result["succeeded"], result["failed"]), ("PARTIAL", 3, 1))
+                self.assertEqual([o.get("result") for o in result["items"]],
+                                 [{"square": 1}, {"square": 4}, None, {"square": 16}])
+                self.assertEqual(result["items"][2]["error"], "negative")
+
+    def test_process_mode_spawns_workers(self):
+        with patch.object(op_batch, "ProcessPoolExecutor", wraps=op_batch.ProcessPoolExecutor) as pool:
+            result = OpBatch(_SquareOp, actor="test", workers=2, processes=True).execute(
+                items=self._items([3, 5]))
+        self.assertEqual(pool.call_args.kwargs["mp_context"].get_start_method(), "spawn")
+        self.assertEqual([o["result"] for o in result["items"]], [{"square": 9}, {"square": 25}])
+
+    def test_services_shared_and_workers_capped(self):
+        result = OpBatch(_SquareOp, actor="test", workers=4).execute(items=self._items(range(20)))
+        self.assertEqual(result["status"], "COMPLETED")
+        self.assertLessEqual(_SquareOp.built, 4)  # built once (racing threads may build a spare)
+
+        serial = OpBatch(_SerialOp, actor="test", workers=8).execute(items=self._items([1, 2]))
+        self.assertEqual((serial["workers"], serial["mode"]), (1, "inline"))
+        self.assertEqual(OpCreateClient.max_batch_workers, 1)
+
+    def test_audit_events_per_item_and_aggregated(self):
+        OpBatch(_SquareOp, actor="test", workers=2).execute(client_id="IMPORT", items=self._items([2, -1]))
+        events = AuditLogger().get_recent_events(limit=10)
+        self.assertEqual(len(events), 3)
+
+        batch = events[0]
+        self.assertEqual((batch["op"], batch["client_id"], batch["status"]), ("OpBatch", "IMPORT", "SUCCESS"))
+        self.assertEqual(batch["payload"], {"items": 2, "op": "_SquareOp"})
+        self.assertNotIn("items", batch["result"])
+        self.assertEqual(batch["result"]["errors"], {"1": "negative"})
+
+        items = sorted(events[1:], key=lambda e: e["client_id"])
+        self.assertEqual([(e["op"], e["client_id"], e["status"]) for e in items],
+                         [("_SquareOp", "C-1", "ERROR"), ("_SquareOp", "C2", "SUCCESS")])
+        self.assertEqual(items[1]["payload"], {"client_name": "C2", "n": 2})
+        self.assertIn("duration_ms", items[1])
+
+    def test_cancellation_stops_batch(self):
+        op = OpBatch(_SquareOp, actor="test", workers=1)
+        op.cancel_event = threading.Event()
+        seen = []
+
+        def progress(done, total, message):
+            seen.append(done)
+            op.cancel_event.set()
+        op.progress_callback = progress
+
+        with self.assertRaises(OperationCancelledError):
+            op.execute(items=self._items(range(5)))
+        self.assertEqual(seen, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
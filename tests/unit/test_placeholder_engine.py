@@ -0,0 +1,70 @@
+"""
+Unit Tests for PlaceholderEngine (single-pass @variable substitution).
+
+The legacy per-key loop is kept here as the reference implementation.
+"""
+
+import re
+import unittest
+
+from foton_system.modules.documents.domain.services.placeholder_engine import PlaceholderEngine, KEY_PATTERN
+
+
+def legacy_replace(text, replacements):
+    for key in sorted(replacements.keys(), key=len, reverse=True):
+        pattern = r'(?<![\w.])' + re.escape(key) + r'(?!\.[a-z]{2,}\b)'
+        text = re.sub(pattern, str(replacements[key]), text, flags=re.IGNORECASE)
+    return text
+
+
+class TestPlaceholderEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.replacements = {
+            '@nome': 'Ana',
+            '@nomeCliente': 'Ana Souza',
+            '@valor': '1.500,00',
+            '@area%': '80%',
+            '@cidade': 'Curitiba',
+        }
+        self.engine = PlaceholderEngine(self.replacements)
+
+    def test_matches_legacy_behaviour(self):
+        samples = [
+            "Contratante: @nomeCliente, residente em @cidade.",
+            "@NOME paga @valor (@area% da obra).",
+            "Contato: contato@empresa.com ou @nome.com.br",
+            "Sem variáveis aqui.",
+            "@nomeX @nome_ x.@nome @nome.pdf",
+        ]
+        for text in samples:
+            self.assertEqual(self.engine.replace(text), legacy_replace(text, self.replacements), text)
+
+    def test_longest_key_wins(self):
+        self.assertEqual(self.engine.replace("@nomeCliente"), "Ana Souza")
+
+    def test_email_guard(self):
+        self.assertEqual(self.engine.replace("joao@nome.com"), "joao@nome.com")
+        self.assertEqual(self.engine.replace("@cidade.com"), "@cidade.com")
+
+    def test_values_are_not_reprocessed(self):
+        engine = PlaceholderEngine({'@a': '@b', '@b': 'X'})
+        self.assertEqual(engine.replace("@a @b"), "@b X")
+
+    def test_backslashes_in_values_are_literal(self):
+        engine = PlaceholderEngine({'@caminho': r'C:\temp\novo'})
+        self.assertEqual(engine.replace("@caminho"), r'C:\temp\novo')
+
+    def test_of_reuses_compiled_engine(self):
+        self.assertIs(PlaceholderEngine.of(self.engine), self.engine)
+        self.assertIs(PlaceholderEngine.of(self.replacements), PlaceholderEngine.of(dict(self.replacements)))
+
+    def test_empty_replacements(self):
+        self.assertEqual(PlaceholderEngine({}).replace("@nome"), "@nome")
+
+    def test_key_pattern_extraction(self):
+        self.assertEqual(KEY_PATTERN.findall("@nome e a@b.com e @valor%"), ['@nome', '@valor%'])
+
+
+if __name__ == '__main__':
+    unittest.main()
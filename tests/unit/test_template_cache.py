@@ -0,0 +1,162 @@
+"""
+Tests for TemplateCache / CompiledTemplate.
+
+Covers:
+- Required keys and '@' paragraph locations (body, tables, headers, slides)
+- Validation as a set difference (no document load)
+- replace_compiled output identical to the full replace_text pass
+- Cache hits and recompilation on template change
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from docx import Document
+from pptx import Presentation
+from pptx.util import Inches
+
+from foton_system.modules.documents.application.use_cases.document_service import DocumentService
+from foton_system.modules.documents.infrastructure.adapters.python_docx_adapter import PythonDocxAdapter
+from foton_system.modules.documents.infrastructure.adapters.python_pptx_adapter import PythonPPTXAdapter
+from foton_system.modules.documents.infrastructure.services.template_cache import (
+    TemplateCache, compile_template,
+)
+
+
+def _docx_text(path):
+    doc = Document(str(path))
+    parts = [p.text for p in doc.paragraphs]
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                parts.extend(p.text for p in cell.paragraphs)
+    for section in doc.sections:
+        parts.extend(p.text for p in section.header.paragraphs)
+    return parts
+
+
+class TestTemplateCompiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.docx_path = self.tmp / "contrato.docx"
+        doc = Document()
+        doc.sections[0].header.paragraphs[0].text = "Contrato @CodCliente"
+        doc.add_paragraph("Sem variáveis aqui.")
+        p = doc.add_paragraph("Contratante: ")
+        p.add_run("@Nome")
+        p.add_run("Cliente, contato@empresa.com")
+        doc.add_paragraph("Valor @Valor e @Valor%")
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "Área"
+        table.cell(0, 1).text = "@Area m²"
+        doc.save(self.docx_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_required_keys_docx(self):
+        compiled = compile_template(self.docx_path, 'docx')
+        self.assertEqual(compiled.required_keys,
+                         {'@codcliente', '@nomecliente', '@valor', '@valor%', '@area'})
+
+    def test_locations_only_paragraphs_with_at(self):
+        compiled = compile_template(self.docx_path, 'docx')
+        self.assertEqual(set(compiled.locations), {'word/document.xml', 'word/header1.xml'})
+        self.assertEqual(compiled.paragraph_count, 4)
+
+    def test_missing_keys_is_case_insensitive_set_difference(self):
+        compiled = compile_template(self.docx_path, 'docx')
+        missing = compiled.missing_keys({'@CodCliente': 'X', '@nomecliente': 'Y', '@Valor': '1'})
+        self.assertEqual(missing, ['@area', '@valor%'])
+
+    def test_replace_compiled_matches_full_pass(self):
+        replacements = {'@CodCliente': '730', '@NomeCliente': 'Silva', '@Valor': '10,00',
+                        '@Valor%': '5%', '@Area': '120'}
+        adapter = PythonDocxAdapter()
+        compiled = compile_template(self.docx_path, 'docx')
+
+        full = adapter.replace_text(adapter.load_document(str(self.docx_path)), replacements)
+        full.save(self.tmp / "full.docx")
+        fast = adapter.replace_compiled(adapter.load_document(str(self.docx_path)), replacements, compiled)
+        fast.save(self.tmp / "fast.docx")
+
+        self.assertEqual(_docx_text(self.tmp / "fast.docx"), _docx_text(self.tmp / "full.docx"))
+        self.assertIn("Contratante: Silva, contato@empresa.com", _docx_text(self.tmp / "fast.docx"))
+
+    def test_pptx_slides(self):
+        path = self.tmp / "apresentacao.pptx"
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Proposta @NomeCliente"
+        box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(4), Inches(1))
+        box.text_frame.text = "Sem chave"
+        prs.save(path)
+
+        compiled = compile_template(path, 'pptx')
+        self.assertEqual(compiled.required_keys, {'@nomecliente'})
+        self.assertEqual(compiled.paragraph_count, 1)
+
+        adapter = PythonPPTXAdapter()
+        result = adapter.replace_compiled(adapter.load_document(str(path)), {'@NomeCliente': 'Silva'}, compiled)
+        self.assertEqual(result.slides[0].shapes.title.text, "Proposta Silva")
+
+    def test_unknown_doc_type_raises(self):
+        with self.assertRaises(ValueError):
+            compile_template(self.docx_path, 'xlsx')
+
+
+class TestTemplateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.path = self.tmp / "t.docx"
+        doc = Document()
+        doc.add_paragraph("@A")
+        doc.save(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_hit_then_recompile_on_change(self):
+        cache = TemplateCache()
+        first = cache.get(self.path, 'docx')
+        self.assertIs(cache.get(self.path, 'docx'), first)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+        doc = Document()
+        doc.add_paragraph("@A @B")
+        doc.save(self.path)
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, first.mtime_ns + 1_000_000))
+
+        second = cache.get(self.path, 'docx')
+        self.assertEqual(second.required_keys, {'@a', '@b'})
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_lru_bound(self):
+        cache = TemplateCache(max_entries=1)
+        other = self.tmp / "u.docx"
+        shutil.copy(self.path, other)
+        cache.get(self.path, 'docx')
+        cache.get(other, 'docx')
+        self.assertEqual(cache.stats()['entries'], 1)
+
+    def test_document_service_validates_without_loading(self):
+        docx_adapter = MagicMock()
+        service = DocumentService(docx_adapter, MagicMock(), config=MagicMock())
+        missing = service._validate_keys(str(self.path), {'@b': '1'}, 'docx')
+        self.assertEqual(missing, ['@a'])
+        docx_adapter.load_document.assert_not_called()
+
+    def test_document_service_falls_back_when_not_compilable(self):
+        service = DocumentService(MagicMock(), MagicMock(), config=MagicMock())
+        self.assertIsNone(service._compile_template(str(self.tmp / "nao_existe.docx"), 'docx'))
+
+
+if __name__ == '__main__':
+    unittest.main()
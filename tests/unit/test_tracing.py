@@ -0,0 +1,184 @@
+"""
+Tests for tracing (timing spans for ops and services).
+
+Covers:
+- Disabled: span() is the shared no-op, traced functions run untouched
+- Nesting via ContextVar, explicit parent across threads, errors recorded
+- JSONL and Chrome trace exporters (appendable files)
+- BaseOp attaches duration_ms always and the span tree when enabled
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+from foton_system.core.ops.audit_logger import AuditLogger
+from foton_system.core.ops.base_op import BaseOp
+from foton_system.modules.shared.infrastructure.services import tracing
+
+
+class _SampleOp(BaseOp):
+    def validate(self, **kwargs) -> Dict[str, Any]:
+        if kwargs.get("fail"):
+            raise ValueError("bad input")
+        return kwargs
+
+    def execute_logic(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+        with tracing.span("service.step", items=2):
+            pass
+        return {"status": "OK"}
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.exported = []
+        tracing.enable(True)
+        tracing.add_exporter(self.exported.append)
+
+    def tearDown(self):
+        tracing.enable(False)
+        tracing.clear_exporters()
+        shutil.rmtree(self.tmp)
+
+    def test_disabled_is_noop(self):
+        tracing.enable(False)
+        span = tracing.span("x", a=1)
+        self.assertIs(span, tracing.NOOP)
+        with span as s:
+            s.set(b=2)
+        self.assertFalse(s)
+        self.assertIsNone(s.summary())
+        self.assertEqual(self.exported, [])
+
+        @tracing.traced()
+        def add(a, b):
+            return a + b
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add.__name__, "add")
+
+    def test_nested_spans_and_export(self):
+        with tracing.span("root", op="OpX") as root:
+            with tracing.span("child") as child:
+                with tracing.span("grandchild"):
+                    pass
+            self.assertIs(tracing.current_span(), root)
+        self.assertIsNone(tracing.current_span())
+
+        self.assertEqual(len(self.exported), 1)
+        names = [(s.name, s.parent.name if s.parent else None) for s in self.exported[0]]
+        self.assertEqual(names, [("root", None), ("child", "root"), ("grandchild", "child")])
+        self.assertGreaterEqual(root.duration_ms, child.duration_ms)
+        self.assertEqual(root.summary()[0]["attrs"], {"op": "OpX"})
+
+    def test_error_recorded_and_propagated(self):
+        with self.assertRaises(KeyError):
+            with tracing.span("root") as root:
+                with tracing.span("fails"):
+                    raise KeyError("x")
+        self.assertEqual([d.get("error") for d in root.summary()], ["KeyError", "KeyError"])
+
+    def test_explicit_parent_from_worker_thread(self):
+        with tracing.span("batch") as batch:
+            def work():
+                self.assertIsNone(tracing.current_span())  # new thread, empty context
+                with tracing.span("item", parent=batch):
+                    pass
+            t = threading.Thread(target=work)
+            t.start()
+            t.join()
+        self.assertEqual([s.name for s in self.exported[0]], ["batch", "item"])
+
+    def test_traced_decorator(self):
+        @tracing.traced("calc")
+        def calc():
+            return tracing.current_span().name
+        self.assertEqual(calc(), "calc")
+        self.assertEqual(self.exported[0][0].name, "calc")
+
+    def test_jsonl_exporter(self):
+        path = self.tmp / "trace.jsonl"
+        tracing.add_exporter(tracing.exporter_for(path))
+        with tracing.span("root"):
+            with tracing.span("child"):
+                pass
+        rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([r["name"] for r in rows], ["root", "child"])
+        self.assertEqual(rows[1]["parent"], rows[0]["id"])
+        self.assertEqual({r["trace"] for r in rows}, {rows[0]["id"]})
+
+    def test_chrome_trace_exporter_appends(self):
+        path = self.tmp / "trace.json"
+        tracing.add_exporter(tracing.exporter_for(path))
+        for _ in range(2):
+            with tracing.span("root"):
+                with tracing.span("child"):
+                    pass
+        # Viewers accept the open array; closing it must give valid JSON
+        text = path.read_text(encoding="utf-8")
+        self.assertTrue(text.startswith("[\n"))
+        events = json.loads(text.rstrip().rstrip(",") + "]")
+        self.assertEqual(len(events), 4)
+        self.assertEqual({e["ph"] for e in events}, {"X"})
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
+
+    def test_exporter_failure_does_not_break_code(self):
+        tracing.add_exporter(lambda spans: 1 / 0)
+        with tracing.span("root"):
+            pass
+        self.assertEqual(len(self.exported), 1)
+
+    def test_configure_from_env(self):
+        tracing.enable(False)
+        tracing.clear_exporters()
+        path = self.tmp / "env.json"
+        with patch.dict("os.environ", {"FOTON_TRACE_FILE": str(path)}):
+            tracing.configure_from_env()
+        self.assertTrue(tracing.is_enabled())
+        with tracing.span("root"):
+            pass
+        self.assertTrue(path.exists())
+
+
+class TestOpTiming(unittest.TestCase):
+
+    def setUp(self):
+        AuditLogger._instance = None
+        self.tmp = Path(tempfile.mkdtemp())
+        bs = patch("foton_system.core.ops.audit_logger.BootstrapService")
+        self.addCleanup(bs.stop)
+        bs.start().get_user_config_dir.return_value = self.tmp
+
+    def tearDown(self):
+        tracing.enable(False)
+        AuditLogger.reset()
+        shutil.rmtree(self.tmp)
+
+    def test_duration_without_spans_when_disabled(self):
+        _SampleOp(actor="test").execute(client_id="730_Silva")
+        event = AuditLogger().get_recent_events(1)[0]
+        self.assertGreaterEqual(event["duration_ms"], 0)
+        self.assertNotIn("spans", event)
+
+    def test_span_tree_in_audit_event(self):
+        tracing.enable(True)
+        _SampleOp(actor="test").execute(client_id="730_Silva")
+        with self.assertRaises(ValueError):
+            _SampleOp(actor="test").execute(client_id="730_Silva", fail=True)
+
+        failed, ok = AuditLogger().get_recent_events(2)
+        self.assertEqual([s["name"] for s in ok["spans"]], ["_SampleOp", "validate", "execute", "service.step"])
+        self.assertEqual(ok["spans"][3]["attrs"], {"items": 2})
+        self.assertEqual(ok["spans"][3]["parent"], ok["spans"][2]["id"])
+        self.assertEqual([s["name"] for s in failed["spans"]], ["_SampleOp", "validate"])
+        self.assertEqual(failed["spans"][1]["error"], "ValueError")
+
+
+if __name__ == "__main__":
+    unittest.main()